@@ -1166,6 +1166,92 @@ describe("AppRoot.applyDelta", () => {
     const newNode = newRoot.main.getIn([1, 1]) as BlockNode
     expect(newNode.deltaMsgReceivedAt).toBe(timestamp)
   })
+
+  it("handles 'unchanged' deltas for elements", () => {
+    const delta = makeProto(DeltaProto, { unchanged: true })
+    const newRoot = ROOT.applyDelta(
+      "new_session_id",
+      delta,
+      forwardMsgMetadata([0, 1, 0])
+    )
+
+    const oldNode = ROOT.main.getIn([1, 0]) as ElementNode
+    const newNode = newRoot.main.getIn([1, 0]) as ElementNode
+    expect(newNode).toBeTextNode("2")
+    expect(newNode.element).toBe(oldNode.element)
+    expect(newNode.metadata).toBe(oldNode.metadata)
+
+    // Check that our new scriptRunId has been set only on the touched nodes
+    expect(newRoot.main.scriptRunId).toBe("new_session_id")
+    expect(newRoot.main.getIn([0])?.scriptRunId).toBe(NO_SCRIPT_RUN_ID)
+    expect(newRoot.main.getIn([1])?.scriptRunId).toBe("new_session_id")
+    expect(newNode.scriptRunId).toBe("new_session_id")
+  })
+
+  it("handles 'unchanged' deltas for blocks", () => {
+    const timestamp = new Date(Date.UTC(2017, 1, 14)).valueOf()
+    Date.now = jest.fn(() => timestamp)
+    const delta = makeProto(DeltaProto, { unchanged: true })
+    const newRoot = ROOT.applyDelta(
+      "new_session_id",
+      delta,
+      forwardMsgMetadata([0, 1])
+    )
+
+    const oldNode = ROOT.main.getIn([1]) as BlockNode
+    const newNode = newRoot.main.getIn([1]) as BlockNode
+    expect(newNode.deltaBlock).toBe(oldNode.deltaBlock)
+    expect(newNode.children).toBe(oldNode.children)
+    expect(newNode.scriptRunId).toBe("new_session_id")
+    expect(newNode.deltaMsgReceivedAt).toBe(timestamp)
+
+    // The children are not part of the current script run unless the server
+    // sends them (or an 'unchanged' delta for them).
+    expect(newRoot.main.getIn([1, 0])?.scriptRunId).toBe(NO_SCRIPT_RUN_ID)
+  })
+
+  it("throws an error for 'unchanged' deltas with an invalid path", () => {
+    const delta = makeProto(DeltaProto, { unchanged: true })
+    expect(() =>
+      ROOT.applyDelta("new_session_id", delta, forwardMsgMetadata([0, 1, 5]))
+    ).toThrow("Can't keep unchanged node: invalid deltaPath: 0,1,5")
+  })
+
+  it("handles 'appendMarkdown' deltas", () => {
+    const root = ROOT.applyDelta(
+      "new_session_id",
+      makeProto(DeltaProto, {
+        newElement: { markdown: { body: "Hello", allowHtml: true } },
+      }),
+      forwardMsgMetadata([0, 1, 1])
+    )
+    const newRoot = root.applyDelta(
+      "new_session_id",
+      makeProto(DeltaProto, { appendMarkdown: " world" }),
+      forwardMsgMetadata([0, 1, 1])
+    )
+
+    const newNode = newRoot.main.getIn([1, 1]) as ElementNode
+    expect(newNode.element.markdown?.body).toBe("Hello world")
+    expect(newNode.element.markdown?.allowHtml).toBe(true)
+    expect(newNode.scriptRunId).toBe("new_session_id")
+    // The original node isn't modified.
+    const oldNode = root.main.getIn([1, 1]) as ElementNode
+    expect(oldNode.element.markdown?.body).toBe("Hello")
+  })
+
+  it("shows an error for 'appendMarkdown' deltas for other element types", () => {
+    const newRoot = ROOT.applyDelta(
+      "new_session_id",
+      makeProto(DeltaProto, { appendMarkdown: " world" }),
+      forwardMsgMetadata([0, 1, 0])
+    )
+
+    const newNode = newRoot.main.getIn([1, 0]) as ElementNode
+    expect(newNode.element.alert?.body).toBe(
+      "elementType 'text' is not a valid appendMarkdown target!"
+    )
+  })
 })
 
 describe("AppRoot.clearStaleNodes", () => {
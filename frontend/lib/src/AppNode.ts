@@ -134,6 +134,12 @@ export interface AppNode {
    */
   setIn(path: number[], node: AppNode, scriptRunId: string): AppNode
 
+  /**
+   * Return a copy of this node that belongs to the given script run. Used
+   * when the server tells us that the node didn't change in that run.
+   */
+  withScriptRunId(scriptRunId: string, deltaMsgReceivedAt?: number): AppNode
+
   /**
    * Recursively remove children nodes whose activeScriptHash is no longer
    * associated with the mainScriptHash.
@@ -253,6 +259,20 @@ export class ElementNode implements AppNode {
     throw new Error("'setIn' cannot be called on an ElementNode")
   }
 
+  public withScriptRunId(scriptRunId: string): ElementNode {
+    const newNode = new ElementNode(
+      this.element,
+      this.metadata,
+      scriptRunId,
+      this.activeScriptHash,
+      this.fragmentId
+    )
+    // The element didn't change, so we can reuse its parsed data.
+    newNode.lazyQuiverElement = this.lazyQuiverElement
+    newNode.lazyVegaLiteChartElement = this.lazyVegaLiteChartElement
+    return newNode
+  }
+
   public filterMainScriptElements(
     mainScriptHash: string
   ): AppNode | undefined {
@@ -334,6 +354,28 @@ export class ElementNode implements AppNode {
     return newNode
   }
 
+  public appendMarkdown(text: string, scriptRunId: string): ElementNode {
+    const { markdown } = this.element
+    if (this.element.type !== "markdown" || isNullOrUndefined(markdown)) {
+      // This should never happen!
+      throw new Error(
+        `elementType '${this.element.type}' is not a valid appendMarkdown target!`
+      )
+    }
+
+    const element = new Element({
+      ...this.element,
+      markdown: { ...markdown, body: markdown.body + text },
+    })
+    return new ElementNode(
+      element,
+      this.metadata,
+      scriptRunId,
+      this.activeScriptHash,
+      this.fragmentId
+    )
+  }
+
   private static quiverAddRowsHelper(
     element: Quiver,
     namedDataSet: ArrowNamedDataSet
@@ -345,7 +387,9 @@ export class ElementNode implements AppNode {
     }
 
     const newQuiver = new Quiver(namedDataSet.data as IArrow)
-    return element.addRows(newQuiver)
+    return element
+      .addRows(newQuiver)
+      .keepLastRows(namedDataSet.maxRows ?? 0)
   }
 
   private static vegaLiteChartAddRowsHelper(
@@ -356,13 +400,16 @@ export class ElementNode implements AppNode {
     const newDataSetQuiver = new Quiver(namedDataSet.data as IArrow)
 
     return produce(element, (draft: VegaLiteChartElement) => {
+      const maxRows = namedDataSet.maxRows ?? 0
       const existingDataSet = getNamedDataSet(draft.datasets, newDataSetName)
       if (existingDataSet) {
-        existingDataSet.data = existingDataSet.data.addRows(newDataSetQuiver)
+        existingDataSet.data = existingDataSet.data
+          .addRows(newDataSetQuiver)
+          .keepLastRows(maxRows)
       } else {
         draft.data = draft.data
-          ? draft.data.addRows(newDataSetQuiver)
-          : newDataSetQuiver
+          ? draft.data.addRows(newDataSetQuiver).keepLastRows(maxRows)
+          : newDataSetQuiver.keepLastRows(maxRows)
       }
     })
   }
@@ -476,6 +523,20 @@ export class BlockNode implements AppNode {
     )
   }
 
+  public withScriptRunId(
+    scriptRunId: string,
+    deltaMsgReceivedAt?: number
+  ): BlockNode {
+    return new BlockNode(
+      this.activeScriptHash,
+      this.children,
+      this.deltaBlock,
+      scriptRunId,
+      this.fragmentId,
+      deltaMsgReceivedAt
+    )
+  }
+
   filterMainScriptElements(mainScriptHash: string): AppNode | undefined {
     if (this.activeScriptHash !== mainScriptHash) {
       return undefined
@@ -745,6 +806,15 @@ export class AppRoot {
         )
       }
 
+      case "unchanged": {
+        const deltaMsgReceivedAt = Date.now()
+        return this.keepUnchangedNode(
+          deltaPath,
+          scriptRunId,
+          deltaMsgReceivedAt
+        )
+      }
+
       case "arrowAddRows": {
         try {
           return this.arrowAddRows(
@@ -766,6 +836,27 @@ export class AppRoot {
         }
       }
 
+      case "appendMarkdown": {
+        try {
+          return this.appendMarkdown(
+            deltaPath,
+            delta.appendMarkdown as string,
+            scriptRunId
+          )
+        } catch (error) {
+          const errorElement = makeElementWithErrorText(
+            ensureError(error).message
+          )
+          return this.addElement(
+            deltaPath,
+            scriptRunId,
+            errorElement,
+            metadata,
+            activeScriptHash
+          )
+        }
+      }
+
       default: {
         throw new Error(`Unrecognized deltaType: '${delta.type}'`)
       }
@@ -904,6 +995,29 @@ export class AppRoot {
     )
   }
 
+  private keepUnchangedNode(
+    deltaPath: number[],
+    scriptRunId: string,
+    deltaMsgReceivedAt: number
+  ): AppRoot {
+    const existingNode = this.root.getIn(deltaPath)
+    if (isNullOrUndefined(existingNode)) {
+      throw new Error(
+        `Can't keep unchanged node: invalid deltaPath: ${deltaPath}`
+      )
+    }
+
+    return new AppRoot(
+      this.mainScriptHash,
+      this.root.setIn(
+        deltaPath,
+        existingNode.withScriptRunId(scriptRunId, deltaMsgReceivedAt),
+        scriptRunId
+      ),
+      this.appLogo
+    )
+  }
+
   private arrowAddRows(
     deltaPath: number[],
     namedDataSet: ArrowNamedDataSet,
@@ -921,6 +1035,24 @@ export class AppRoot {
       this.appLogo
     )
   }
+
+  private appendMarkdown(
+    deltaPath: number[],
+    text: string,
+    scriptRunId: string
+  ): AppRoot {
+    const existingNode = this.root.getIn(deltaPath) as ElementNode
+    if (isNullOrUndefined(existingNode)) {
+      throw new Error(`Can't appendMarkdown: invalid deltaPath: ${deltaPath}`)
+    }
+
+    const elementNode = existingNode.appendMarkdown(text, scriptRunId)
+    return new AppRoot(
+      this.mainScriptHash,
+      this.root.setIn(deltaPath, elementNode, scriptRunId),
+      this.appLogo
+    )
+  }
 }
 
 /** Iterates over datasets and converts data to Quiver. */
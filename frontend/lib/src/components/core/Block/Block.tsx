@@ -47,6 +47,7 @@ import {
   convertKeyToClassName,
   getKeyFromId,
   isComponentStale,
+  reportLazyBlockOpened,
   shouldComponentBeEnabled,
 } from "./utils"
 import ElementNodeRenderer from "./ElementNodeRenderer"
@@ -114,9 +115,11 @@ const BlockNodeRenderer = (props: BlockPropsWithWidth): ReactElement => {
   if (node.deltaBlock.expandable) {
     return (
       <Expander
-        empty={node.isEmpty}
+        // Lazy expanders are sent without content until they are opened:
+        empty={node.isEmpty && !node.deltaBlock.lazy}
         isStale={isStale}
         element={node.deltaBlock.expandable as BlockProto.Expandable}
+        onOpen={() => reportLazyBlockOpened(node, props.widgetMgr)}
       >
         {child}
       </Expander>
@@ -203,3 +203,24 @@ export function getKeyFromId(
   const userKey = elementId.split("-", 3).pop()
   return userKey === "None" ? undefined : userKey
 }
+
+/**
+ * Reports to the server that a lazy block (e.g. an expander or a tab with
+ * deferred content) was opened for the first time. This sets the block's
+ * boolean widget value and triggers a rerun that renders the block content.
+ */
+export function reportLazyBlockOpened(
+  node: BlockNode,
+  widgetMgr: WidgetStateManager
+): void {
+  const { lazy, id } = node.deltaBlock
+  if (!lazy || !id) {
+    return
+  }
+
+  const widget = { id }
+  if (widgetMgr.getBoolValue(widget)) {
+    return
+  }
+  widgetMgr.setBoolValue(widget, true, { fromUi: true }, node.fragmentId)
+}
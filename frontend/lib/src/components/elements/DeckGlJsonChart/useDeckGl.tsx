@@ -40,6 +40,7 @@ import type {
   ParsedDeckGlConfig,
 } from "./types"
 import { jsonConverter } from "./utils/jsonConverter"
+import { resolveArrowLayerData } from "./utils/arrowLayerData"
 import {
   FillFunction,
   getContextualFillColor,
@@ -216,10 +217,15 @@ export const useDeckGl = (props: UseDeckGlProps): UseDeckGlShape => {
     isSelectionModeActivated && Object.keys(data.selection.indices).length > 0
 
   const parsedPydeckJson = useMemo(() => {
-    return Object.freeze(JSON5.parse<ParsedDeckGlConfig>(element.json))
+    return Object.freeze(
+      resolveArrowLayerData(
+        JSON5.parse<ParsedDeckGlConfig>(element.json),
+        element.arrowData
+      )
+    )
     // Only parse JSON when transitioning to/from fullscreen, the json changes, or theme changes
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [isFullScreen, isLightTheme, element.json])
+  }, [isFullScreen, isLightTheme, element.json, element.arrowData])
 
   const deck = useMemo<DeckObject>(() => {
     const copy = { ...parsedPydeckJson }
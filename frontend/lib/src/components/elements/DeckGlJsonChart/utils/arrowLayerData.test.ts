@@ -0,0 +1,65 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { tableFromArrays, tableToIPC } from "apache-arrow"
+
+import type { ParsedDeckGlConfig } from "../types"
+
+import {
+  ARROW_LAYER_DATA_REF_PREFIX,
+  arrowTableToRecords,
+  resolveArrowLayerData,
+} from "./arrowLayerData"
+
+const TABLE = tableFromArrays({
+  lat: Float64Array.from([1.5, 2.5]),
+  lon: BigInt64Array.from([BigInt(10), BigInt(20)]),
+})
+
+describe("arrowTableToRecords", () => {
+  it("converts the table into records with deck.gl compatible values", () => {
+    expect(arrowTableToRecords(TABLE)).toEqual([
+      { lat: 1.5, lon: 10 },
+      { lat: 2.5, lon: 20 },
+    ])
+  })
+})
+
+describe("resolveArrowLayerData", () => {
+  const config = {
+    layers: [
+      { "@@type": "ScatterplotLayer", data: `${ARROW_LAYER_DATA_REF_PREFIX}0` },
+      { "@@type": "ScatterplotLayer", data: [{ lat: 1, lon: 2 }] },
+    ],
+  } as unknown as ParsedDeckGlConfig
+
+  it("replaces placeholders with the decoded Arrow data", () => {
+    const resolved = resolveArrowLayerData(config, {
+      "0": { data: tableToIPC(TABLE, "stream") },
+    })
+
+    expect(resolved.layers[0].data).toEqual([
+      { lat: 1.5, lon: 10 },
+      { lat: 2.5, lon: 20 },
+    ])
+    expect(resolved.layers[1]).toBe(config.layers[1])
+  })
+
+  it("returns the config as-is if there is no Arrow data", () => {
+    expect(resolveArrowLayerData(config, {})).toBe(config)
+    expect(resolveArrowLayerData(config, undefined)).toBe(config)
+  })
+})
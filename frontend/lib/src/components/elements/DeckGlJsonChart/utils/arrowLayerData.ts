@@ -0,0 +1,92 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { StructRow, Table, tableFromIPC, Vector } from "apache-arrow"
+
+import type { IArrow } from "@streamlit/lib/src/proto"
+
+import type { ParsedDeckGlConfig } from "../types"
+
+/**
+ * Prefix of the placeholder that references Arrow layer data in the JSON spec.
+ * This needs to be kept in sync with deck_gl_json_chart.py.
+ */
+export const ARROW_LAYER_DATA_REF_PREFIX = "@@streamlit-arrow-data:"
+
+/** Convert an Arrow value into a value that can be used by deck.gl. */
+function toLayerValue(value: unknown): unknown {
+  if (typeof value === "bigint") {
+    return Number(value)
+  }
+  if (value instanceof Vector) {
+    return Array.from(value, toLayerValue)
+  }
+  if (value instanceof StructRow) {
+    return Object.fromEntries(
+      Object.entries(value.toJSON()).map(([k, v]) => [k, toLayerValue(v)])
+    )
+  }
+  return value
+}
+
+/** Convert an Arrow table into the list of records expected by deck.gl. */
+export function arrowTableToRecords(table: Table): Record<string, unknown>[] {
+  const columns = table.schema.fields.map(
+    (field, i) => [field.name, table.getChildAt(i)] as const
+  )
+  const records = new Array<Record<string, unknown>>(table.numRows)
+
+  for (let rowIndex = 0; rowIndex < table.numRows; rowIndex++) {
+    const record: Record<string, unknown> = {}
+    columns.forEach(([name, column]) => {
+      record[name] = toLayerValue(column?.get(rowIndex))
+    })
+    records[rowIndex] = record
+  }
+  return records
+}
+
+/**
+ * Replace the Arrow data placeholders of all layers with the decoded data.
+ */
+export function resolveArrowLayerData(
+  config: ParsedDeckGlConfig,
+  arrowData: Record<string, IArrow> | null | undefined
+): ParsedDeckGlConfig {
+  if (!config.layers || !arrowData || Object.keys(arrowData).length === 0) {
+    return config
+  }
+
+  return {
+    ...config,
+    layers: config.layers.map(layer => {
+      const data = layer?.data
+      if (
+        typeof data !== "string" ||
+        !data.startsWith(ARROW_LAYER_DATA_REF_PREFIX)
+      ) {
+        return layer
+      }
+
+      const arrow = arrowData[data.slice(ARROW_LAYER_DATA_REF_PREFIX.length)]
+      if (!arrow?.data) {
+        return layer
+      }
+
+      return { ...layer, data: arrowTableToRecords(tableFromIPC(arrow.data)) }
+    }),
+  }
+}
@@ -163,4 +163,20 @@ describe("Expander container", () => {
     fireEvent.click(screen.getByText("hi"))
     expect(screen.getByText("test")).toBeVisible()
   })
+
+  it("calls onOpen when the expander is expanded", () => {
+    const onOpen = jest.fn()
+    const props = getProps({ expanded: false }, { onOpen })
+    render(
+      <Expander {...props}>
+        <div>test</div>
+      </Expander>
+    )
+
+    fireEvent.click(screen.getByText("hi"))
+    expect(onOpen).toHaveBeenCalledTimes(1)
+
+    fireEvent.click(screen.getByText("hi"))
+    expect(onOpen).toHaveBeenCalledTimes(1)
+  })
 })
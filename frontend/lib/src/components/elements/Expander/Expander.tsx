@@ -94,12 +94,15 @@ export interface ExpanderProps {
   element: BlockProto.Expandable
   isStale: boolean
   empty: boolean
+  // Called whenever the user expands the expander.
+  onOpen?: () => void
 }
 
 const Expander: React.FC<React.PropsWithChildren<ExpanderProps>> = ({
   element,
   isStale,
   empty,
+  onOpen,
   children,
 }): ReactElement => {
   const { label, expanded: initialExpanded } = element
@@ -189,6 +192,7 @@ const Expander: React.FC<React.PropsWithChildren<ExpanderProps>> = ({
     const summaryHeight = summaryRef.current.getBoundingClientRect().height
 
     if (!expanded) {
+      onOpen?.()
       detailsEl.style.height = `${detailsHeight}px`
       detailsEl.open = true
 
@@ -27,7 +27,10 @@ import { Tab as UITab, Tabs as UITabs } from "baseui/tabs-motion"
 
 import { AppNode, BlockNode } from "@streamlit/lib/src/AppNode"
 import { BlockPropsWithoutWidth } from "@streamlit/lib/src/components/core/Block"
-import { isElementStale } from "@streamlit/lib/src/components/core/Block/utils"
+import {
+  isElementStale,
+  reportLazyBlockOpened,
+} from "@streamlit/lib/src/components/core/Block/utils"
 import { LibContext } from "@streamlit/lib/src/components/core/LibContext"
 import StreamlitMarkdown from "@streamlit/lib/src/components/shared/StreamlitMarkdown"
 
@@ -41,7 +44,14 @@ export interface TabProps extends BlockPropsWithoutWidth {
 }
 
 function Tabs(props: Readonly<TabProps>): ReactElement {
-  const { widgetsDisabled, node, isStale, scriptRunState, scriptRunId } = props
+  const {
+    widgetsDisabled,
+    node,
+    isStale,
+    scriptRunState,
+    scriptRunId,
+    widgetMgr,
+  } = props
   const { fragmentIdsThisRun } = useContext(LibContext)
 
   let allTabLabels: string[] = []
@@ -100,6 +110,10 @@ function Tabs(props: Readonly<TabProps>): ReactElement {
         onChange={({ activeKey }) => {
           setActiveTabKey(activeKey)
           setActiveTabName(allTabLabels[activeKey as number])
+          reportLazyBlockOpened(
+            node.children[activeKey as number] as BlockNode,
+            widgetMgr
+          )
         }}
         /* renderAll on UITabs should always be set to true to avoid scrolling issue
            https://github.com/streamlit/streamlit/issues/5069
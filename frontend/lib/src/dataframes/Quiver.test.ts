@@ -1832,4 +1832,46 @@ describe("Quiver", () => {
       })
     })
   })
+
+  describe("Keep last rows", () => {
+    test("drops the oldest rows of a range index", () => {
+      const mockElement = { data: RANGE }
+      const q = new Quiver(mockElement)
+
+      const qq = q.addRows(q).keepLastRows(3)
+
+      expect(qq.index).toEqual([[1, 2, 3]])
+      expect(qq.data.toArray().map(a => a?.toArray())).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+      expect(qq.types.index[0].meta).toEqual({
+        start: 1,
+        step: 1,
+        stop: 4,
+        kind: "range",
+        name: null,
+      })
+    })
+
+    test("drops the oldest rows of a non-range index", () => {
+      const mockElement = { data: UNICODE }
+      const q = new Quiver(mockElement)
+
+      const qq = q.addRows(q).keepLastRows(1)
+
+      expect(qq.index.length).toEqual(1)
+      expect(qq.index[0].length).toEqual(1)
+      expect(qq.dimensions.dataRows).toEqual(1)
+    })
+
+    test("is a no-op if the limit is not exceeded or disabled", () => {
+      const mockElement = { data: RANGE }
+      const q = new Quiver(mockElement)
+
+      expect(q.keepLastRows(2)).toBe(q)
+      expect(q.keepLastRows(0)).toBe(q)
+    })
+  })
 })
@@ -1416,6 +1416,43 @@ st.add_rows(my_styler.data)
     })
   }
 
+  /**
+   * Return a new Quiver that only contains the last `maxRows` rows.
+   * This is used to bound elements that are continuously extended via
+   * `add_rows()`.
+   */
+  public keepLastRows(maxRows: number): Quiver {
+    const numRows = this._data.numRows
+    if (maxRows <= 0 || numRows <= maxRows) {
+      return this
+    }
+
+    const offset = numRows - maxRows
+    const index = this._index.map(indexValue => indexValue.slice(offset))
+    const data = this._data.slice(offset)
+    const indexTypes = this._types.index.map(indexType => {
+      // NOTE: "range" index cannot be a part of a multi-index, i.e.
+      // if the index type is "range", there will only be one element in the index array.
+      if (indexType.pandas_type === IndexTypeName.RangeIndex) {
+        const { start, step } = indexType.meta as RangeIndex
+        return {
+          ...indexType,
+          meta: {
+            ...indexType.meta,
+            start: start + offset * step,
+          },
+        }
+      }
+      return indexType
+    })
+
+    return produce(this, (draft: Quiver) => {
+      draft._index = index
+      draft._data = data
+      draft._types = { index: indexTypes, data: this._types.data }
+    })
+  }
+
   private static parseFields(schema: ArrowSchema): Record<string, Field> {
     // None-index data columns are listed first, and all index columns listed last
     // within the fields array in arrow.
@@ -18,22 +18,73 @@ CustomComponent for dataframe serialization.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any, Final, Tuple
 
-from streamlit import dataframe_util
+from cachetools import LRUCache
+from typing_extensions import TypeAlias
+
+from streamlit import config, dataframe_util
 from streamlit.elements.lib import pandas_styler_utils
+from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
     from pandas import DataFrame, Index, Series
 
     from streamlit.proto.Components_pb2 import ArrowTable as ArrowTableProto
 
+# The maximum total size of the marshalled dataframes that are kept for reuse.
+_MARSHALLED_TABLE_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
+# The data, index and columns payloads of an ArrowTable proto.
+MarshalledTable: TypeAlias = Tuple[bytes, bytes, bytes]
+
 
 def _maybe_tuple_to_list(item: Any) -> Any:
     """Convert a tuple to a list. Leave as is if it's not a tuple."""
     return list(item) if isinstance(item, tuple) else item
 
 
+class _MarshalledTableCache:
+    """A thread-safe LRU cache for marshalled dataframes, bounded by the
+    total size of their payloads.
+
+    Entries are keyed by a fingerprint of the dataframe content, so
+    dataframes that didn't change between reruns don't need to be converted
+    to Arrow again.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._cache: LRUCache[str, MarshalledTable] = LRUCache(
+            maxsize=max_bytes, getsizeof=lambda table: sum(map(len, table))
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> MarshalledTable | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, table: MarshalledTable) -> None:
+        with self._lock:
+            try:
+                self._cache[key] = table
+            except ValueError:
+                # The table is larger than the whole cache.
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_marshalled_table_cache: Final = _MarshalledTableCache(
+    _MARSHALLED_TABLE_CACHE_MAX_BYTES
+)
+
+
 def marshall(
     proto: ArrowTableProto, data: Any, default_uuid: str | None = None
 ) -> None:
@@ -44,18 +95,170 @@ def marshall(
     proto : proto.ArrowTable
         Output. The protobuf for a Streamlit ArrowTable proto.
 
-    data : pandas.DataFrame, pandas.Styler, numpy.ndarray, Iterable, dict, or None
+    data : pandas.DataFrame, pandas.Styler, pyarrow.Table, polars.DataFrame, numpy.ndarray, Iterable, dict, or None
         Something that is or can be converted to a dataframe.
 
     """
     if dataframe_util.is_pandas_styler(data):
         pandas_styler_utils.marshall_styler(proto, data, default_uuid)  # type: ignore
+    else:
+        table = _maybe_convert_to_arrow_table(data)
+        if table is not None:
+            _marshall_arrow_table(proto, table)
+            return
 
     df = dataframe_util.convert_anything_to_pandas_df(data)
+
+    fingerprint = _get_dataframe_fingerprint(df)
+    if fingerprint is not None:
+        marshalled_table = _marshalled_table_cache.get(fingerprint)
+        if marshalled_table is not None:
+            proto.data, proto.index, proto.columns = marshalled_table
+            return
+
     _marshall_index(proto, df.index)
     _marshall_columns(proto, df.columns)
     _marshall_data(proto, df)
 
+    if fingerprint is not None:
+        _marshalled_table_cache.set(
+            fingerprint, (proto.data, proto.index, proto.columns)
+        )
+
+
+def _maybe_convert_to_arrow_table(data: Any) -> pa.Table | None:
+    """Return data as a pyarrow.Table if it's already in an Arrow-based
+    format, or None if it needs to be converted via pandas.
+    """
+    import pyarrow as pa
+
+    if isinstance(data, pa.Table):
+        return data
+    if dataframe_util.is_polars_dataframe(data):
+        return data.to_arrow()
+    return None
+
+
+def _marshall_arrow_table(proto: ArrowTableProto, table: pa.Table) -> None:
+    """Marshall a pyarrow.Table into an ArrowTable proto, without converting
+    its data to pandas.
+
+    The table has a default (range) index, like the pandas.DataFrame it
+    would be converted to.
+    """
+    import pandas as pd
+
+    _marshall_index(proto, pd.RangeIndex(table.num_rows))
+    _marshall_columns(proto, pd.Index(table.column_names, dtype=object))
+    proto.data = dataframe_util.convert_arrow_table_to_arrow_bytes(
+        _convert_to_compatible_types(table)
+    )
+
+
+def _convert_to_compatible_types(table: pa.Table) -> pa.Table:
+    """Cast columns with large or view types to their regular variant.
+
+    These types are produced by Polars, but the Arrow version bundled with a
+    component might not support them.
+    """
+    import pyarrow as pa
+
+    compatible_types = {
+        pa.large_string(): pa.string(),
+        pa.large_binary(): pa.binary(),
+    }
+    if hasattr(pa, "string_view"):
+        compatible_types[pa.string_view()] = pa.string()
+        compatible_types[pa.binary_view()] = pa.binary()
+
+    schema = pa.schema(
+        [
+            field.with_type(compatible_types.get(field.type, field.type))
+            for field in table.schema
+        ],
+        metadata=table.schema.metadata,
+    )
+    if schema.equals(table.schema):
+        return table
+    return table.cast(schema)
+
+
+def _get_dataframe_fingerprint(df: DataFrame) -> str | None:
+    """Compute a fingerprint of the content of a dataframe.
+
+    Returns None if the dataframe contains types that can't be fingerprinted
+    reliably (e.g. categorical, extension, or mixed object columns), in which
+    case it isn't reused.
+    """
+    import pandas as pd
+
+    if isinstance(df.index, pd.MultiIndex) or isinstance(df.columns, pd.MultiIndex):
+        return None
+
+    h = hashlib.new("md5", **HASHLIB_KWARGS)
+    # The payloads depend on the truncation settings.
+    h.update(
+        repr(
+            (
+                config.get_option("server.enableArrowTruncation"),
+                config.get_option("server.maxMessageSize"),
+                df.shape,
+                list(df.columns),
+                list(df.dtypes),
+                df.columns.name,
+                df.index.dtype,
+                df.index.name,
+            )
+        ).encode()
+    )
+
+    if isinstance(df.index, pd.RangeIndex):
+        h.update(repr(df.index).encode())
+    else:
+        index_buffer = _get_hashable_buffer(df.index.values)
+        if index_buffer is None:
+            return None
+        h.update(index_buffer)
+
+    for _, column in df.items():
+        column_buffer = _get_hashable_buffer(column.values)
+        if column_buffer is None:
+            return None
+        h.update(column_buffer)
+
+    return h.hexdigest()
+
+
+def _get_hashable_buffer(values: Any) -> np.ndarray[Any, Any] | None:
+    """Return a buffer that identifies the values of a column or index, or
+    None if the values can't be fingerprinted.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(values, np.ndarray):
+        return None
+
+    if values.dtype.kind == "O":
+        # pandas hashes objects other than strings by their string
+        # representation, so e.g. 1 and "1" would have the same hash.
+        if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+            return None
+        return pd.util.hash_array(values)
+    return np.ascontiguousarray(values).view(np.uint8)
+
+
+def _index_to_dataframe(index: Index) -> DataFrame:
+    """Convert an index to a dataframe with a column for each level."""
+    import numpy as np
+    import pandas as pd
+
+    values = index.values
+    if len(index) > 0 and isinstance(values, np.ndarray) and values.dtype.kind != "O":
+        # Same result as the row-by-row conversion below, but vectorized.
+        return pd.DataFrame({0: values})
+    return pd.DataFrame(map(_maybe_tuple_to_list, values))
+
 
 def _marshall_index(proto: ArrowTableProto, index: Index) -> None:
     """Marshall pandas.DataFrame index into an ArrowTable proto.
@@ -70,10 +273,7 @@ def _marshall_index(proto: ArrowTableProto, index: Index) -> None:
         Will default to RangeIndex (0, 1, 2, ..., n) if no index is provided.
 
     """
-    import pandas as pd
-
-    index = map(_maybe_tuple_to_list, index.values)
-    index_df = pd.DataFrame(index)
+    index_df = _index_to_dataframe(index)
     proto.index = dataframe_util.convert_pandas_df_to_arrow_bytes(index_df)
 
 
@@ -90,10 +290,7 @@ def _marshall_columns(proto: ArrowTableProto, columns: Series) -> None:
         Will default to RangeIndex (0, 1, 2, ..., n) if no column labels are provided.
 
     """
-    import pandas as pd
-
-    columns = map(_maybe_tuple_to_list, columns.values)
-    columns_df = pd.DataFrame(columns)
+    columns_df = _index_to_dataframe(columns)
     proto.columns = dataframe_util.convert_pandas_df_to_arrow_bytes(columns_df)
 
 
@@ -52,6 +52,16 @@ _config_options_template: dict[str, ConfigOption] = OrderedDict()
 # Stores the current state of config options.
 _config_options: dict[str, ConfigOption] | None = None
 
+# A snapshot of the values in _config_options, which lets get_option read them
+# without grabbing _config_lock. The snapshot is never mutated: it's replaced
+# as a whole whenever an option changes, and it's only valid for the
+# _config_options dict that it was built from. Options whose values are
+# computed on each access aren't part of it.
+_config_values_snapshot: tuple[dict[str, ConfigOption] | None, dict[str, Any]] = (
+    None,
+    {},
+)
+
 
 # Indicates that a config option was defined by the user.
 _USER_DEFINED = "<user defined>"
@@ -157,6 +167,14 @@ def get_option(key: str) -> Any:
     >>> color = st.get_option("theme.primaryColor")
 
     """
+    snapshot_options, snapshot_values = _config_values_snapshot
+    if snapshot_options is not None and snapshot_options is _config_options:
+        try:
+            return snapshot_values[key]
+        except KeyError:
+            # The option is computed on each access, or doesn't exist.
+            pass
+
     with _config_lock:
         config_options = get_config_options()
 
@@ -282,6 +300,7 @@ def _delete_option(key: str) -> None:
             _config_options is not None
         ), "_config_options should always be populated here."
         del _config_options[key]
+        _update_config_values_snapshot()
     except Exception:
         # We don't care if the option already doesn't exist.
         pass
@@ -386,6 +405,19 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "global.enableDeltaDiffing",
+    description="""
+        If True, the server remembers the last element sent to each client
+        at every position of the app. When a rerun produces an identical
+        element at the same position, only a small "unchanged" marker is
+        sent instead of the element.
+    """,
+    visibility="hidden",
+    default_val=True,
+    type_=bool,
+)
+
 _create_option(
     "global.storeCachedForwardMessagesInMemory",
     description="""
@@ -576,6 +608,109 @@ _create_option(
     type_=str,
 )
 
+_create_option(
+    "runner.cacheHashFullData",
+    description="""
+        Hash the full contents of large dataframes and NumPy arrays that are
+        passed to functions decorated with st.cache_data or st.cache_resource.
+
+        By default, only a sample of the rows of dataframes with at least
+        100,000 rows, and of the elements of arrays with at least 1,000,000
+        elements, is hashed to compute the cache key. This is faster, but
+        changes to values outside of the sample don't invalidate the cached
+        result.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
+_create_option(
+    "runner.cacheMaxSize",
+    description="""
+        The maximum total size, in megabytes, of the entries that functions
+        decorated with st.cache_data and st.cache_resource keep in memory.
+
+        When the caches grow larger, the least recently used entries of the
+        largest caches are evicted. Set to 0 to not limit the size of the
+        caches.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.cacheDiskCompression",
+    description="""
+        How to compress the entries of functions decorated with
+        st.cache_data(persist="disk") on disk. One of "none", "zlib", "lz4",
+        or "zstd". "lz4" and "zstd" require the lz4 and zstandard packages.
+    """,
+    default_val="none",
+    type_=str,
+)
+
+_create_option(
+    "runner.cacheMaxDiskSize",
+    description="""
+        The maximum total size, in megabytes, of the entries that functions
+        decorated with st.cache_data(persist="disk") store on disk.
+
+        When the entries grow larger, the least recently used entries are
+        deleted. Set to 0 to not limit the size of the entries.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.cacheStorage",
+    description="""
+        Where functions decorated with st.cache_data store their entries.
+
+        Allowed values:
+        * "memory"        : Each server process keeps its entries in its own
+                            memory.
+        * "shared_memory" : All server processes on the same machine share
+                            their entries in shared memory (/dev/shm where
+                            available), so that running several processes
+                            doesn't compute and hold the same entries
+                            several times.
+
+        With either value, st.cache_data(persist="disk") also stores entries
+        on disk.
+    """,
+    default_val="memory",
+    type_=str,
+)
+
+_create_option(
+    "runner.cacheMaxSharedMemorySize",
+    description="""
+        The maximum total size, in megabytes, of the st.cache_data entries in
+        shared memory when runner.cacheStorage is "shared_memory".
+
+        When the entries grow larger, the least recently used entries are
+        deleted. Set to 0 to not limit the size of the entries.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.maxConcurrentScriptRuns",
+    description="""
+        The maximum number of script runs that may execute at the same time
+        across all sessions. Additional runs wait in a first-come, first-served
+        queue until a slot frees up, and rerun requests of a waiting session
+        are coalesced into its queued run. This turns load spikes into latency
+        instead of oversubscribing the CPU and memory.
+
+        Set to 0 (the default) to not limit the number of concurrent runs.
+    """,
+    default_val=0,
+    type_=int,
+)
+
 # Config Section: Server #
 
 _create_section("server", "Settings for the Streamlit server")
@@ -756,6 +891,22 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.maxSessionBufferSize",
+    description="""
+        Max size, in megabytes, of the messages that a session can have
+        waiting to be written to its WebSocket connection. Once a client
+        falls behind by more than this, no more messages are sent to it until
+        it catches up. In the meantime, its outgoing messages are held back
+        and combined, e.g. a chart that is updated many times is only sent
+        once with its latest data.
+
+        Set to 0 to not limit the buffer size.
+    """,
+    default_val=16,
+    type_=int,
+)
+
 _create_option(
     "server.enableArrowTruncation",
     description="""
@@ -768,6 +919,20 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.addRowsMaxRows",
+    description="""
+        Maximum number of rows kept by an element that is continuously
+        extended via `add_rows()`. Once an element exceeds this limit, the
+        oldest rows are dropped. This prevents long-running data streams from
+        growing without bounds.
+
+        Set to 0 to keep all rows.
+    """,
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "server.enableWebsocketCompression",
     description="""
@@ -798,6 +963,104 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.disconnectedSessionMaxEntries",
+    description="""
+        The maximum number of sessions whose websockets have been disconnected
+        that the server keeps in memory. If exceeded, the sessions that
+        disconnected least recently are cleaned up before
+        server.disconnectedSessionTTL has passed. With server.workers, this
+        applies to each worker.
+    """,
+    default_val=128,
+    type_=int,
+)
+
+_create_option(
+    "server.sessionStoragePath",
+    description="""
+        Path of an SQLite database in which the session_state of disconnected
+        sessions is persisted. If set, clients that reconnect to a session that
+        the server no longer holds in memory (e.g. because the server was
+        restarted) resume the session with the session_state values that were set
+        by the app, instead of starting from scratch. Only values that can be
+        pickled are persisted.
+
+        If unset, disconnected sessions are only kept in memory for
+        server.disconnectedSessionTTL seconds.
+
+        The database must only be writable by the Streamlit server.
+
+        Default: (unset)
+    """,
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "server.sessionStorageMaxEntries",
+    description="""
+        The maximum number of sessions whose session_state is persisted in
+        server.sessionStoragePath. If exceeded, the states of the sessions that
+        disconnected least recently are removed.
+    """,
+    default_val=10000,
+    type_=int,
+)
+
+_create_option(
+    "server.sessionStorageTTL",
+    description="""
+        TTL in seconds for the session_state of disconnected sessions persisted in
+        server.sessionStoragePath.
+    """,
+    default_val=24 * 60 * 60,
+    type_=int,
+)
+
+_create_option(
+    "server.sessionHibernationTimeout",
+    description="""
+        Time in seconds after which idle sessions are hibernated. A session is
+        idle if its script isn't running and it didn't receive any messages from
+        its client, except for heartbeats.
+
+        When a session is hibernated, the session_state values set by the app
+        are moved from memory to a temporary file, and the session's references
+        to cached messages are released. Only values that can be pickled are
+        moved, and they are restored as copies. The session is restored as soon
+        as its client interacts with the app again.
+
+        Default: (disabled)
+    """,
+    default_val=None,
+    type_=int,
+)
+
+_create_option(
+    "server.workers",
+    description="""
+        The number of worker processes that run app sessions.
+
+        If this is larger than 1, the server process only routes requests: each
+        websocket session is assigned to one of the worker processes, which
+        runs its script. Reconnecting sessions are routed back to the worker
+        that holds their state. This allows CPU-heavy apps to use multiple
+        cores. Since every worker is a separate process, st.cache_resource and
+        st.cache_data (with the default in-memory storage) are not shared
+        between workers.
+
+        The metrics at /_stcore/metrics combine the metrics of all workers,
+        with a "worker" label that holds the index of the worker. The server
+        is only reported as healthy at /_stcore/health if all workers are.
+
+        This is only supported on platforms that can fork processes (Linux
+        and macOS).
+    """,
+    default_val=1,
+    type_=int,
+)
+
 # Config Section: Browser #
 
 _create_section("browser", "Configuration of non-UI browser options.")
@@ -1102,6 +1365,33 @@ def _set_option(key: str, value: Any, where_defined: str) -> None:
 
     else:
         _config_options[key].set_value(value, where_defined)
+        # While config files are being parsed, the snapshot still belongs to
+        # the previous options, and it's only updated once parsing is done.
+        if _config_values_snapshot[0] is _config_options:
+            _update_config_values_snapshot()
+
+
+def _update_config_values_snapshot() -> None:
+    """Replace the snapshot that get_option reads from with one that holds
+    the current values of _config_options.
+
+    This must be called while holding _config_lock.
+    """
+    global _config_values_snapshot
+
+    config_options = _config_options
+    if config_options is None:
+        _config_values_snapshot = (None, {})
+        return
+
+    _config_values_snapshot = (
+        config_options,
+        {
+            key: option.value
+            for key, option in config_options.items()
+            if not option.is_computed
+        },
+    )
 
 
 def _update_config_with_sensitive_env_var(config_options: dict[str, ConfigOption]):
@@ -1274,6 +1564,7 @@ def get_config_options(
                 " To have these changes be reflected, please restart streamlit."
             )
 
+        _update_config_values_snapshot()
         _on_config_parsed.send()
         return _config_options
 
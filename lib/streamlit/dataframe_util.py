@@ -796,8 +796,11 @@ def convert_arrow_table_to_arrow_bytes(table: pa.Table) -> bytes:
     return cast(bytes, sink.getvalue().to_pybytes())
 
 
-def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
-    """Serialize pandas.DataFrame to Arrow IPC bytes.
+def convert_pandas_df_to_arrow_table(df: DataFrame) -> pa.Table:
+    """Convert pandas.DataFrame to a pyarrow.Table.
+
+    If the dataframe contains column types that are not supported by Arrow,
+    those columns will be automatically fixed to be Arrow-compatible.
 
     Parameters
     ----------
@@ -806,13 +809,13 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
 
     Returns
     -------
-    bytes
-        The serialized Arrow IPC bytes.
+    pyarrow.Table
+        The converted Arrow table.
     """
     import pyarrow as pa
 
     try:
-        table = pa.Table.from_pandas(df)
+        return pa.Table.from_pandas(df)
     except (pa.ArrowTypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
         _LOGGER.info(
             "Serialization of dataframe to Arrow table was unsuccessful due to: %s. "
@@ -821,8 +824,23 @@ def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
             ex,
         )
         df = fix_arrow_incompatible_column_types(df)
-        table = pa.Table.from_pandas(df)
-    return convert_arrow_table_to_arrow_bytes(table)
+        return pa.Table.from_pandas(df)
+
+
+def convert_pandas_df_to_arrow_bytes(df: DataFrame) -> bytes:
+    """Serialize pandas.DataFrame to Arrow IPC bytes.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe to convert.
+
+    Returns
+    -------
+    bytes
+        The serialized Arrow IPC bytes.
+    """
+    return convert_arrow_table_to_arrow_bytes(convert_pandas_df_to_arrow_table(df))
 
 
 def convert_arrow_bytes_to_pandas_df(source: bytes) -> DataFrame:
@@ -96,6 +96,7 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.proto import Block_pb2, ForwardMsg_pb2
 from streamlit.proto.RootContainer_pb2 import RootContainer
 from streamlit.runtime import caching
+from streamlit.runtime.forward_msg_cache import populate_hash_from_element_hash
 from streamlit.runtime.scriptrunner import enqueue_message as _enqueue_message
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 
@@ -420,6 +421,7 @@ class DeltaGenerator(
         element_proto: Message,
         add_rows_metadata: AddRowsMetadata | None = None,
         user_key: str | None = None,
+        element_hash: str | None = None,
     ) -> DeltaGenerator:
         """Create NewElement delta, fill it, and enqueue it.
 
@@ -433,6 +435,10 @@ class DeltaGenerator(
             Metadata for the add_rows method
         user_key : str or None
             A custom key for the element provided by the user.
+        element_hash : str or None
+            The hash of element_proto, if it's already known, e.g. because the
+            element is replayed from a cached function. The message's hash is
+            then computed from it, instead of by serializing the message.
 
         Returns
         -------
@@ -458,6 +464,10 @@ class DeltaGenerator(
         msg = ForwardMsg_pb2.ForwardMsg()
         msg_el_proto = getattr(msg.delta.new_element, delta_type)
         msg_el_proto.CopyFrom(element_proto)
+        if element_hash is not None:
+            populate_hash_from_element_hash(
+                msg, element_hash, ctx.current_fragment_id if ctx else None
+            )
 
         # Only enqueue message and fill in metadata if there's a container.
         msg_was_enqueued = False
@@ -495,6 +505,7 @@ class DeltaGenerator(
             invoked_dg_id=self.id,
             used_dg_id=dg.id,
             returned_dg_id=output_dg.id,
+            element_hash=element_hash,
         )
 
         return output_dg
@@ -30,7 +30,7 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from streamlit import dataframe_util
+from streamlit import config, dataframe_util
 from streamlit.elements.lib.column_config_utils import (
     INDEX_IDENTIFIER,
     ColumnConfigMappingInput,
@@ -55,6 +55,7 @@ from streamlit.runtime.scriptrunner_utils.script_run_context import (
 from streamlit.runtime.state import WidgetCallback, register_widget
 
 if TYPE_CHECKING:
+    import pyarrow as pa
     from numpy import typing as npt
     from pandas import DataFrame
 
@@ -719,6 +720,16 @@ def _prep_data_for_add_rows(
             # When calling add_rows on st.table or st.dataframe we want styles to
             # pass through.
             return data, None
+
+        import pyarrow as pa
+
+        # Arrow-native data is shipped as-is without a roundtrip through pandas.
+        if isinstance(data, pa.Table):
+            return data, None
+        if isinstance(data, pa.RecordBatch):
+            return pa.Table.from_batches([data]), None
+        if dataframe_util.is_polars_dataframe(data):
+            return data.to_arrow(), None
         return dataframe_util.convert_anything_to_pandas_df(data), None
 
     # If add_rows_metadata is set, it indicates that the add_rows used called
@@ -832,18 +843,76 @@ def _arrow_add_rows(
     msg = ForwardMsg()
     msg.metadata.delta_path[:] = dg._cursor.delta_path
 
-    default_uuid = str(hash(dg._get_delta_path_str()))
-    marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
+    if dataframe_util.is_pandas_styler(new_data):
+        default_uuid = str(hash(dg._get_delta_path_str()))
+        marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
+    else:
+        # The Arrow schema of the first appended chunk is stored with the
+        # cursor, so that all following chunks are serialized with the exact
+        # same column types.
+        table, dg._cursor.props["add_rows_schema"] = _convert_to_add_rows_table(
+            new_data, dg._cursor.props.get("add_rows_schema")
+        )
+        msg.delta.arrow_add_rows.data.data = (
+            dataframe_util.convert_arrow_table_to_arrow_bytes(table)
+        )
 
     if name:
         msg.delta.arrow_add_rows.name = name
         msg.delta.arrow_add_rows.has_name = True
 
+    max_rows = config.get_option("server.addRowsMaxRows")
+    if max_rows > 0:
+        msg.delta.arrow_add_rows.max_rows = max_rows
+
     enqueue_message(msg)
 
     return dg
 
 
+def _convert_to_add_rows_table(
+    data: Data, schema: pa.Schema | None
+) -> tuple[pa.Table, pa.Schema]:
+    """Convert an add_rows chunk to a pyarrow.Table matching the given schema.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame or pyarrow.Table
+        The prepared chunk of rows to append.
+
+    schema : pyarrow.Schema or None
+        The schema negotiated with the first chunk appended to this element.
+        If None, the schema of the converted chunk becomes the negotiated one.
+
+    Returns
+    -------
+    tuple[pyarrow.Table, pyarrow.Schema]
+        The converted table and the schema to use for the following chunks.
+    """
+    import pyarrow as pa
+
+    if isinstance(data, pa.Table):
+        table = data
+    else:
+        table = dataframe_util.convert_pandas_df_to_arrow_table(
+            dataframe_util.convert_anything_to_pandas_df(data)
+        )
+
+    if schema is None:
+        return table, table.schema
+
+    if table.schema.names == schema.names and not table.schema.equals(schema):
+        try:
+            # Keep the metadata of the new chunk since it contains
+            # chunk-specific information (e.g. the range index bounds).
+            table = table.cast(schema.with_metadata(table.schema.metadata))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            # The frontend will show a proper error message about
+            # the mismatching types.
+            pass
+    return table, schema
+
+
 def marshall(proto: ArrowProto, data: Data, default_uuid: str | None = None) -> None:
     """Marshall pandas.DataFrame into an Arrow proto.
 
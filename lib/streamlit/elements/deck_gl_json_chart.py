@@ -31,7 +31,7 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from streamlit import config
+from streamlit import config, dataframe_util
 from streamlit.elements.lib.event_utils import AttributeDictionary
 from streamlit.elements.lib.form_utils import current_form_id
 from streamlit.elements.lib.policies import check_widget_policies
@@ -44,8 +44,10 @@ from streamlit.runtime.state import (
     WidgetCallback,
     register_widget,
 )
+from streamlit.util import calc_md5
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from pydeck import Deck
 
     from streamlit.delta_generator import DeltaGenerator
@@ -56,6 +58,14 @@ EMPTY_MAP: Final[Mapping[str, Any]] = {
     "initialViewState": {"latitude": 0, "longitude": 0, "pitch": 0, "zoom": 1},
 }
 
+# Layers with at least this many rows are sent to the frontend as Arrow IPC
+# instead of being inlined as JSON records into the spec.
+ARROW_LAYER_DATA_MIN_ROWS: Final = 1000
+
+# Prefix of the placeholder that references Arrow layer data in the JSON spec.
+# This needs to be kept in sync with the frontend.
+_ARROW_LAYER_DATA_REF_PREFIX: Final = "@@streamlit-arrow-data:"
+
 SelectionMode: TypeAlias = Literal["single-object", "multi-object"]
 _SELECTION_MODES: Final[set[SelectionMode]] = {
     "single-object",
@@ -454,7 +464,7 @@ class PydeckMixin:
         if pydeck_obj is None:
             spec = json.dumps(EMPTY_MAP)
         else:
-            spec = pydeck_obj.to_json()
+            spec = _pydeck_to_json(pydeck_obj, pydeck_proto)
 
         pydeck_proto.json = spec
         pydeck_proto.use_container_width = use_container_width
@@ -503,6 +513,10 @@ class PydeckMixin:
                 selection_mode=selection_mode,
                 use_container_width=use_container_width,
                 spec=spec,
+                arrow_data=[
+                    calc_md5(pydeck_proto.arrow_data[ref].data)
+                    for ref in sorted(pydeck_proto.arrow_data)
+                ],
                 form_id=pydeck_proto.form_id,
             )
 
@@ -529,6 +543,86 @@ class PydeckMixin:
         return cast("DeltaGenerator", self)
 
 
+def marshall_layer_data(
+    pydeck_proto: PydeckProto, layer_ref: str, data: DataFrame | list[Any]
+) -> list[Any] | str:
+    """Marshall the data of a layer into the Arrow data of the proto if it is
+    large enough to benefit from a binary columnar transport.
+
+    Parameters
+    ----------
+    pydeck_proto : DeckGlJsonChartProto
+        The proto to add the Arrow data to.
+
+    layer_ref : str
+        A name for the layer data that is unique within the chart.
+
+    data : pandas.DataFrame or list of dict
+        The data of the layer.
+
+    Returns
+    -------
+    list of dict or str
+        The value to use as data of the layer in the JSON spec. This is either
+        a reference to the marshalled Arrow data, or the data as a list of
+        records if it was not marshalled.
+    """
+    import pyarrow as pa
+
+    records = data if isinstance(data, list) else None
+    table = None
+
+    if len(data) >= ARROW_LAYER_DATA_MIN_ROWS:
+        try:
+            if records is None:
+                table = pa.Table.from_pandas(data, preserve_index=False)
+            elif _is_uniform_records(records):
+                table = pa.Table.from_pylist(records)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            # The data is not Arrow-compatible, so we keep it inline.
+            pass
+
+    if table is None:
+        return records if records is not None else data.to_dict("records")
+
+    pydeck_proto.arrow_data[
+        layer_ref
+    ].data = dataframe_util.convert_arrow_table_to_arrow_bytes(table)
+    return f"{_ARROW_LAYER_DATA_REF_PREFIX}{layer_ref}"
+
+
+def _is_uniform_records(data: list[Any]) -> bool:
+    """True if data is a list of dicts that all have the same keys."""
+    if not isinstance(data[0], dict):
+        return False
+    keys = data[0].keys()
+    return all(isinstance(row, dict) and row.keys() == keys for row in data)
+
+
+def _pydeck_to_json(pydeck_obj: Deck, pydeck_proto: PydeckProto) -> str:
+    """Serialize the pydeck object to JSON, moving large layer data into
+    the Arrow data of the proto."""
+    replaced_data: list[tuple[Any, list[Any]]] = []
+    try:
+        for i, layer in enumerate(getattr(pydeck_obj, "layers", None) or []):
+            data = getattr(layer, "data", None)
+            # Data of layers using pydeck's binary transport is not part of
+            # the JSON and other data types (e.g. URLs) are kept as-is.
+            if isinstance(data, list) and not getattr(
+                layer, "use_binary_transport", False
+            ):
+                layer_data = marshall_layer_data(pydeck_proto, str(i), data)
+                if isinstance(layer_data, str):
+                    replaced_data.append((layer, data))
+                    layer.data = layer_data
+
+        return cast(str, pydeck_obj.to_json())
+    finally:
+        # Restore the original data so that the pydeck object is not modified.
+        for layer, data in replaced_data:
+            layer.data = data
+
+
 def _get_pydeck_tooltip(pydeck_obj: Deck | None) -> dict[str, str] | None:
     if pydeck_obj is None:
         return None
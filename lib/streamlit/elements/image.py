@@ -21,12 +21,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import os
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import IntEnum
-from typing import TYPE_CHECKING, Final, Literal, Sequence, Union, cast
+from typing import TYPE_CHECKING, Final, Literal, Sequence, Tuple, Union, cast
 
+from cachetools import LRUCache
 from typing_extensions import TypeAlias
 
 from streamlit import runtime, url_util
@@ -36,6 +40,7 @@ from streamlit.proto.Image_pb2 import ImageList as ImageListProto
 from streamlit.runtime import caching
 from streamlit.runtime.metrics_util import gather_metrics
 from streamlit.type_util import NumpyShape
+from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
     from typing import Any
@@ -51,6 +56,13 @@ if TYPE_CHECKING:
 # DPI.
 MAXIMUM_CONTENT_WIDTH: Final[int] = 2 * 730
 
+# The maximum total size of the encoded images kept in the encoded image cache.
+_ENCODED_IMAGE_CACHE_MAX_BYTES: Final[int] = 128 * 1024 * 1024
+
+# The maximum number of threads used to encode the images of a single call.
+# Encoding is mostly done by PIL, which releases the GIL.
+_MAX_ENCODING_WORKERS: Final[int] = 4
+
 PILImage: TypeAlias = Union[
     "ImageFile.ImageFile", "Image.Image", "GifImagePlugin.GifImageFile"
 ]
@@ -60,6 +72,7 @@ UseColumnWith: TypeAlias = Union[Literal["auto", "always", "never"], bool, None]
 Channels: TypeAlias = Literal["RGB", "BGR"]
 ImageFormat: TypeAlias = Literal["JPEG", "PNG", "GIF"]
 ImageFormatOrAuto: TypeAlias = Literal[ImageFormat, "auto"]
+EncodedImage: TypeAlias = Tuple[bytes, ImageFormat]
 
 
 # @see Image.proto
@@ -374,75 +387,89 @@ def _clip_image(image: npt.NDArray[Any], clamp: bool) -> npt.NDArray[Any]:
     return data
 
 
-def image_to_url(
-    image: AtomicImage,
+class _EncodedImageCache:
+    """A thread-safe LRU cache for encoded images, bounded by the total size
+    of the encoded image bytes.
+
+    Entries are keyed by a fingerprint of the image content and all
+    parameters that affect the encoded output, so images that didn't change
+    between reruns don't need to be encoded again.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._cache: LRUCache[str, EncodedImage] = LRUCache(
+            maxsize=max_bytes, getsizeof=lambda encoded_image: len(encoded_image[0])
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> EncodedImage | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, encoded_image: EncodedImage) -> None:
+        with self._lock:
+            try:
+                self._cache[key] = encoded_image
+            except ValueError:
+                # The image is larger than the whole cache.
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_encoded_image_cache: Final = _EncodedImageCache(_ENCODED_IMAGE_CACHE_MAX_BYTES)
+_encoding_executor: Final = ThreadPoolExecutor(
+    max_workers=_MAX_ENCODING_WORKERS, thread_name_prefix="ImageEncoder"
+)
+
+
+def _get_encoded_image_cache_key(
+    image: PILImage | npt.NDArray[Any] | io.BytesIO | bytes,
     width: int,
     clamp: bool,
     channels: Channels,
     output_format: ImageFormatOrAuto,
-    image_id: str,
 ) -> str:
-    """Return a URL that an image can be served from.
-    If `image` is already a URL, return it unmodified.
-    Otherwise, add the image to the MediaFileManager and return the URL.
-
-    (When running in "raw" mode, we won't actually load data into the
-    MediaFileManager, and we'll return an empty URL.)
-    """
+    """Compute a fingerprint of the image content and the encoding parameters."""
     import numpy as np
     from PIL import Image, ImageFile
 
-    image_data: bytes
+    h = hashlib.new("md5", **HASHLIB_KWARGS)
+    h.update(f"{width}-{clamp}-{channels}-{output_format}".encode())
 
-    # Strings
-    if isinstance(image, str):
-        if not os.path.isfile(image) and url_util.is_url(
-            image, allowed_schemas=("http", "https", "data")
-        ):
-            # If it's a url, return it directly.
-            return image
-
-        if image.endswith(".svg") and os.path.isfile(image):
-            # Unpack local SVG image file to an SVG string
-            with open(image) as textfile:
-                image = textfile.read()
-
-        # Following regex allows svg image files to start either via a "<?xml...>" tag
-        # eventually followed by a "<svg...>" tag or directly starting with a "<svg>" tag
-        if re.search(r"(^\s?(<\?xml[\s\S]*<svg\s)|^\s?<svg\s|^\s?<svg>\s)", image):
-            if "xmlns" not in image:
-                # The xmlns attribute is required for SVGs to render in an img tag.
-                # If it's not present, we add to the first SVG tag:
-                image = image.replace(
-                    "<svg", '<svg xmlns="http://www.w3.org/2000/svg" ', 1
-                )
-            # Convert to base64 to prevent issues with encoding:
-            import base64
+    if isinstance(image, (ImageFile.ImageFile, Image.Image)):
+        h.update(f"{type(image)}-{image.mode}-{image.size}-{image.format}".encode())
+        h.update(bytes(image.getpalette() or []))
+        h.update(image.tobytes())
+    elif isinstance(image, io.BytesIO):
+        h.update(image.getbuffer())
+    elif isinstance(image, np.ndarray):
+        h.update(f"{image.dtype}-{image.shape}".encode())
+        h.update(np.ascontiguousarray(image).data)
+    else:
+        h.update(image)
 
-            image_b64_encoded = base64.b64encode(image.encode("utf-8")).decode("utf-8")
-            # Return SVG as data URI:
-            return f"data:image/svg+xml;base64,{image_b64_encoded}"
+    return h.hexdigest()
 
-        # Otherwise, try to open it as a file.
-        try:
-            with open(image, "rb") as f:
-                image_data = f.read()
-        except Exception:
-            # When we aren't able to open the image file, we still pass the path to
-            # the MediaFileManager - its storage backend may have access to files
-            # that Streamlit does not.
-            import mimetypes
 
-            mimetype, _ = mimetypes.guess_type(image)
-            if mimetype is None:
-                mimetype = "application/octet-stream"
+def _encode_image(
+    image: PILImage | npt.NDArray[Any] | io.BytesIO | bytes,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> EncodedImage:
+    """Encode the image into bytes of a format supported by the frontend,
+    resizing it if necessary. Return the image bytes and their format."""
+    import numpy as np
+    from PIL import Image, ImageFile
 
-            url = runtime.get_instance().media_file_mgr.add(image, mimetype, image_id)
-            caching.save_media_data(image, mimetype, image_id)
-            return url
+    image_data: bytes
 
     # PIL Images
-    elif isinstance(image, (ImageFile.ImageFile, Image.Image)):
+    if isinstance(image, (ImageFile.ImageFile, Image.Image)):
         format = _validate_image_format_string(image, output_format)
         image_data = _PIL_to_bytes(image, format)
 
@@ -481,9 +508,37 @@ def image_to_url(
     else:
         image_data = image
 
-    # Determine the image's format, resize it, and get its mimetype
+    # Determine the image's format and resize it
     image_format = _validate_image_format_string(image_data, output_format)
     image_data = _ensure_image_size_and_format(image_data, width, image_format)
+    return image_data, image_format
+
+
+def _get_encoded_image(
+    image: PILImage | npt.NDArray[Any] | io.BytesIO | bytes,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> EncodedImage:
+    """Return the encoded image from the encoded image cache, or encode
+    it if it isn't cached yet."""
+    if getattr(image, "n_frames", 1) > 1:
+        # The cache key only covers the current frame of a PIL image, so
+        # multi-frame images (e.g. animated GIFs) are always encoded.
+        return _encode_image(image, width, clamp, channels, output_format)
+
+    key = _get_encoded_image_cache_key(image, width, clamp, channels, output_format)
+    encoded_image = _encoded_image_cache.get(key)
+    if encoded_image is None:
+        encoded_image = _encode_image(image, width, clamp, channels, output_format)
+        _encoded_image_cache.set(key, encoded_image)
+    return encoded_image
+
+
+def _register_encoded_image(encoded_image: EncodedImage, image_id: str) -> str:
+    """Add the encoded image to the MediaFileManager and return its URL."""
+    image_data, image_format = encoded_image
     mimetype = _get_image_format_mimetype(image_format)
 
     if runtime.exists():
@@ -495,6 +550,72 @@ def image_to_url(
         return ""
 
 
+def image_to_url(
+    image: AtomicImage,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+    image_id: str,
+) -> str:
+    """Return a URL that an image can be served from.
+    If `image` is already a URL, return it unmodified.
+    Otherwise, add the image to the MediaFileManager and return the URL.
+
+    (When running in "raw" mode, we won't actually load data into the
+    MediaFileManager, and we'll return an empty URL.)
+    """
+    # Strings
+    if isinstance(image, str):
+        if not os.path.isfile(image) and url_util.is_url(
+            image, allowed_schemas=("http", "https", "data")
+        ):
+            # If it's a url, return it directly.
+            return image
+
+        if image.endswith(".svg") and os.path.isfile(image):
+            # Unpack local SVG image file to an SVG string
+            with open(image) as textfile:
+                image = textfile.read()
+
+        # Following regex allows svg image files to start either via a "<?xml...>" tag
+        # eventually followed by a "<svg...>" tag or directly starting with a "<svg>" tag
+        if re.search(r"(^\s?(<\?xml[\s\S]*<svg\s)|^\s?<svg\s|^\s?<svg>\s)", image):
+            if "xmlns" not in image:
+                # The xmlns attribute is required for SVGs to render in an img tag.
+                # If it's not present, we add to the first SVG tag:
+                image = image.replace(
+                    "<svg", '<svg xmlns="http://www.w3.org/2000/svg" ', 1
+                )
+            # Convert to base64 to prevent issues with encoding:
+            import base64
+
+            image_b64_encoded = base64.b64encode(image.encode("utf-8")).decode("utf-8")
+            # Return SVG as data URI:
+            return f"data:image/svg+xml;base64,{image_b64_encoded}"
+
+        # Otherwise, try to open it as a file.
+        try:
+            with open(image, "rb") as f:
+                image = f.read()
+        except Exception:
+            # When we aren't able to open the image file, we still pass the path to
+            # the MediaFileManager - its storage backend may have access to files
+            # that Streamlit does not.
+            import mimetypes
+
+            mimetype, _ = mimetypes.guess_type(image)
+            if mimetype is None:
+                mimetype = "application/octet-stream"
+
+            url = runtime.get_instance().media_file_mgr.add(image, mimetype, image_id)
+            caching.save_media_data(image, mimetype, image_id)
+            return url
+
+    encoded_image = _get_encoded_image(image, width, clamp, channels, output_format)
+    return _register_encoded_image(encoded_image, image_id)
+
+
 def marshall_images(
     coordinates: str,
     image: ImageOrImageList,
@@ -575,9 +696,27 @@ def marshall_images(
         len(images),
     )
 
+    # Encode multiple images in parallel. Strings (URLs, SVGs and file paths)
+    # are handled by image_to_url below. An image that appears more than once
+    # in the list is only encoded once, since PIL images must not be used by
+    # multiple threads at the same time.
+    encoding_futures: dict[int, Future[EncodedImage]] = {}
+    encoded_images: list[Future[EncodedImage] | None] = []
+    for image in images:
+        if len(images) == 1 or isinstance(image, str):
+            encoded_images.append(None)
+            continue
+        if id(image) not in encoding_futures:
+            encoding_futures[id(image)] = _encoding_executor.submit(
+                _get_encoded_image, image, width, clamp, channels, output_format
+            )
+        encoded_images.append(encoding_futures[id(image)])
+
     proto_imgs.width = int(width)
     # Each image in an image list needs to be kept track of at its own coordinates.
-    for coord_suffix, (image, caption) in enumerate(zip(images, captions)):
+    for coord_suffix, (image, caption, encoded_image) in enumerate(
+        zip(images, captions, encoded_images)
+    ):
         proto_img = proto_imgs.imgs.add()
         if caption is not None:
             proto_img.caption = str(caption)
@@ -586,6 +725,10 @@ def marshall_images(
         # MediaFileManager. For this, we just add the index to the image's "coordinates".
         image_id = "%s-%i" % (coordinates, coord_suffix)
 
-        proto_img.url = image_to_url(
-            image, width, clamp, channels, output_format, image_id
-        )
+        if encoded_image is not None:
+            # Registering the image needs to happen on the script thread.
+            proto_img.url = _register_encoded_image(encoded_image.result(), image_id)
+        else:
+            proto_img.url = image_to_url(
+                image, width, clamp, channels, output_format, image_id
+            )
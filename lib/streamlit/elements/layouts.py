@@ -14,12 +14,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Sequence, Union, cast
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Sequence, Union, cast
 
 from typing_extensions import TypeAlias
 
 from streamlit.delta_generator_singletons import get_dg_singleton_instance
-from streamlit.elements.lib.utils import Key, compute_and_register_element_id, to_key
+from streamlit.elements.lib.utils import (
+    SAFE_VALUES,
+    Key,
+    compute_and_register_element_id,
+    to_key,
+)
 from streamlit.errors import (
     StreamlitAPIException,
     StreamlitInvalidColumnGapError,
@@ -28,6 +33,8 @@ from streamlit.errors import (
 )
 from streamlit.proto.Block_pb2 import Block as BlockProto
 from streamlit.runtime.metrics_util import gather_metrics
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.state import register_widget
 from streamlit.string_util import validate_icon_or_emoji
 
 if TYPE_CHECKING:
@@ -36,6 +43,62 @@ if TYPE_CHECKING:
     from streamlit.elements.lib.mutable_status_container import StatusContainer
 
 SpecType: TypeAlias = Union[int, Sequence[Union[int, float]]]
+LazyContent: TypeAlias = Callable[[], object]
+
+
+def _deserialize_opened(ui_value: bool | None, widget_id: str = "") -> bool:
+    return bool(ui_value)
+
+
+def _mark_block_as_lazy(
+    block_proto: BlockProto,
+    element_type: str,
+    content: LazyContent,
+    user_key: str | None,
+    **kwargs: SAFE_VALUES | Iterable[SAFE_VALUES],
+) -> None:
+    """Configure a block proto so that its content is deferred until opened.
+
+    The block ID doubles as the ID of a boolean widget that the frontend sets
+    to True once the user opens the block (e.g. expands the expander or
+    selects the tab). Blocks that have the same arguments and content
+    function, e.g. a lambda defined in a loop, need a user_key to be told
+    apart.
+    """
+    block_proto.lazy = True
+    # The block is sent without any children until it is opened, so it
+    # must be rendered even if it is empty.
+    block_proto.allow_empty = True
+    block_proto.id = compute_and_register_element_id(
+        element_type,
+        user_key=user_key,
+        form_id=None,
+        content=getattr(content, "__qualname__", None),
+        **kwargs,
+    )
+
+
+def _render_lazy_content(
+    block_dg: DeltaGenerator,
+    block_proto: BlockProto,
+    content: LazyContent,
+    is_open: bool,
+) -> None:
+    """Run the content callable within the block if the block was opened."""
+    ctx = get_script_run_ctx()
+    opened = register_widget(
+        block_proto.id,
+        deserializer=_deserialize_opened,
+        serializer=bool,
+        ctx=ctx,
+        value_type="bool_value",
+    ).value
+
+    # Without a script run context (e.g. running as a bare script), there
+    # is no frontend that could report the open state, so render eagerly.
+    if ctx is None or is_open or opened:
+        with block_dg:
+            content()
 
 
 class LayoutsMixin:
@@ -348,7 +411,13 @@ class LayoutsMixin:
         return [row._block(column_proto(w / total_weight)) for w in weights]
 
     @gather_metrics("tabs")
-    def tabs(self, tabs: Sequence[str]) -> Sequence[DeltaGenerator]:
+    def tabs(
+        self,
+        tabs: Sequence[str],
+        *,
+        content: Sequence[LazyContent] | None = None,
+        key: Key | None = None,
+    ) -> Sequence[DeltaGenerator]:
         r"""Insert containers separated into tabs.
 
         Inserts a number of multi-element containers as tabs.
@@ -360,8 +429,8 @@ class LayoutsMixin:
         examples below.
 
         .. warning::
-            All the content of every tab is always sent to and rendered on the frontend.
-            Conditional rendering is currently not supported.
+            Unless ``content`` is provided, all the content of every tab is
+            always sent to and rendered on the frontend.
 
         Parameters
         ----------
@@ -382,6 +451,23 @@ class LayoutsMixin:
             .. |st.markdown| replace:: ``st.markdown``
             .. _st.markdown: https://docs.streamlit.io/develop/api-reference/text/st.markdown
 
+        content : list of callables or None
+            An optional list with one function per tab that renders the tab's
+            content. If this is provided, the tabs are lazy: the function of
+            the first tab is called right away, but the function of every
+            other tab is only called once the user selects that tab for the
+            first time. Selecting a tab for the first time triggers a rerun
+            of the app (or of the fragment containing the tabs). Until then,
+            none of the tab's elements are computed or sent to the frontend,
+            which speeds up apps with many heavy tabs.
+
+        key : str, int, or None
+            An optional string or integer to use as the unique key for lazy
+            tabs. This is only used if ``content`` is provided, and is
+            required to tell apart lazy tabs that have the same labels and
+            content functions, e.g. tabs created in a loop. Multiple elements
+            may not share the same key.
+
         Returns
         -------
         list of containers
@@ -428,6 +514,20 @@ class LayoutsMixin:
             https://doc-tabs2.streamlit.app/
             height: 700px
 
+        Use ``content`` to only compute the content of a tab once it is
+        selected:
+
+        >>> import streamlit as st
+        >>> import numpy as np
+        >>>
+        >>> def show_chart():
+        ...     st.line_chart(np.random.randn(100_000, 3))
+        >>>
+        >>> def show_data():
+        ...     st.dataframe(np.random.randn(100_000, 3))
+        >>>
+        >>> st.tabs(["📈 Chart", "🗃 Data"], content=[show_chart, show_data])
+
         """
         if not tabs:
             raise StreamlitAPIException(
@@ -439,16 +539,53 @@ class LayoutsMixin:
                 "The tabs input list to st.tabs is only allowed to contain strings."
             )
 
+        if content is not None and len(content) != len(tabs):
+            raise StreamlitAPIException(
+                "The content argument to st.tabs must contain exactly one "
+                f"function per tab. Got {len(content)} functions for "
+                f"{len(tabs)} tabs."
+            )
+
         def tab_proto(label: str) -> BlockProto:
             tab_proto = BlockProto()
             tab_proto.tab.label = label
             tab_proto.allow_empty = True
             return tab_proto
 
+        key = to_key(key)
         block_proto = BlockProto()
         block_proto.tab_container.SetInParent()
+        if content is not None and key:
+            # The key is registered once for all tabs, and included in the
+            # ID of each of them.
+            block_proto.id = compute_and_register_element_id(
+                "tabs", user_key=key, form_id=None
+            )
         tab_container = self.dg._block(block_proto)
-        return tuple(tab_container._block(tab_proto(tab_label)) for tab_label in tabs)
+
+        if content is None:
+            return tuple(
+                tab_container._block(tab_proto(tab_label)) for tab_label in tabs
+            )
+
+        tab_dgs = []
+        for index, (tab_label, tab_content) in enumerate(zip(tabs, content)):
+            lazy_tab_proto = tab_proto(tab_label)
+            _mark_block_as_lazy(
+                lazy_tab_proto,
+                "tab",
+                tab_content,
+                user_key=None,
+                key=key,
+                label=tab_label,
+                index=index,
+                tabs=list(tabs),
+            )
+            tab_dg = tab_container._block(lazy_tab_proto)
+            # The first tab is selected by default:
+            _render_lazy_content(tab_dg, lazy_tab_proto, tab_content, index == 0)
+            tab_dgs.append(tab_dg)
+        return tuple(tab_dgs)
 
     @gather_metrics("expander")
     def expander(
@@ -457,6 +594,8 @@ class LayoutsMixin:
         expanded: bool = False,
         *,
         icon: str | None = None,
+        content: LazyContent | None = None,
+        key: Key | None = None,
     ) -> DeltaGenerator:
         r"""Insert a multi-element container that can be expanded/collapsed.
 
@@ -510,6 +649,22 @@ class LayoutsMixin:
               <https://fonts.google.com/icons?icon.set=Material+Symbols&icon.style=Rounded>`_
               font library.
 
+        content : callable or None
+            An optional function that renders the content of the expander. If
+            this is provided, the expander is lazy: the function is only
+            called once the user expands the expander for the first time (or
+            right away if ``expanded`` is True). Expanding the expander for the
+            first time triggers a rerun of the app (or of the fragment
+            containing the expander). Until then, none of the expander's
+            elements are computed or sent to the frontend.
+
+        key : str, int, or None
+            An optional string or integer to use as the unique key for a lazy
+            expander. This is only used if ``content`` is provided, and is
+            required to tell apart lazy expanders that have the same label
+            and content function, e.g. expanders created in a loop. Multiple
+            elements may not share the same key.
+
         Examples
         --------
         You can use the ``with`` notation to insert any element into an expander
@@ -548,6 +703,16 @@ class LayoutsMixin:
             https://doc-expander.streamlit.app/
             height: 750px
 
+        Use ``content`` to only compute the content once it is expanded:
+
+        >>> import streamlit as st
+        >>> import numpy as np
+        >>>
+        >>> def show_details():
+        ...     st.dataframe(np.random.randn(100_000, 3))
+        >>>
+        >>> st.expander("See details", content=show_details)
+
         """
         if label is None:
             raise StreamlitAPIException("A label is required for an expander")
@@ -562,7 +727,20 @@ class LayoutsMixin:
         block_proto.allow_empty = False
         block_proto.expandable.CopyFrom(expandable_proto)
 
-        return self.dg._block(block_proto=block_proto)
+        if content is None:
+            return self.dg._block(block_proto=block_proto)
+
+        _mark_block_as_lazy(
+            block_proto,
+            "expander",
+            content,
+            user_key=to_key(key),
+            label=label,
+            icon=icon,
+        )
+        expander_dg = self.dg._block(block_proto=block_proto)
+        _render_lazy_content(expander_dg, block_proto, content, expanded)
+        return expander_dg
 
     @gather_metrics("popover")
     def popover(
@@ -238,7 +238,7 @@ class MapMixin:
         map_style = None
         map_proto = DeckGlJsonChartProto()
         deck_gl_json = to_deckgl_json(
-            data, latitude, longitude, size, color, map_style, zoom
+            map_proto, data, latitude, longitude, size, color, map_style, zoom
         )
         marshall(
             map_proto, deck_gl_json, use_container_width, width=width, height=height
@@ -252,6 +252,7 @@ class MapMixin:
 
 
 def to_deckgl_json(
+    map_proto: DeckGlJsonChartProto,
     data: Data,
     lat: str | None,
     lon: str | None,
@@ -307,7 +308,7 @@ def to_deckgl_json(
             "radiusMinPixels": 3,
             "radiusUnits": "meters",
             "getFillColor": color_arg,
-            "data": df.to_dict("records"),
+            "data": deck_gl_json_chart.marshall_layer_data(map_proto, "0", df),
         }
     ]
 
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from dataclasses import dataclass
 from typing import (
@@ -77,6 +78,21 @@ FigureOrData: TypeAlias = Union[
 SelectionMode: TypeAlias = Literal["lasso", "points", "box"]
 _SELECTION_MODES: Final[set[SelectionMode]] = {"lasso", "points", "box"}
 
+# Mapping of NumPy dtypes to the typed array dtypes supported by plotly.js.
+_TYPED_ARRAY_DTYPES: Final[dict[str, str]] = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+# Keys that plotly.js does not support typed arrays for.
+_TYPED_ARRAY_SKIPPED_KEYS: Final = {"geojson", "layer", "layers", "range"}
+
 
 class PlotlySelectionState(TypedDict, total=False):
     """
@@ -240,6 +256,86 @@ class PlotlyChartSelectionSerde:
         return json.dumps(selection_state, default=str)
 
 
+def _to_typed_array_spec(arr: Any) -> Any:
+    """Convert a NumPy array to a plotly.js typed array spec.
+
+    The array data is sent as base64-encoded binary instead of decimal text,
+    which is a lot smaller and faster to produce for large arrays. If the
+    array cannot be represented as typed array, it is returned as-is.
+    """
+    import numpy as np
+
+    if arr.ndim not in (1, 2) or arr.size == 0:
+        return arr
+
+    if arr.dtype.kind in "iu" and arr.dtype.itemsize == 8:
+        # plotly.js doesn't support 64-bit integers, so we try to downcast.
+        min_value, max_value = arr.min(), arr.max()
+        for dtype in (
+            ("uint8", "uint16", "uint32")
+            if arr.dtype.kind == "u"
+            else ("int8", "int16", "int32")
+        ):
+            info = np.iinfo(dtype)
+            if info.min <= min_value and max_value <= info.max:
+                arr = arr.astype(dtype)
+                break
+        else:
+            return arr
+
+    typed_array_dtype = _TYPED_ARRAY_DTYPES.get(str(arr.dtype))
+    if typed_array_dtype is None:
+        return arr
+
+    spec = {
+        "dtype": typed_array_dtype,
+        "bdata": base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode(),
+    }
+    if arr.ndim > 1:
+        spec["shape"] = ", ".join(str(dim) for dim in arr.shape)
+    return spec
+
+
+def _encode_typed_arrays(obj: Any) -> None:
+    """Replace all NumPy arrays in the given figure dict (in-place) with
+    plotly.js typed array specs.
+
+    Plotly >= 6 already does this as part of ``Figure.to_dict()``, so this
+    is only relevant for older plotly versions.
+    """
+    import numpy as np
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in _TYPED_ARRAY_SKIPPED_KEYS:
+                continue
+            if isinstance(value, np.ndarray):
+                obj[key] = _to_typed_array_spec(value)
+            else:
+                _encode_typed_arrays(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _encode_typed_arrays(value)
+
+
+def _figure_to_json(figure: BaseFigure | dict[str, Any]) -> str:
+    """Serialize the figure to a JSON spec for plotly.js.
+
+    Array data is encoded as binary typed arrays, and plotly's configured JSON
+    engine is used (``plotly.io.json.config.default_engine``), which picks
+    the faster ``orjson`` engine if it is installed.
+
+    Figure dicts are expected to be owned by the caller (e.g. the output of
+    ``Figure.to_dict()``) since they get modified in-place.
+    """
+    import plotly.io
+    from plotly.basedatatypes import BaseFigure
+
+    fig_dict = figure.to_dict() if isinstance(figure, BaseFigure) else figure
+    _encode_typed_arrays(fig_dict.get("data"))
+    return cast(str, plotly.io.to_json(fig_dict, validate=False))
+
+
 def parse_selection_mode(
     selection_mode: SelectionMode | Iterable[SelectionMode],
 ) -> set[PlotlyChartProto.SelectionMode.ValueType]:
@@ -434,7 +530,6 @@ class PlotlyMixin:
            height: 550px
 
         """
-        import plotly.io
         import plotly.tools
 
         # NOTE: "figure_or_data" is the name used in Plotly's .plot() method
@@ -495,7 +590,7 @@ class PlotlyMixin:
         config.setdefault("showLink", kwargs.get("show_link", False))
         config.setdefault("linkText", kwargs.get("link_text", False))
 
-        plotly_chart_proto.spec = plotly.io.to_json(figure, validate=False)
+        plotly_chart_proto.spec = _figure_to_json(figure)
         plotly_chart_proto.config = json.dumps(config)
 
         ctx = get_script_run_ctx()
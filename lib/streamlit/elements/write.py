@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import dataclasses
 import inspect
+import threading
+import time
 import types
 from collections import ChainMap, UserDict, UserList
 from collections.abc import ItemsView, KeysView, ValuesView
@@ -34,7 +36,12 @@ from typing import (
 from streamlit import dataframe_util, type_util
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime.metrics_util import gather_metrics
+from streamlit.runtime.scriptrunner import add_script_run_ctx, enqueue_message
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    in_cached_function,
+)
 from streamlit.string_util import (
     is_mem_address_str,
     max_char_sequence,
@@ -55,13 +62,27 @@ HELP_TYPES: Final[tuple[type[Any], ...]] = (
 
 _LOGGER: Final = get_logger(__name__)
 
-_TEXT_CURSOR: Final = "▕"
+# Text chunks that st.write_stream receives within this interval are sent to
+# the app together. Text that is still pending when the interval ends is sent
+# even if no other chunk arrives.
+_STREAM_FLUSH_INTERVAL_SECS: Final = 0.05
 
 
 class StreamingOutput(List[Any]):
     pass
 
 
+def _append_markdown(dg: DeltaGenerator, text: str) -> None:
+    """Append text to the body of the markdown element that dg is locked to."""
+    if dg._root_container is None or dg._cursor is None:
+        return
+
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = dg._cursor.delta_path
+    msg.delta.append_markdown = text
+    enqueue_message(msg)
+
+
 class WriteMixin:
     @gather_metrics("write_stream")
     def write_stream(
@@ -144,16 +165,69 @@ class WriteMixin:
 
         stream_container: DeltaGenerator | None = None
         streamed_response: str = ""
+        # Text that was added to streamed_response but not sent to the app yet.
+        pending_text: str = ""
+        last_sent_time: float = 0.0
+        # Sends the pending text at the end of the flush interval, in case the
+        # stream stalls before its next chunk. The lock guards the pending
+        # text, which the timer thread sends.
+        send_timer: threading.Timer | None = None
+        pending_text_lock = threading.Lock()
         written_content: list[Any] = StreamingOutput()
 
+        def cancel_send_timer():
+            nonlocal send_timer
+
+            if send_timer is not None:
+                send_timer.cancel()
+                send_timer = None
+
+        def send_pending_text():
+            """Append the pending text to the markdown element in the app."""
+            nonlocal pending_text
+            nonlocal last_sent_time
+
+            with pending_text_lock:
+                cancel_send_timer()
+                if pending_text and stream_container:
+                    _append_markdown(stream_container, pending_text)
+                    pending_text = ""
+                last_sent_time = time.monotonic()
+
+        def add_pending_text(text: str):
+            """Add text to the pending text, and send it once the flush
+            interval has passed.
+            """
+            nonlocal pending_text
+            nonlocal send_timer
+
+            with pending_text_lock:
+                pending_text += text
+                wait_secs = _STREAM_FLUSH_INTERVAL_SECS - (
+                    time.monotonic() - last_sent_time
+                )
+                if wait_secs > 0 and send_timer is None:
+                    send_timer = threading.Timer(wait_secs, send_pending_text)
+                    add_script_run_ctx(send_timer).start()
+            if wait_secs <= 0:
+                send_pending_text()
+
         def flush_stream_response():
             """Write the full response to the app."""
             nonlocal streamed_response
             nonlocal stream_container
+            nonlocal pending_text
 
             if streamed_response and stream_container:
-                # Replace the stream_container element the full response
-                stream_container.markdown(streamed_response)
+                if in_cached_function.get():
+                    # Cached functions replay elements but not appended text,
+                    # so we replace the element with the full response.
+                    with pending_text_lock:
+                        cancel_send_timer()
+                        pending_text = ""
+                    stream_container.markdown(streamed_response)
+                else:
+                    send_pending_text()
                 written_content.append(streamed_response)
                 stream_container = None
                 streamed_response = ""
@@ -171,61 +245,75 @@ class WriteMixin:
 
         # Iterate through the generator and write each chunk to the app
         # with a type writer effect.
-        for chunk in stream:  # type: ignore
-            if type_util.is_openai_chunk(chunk):
-                # Try to convert OpenAI chat completion chunk to a string:
-                try:
-                    if len(chunk.choices) == 0 or chunk.choices[0].delta is None:
-                        # The choices list can be empty. E.g. when using the
-                        # AzureOpenAI client, the first chunk will always be empty.
-                        chunk = ""
-                    else:
-                        chunk = chunk.choices[0].delta.content or ""
-                except AttributeError as err:
-                    raise StreamlitAPIException(
-                        "Failed to parse the OpenAI ChatCompletionChunk. "
-                        "The most likely cause is a change of the chunk object structure "
-                        "due to a recent OpenAI update. You might be able to fix this "
-                        "by downgrading the OpenAI library or upgrading Streamlit. Also, "
-                        "please report this issue to: https://github.com/streamlit/streamlit/issues."
-                    ) from err
-
-            if type_util.is_type(chunk, "langchain_core.messages.ai.AIMessageChunk"):
-                # Try to convert LangChain message chunk to a string:
-                try:
-                    chunk = chunk.content or ""
-                except AttributeError as err:
-                    raise StreamlitAPIException(
-                        "Failed to parse the LangChain AIMessageChunk. "
-                        "The most likely cause is a change of the chunk object structure "
-                        "due to a recent LangChain update. You might be able to fix this "
-                        "by downgrading the OpenAI library or upgrading Streamlit. Also, "
-                        "please report this issue to: https://github.com/streamlit/streamlit/issues."
-                    ) from err
-
-            if isinstance(chunk, str):
-                if not chunk:
-                    # Empty strings can be ignored
-                    continue
-
-                first_text = False
-                if not stream_container:
-                    stream_container = self.dg.empty()
-                    first_text = True
-                streamed_response += chunk
-                # Only add the streaming symbol on the second text chunk
-                stream_container.markdown(
-                    streamed_response + ("" if first_text else _TEXT_CURSOR),
-                )
-            elif callable(chunk):
-                flush_stream_response()
-                chunk()
-            else:
-                flush_stream_response()
-                self.write(chunk)
-                written_content.append(chunk)
-
-        flush_stream_response()
+        try:
+            for chunk in stream:  # type: ignore
+                if type_util.is_openai_chunk(chunk):
+                    # Try to convert OpenAI chat completion chunk to a string:
+                    try:
+                        if len(chunk.choices) == 0 or chunk.choices[0].delta is None:
+                            # The choices list can be empty. E.g. when using the
+                            # AzureOpenAI client, the first chunk will always be empty.
+                            chunk = ""
+                        else:
+                            chunk = chunk.choices[0].delta.content or ""
+                    except AttributeError as err:
+                        raise StreamlitAPIException(
+                            "Failed to parse the OpenAI ChatCompletionChunk. "
+                            "The most likely cause is a change of the chunk object structure "
+                            "due to a recent OpenAI update. You might be able to fix this "
+                            "by downgrading the OpenAI library or upgrading Streamlit. Also, "
+                            "please report this issue to: https://github.com/streamlit/streamlit/issues."
+                        ) from err
+
+                if type_util.is_type(
+                    chunk, "langchain_core.messages.ai.AIMessageChunk"
+                ):
+                    # Try to convert LangChain message chunk to a string:
+                    try:
+                        chunk = chunk.content or ""
+                    except AttributeError as err:
+                        raise StreamlitAPIException(
+                            "Failed to parse the LangChain AIMessageChunk. "
+                            "The most likely cause is a change of the chunk object structure "
+                            "due to a recent LangChain update. You might be able to fix this "
+                            "by downgrading the OpenAI library or upgrading Streamlit. Also, "
+                            "please report this issue to: https://github.com/streamlit/streamlit/issues."
+                        ) from err
+
+                if isinstance(chunk, str):
+                    if not chunk:
+                        # Empty strings can be ignored
+                        continue
+
+                    streamed_response += chunk
+                    if not stream_container:
+                        # The first chunk creates the markdown element, and the
+                        # following ones are appended to it.
+                        stream_container = self.dg.empty().markdown(chunk)
+                        last_sent_time = time.monotonic()
+                        continue
+
+                    # Chunks that arrive in quick succession are sent together.
+                    add_pending_text(chunk)
+                elif callable(chunk):
+                    flush_stream_response()
+                    chunk()
+                else:
+                    flush_stream_response()
+                    self.write(chunk)
+                    written_content.append(chunk)
+
+            flush_stream_response()
+        except Exception:
+            # Show the text that arrived before the stream failed.
+            send_pending_text()
+            raise
+        finally:
+            # The timer must not send text after this returns, since the
+            # element may belong to a different script run by then.
+            with pending_text_lock:
+                cancel_send_timer()
+                pending_text = ""
 
         if not written_content:
             # If nothing was streamed, return an empty string.
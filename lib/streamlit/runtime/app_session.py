@@ -15,10 +15,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 import sys
+import threading
 import uuid
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Final
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 import streamlit.elements.exception as exception_utils
 from streamlit import config, runtime
@@ -38,8 +41,14 @@ from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.fragment import FragmentStorage, MemoryFragmentStorage
 from streamlit.runtime.metrics_util import Installation
 from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.performance_metrics import rerun_requests
 from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
 from streamlit.runtime.secrets import secrets_singleton
+from streamlit.runtime.session_hibernation import (
+    discard_hibernated_session_state,
+    hibernate_session_state,
+    rehydrate_session_state,
+)
 from streamlit.string_util import to_snake_case
 from streamlit.version import STREAMLIT_VERSION_STRING
 from streamlit.watcher import LocalSourcesWatcher
@@ -167,6 +176,17 @@ class AppSession:
 
         self._fragment_storage: FragmentStorage = MemoryFragmentStorage()
 
+        # Idle sessions are hibernated after server.sessionHibernationTimeout
+        # seconds. While hibernated, the session_state values set by user code
+        # are stored in the file at _hibernated_state_path, or in
+        # _hibernating_state while they are being written to it.
+        self._hibernation_timer: asyncio.TimerHandle | None = None
+        self._is_hibernated = False
+        self._hibernated_state_path: str | None = None
+        self._hibernating_state: tuple[dict[str, Any], dict[str, Any]] | None = None
+        # Sessions may be rehydrated from any thread.
+        self._hibernation_lock = threading.Lock()
+
         _LOGGER.debug("AppSession initialized (id=%s)", self.id)
 
     def __del__(self) -> None:
@@ -216,6 +236,11 @@ class AppSession:
         self._stop_config_listener = None
         self._stop_pages_listener = None
 
+    @property
+    def browser_queue_length(self) -> int:
+        """The number of messages waiting to be sent to the browser."""
+        return len(self._browser_queue)
+
     def flush_browser_queue(self) -> list[ForwardMsg]:
         """Clear the forward message queue and return the messages it contained.
 
@@ -259,6 +284,129 @@ class AppSession:
             # generally already done so by the time we get here.
             self.disconnect_file_watchers()
 
+            if self._hibernation_timer is not None:
+                self._hibernation_timer.cancel()
+                self._hibernation_timer = None
+            with self._hibernation_lock:
+                self._hibernating_state = None
+                if self._hibernated_state_path is not None:
+                    discard_hibernated_session_state(self._hibernated_state_path)
+                    self._hibernated_state_path = None
+
+    @property
+    def is_hibernated(self) -> bool:
+        return self._is_hibernated
+
+    @property
+    def hibernated_state_size(self) -> int:
+        """The size in bytes of the session_state values that hibernate moved
+        to disk, or 0 if there are none.
+        """
+        if self._hibernated_state_path is None:
+            return 0
+        try:
+            return os.path.getsize(self._hibernated_state_path)
+        except OSError:
+            return 0
+
+    def hibernate(self) -> None:
+        """Release the memory that this session doesn't need while it's idle.
+
+        The session_state values set by user code are moved to disk, and the
+        session's references to cached messages are released. The values are
+        written in a background thread. The session is rehydrated when it
+        handles its next BackMsg, when its script is rerun, or when its
+        session_state is accessed.
+
+        Does nothing if the script is running.
+        """
+        if self._is_hibernated or self._state != AppSessionState.APP_NOT_RUNNING:
+            return
+
+        with self._hibernation_lock:
+            user_state = self._session_state.pop_user_state()
+            self._hibernating_state = user_state
+            self._is_hibernated = True
+
+        if runtime.exists():
+            runtime.get_instance().message_cache.remove_refs_for_session(self)
+
+        future = self._event_loop.run_in_executor(
+            None, hibernate_session_state, self.id, user_state
+        )
+        future.add_done_callback(
+            functools.partial(self._on_session_state_hibernated, user_state)
+        )
+        _LOGGER.debug("Hibernated session (id=%s)", self.id)
+
+    def _on_session_state_hibernated(
+        self,
+        user_state: tuple[dict[str, Any], dict[str, Any]],
+        future: asyncio.Future[
+            tuple[str | None, tuple[dict[str, Any], dict[str, Any]]]
+        ],
+    ) -> None:
+        """Called when hibernate_session_state finished writing user_state."""
+        try:
+            path, kept_state = future.result()
+        except Exception as ex:
+            _LOGGER.error("Unable to hibernate session %s: %s", self.id, ex)
+            path, kept_state = None, user_state
+
+        with self._hibernation_lock:
+            if self._hibernating_state is not user_state:
+                # The session was rehydrated or shut down in the meantime, and
+                # the values are already back in memory.
+                if path is not None:
+                    discard_hibernated_session_state(path)
+                return
+
+            self._hibernating_state = None
+            self._hibernated_state_path = path
+            self._session_state.push_user_state(*kept_state)
+
+    def _rehydrate(self) -> None:
+        """Undo hibernate."""
+        with self._hibernation_lock:
+            if not self._is_hibernated:
+                return
+
+            self._is_hibernated = False
+            if self._hibernating_state is not None:
+                self._session_state.push_user_state(*self._hibernating_state)
+                self._hibernating_state = None
+            elif self._hibernated_state_path is not None:
+                path = self._hibernated_state_path
+                self._hibernated_state_path = None
+                try:
+                    rehydrate_session_state(path, self._session_state)
+                except Exception as ex:
+                    _LOGGER.error(
+                        "Unable to restore the session_state of session %s: %s",
+                        self.id,
+                        ex,
+                    )
+        _LOGGER.debug("Rehydrated session (id=%s)", self.id)
+
+    def _reset_hibernation_timer(self) -> None:
+        """Restart the timer after which this session is hibernated if it stays
+        idle.
+        """
+        if self._hibernation_timer is not None:
+            self._hibernation_timer.cancel()
+            self._hibernation_timer = None
+
+        timeout = config.get_option("server.sessionHibernationTimeout")
+        if timeout and self._state != AppSessionState.SHUTDOWN_REQUESTED:
+            self._hibernation_timer = self._event_loop.call_later(
+                timeout, self._on_hibernation_timeout
+            )
+
+    def _on_hibernation_timeout(self) -> None:
+        self._hibernation_timer = None
+        # If the script is still running, the timer is restarted once it stops.
+        self.hibernate()
+
     def _enqueue_forward_msg(self, msg: ForwardMsg) -> None:
         """Enqueue a new ForwardMsg to our browser queue.
 
@@ -284,6 +432,12 @@ class AppSession:
         try:
             msg_type = msg.WhichOneof("type")
 
+            # Heartbeats are sent by idle frontends as well, so they don't count
+            # as activity.
+            if msg_type != "app_heartbeat":
+                self._rehydrate()
+                self._reset_hibernation_timer()
+
             if msg_type == "rerun_script":
                 if msg.debug_last_backmsg_id:
                     self._debug_last_backmsg_id = msg.debug_last_backmsg_id
@@ -354,6 +508,9 @@ class AppSession:
             _LOGGER.warning("Discarding rerun request after shutdown")
             return
 
+        rerun_requests.inc()
+        self._rehydrate()
+
         if client_state:
             fragment_id = client_state.fragment_id
 
@@ -418,6 +575,12 @@ class AppSession:
 
     @property
     def session_state(self) -> SessionState:
+        if self._is_hibernated:
+            self._rehydrate()
+            # Unlike script runs, which restart the hibernation timer when they
+            # stop, accessing session_state doesn't restart it by itself. This
+            # may be called from any thread.
+            self._event_loop.call_soon_threadsafe(self._reset_hibernation_timer)
         return self._session_state
 
     def _should_rerun_on_file_change(self, filepath: str) -> bool:
@@ -599,6 +762,7 @@ class AppSession:
         ):
             if self._state != AppSessionState.SHUTDOWN_REQUESTED:
                 self._state = AppSessionState.APP_NOT_RUNNING
+                self._reset_hibernation_timer()
 
             if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS:
                 status = ForwardMsg.FINISHED_SUCCESSFULLY
@@ -634,6 +798,7 @@ class AppSession:
 
         elif event == ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN:
             self._state = AppSessionState.APP_NOT_RUNNING
+            self._reset_hibernation_timer()
             self._enqueue_forward_msg(
                 self._create_script_finished_message(
                     ForwardMsg.FINISHED_EARLY_FOR_RERUN
@@ -41,16 +41,27 @@ def save_element_message(
     invoked_dg_id: str,
     used_dg_id: str,
     returned_dg_id: str,
+    element_hash: str | None = None,
 ) -> None:
     """Save the message for an element to a thread-local callstack, so it can
     be used later to replay the element when a cache-decorated function's
     execution is skipped.
     """
     CACHE_DATA_MESSAGE_REPLAY_CTX.save_element_message(
-        delta_type, element_proto, invoked_dg_id, used_dg_id, returned_dg_id
+        delta_type,
+        element_proto,
+        invoked_dg_id,
+        used_dg_id,
+        returned_dg_id,
+        element_hash,
     )
     CACHE_RESOURCE_MESSAGE_REPLAY_CTX.save_element_message(
-        delta_type, element_proto, invoked_dg_id, used_dg_id, returned_dg_id
+        delta_type,
+        element_proto,
+        invoked_dg_id,
+        used_dg_id,
+        returned_dg_id,
+        element_hash,
     )
 
 
@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+import functools
+import math
 import pickle
 import threading
 import types
@@ -31,12 +33,14 @@ from typing import (
     overload,
 )
 
+from cachetools import TTLCache
 from typing_extensions import TypeAlias
 
 import streamlit as st
 from streamlit import runtime
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheError, CacheKeyNotFoundError
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
@@ -91,6 +95,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
         max_entries: int | None,
         ttl: float | timedelta | str | None,
         hash_funcs: HashFuncsDict | None = None,
+        stale_while_revalidate: float | timedelta | str | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         super().__init__(
             func,
@@ -100,6 +107,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
         self.persist = persist
         self.max_entries = max_entries
         self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_size = max_size
+        self.max_concurrency = max_concurrency
 
         self.validate_params()
 
@@ -123,6 +133,9 @@ class CachedDataFuncInfo(CachedFuncInfo):
             max_entries=self.max_entries,
             ttl=self.ttl,
             display_name=self.display_name,
+            stale_while_revalidate=self.stale_while_revalidate,
+            max_size=self.max_size,
+            max_concurrency=self.max_concurrency,
         )
 
     def validate_params(self) -> None:
@@ -132,6 +145,14 @@ class CachedDataFuncInfo(CachedFuncInfo):
         When called, this method could log warnings if cache params are invalid
         for current storage.
         """
+        if self.stale_while_revalidate is not None and self.ttl is None:
+            raise StreamlitAPIException(
+                "`stale_while_revalidate` can only be used together with `ttl`."
+            )
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise StreamlitAPIException(
+                "`max_concurrency` must be a positive integer or None."
+            )
         _data_caches.validate_cache_params(
             function_name=self.func.__name__,
             persist=self.persist,
@@ -154,6 +175,9 @@ class DataCaches(CacheStatsProvider):
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
         display_name: str,
+        stale_while_revalidate: int | float | timedelta | str | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> DataCache:
         """Return the mem cache for the given key.
 
@@ -161,6 +185,9 @@ class DataCaches(CacheStatsProvider):
         """
 
         ttl_seconds = time_to_seconds(ttl, coerce_none_to_inf=False)
+        stale_seconds = time_to_seconds(
+            stale_while_revalidate, coerce_none_to_inf=False
+        )
 
         # Get the existing cache, if it exists, and validate that its params
         # haven't changed.
@@ -169,7 +196,10 @@ class DataCaches(CacheStatsProvider):
             if (
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
+                and cache.stale_seconds == stale_seconds
                 and cache.max_entries == max_entries
+                and cache.max_size == max_size
+                and cache.max_concurrency == max_concurrency
                 and cache.persist == persist
             ):
                 return cache
@@ -196,12 +226,18 @@ class DataCaches(CacheStatsProvider):
                 ttl,
             )
 
+            # Stale values are kept in the storage until they can't be
+            # returned anymore.
+            storage_ttl_seconds = ttl_seconds
+            if ttl_seconds is not None and stale_seconds is not None:
+                storage_ttl_seconds = ttl_seconds + stale_seconds
             cache_context = self.create_cache_storage_context(
                 function_key=key,
                 function_name=display_name,
-                ttl_seconds=ttl_seconds,
+                ttl_seconds=storage_ttl_seconds,
                 max_entries=max_entries,
                 persist=persist,
+                max_size=max_size,
             )
             cache_storage_manager = self.get_storage_manager()
             storage = cache_storage_manager.create(cache_context)
@@ -213,6 +249,9 @@ class DataCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
+                stale_seconds=stale_seconds,
+                max_size=max_size,
+                max_concurrency=max_concurrency,
             )
             self._function_caches[key] = cache
             return cache
@@ -286,6 +325,7 @@ class DataCaches(CacheStatsProvider):
         persist: CachePersistType,
         ttl_seconds: float | None,
         max_entries: int | None,
+        max_size: int | None = None,
     ) -> CacheStorageContext:
         return CacheStorageContext(
             function_key=function_key,
@@ -293,6 +333,7 @@ class DataCaches(CacheStatsProvider):
             ttl_seconds=ttl_seconds,
             max_entries=max_entries,
             persist=persist,
+            max_size=max_size,
         )
 
     def get_storage_manager(self) -> CacheStorageManager:
@@ -353,6 +394,10 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        stale_while_revalidate: float | timedelta | str | None = None,
+        prewarm: list[tuple[Any, ...]] | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -365,6 +410,10 @@ class CacheDataAPI:
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        stale_while_revalidate: float | timedelta | str | None = None,
+        prewarm: list[tuple[Any, ...]] | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         return self._decorator(
             func,
@@ -374,6 +423,10 @@ class CacheDataAPI:
             show_spinner=show_spinner,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            stale_while_revalidate=stale_while_revalidate,
+            prewarm=prewarm,
+            max_size=max_size,
+            max_concurrency=max_concurrency,
         )
 
     def _decorator(
@@ -386,6 +439,10 @@ class CacheDataAPI:
         persist: CachePersistType | bool,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        stale_while_revalidate: float | timedelta | str | None = None,
+        prewarm: list[tuple[Any, ...]] | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         """Decorator to cache functions that return data (e.g. dataframe transforms, database queries, ML inference).
 
@@ -416,8 +473,6 @@ class CacheDataAPI:
               <https://docs.python.org/3/library/datetime.html#timedelta-objects>`_,
               e.g. ``timedelta(days=1)``.
 
-            Note that ``ttl`` will be ignored if ``persist="disk"`` or ``persist=True``.
-
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
             for an unbounded cache. When a new entry is added to a full cache,
@@ -444,6 +499,38 @@ class CacheDataAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        stale_while_revalidate : float, timedelta, str, or None
+            How long to keep returning a cache entry after its ``ttl`` expired,
+            while it's recomputed in the background. Supports the same formats
+            as ``ttl``, which must be set as well. This way, only the first call
+            after an entry expired is slowed down by the computation, rather
+            than all calls until it finishes. ``None`` (default) recomputes
+            expired entries right away.
+
+            Entries whose computation called Streamlit commands that display
+            elements are always recomputed right away.
+
+        prewarm : list of tuples, or None
+            Arguments to compute cache entries for in the background when the
+            function is first decorated, so that the first calls with these
+            arguments don't wait for the computation. Each tuple holds the
+            positional arguments of one call. Defaults to None.
+
+        max_size : int or None
+            The maximum total size of the entries to keep in memory, in bytes,
+            or None for no limit (default). Entries are measured in their
+            pickled form. When the limit is exceeded, the least recently used
+            entries are removed. All caches together are also bounded by the
+            ``runner.cacheMaxSize`` config option.
+
+        max_concurrency : int or None
+            The maximum number of entries of this function to compute at the
+            same time, or None for no limit (default). Use this for expensive
+            functions, e.g. ones that query a database, so that many sessions
+            missing the cache with different arguments don't overload the
+            backend. Calls with the same arguments always share a single
+            computation, regardless of this limit.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -558,7 +645,7 @@ class CacheDataAPI:
             show_widget_replay_deprecation("cache_data")
 
         def wrapper(f):
-            return make_cached_func_wrapper(
+            cached_func = make_cached_func_wrapper(
                 CachedDataFuncInfo(
                     func=f,
                     persist=persist_string,
@@ -566,22 +653,19 @@ class CacheDataAPI:
                     max_entries=max_entries,
                     ttl=ttl,
                     hash_funcs=hash_funcs,
+                    stale_while_revalidate=stale_while_revalidate,
+                    max_size=max_size,
+                    max_concurrency=max_concurrency,
                 )
             )
+            if prewarm:
+                cached_func._prewarm(prewarm)
+            return cached_func
 
         if func is None:
             return wrapper
 
-        return make_cached_func_wrapper(
-            CachedDataFuncInfo(
-                func=cast(types.FunctionType, func),
-                persist=persist_string,
-                show_spinner=show_spinner,
-                max_entries=max_entries,
-                ttl=ttl,
-                hash_funcs=hash_funcs,
-            )
-        )
+        return wrapper(cast(types.FunctionType, func))
 
     @gather_metrics("clear_data_caches")
     def clear(self) -> None:
@@ -600,14 +684,44 @@ class DataCache(Cache):
         max_entries: int | None,
         ttl_seconds: float | None,
         display_name: str,
+        stale_seconds: float | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
-        super().__init__()
+        super().__init__(max_concurrency=max_concurrency)
         self.key = key
         self.display_name = display_name
         self.storage = storage
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
+        self.max_size = max_size
         self.persist = persist
+        self.stale_seconds = stale_seconds
+        # When entries become stale, by key. Only used with
+        # stale_while_revalidate; the storage removes entries once they can't
+        # be returned anymore.
+        self._stale_times: TTLCache[str, float] | None = None
+        self._stale_times_lock = threading.Lock()
+        if ttl_seconds is not None and stale_seconds is not None:
+            self._stale_times = TTLCache(
+                maxsize=math.inf if max_entries is None else max_entries,
+                ttl=ttl_seconds + stale_seconds,
+                timer=cache_utils.TTLCACHE_TIMER,
+            )
+
+    def is_stale(self, value_key: str) -> bool:
+        if self._stale_times is None:
+            return False
+        with self._stale_times_lock:
+            stale_time = self._stale_times.get(value_key)
+        return stale_time is not None and cache_utils.TTLCACHE_TIMER() >= stale_time
+
+    def _update_stale_time(self, key: str, only_if_unknown: bool) -> None:
+        if self._stale_times is None or self.ttl_seconds is None:
+            return
+        with self._stale_times_lock:
+            if not only_if_unknown or key not in self._stale_times:
+                self._stale_times[key] = cache_utils.TTLCACHE_TIMER() + self.ttl_seconds
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
@@ -633,14 +747,25 @@ class DataCache(Cache):
                 # rerun the function.
                 self.storage.delete(key)
                 raise CacheKeyNotFoundError()
-            return entry
         except pickle.UnpicklingError as exc:
             raise CacheError(f"Failed to unpickle {key}") from exc
 
+        # An entry that was written by another process, or before a restart
+        # when it's persisted, is fresh for the ttl from now on.
+        self._update_stale_time(key, only_if_unknown=True)
+        if entry.messages and self.is_stale(key):
+            # The entry can't be recomputed in the background, see
+            # CachedFunc._compute_in_background.
+            raise CacheKeyNotFoundError()
+        return entry
+
     @gather_metrics("_cache_data_object")
-    def write_result(self, key: str, value: Any, messages: list[MsgData]) -> None:
+    def write_result(
+        self, key: str, value: Any, messages: list[MsgData]
+    ) -> Callable[[], CachedResult]:
         """Write a value and associated messages to the cache.
-        The value must be pickleable.
+        The value must be pickleable. Callers that waited for the value get
+        their own copy of it, which is unpickled from the written entry.
         """
         try:
             main_id = st._main.id
@@ -650,8 +775,16 @@ class DataCache(Cache):
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
         self.storage.set(key, pickled_entry)
+        self._update_stale_time(key, only_if_unknown=False)
+        return functools.partial(pickle.loads, pickled_entry)
 
     def _clear(self, key: str | None = None) -> None:
+        if self._stale_times is not None:
+            with self._stale_times_lock:
+                if not key:
+                    self._stale_times.clear()
+                else:
+                    self._stale_times.pop(key, None)
         if not key:
             self.storage.clear()
         else:
@@ -21,10 +21,10 @@ import threading
 import types
 from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar, cast, overload
 
-from cachetools import TTLCache
 from typing_extensions import TypeAlias
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
 from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheKeyNotFoundError
@@ -41,7 +41,13 @@ from streamlit.runtime.caching.cached_message_replay import (
     show_widget_replay_deprecation,
 )
 from streamlit.runtime.metrics_util import gather_metrics
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    SizeEstimates,
+    estimate_size,
+    group_stats,
+)
 from streamlit.time_util import time_to_seconds
 
 if TYPE_CHECKING:
@@ -80,6 +86,8 @@ class ResourceCaches(CacheStatsProvider):
         max_entries: int | float | None,
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> ResourceCache:
         """Return the mem cache for the given key.
 
@@ -89,6 +97,7 @@ class ResourceCaches(CacheStatsProvider):
             max_entries = math.inf
 
         ttl_seconds = time_to_seconds(ttl)
+        max_size_bytes = math.inf if max_size is None else max_size
 
         # Get the existing cache, if it exists, and validate that its params
         # haven't changed.
@@ -98,6 +107,8 @@ class ResourceCaches(CacheStatsProvider):
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
+                and cache.max_size == max_size_bytes
+                and cache.max_concurrency == max_concurrency
                 and _equal_validate_funcs(cache.validate, validate)
             ):
                 return cache
@@ -110,6 +121,8 @@ class ResourceCaches(CacheStatsProvider):
                 max_entries=max_entries,
                 ttl_seconds=ttl_seconds,
                 validate=validate,
+                max_size=max_size_bytes,
+                max_concurrency=max_concurrency,
             )
             self._function_caches[key] = cache
             return cache
@@ -151,6 +164,8 @@ class CachedResourceFuncInfo(CachedFuncInfo):
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         super().__init__(
             func,
@@ -160,6 +175,13 @@ class CachedResourceFuncInfo(CachedFuncInfo):
         self.max_entries = max_entries
         self.ttl = ttl
         self.validate = validate
+        self.max_size = max_size
+        self.max_concurrency = max_concurrency
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise StreamlitAPIException(
+                "`max_concurrency` must be a positive integer or None."
+            )
 
     @property
     def cache_type(self) -> CacheType:
@@ -181,6 +203,8 @@ class CachedResourceFuncInfo(CachedFuncInfo):
             max_entries=self.max_entries,
             ttl=self.ttl,
             validate=self.validate,
+            max_size=self.max_size,
+            max_concurrency=self.max_concurrency,
         )
 
 
@@ -222,6 +246,8 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> Callable[[F], F]: ...
 
     def __call__(
@@ -234,6 +260,8 @@ class CacheResourceAPI:
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         return self._decorator(
             func,
@@ -243,6 +271,8 @@ class CacheResourceAPI:
             validate=validate,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            max_size=max_size,
+            max_concurrency=max_concurrency,
         )
 
     def _decorator(
@@ -255,6 +285,8 @@ class CacheResourceAPI:
         validate: ValidateFunc | None,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        max_size: int | None = None,
+        max_concurrency: int | None = None,
     ):
         """Decorator to cache functions that return global resources (e.g. database connections, ML models).
 
@@ -316,6 +348,23 @@ class CacheResourceAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        max_size : int or None
+            The maximum total size of the entries to keep in the cache, in
+            bytes, or None for no limit (default). The size of a resource is
+            estimated from its buffers for NumPy arrays and pandas and Arrow
+            objects, and from its referenced objects otherwise. When the
+            limit is exceeded, the least recently used entries are removed.
+            All caches together are also bounded by the
+            ``runner.cacheMaxSize`` config option.
+
+        max_concurrency : int or None
+            The maximum number of entries of this function to compute at the
+            same time, or None for no limit (default). Use this for expensive
+            functions, e.g. ones that query a database, so that many sessions
+            missing the cache with different arguments don't overload the
+            backend. Calls with the same arguments always share a single
+            computation, regardless of this limit.
+
         .. deprecated::
             The cached widget replay functionality was removed in 1.38. Please
             remove the ``experimental_allow_widgets`` parameter from your
@@ -418,6 +467,8 @@ class CacheResourceAPI:
                     ttl=ttl,
                     validate=validate,
                     hash_funcs=hash_funcs,
+                    max_size=max_size,
+                    max_concurrency=max_concurrency,
                 )
             )
 
@@ -429,6 +480,8 @@ class CacheResourceAPI:
                 ttl=ttl,
                 validate=validate,
                 hash_funcs=hash_funcs,
+                max_size=max_size,
+                max_concurrency=max_concurrency,
             )
         )
 
@@ -438,6 +491,10 @@ class CacheResourceAPI:
         _resource_caches.clear_all()
 
 
+def _zero_size(result: CachedResult) -> int:
+    return 0
+
+
 class ResourceCache(Cache):
     """Manages cached values for a single st.cache_resource function."""
 
@@ -448,24 +505,56 @@ class ResourceCache(Cache):
         ttl_seconds: float,
         validate: ValidateFunc | None,
         display_name: str,
+        max_size: float = math.inf,
+        max_concurrency: int | None = None,
     ):
-        super().__init__()
+        super().__init__(max_concurrency=max_concurrency)
         self.key = key
         self.display_name = display_name
-        self._mem_cache: TTLCache[str, CachedResult] = TTLCache(
-            maxsize=max_entries, ttl=ttl_seconds, timer=cache_utils.TTLCACHE_TIMER
+        # Sizing resources can be slow, so they're only sized if their size
+        # is bounded.
+        size_bounded = (
+            max_size != math.inf
+            or cache_utils.get_cache_memory_budget().max_size != math.inf
+        )
+        self._mem_cache = cache_utils.SizeBoundedTTLCache(
+            max_entries=max_entries,
+            max_size=max_size,
+            ttl=ttl_seconds,
+            getsizeof=estimate_size if size_bounded else _zero_size,
+            cache_type="st_cache_resource",
+            display_name=display_name,
         )
         self._mem_cache_lock = threading.Lock()
+        self._size_estimates = SizeEstimates()
         self.validate = validate
+        cache_utils.get_cache_memory_budget().register(self)
 
     @property
     def max_entries(self) -> float:
+        return self._mem_cache.max_entries
+
+    @property
+    def max_size(self) -> float:
         return self._mem_cache.maxsize
 
     @property
     def ttl_seconds(self) -> float:
         return self._mem_cache.ttl
 
+    @property
+    def memory_size(self) -> int:
+        """The total estimated size of the cached resources in bytes."""
+        with self._mem_cache_lock:
+            return int(self._mem_cache.currsize)
+
+    def evict_lru_entry(self) -> int:
+        """Evict the least recently used resource, and return the estimated
+        number of bytes that were freed.
+        """
+        with self._mem_cache_lock:
+            return self._mem_cache.evict_lru_entry()
+
     def read_result(self, key: str) -> CachedResult:
         """Read a value and associated messages from the cache.
         Raise `CacheKeyNotFoundError` if the value doesn't exist.
@@ -485,13 +574,21 @@ class ResourceCache(Cache):
             return result
 
     @gather_metrics("_cache_resource_object")
-    def write_result(self, key: str, value: Any, messages: list[MsgData]) -> None:
-        """Write a value and associated messages to the cache."""
+    def write_result(
+        self, key: str, value: Any, messages: list[MsgData]
+    ) -> Callable[[], CachedResult]:
+        """Write a value and associated messages to the cache. Callers that
+        waited for the value share it, like all other callers.
+        """
         main_id = st._main.id
         sidebar_id = st.sidebar.id
 
+        result = CachedResult(value, messages, main_id, sidebar_id)
         with self._mem_cache_lock:
-            self._mem_cache[key] = CachedResult(value, messages, main_id, sidebar_id)
+            self._mem_cache[key] = result
+        self._size_estimates.set(key, result)
+        cache_utils.get_cache_memory_budget().enforce()
+        return lambda: result
 
     def _clear(self, key: str | None = None) -> None:
         with self._mem_cache_lock:
@@ -505,16 +602,13 @@ class ResourceCache(Cache):
         # expensive, and we want to minimize the time we spend holding
         # the lock.
         with self._mem_cache_lock:
-            cache_entries = list(self._mem_cache.values())
-
-        # Lazy-load vendored package to prevent import of numpy
-        from streamlit.vendor.pympler.asizeof import asizeof
+            cache_entries = list(self._mem_cache.items())
 
         return [
             CacheStat(
                 category_name="st_cache_resource",
                 cache_name=self.display_name,
-                byte_length=asizeof(entry),
+                byte_length=byte_length,
             )
-            for entry in cache_entries
+            for byte_length in self._size_estimates.get_sizes(cache_entries)
         ]
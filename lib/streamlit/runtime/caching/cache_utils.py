@@ -20,13 +20,18 @@ import contextlib
 import functools
 import hashlib
 import inspect
+import math
 import threading
 import time
+import weakref
 from abc import abstractmethod
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Final
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterator, Protocol, Tuple
 
-from streamlit import type_util
+from cachetools import LRUCache, TTLCache
+
+from streamlit import config, type_util
 from streamlit.dataframe_util import is_unevaluated_data_object
 from streamlit.elements.spinner import spinner
 from streamlit.logger import get_logger
@@ -46,6 +51,14 @@ from streamlit.runtime.caching.cached_message_replay import (
     replay_cached_messages,
 )
 from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.performance_metrics import (
+    cache_background_computations,
+    cache_coalesced_calls,
+    cache_computation_waits,
+    cache_evictions,
+    cache_hits,
+    cache_misses,
+)
 from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
@@ -59,13 +72,216 @@ _LOGGER: Final = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# The maximum number of functions whose keys and positional argument names are
+# memoized.
+_MAX_MEMOIZED_FUNCTIONS: Final = 1024
+
+# Identifies a function for memoizing values that are derived from its
+# signature and source code. See _get_function_memo_key.
+_FunctionMemoKey = Tuple[Any, ...]
+
+_function_memo_lock: Final = threading.Lock()
+_function_keys: LRUCache[tuple[CacheType, _FunctionMemoKey], str] = LRUCache(
+    maxsize=_MAX_MEMOIZED_FUNCTIONS
+)
+_positional_arg_names: LRUCache[_FunctionMemoKey, tuple[str | None, ...]] = LRUCache(
+    maxsize=_MAX_MEMOIZED_FUNCTIONS
+)
+
+# The maximum number of cached values that are computed in the background at
+# the same time, to revalidate stale values or prewarm caches.
+_MAX_BACKGROUND_COMPUTATIONS: Final = 4
+
+_background_executor: ThreadPoolExecutor | None = None
+_background_executor_lock: Final = threading.Lock()
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    global _background_executor
+    with _background_executor_lock:
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                max_workers=_MAX_BACKGROUND_COMPUTATIONS,
+                thread_name_prefix="CacheBackgroundComputation",
+            )
+        return _background_executor
+
+
+class SizeBoundedTTLCache(TTLCache):  # type: ignore[type-arg]
+    """A TTLCache that is bounded by the number of its entries and by their
+    total size in bytes.
+
+    The least recently used entries are evicted first. Evictions are counted
+    in the cache_evictions metric. Entries that are larger than `max_size` on
+    their own aren't stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: float,
+        max_size: float,
+        ttl: float,
+        getsizeof: Callable[[Any], int],
+        cache_type: str,
+        display_name: str,
+    ):
+        super().__init__(
+            maxsize=max_size, ttl=ttl, timer=TTLCACHE_TIMER, getsizeof=self._getsizeof
+        )
+        self.max_entries = max_entries
+        self._sizer = getsizeof
+        # The value that is being written and its size, so that it's only
+        # sized once.
+        self._sized_value: tuple[Any, int] | None = None
+        self._metric_labels = {"cache_type": cache_type, "cache": display_name}
+        # Whether popitem is called to evict entries, rather than by clear().
+        self._evicting = False
+
+    def _getsizeof(self, value: Any) -> int:
+        if self._sized_value is not None and self._sized_value[0] is value:
+            return self._sized_value[1]
+        return self._sizer(value)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        size = self._sizer(value)
+        if size > self.maxsize:
+            self.pop(key, None)
+            cache_evictions.inc(**self._metric_labels)
+            return
+
+        self._sized_value = (value, size)
+        self._evicting = True
+        try:
+            super().__setitem__(key, value)
+            while len(self) > self.max_entries:
+                self.popitem()
+        finally:
+            self._sized_value = None
+            self._evicting = False
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        if self._evicting:
+            cache_evictions.inc(**self._metric_labels)
+        return item
+
+    def evict_lru_entry(self) -> int:
+        """Evict the least recently used entry and return the number of bytes
+        that were freed, or 0 if the cache is empty.
+        """
+        size = self.currsize
+        self._evicting = True
+        try:
+            self.popitem()
+        except KeyError:
+            pass
+        finally:
+            self._evicting = False
+        return size - self.currsize
+
+
+class MemoryBudgetedCache(Protocol):
+    """A cache whose in-memory entries count against the cache memory budget."""
+
+    @property
+    def memory_size(self) -> int:
+        """The total size of the cache's in-memory entries in bytes."""
+        raise NotImplementedError
+
+    def evict_lru_entry(self) -> int:
+        """Evict the least recently used in-memory entry and return the number
+        of bytes that were freed, or 0 if the cache is empty.
+        """
+        raise NotImplementedError
+
+
+class CacheMemoryBudget:
+    """Bounds the total size of the in-memory entries of all st.cache_data and
+    st.cache_resource caches to `runner.cacheMaxSize`, by evicting the least
+    recently used entries of the largest caches.
+    """
+
+    def __init__(self):
+        self._caches: weakref.WeakSet[MemoryBudgetedCache] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> float:
+        """The budget in bytes, or infinity if it's unbounded."""
+        max_size_mb = config.get_option("runner.cacheMaxSize")
+        return max_size_mb * 1024 * 1024 if max_size_mb > 0 else math.inf
+
+    def register(self, cache: MemoryBudgetedCache) -> None:
+        with self._lock:
+            self._caches.add(cache)
+
+    def enforce(self) -> None:
+        """Evict entries until the caches fit into the budget.
+
+        Call this after writing to a cache, without holding any cache locks.
+        """
+        max_size = self.max_size
+        if max_size == math.inf:
+            return
+
+        with self._lock:
+            sizes = {cache: cache.memory_size for cache in self._caches}
+            total_size = sum(sizes.values())
+            while total_size > max_size and sizes:
+                largest_cache = max(sizes, key=sizes.__getitem__)
+                freed_size = largest_cache.evict_lru_entry()
+                if freed_size == 0:
+                    del sizes[largest_cache]
+                    continue
+                sizes[largest_cache] -= freed_size
+                total_size -= freed_size
+
+
+# Singleton CacheMemoryBudget instance
+_cache_memory_budget = CacheMemoryBudget()
+
+
+def get_cache_memory_budget() -> CacheMemoryBudget:
+    """Return the budget shared by the st.cache_data and st.cache_resource
+    caches.
+    """
+    return _cache_memory_budget
+
+
+class _Computation:
+    """A cached value that is being computed by one caller, which concurrent
+    callers with the same value key wait for.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        # Returns the computed result to the waiting callers. Set once the
+        # result was written to the cache, and left as None if that failed.
+        self.get_result: Callable[[], CachedResult] | None = None
+
 
 class Cache:
     """Function cache interface. Caches persist across script runs."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int | None = None):
+        self.max_concurrency = max_concurrency
         self._value_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
         self._value_locks_lock = threading.Lock()
+        # The keys of values that are being computed in the background, and
+        # of values that were prewarmed. Guarded by _value_locks_lock.
+        self._background_keys: set[str] = set()
+        self._prewarmed_keys: set[str] = set()
+        # The values that are being computed by a caller that missed the
+        # cache. Guarded by _value_locks_lock.
+        self._computations: dict[str, _Computation] = {}
+        self._computation_slots = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )
+        # Whether the current thread holds a computation slot, so that a
+        # cached function that calls itself doesn't wait for its own slot.
+        self._slot_holders = threading.local()
 
     @abstractmethod
     def read_result(self, value_key: str) -> CachedResult:
@@ -80,9 +296,15 @@ class Cache:
         raise NotImplementedError
 
     @abstractmethod
-    def write_result(self, value_key: str, value: Any, messages: list[MsgData]) -> None:
+    def write_result(
+        self, value_key: str, value: Any, messages: list[MsgData]
+    ) -> Callable[[], CachedResult]:
         """Write a value and associated messages to the cache, overwriting any existing
         result that uses the value_key.
+
+        Return a function that returns the written result, which is handed to
+        the callers that waited for the value to be computed, instead of them
+        reading it from the cache.
         """
         # We *could* `del self._value_locks[value_key]` here, since nobody will be taking
         # a compute_value_lock for this value_key after the result is written.
@@ -98,6 +320,73 @@ class Cache:
         with self._value_locks_lock:
             return self._value_locks[value_key]
 
+    def join_computation(self, value_key: str) -> tuple[_Computation, bool]:
+        """Return the computation of a value that missed the cache, and True if
+        the caller started it, so that it must compute the value and call
+        end_computation. Otherwise, the caller can wait for it to be done.
+        """
+        with self._value_locks_lock:
+            computation = self._computations.get(value_key)
+            if computation is not None:
+                return computation, False
+            computation = self._computations[value_key] = _Computation()
+            return computation, True
+
+    def end_computation(self, value_key: str, computation: _Computation) -> None:
+        with self._value_locks_lock:
+            if self._computations.get(value_key) is computation:
+                del self._computations[value_key]
+        computation.done.set()
+
+    @contextlib.contextmanager
+    def computation_slot(self) -> Iterator[bool]:
+        """Hold one of the function's max_concurrency slots for computing values.
+        Yield True if there was no free slot, so that the caller had to wait.
+        """
+        if self._computation_slots is None or getattr(
+            self._slot_holders, "holds_slot", False
+        ):
+            yield False
+            return
+
+        waited = not self._computation_slots.acquire(blocking=False)
+        if waited:
+            self._computation_slots.acquire()
+        self._slot_holders.holds_slot = True
+        try:
+            yield waited
+        finally:
+            self._slot_holders.holds_slot = False
+            self._computation_slots.release()
+
+    def is_stale(self, value_key: str) -> bool:
+        """Return True if a cached value has expired, but can still be returned
+        while it's recomputed in the background.
+        """
+        return False
+
+    def start_background_computation(self, value_key: str) -> bool:
+        """Mark a value as being computed in the background. Return False if
+        it's already being computed.
+        """
+        with self._value_locks_lock:
+            if value_key in self._background_keys:
+                return False
+            self._background_keys.add(value_key)
+            return True
+
+    def end_background_computation(self, value_key: str) -> None:
+        with self._value_locks_lock:
+            self._background_keys.discard(value_key)
+
+    def mark_prewarmed(self, value_key: str) -> bool:
+        """Mark a value as prewarmed. Return False if it already was."""
+        with self._value_locks_lock:
+            if value_key in self._prewarmed_keys:
+                return False
+            self._prewarmed_keys.add(value_key)
+            return True
+
     def clear(self, key: str | None = None):
         """Clear values from this cache.
         If no argument is passed, all items are cleared from the cache.
@@ -105,8 +394,10 @@ class Cache:
         with self._value_locks_lock:
             if not key:
                 self._value_locks.clear()
-            elif key in self._value_locks:
-                del self._value_locks[key]
+                self._prewarmed_keys.clear()
+            else:
+                self._value_locks.pop(key, None)
+                self._prewarmed_keys.discard(key)
         self._clear(key=key)
 
     @abstractmethod
@@ -187,7 +478,8 @@ class BoundCachedFunc:
 class CachedFunc:
     def __init__(self, info: CachedFuncInfo):
         self._info = info
-        self._function_key = _make_function_key(info.cache_type, info.func)
+        self._function_key = _get_function_key(info.cache_type, info.func)
+        self._positional_arg_names = _get_positional_arg_names(info.func)
 
     def __repr__(self):
         return f"<CachedFunc: {self._info.func}>"
@@ -218,6 +510,13 @@ class CachedFunc:
         else:
             return self._get_or_create_cached_value(args, kwargs)
 
+    @property
+    def _metric_cache_type(self) -> str:
+        """The cache_type label of the cache's performance metrics, e.g.
+        "st_cache_data".
+        """
+        return f"st_cache_{self._info.cache_type.value.lower()}"
+
     def _get_or_create_cached_value(
         self, func_args: tuple[Any, ...], func_kwargs: dict[str, Any]
     ) -> Any:
@@ -231,6 +530,7 @@ class CachedFunc:
         value_key = _make_value_key(
             cache_type=self._info.cache_type,
             func=self._info.func,
+            positional_arg_names=self._positional_arg_names,
             func_args=func_args,
             func_kwargs=func_kwargs,
             hash_funcs=self._info.hash_funcs,
@@ -238,11 +538,16 @@ class CachedFunc:
 
         with contextlib.suppress(CacheKeyNotFoundError):
             cached_result = cache.read_result(value_key)
+            if cache.is_stale(value_key):
+                self._compute_in_background(
+                    cache, value_key, func_args, func_kwargs, only_if_stale=True
+                )
             return self._handle_cache_hit(cached_result)
         return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
 
     def _handle_cache_hit(self, result: CachedResult) -> Any:
         """Handle a cache hit: replay the result's cached messages, and return its value."""
+        cache_hits.inc(cache_type=self._metric_cache_type)
         replay_cached_messages(
             result,
             self._info.cache_type,
@@ -262,11 +567,18 @@ class CachedFunc:
         """
 
         # Implementation notes:
-        # - We take a "compute_value_lock" before computing our value. This ensures that
-        #   multiple sessions don't try to compute the same value simultaneously.
+        # - Concurrent callers of the same value_key are coalesced into a single
+        #   computation: the first caller computes the value, and the others wait
+        #   for it and receive its result, instead of each of them reading the
+        #   value back from the cache (which, for st.cache_data, means fetching it
+        #   from the storage). If the computation fails, the waiting callers
+        #   compute the value themselves, one after another.
         #
-        # - We use a different lock for each value_key, as opposed to a single lock for
-        #   the entire cache, so that unrelated value computations don't block on each other.
+        # - The computing caller also takes a "compute_value_lock", which is held
+        #   by values that are being recomputed in the background as well. We use
+        #   a different lock for each value_key, as opposed to a single lock for
+        #   the entire cache, so that unrelated value computations don't block on
+        #   each other.
         #
         # - When retrieving a cache entry that may not yet exist, we use a "double-checked locking"
         #   strategy: first we try to retrieve the cache entry without taking a value lock. (This
@@ -278,7 +590,37 @@ class CachedFunc:
         #   This means that the happy path ("cache entry exists") is a wee bit faster because
         #   no lock is acquired. But the unhappy path ("cache entry needs to be recomputed") is
         #   a wee bit slower, because we do two lookups for the entry.
+        #
+        # - If the function has a max_concurrency, computing the value also takes
+        #   one of its slots, so that at most that many values are computed at once.
+
+        while True:
+            computation, must_compute = cache.join_computation(value_key)
+            if must_compute:
+                break
+            computation.done.wait()
+            if computation.get_result is not None:
+                cache_coalesced_calls.inc(cache_type=self._metric_cache_type)
+                return self._handle_cache_hit(computation.get_result())
+
+        try:
+            return self._compute_cached_value(
+                cache, computation, value_key, func_args, func_kwargs
+            )
+        finally:
+            cache.end_computation(value_key, computation)
 
+    def _compute_cached_value(
+        self,
+        cache: Cache,
+        computation: _Computation,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Compute a value that missed the cache as part of the given
+        computation, write it to the cache, and return it.
+        """
         with cache.compute_value_lock(value_key):
             # We've acquired the lock - but another thread may have acquired it first
             # and already computed the value. So we need to test for a cache hit again,
@@ -293,16 +635,22 @@ class CachedFunc:
                 pass
 
             # We acquired the lock before any other thread. Compute the value!
-            with self._info.cached_message_replay_ctx.calling_cached_function(
-                self._info.func
-            ):
-                computed_value = self._info.func(*func_args, **func_kwargs)
+            cache_misses.inc(cache_type=self._metric_cache_type)
+            with cache.computation_slot() as waited:
+                if waited:
+                    cache_computation_waits.inc(cache_type=self._metric_cache_type)
+                with self._info.cached_message_replay_ctx.calling_cached_function(
+                    self._info.func
+                ):
+                    computed_value = self._info.func(*func_args, **func_kwargs)
 
             # We've computed our value, and now we need to write it back to the cache
             # along with any "replay messages" that were generated during value computation.
             messages = self._info.cached_message_replay_ctx._most_recent_messages
             try:
-                cache.write_result(value_key, computed_value, messages)
+                computation.get_result = cache.write_result(
+                    value_key, computed_value, messages
+                )
                 return computed_value
             except (CacheError, RuntimeError) as ex:
                 # An exception was thrown while we tried to write to the cache. Report
@@ -325,6 +673,81 @@ class CachedFunc:
                     return_value=computed_value, func=self._info.func
                 )
 
+    def _compute_in_background(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+        only_if_stale: bool,
+    ) -> None:
+        """Compute a value and write it to the cache on a background thread,
+        unless it's already being computed.
+
+        The thread has no ScriptRunContext, so a function that calls Streamlit
+        commands which produce elements can't be cached from it. In that case,
+        the value is removed from the cache instead, so that the next call
+        computes it in the script thread.
+        """
+        if not cache.start_background_computation(value_key):
+            return
+
+        def compute() -> None:
+            try:
+                with cache.compute_value_lock(value_key):
+                    if only_if_stale and not cache.is_stale(value_key):
+                        # Another thread recomputed the value in the meantime.
+                        return
+                    cache_background_computations.inc(
+                        cache_type=self._metric_cache_type
+                    )
+                    replay_ctx = self._info.cached_message_replay_ctx
+                    with cache.computation_slot() as waited:
+                        if waited:
+                            cache_computation_waits.inc(
+                                cache_type=self._metric_cache_type
+                            )
+                        with replay_ctx.calling_cached_function(self._info.func):
+                            computed_value = self._info.func(*func_args, **func_kwargs)
+                    messages = replay_ctx._most_recent_messages
+                    if messages:
+                        cache.clear(key=value_key)
+                    else:
+                        cache.write_result(value_key, computed_value, messages)
+            except Exception:
+                _LOGGER.warning(
+                    "Failed to compute a value of %s in the background",
+                    self._info.func.__qualname__,
+                    exc_info=True,
+                )
+            finally:
+                cache.end_background_computation(value_key)
+
+        _get_background_executor().submit(compute)
+
+    def _prewarm(self, args_list: list[tuple[Any, ...]]) -> None:
+        """Compute the values for the given argument tuples in the background,
+        once per cache.
+        """
+        cache = self._info.get_function_cache(self._function_key)
+        for func_args in args_list:
+            value_key = _make_value_key(
+                cache_type=self._info.cache_type,
+                func=self._info.func,
+                positional_arg_names=self._positional_arg_names,
+                func_args=func_args,
+                func_kwargs={},
+                hash_funcs=self._info.hash_funcs,
+            )
+            if not cache.mark_prewarmed(value_key):
+                continue
+            try:
+                cache.read_result(value_key)
+            except CacheKeyNotFoundError:
+                self._compute_in_background(
+                    cache, value_key, func_args, {}, only_if_stale=False
+                )
+
     def clear(self, *args, **kwargs):
         """Clear the cached function's associated cache.
 
@@ -367,6 +790,7 @@ class CachedFunc:
             key = _make_value_key(
                 cache_type=self._info.cache_type,
                 func=self._info.func,
+                positional_arg_names=self._positional_arg_names,
                 func_args=args,
                 func_kwargs=kwargs,
                 hash_funcs=self._info.hash_funcs,
@@ -379,6 +803,7 @@ class CachedFunc:
 def _make_value_key(
     cache_type: CacheType,
     func: FunctionType,
+    positional_arg_names: tuple[str | None, ...],
     func_args: tuple[Any, ...],
     func_kwargs: dict[str, Any],
     hash_funcs: HashFuncsDict | None,
@@ -387,6 +812,7 @@ def _make_value_key(
 
     This key is generated from the function's arguments. All arguments
     will be hashed, except for those named with a leading "_".
+    positional_arg_names must be the result of _get_positional_arg_names(func).
 
     Raises
     ------
@@ -398,9 +824,13 @@ def _make_value_key(
     # Create a (name, value) list of all *args and **kwargs passed to the
     # function.
     arg_pairs: list[tuple[str | None, Any]] = []
-    for arg_idx in range(len(func_args)):
-        arg_name = _get_positional_arg_name(func, arg_idx)
-        arg_pairs.append((arg_name, func_args[arg_idx]))
+    for arg_idx, arg_value in enumerate(func_args):
+        arg_name = (
+            positional_arg_names[arg_idx]
+            if arg_idx < len(positional_arg_names)
+            else None
+        )
+        arg_pairs.append((arg_name, arg_value))
 
     for kw_name, kw_val in func_kwargs.items():
         # **kwargs ordering is preserved, per PEP 468
@@ -443,6 +873,43 @@ def _make_value_key(
     return value_key
 
 
+def _get_function_memo_key(func: FunctionType) -> _FunctionMemoKey | None:
+    """Return the key that a function's memoized key and positional argument
+    names are stored under, or None if they can't be memoized.
+
+    Functions are identified by their code object (or the code object of the
+    function they wrap). Reruns create new function objects for the functions
+    that are defined in the app script, but these share their code objects with
+    the previous run, since the compiled script is reused until its source
+    changes, and changed modules are re-imported. So the memoized values are
+    reused across reruns, and invalidated when a function's source changes.
+    """
+    if hasattr(func, "__signature__"):
+        # The signature was overridden, and isn't derived from the code.
+        return None
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return None
+    return (func.__module__, func.__qualname__, code)
+
+
+def _get_function_key(cache_type: CacheType, func: FunctionType) -> str:
+    """Return the unique key for a function's cache, computing it only once
+    per version of the function's source code.
+    """
+    memo_key = _get_function_memo_key(func)
+    if memo_key is None:
+        return _make_function_key(cache_type, func)
+
+    with _function_memo_lock:
+        function_key = _function_keys.get((cache_type, memo_key))
+    if function_key is None:
+        function_key = _make_function_key(cache_type, func)
+        with _function_memo_lock:
+            _function_keys[(cache_type, memo_key)] = function_key
+    return function_key
+
+
 def _make_function_key(cache_type: CacheType, func: FunctionType) -> str:
     """Create the unique key for a function's cache.
 
@@ -481,24 +948,31 @@ def _make_function_key(cache_type: CacheType, func: FunctionType) -> str:
     return func_hasher.hexdigest()
 
 
-def _get_positional_arg_name(func: FunctionType, arg_index: int) -> str | None:
-    """Return the name of a function's positional argument.
+def _get_positional_arg_names(func: FunctionType) -> tuple[str | None, ...]:
+    """Return the names of a function's parameters, indexed by the position
+    of the arguments they receive.
 
-    If arg_index is out of range, or refers to a parameter that is not a
-    named positional argument (e.g. an *args, **kwargs, or keyword-only param),
-    return None instead.
+    Parameters that are not named positional arguments (e.g. *args, **kwargs,
+    or keyword-only params) are None. Arguments at positions beyond the end of
+    the tuple don't have a name either.
     """
-    if arg_index < 0:
-        return None
-
-    params: list[inspect.Parameter] = list(inspect.signature(func).parameters.values())
-    if arg_index >= len(params):
-        return None
-
-    if params[arg_index].kind in (
+    memo_key = _get_function_memo_key(func)
+    if memo_key is not None:
+        with _function_memo_lock:
+            arg_names = _positional_arg_names.get(memo_key)
+        if arg_names is not None:
+            return arg_names
+
+    positional_kinds = (
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
         inspect.Parameter.POSITIONAL_ONLY,
-    ):
-        return params[arg_index].name
+    )
+    arg_names = tuple(
+        param.name if param.kind in positional_kinds else None
+        for param in inspect.signature(func).parameters.values()
+    )
 
-    return None
+    if memo_key is not None:
+        with _function_memo_lock:
+            _positional_arg_names[memo_key] = arg_names
+    return arg_names
@@ -23,6 +23,7 @@ import streamlit as st
 from streamlit import runtime, util
 from streamlit.deprecation_util import show_deprecation_warning
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
+from streamlit.runtime.forward_msg_cache import compute_element_hash
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
     in_cached_function,
 )
@@ -39,9 +40,17 @@ if TYPE_CHECKING:
 
 @dataclass(frozen=True)
 class MediaMsgData:
+    """A media file of an element, for registering it with the MediaFileManager
+    when replaying the element.
+
+    file_id is the ID the MediaFileManager gave the file, which is reused if
+    the file still exists, so that its data doesn't have to be hashed again.
+    """
+
     media: bytes | str
     mimetype: str
     media_id: str
+    file_id: str | None = None
 
 
 @dataclass(frozen=True)
@@ -50,6 +59,10 @@ class ElementMsgData:
     replaying that element's function call.
 
     media_data is filled in iff this is a media element (image, audio, video).
+
+    element_hash is the hash of the message, from which the hash of the
+    replayed ForwardMsg is computed, so that the message doesn't have to be
+    serialized to look it up in the ForwardMsgCache.
     """
 
     delta_type: str
@@ -57,6 +70,7 @@ class ElementMsgData:
     id_of_dg_called_on: str
     returned_dgs_id: str
     media_data: list[MediaMsgData] | None = None
+    element_hash: str | None = None
 
 
 @dataclass(frozen=True)
@@ -163,6 +177,7 @@ class CachedMessageReplayContext(threading.local):
         invoked_dg_id: str,
         used_dg_id: str,
         returned_dg_id: str,
+        element_hash: str | None = None,
     ) -> None:
         """Record the element protobuf as having been produced during any currently
         executing cached functions, so they can be replayed any time the function's
@@ -181,6 +196,7 @@ class CachedMessageReplayContext(threading.local):
                 id_to_save,
                 returned_dg_id,
                 media_data,
+                element_hash or compute_element_hash(delta_type, element_proto),
             )
             for msgs in self._cached_message_stack:
                 msgs.append(element_msg_data)
@@ -223,7 +239,11 @@ class CachedMessageReplayContext(threading.local):
     def save_image_data(
         self, image_data: bytes | str, mimetype: str, image_id: str
     ) -> None:
-        self._media_data.append(MediaMsgData(image_data, mimetype, image_id))
+        if not self._cached_message_stack or not runtime.exists():
+            return
+        # The media was just added to the MediaFileManager at these coordinates.
+        file_id = runtime.get_instance().media_file_mgr.get_file_id(image_id)
+        self._media_data.append(MediaMsgData(image_data, mimetype, image_id, file_id))
 
 
 def replay_cached_messages(
@@ -256,12 +276,16 @@ def replay_cached_messages(
         for msg in result.messages:
             if isinstance(msg, ElementMsgData):
                 if msg.media_data is not None:
+                    media_file_mgr = runtime.get_instance().media_file_mgr
                     for data in msg.media_data:
-                        runtime.get_instance().media_file_mgr.add(
-                            data.media, data.mimetype, data.media_id
-                        )
+                        if data.file_id is None or not media_file_mgr.add_ref(
+                            data.file_id, data.media_id
+                        ):
+                            media_file_mgr.add(data.media, data.mimetype, data.media_id)
                 dg = returned_dgs[msg.id_of_dg_called_on]
-                maybe_dg = dg._enqueue(msg.delta_type, msg.message)
+                maybe_dg = dg._enqueue(
+                    msg.delta_type, msg.message, element_hash=msg.element_hash
+                )
                 if isinstance(maybe_dg, DeltaGenerator):
                     returned_dgs[msg.returned_dgs_id] = maybe_dg
             elif isinstance(msg, BlockMsgData):
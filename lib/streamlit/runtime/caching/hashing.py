@@ -33,17 +33,32 @@ import uuid
 import weakref
 from enum import Enum
 from types import MappingProxyType
-from typing import Any, Callable, Dict, Final, Pattern, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    NamedTuple,
+    Pattern,
+    Type,
+    Union,
+    cast,
+)
 
 from typing_extensions import TypeAlias
 
-from streamlit import type_util, util
+from streamlit import config, type_util, util
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching.cache_errors import UnhashableTypeError
 from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 from streamlit.util import HASHLIB_KWARGS
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # If a dataframe has more than this many rows, we consider it large and hash a sample.
 _PANDAS_ROWS_LARGE: Final = 100000
 _PANDAS_SAMPLE_SIZE: Final = 10000
@@ -275,6 +290,80 @@ def _key(obj: Any | None) -> Any:
     return NoResult
 
 
+def _hash_full_data() -> bool:
+    return bool(config.get_option("runner.cacheHashFullData"))
+
+
+class MemoizedDataHash(NamedTuple):
+    """The hash of a large immutable array, memoized for a script run."""
+
+    # Weak references to the objects returned by _get_data_version when the
+    # hash was computed.
+    data_refs: tuple[weakref.ReferenceType[Any], ...]
+    properties: tuple[Any, ...]
+    hash_bytes: bytes
+
+    def is_current(self, data_objects: list[Any], properties: tuple[Any, ...]) -> bool:
+        """Return True if the hashed object still has the given version."""
+        return (
+            self.properties == properties
+            and len(self.data_refs) == len(data_objects)
+            and all(ref() is o for ref, o in zip(self.data_refs, data_objects))
+        )
+
+
+def _is_immutable_ndarray(arr: Any) -> bool:
+    """True if the data of a numpy array can't be modified, neither through
+    the array itself nor through the arrays or buffers it's a view of.
+    """
+    import numpy as np
+
+    while isinstance(arr, np.ndarray):
+        if arr.flags.writeable:
+            return False
+        arr = arr.base
+    # Other buffers, like memory-mapped files, may be modified.
+    return arr is None or isinstance(arr, bytes)
+
+
+def _get_data_version(obj: Any) -> tuple[list[Any], tuple[Any, ...]] | None:
+    """Return the version of a large array, for memoizing its hash: the
+    objects that hold its data, and the properties that can be modified
+    without replacing them.
+
+    Only arrays whose data can't be modified in place are memoized, since
+    there's no cheap way to detect in-place modifications like `arr *= 2`.
+    Dataframes and writeable arrays are hashed on every call, which is cheap
+    for a sample of them (see _get_sample_positions).
+
+    Returns None if obj isn't large enough to be worth memoizing, or if it
+    may be modified in place.
+    """
+    if not type_util.is_type(obj, "numpy.ndarray"):
+        return None
+    if obj.size < _NP_SIZE_LARGE or not _is_immutable_ndarray(obj):
+        return None
+    return [obj], (obj.shape, obj.strides, obj.dtype.str, _hash_full_data())
+
+
+@functools.lru_cache(maxsize=16)
+def _get_sample_positions(length: int, sample_size: int, replace: bool) -> Any:
+    """Return the positions of the elements or rows of a large array or
+    dataframe that are hashed.
+
+    These are the same positions that `np.random.RandomState(0).choice` and
+    `DataFrame.sample(random_state=0)` pick. Generating them takes longer than
+    hashing the sample, so they're memoized.
+    """
+    import numpy as np
+
+    positions = np.random.RandomState(0).choice(
+        length, size=sample_size, replace=replace
+    )
+    positions.flags.writeable = False
+    return positions
+
+
 class _CacheFuncHasher:
     """A hasher that can hash objects with cycles."""
 
@@ -413,61 +502,14 @@ class _CacheFuncHasher:
             return str(obj).encode()
 
         elif type_util.is_type(obj, "pandas.core.series.Series"):
-            import pandas as pd
-
-            obj = cast(pd.Series, obj)
-            self.update(h, obj.size)
-            self.update(h, obj.dtype.name)
-
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
-
-            try:
-                self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
-                return h.digest()
-            except TypeError:
-                # Use pickle if pandas cannot hash the object for example if
-                # it contains unhashable objects.
-                return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+            return self._memoized_to_bytes(obj, self._series_to_bytes)
 
         elif type_util.is_type(obj, "pandas.core.frame.DataFrame"):
-            import pandas as pd
-
-            obj = cast(pd.DataFrame, obj)
-            self.update(h, obj.shape)
-
-            if len(obj) >= _PANDAS_ROWS_LARGE:
-                obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
-            try:
-                column_hash_bytes = self.to_bytes(
-                    pd.util.hash_pandas_object(obj.dtypes)
-                )
-                self.update(h, column_hash_bytes)
-                values_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj))
-                self.update(h, values_hash_bytes)
-                return h.digest()
-            except TypeError:
-                # Use pickle if pandas cannot hash the object for example if
-                # it contains unhashable objects.
-                return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+            return self._memoized_to_bytes(obj, self._dataframe_to_bytes)
 
         elif type_util.is_type(obj, "numpy.ndarray"):
-            import numpy as np
-
-            # write cast type as string to make it work with our Python 3.8 tests
-            # - can be removed once we sunset support for Python 3.8
-            obj = cast("np.ndarray[Any, Any]", obj)
-            self.update(h, obj.shape)
-            self.update(h, str(obj.dtype))
+            return self._memoized_to_bytes(obj, self._ndarray_to_bytes)
 
-            if obj.size >= _NP_SIZE_LARGE:
-                import numpy as np
-
-                state = np.random.RandomState(0)
-                obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
-
-            self.update(h, obj.tobytes())
-            return h.digest()
         elif type_util.is_type(obj, "PIL.Image.Image"):
             import numpy as np
             from PIL.Image import Image
@@ -568,6 +610,89 @@ class _CacheFuncHasher:
                 self.update(h, item)
             return h.digest()
 
+    def _memoized_to_bytes(self, obj: Any, to_bytes: Callable[[Any], bytes]) -> bytes:
+        """Hash a dataframe or array with to_bytes, reusing its hash if it's
+        a large immutable array that was already hashed earlier in the script
+        run.
+
+        See _get_data_version for which objects are memoized.
+        """
+        version = _get_data_version(obj)
+        ctx = get_script_run_ctx(suppress_warning=True) if version else None
+        if version is None or ctx is None:
+            return to_bytes(obj)
+
+        data_objects, properties = version
+        memoized_hash = ctx.data_hashes_this_run.get(id(obj))
+        if memoized_hash is not None and memoized_hash.is_current(
+            data_objects, properties
+        ):
+            return memoized_hash.hash_bytes
+
+        hash_bytes = to_bytes(obj)
+        try:
+            data_refs = tuple(weakref.ref(o) for o in data_objects)
+        except TypeError:
+            # Some of the objects can't be weakly referenced.
+            return hash_bytes
+        ctx.data_hashes_this_run[id(obj)] = MemoizedDataHash(
+            data_refs, properties, hash_bytes
+        )
+        return hash_bytes
+
+    def _series_to_bytes(self, obj: Any) -> bytes:
+        import pandas as pd
+
+        obj = cast(pd.Series, obj)
+        h = hashlib.new("md5", **HASHLIB_KWARGS)
+        self.update(h, obj.size)
+        self.update(h, obj.dtype.name)
+
+        if len(obj) >= _PANDAS_ROWS_LARGE and not _hash_full_data():
+            obj = obj.take(_get_sample_positions(len(obj), _PANDAS_SAMPLE_SIZE, False))
+
+        try:
+            self.update(h, pd.util.hash_pandas_object(obj).values.tobytes())
+            return h.digest()
+        except TypeError:
+            # Use pickle if pandas cannot hash the object for example if
+            # it contains unhashable objects.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _dataframe_to_bytes(self, obj: Any) -> bytes:
+        import pandas as pd
+
+        obj = cast(pd.DataFrame, obj)
+        h = hashlib.new("md5", **HASHLIB_KWARGS)
+        self.update(h, obj.shape)
+
+        if len(obj) >= _PANDAS_ROWS_LARGE and not _hash_full_data():
+            obj = obj.take(_get_sample_positions(len(obj), _PANDAS_SAMPLE_SIZE, False))
+        try:
+            column_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj.dtypes))
+            self.update(h, column_hash_bytes)
+            values_hash_bytes = self.to_bytes(pd.util.hash_pandas_object(obj))
+            self.update(h, values_hash_bytes)
+            return h.digest()
+        except TypeError:
+            # Use pickle if pandas cannot hash the object for example if
+            # it contains unhashable objects.
+            return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _ndarray_to_bytes(self, obj: Any) -> bytes:
+        # write cast type as string to make it work with our Python 3.8 tests
+        # - can be removed once we sunset support for Python 3.8
+        obj = cast("np.ndarray[Any, Any]", obj)
+        h = hashlib.new("md5", **HASHLIB_KWARGS)
+        self.update(h, obj.shape)
+        self.update(h, str(obj.dtype))
+
+        if obj.size >= _NP_SIZE_LARGE and not _hash_full_data():
+            obj = obj.ravel()[_get_sample_positions(obj.size, _NP_SAMPLE_SIZE, True)]
+
+        self.update(h, obj.tobytes())
+        return h.digest()
+
 
 class NoResult:
     """Placeholder class for return values when None is meaningful."""
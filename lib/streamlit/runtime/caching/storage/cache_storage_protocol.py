@@ -102,6 +102,10 @@ class CacheStorageContext:
         Legacy parameter, that used in Streamlit current cache storage implementation.
         Could be ignored by cache storage implementation, if storage does not support
         persistence or it persistent by default.
+
+    max_size : int or None
+        The maximum total size of the entries to store in the cache storage,
+        in bytes. If None, the cache storage will not limit their size.
     """
 
     function_key: str
@@ -109,6 +113,7 @@ class CacheStorageContext:
     ttl_seconds: float | None = None
     max_entries: int | None = None
     persist: Literal["disk"] | None = None
+    max_size: int | None = None
 
 
 class CacheStorage(Protocol):
@@ -16,8 +16,6 @@ from __future__ import annotations
 import math
 import threading
 
-from cachetools import TTLCache
-
 from streamlit.logger import get_logger
 from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -41,7 +39,9 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     automatically removed if a given time to live (TTL) has passed.
 
     The in-memory cache is also an LRU cache, which means that the entries
-    are automatically removed if the cache size exceeds a given maxsize.
+    are automatically removed if the number of entries exceeds max_entries,
+    or their total size in bytes exceeds max_size. Its entries also count
+    against the global cache memory budget.
 
     If the storage implements its strategy for maxsize, it is recommended
     (but not necessary) that the storage implement the same LRU strategy,
@@ -62,13 +62,18 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         self.function_display_name = context.function_display_name
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
-        self._mem_cache: TTLCache[str, bytes] = TTLCache(
-            maxsize=self.max_entries,
+        self._max_size = context.max_size
+        self._mem_cache = cache_utils.SizeBoundedTTLCache(
+            max_entries=self.max_entries,
+            max_size=self.max_size,
             ttl=self.ttl_seconds,
-            timer=cache_utils.TTLCACHE_TIMER,
+            getsizeof=len,
+            cache_type="st_cache_data",
+            display_name=self.function_display_name,
         )
         self._mem_cache_lock = threading.Lock()
         self._persist_storage = persist_storage
+        cache_utils.get_cache_memory_budget().register(self)
 
     @property
     def ttl_seconds(self) -> float:
@@ -78,6 +83,23 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
+    @property
+    def max_size(self) -> float:
+        return float(self._max_size) if self._max_size is not None else math.inf
+
+    @property
+    def memory_size(self) -> int:
+        """The total size of the in-memory entries in bytes."""
+        with self._mem_cache_lock:
+            return int(self._mem_cache.currsize)
+
+    def evict_lru_entry(self) -> int:
+        """Evict the least recently used in-memory entry, and return the
+        number of bytes that were freed.
+        """
+        with self._mem_cache_lock:
+            return self._mem_cache.evict_lru_entry()
+
     def get(self, key: str) -> bytes:
         """
         Returns the stored value for the key or raise CacheStorageKeyNotFoundError if
@@ -139,6 +161,7 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def _write_to_mem_cache(self, key: str, entry_bytes: bytes) -> None:
         with self._mem_cache_lock:
             self._mem_cache[key] = entry_bytes
+        cache_utils.get_cache_memory_budget().enforce()
 
     def _remove_from_mem_cache(self, key: str) -> None:
         with self._mem_cache_lock:
@@ -33,6 +33,14 @@ if the context is not valid.
 entries from disk for a single `@st.cache_data` decorated function if `persist="disk"`
 is used in CacheStorageContext.
 
+Each entry is stored in its own file, which is written atomically, so that several
+server processes can share the cache folder. The files' metadata serves as the index
+of the cache: the modification time is when the entry was written, which is used to
+expire entries after their TTL, and the access time is when the entry was last read,
+which is used to evict the least recently used entries when a function has more than
+`max_entries` entries, or all entries are larger than `runner.cacheMaxDiskSize`.
+Entries are compressed according to `runner.cacheDiskCompression`.
+
 
     ┌───────────────────────────────┐
     │  LocalDiskCacheStorageManager │
@@ -61,9 +69,12 @@ from __future__ import annotations
 import math
 import os
 import shutil
-from typing import Final
+import time
+import uuid
+import zlib
+from typing import Callable, Final, NamedTuple
 
-from streamlit import errors
+from streamlit import config, errors
 from streamlit.file_util import get_streamlit_file_path, streamlit_read, streamlit_write
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -88,6 +99,98 @@ _CACHE_DIR_NAME: Final = "cache"
 # (`@st.cache_data` was originally called `@st.memo`)
 _CACHED_FILE_EXTENSION: Final = "memo"
 
+# The extension of files that are being written. They're renamed once they're
+# complete, so that other processes never read partially written files.
+_TEMP_FILE_EXTENSION: Final = "tmp"
+
+# Compressed files start with this header, followed by the ID of the
+# compression. Uncompressed files hold the value as is, like the files written
+# by older versions. (Values are pickles, which can't start with the header.)
+_COMPRESSED_FILE_HEADER: Final = b"\x00STCZ"
+
+
+class _Compression(NamedTuple):
+    id: int
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _get_lz4_compression() -> _Compression:
+    import lz4.frame
+
+    return _Compression(2, lz4.frame.compress, lz4.frame.decompress)
+
+
+def _get_zstd_compression() -> _Compression:
+    import zstandard
+
+    return _Compression(
+        3,
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+_COMPRESSIONS: Final[dict[str, Callable[[], _Compression]]] = {
+    "zlib": lambda: _Compression(1, zlib.compress, zlib.decompress),
+    "lz4": _get_lz4_compression,
+    "zstd": _get_zstd_compression,
+}
+_COMPRESSION_NAMES_BY_ID: Final = {1: "zlib", 2: "lz4", 3: "zstd"}
+
+
+def _get_compression(name: str) -> _Compression | None:
+    """Return the compression with the given name, or None if values shouldn't
+    be compressed.
+    """
+    if name == "none":
+        return None
+    get_compression = _COMPRESSIONS.get(name)
+    if get_compression is None:
+        _LOGGER.warning(
+            "Unknown runner.cacheDiskCompression '%s'. Valid values are %s. "
+            "Persisted cache entries won't be compressed.",
+            name,
+            ", ".join(["none", *_COMPRESSIONS]),
+        )
+        return None
+    try:
+        return get_compression()
+    except ImportError:
+        _LOGGER.warning(
+            "runner.cacheDiskCompression is '%s', but the package that implements "
+            "it isn't installed. Persisted cache entries won't be compressed.",
+            name,
+        )
+        return None
+
+
+def _compress(value: bytes, compression: _Compression | None) -> bytes:
+    if compression is None:
+        return value
+    return (
+        _COMPRESSED_FILE_HEADER + bytes([compression.id]) + compression.compress(value)
+    )
+
+
+def _decompress(data: bytes) -> bytes:
+    if not data.startswith(_COMPRESSED_FILE_HEADER):
+        return data
+    compression_id = data[len(_COMPRESSED_FILE_HEADER)]
+    compression = _get_compression(_COMPRESSION_NAMES_BY_ID.get(compression_id, ""))
+    if compression is None:
+        raise CacheStorageError(
+            f"Unable to decompress a cache entry with compression {compression_id}"
+        )
+    return compression.decompress(data[len(_COMPRESSED_FILE_HEADER) + 1 :])
+
+
+class CacheFileInfo(NamedTuple):
+    path: str
+    size: int
+    # When the entry was last read or written, in nanoseconds.
+    access_time_ns: int
+
 
 class LocalDiskCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -103,16 +206,7 @@ class LocalDiskCacheStorageManager(CacheStorageManager):
             shutil.rmtree(cache_path)
 
     def check_context(self, context: CacheStorageContext) -> None:
-        if (
-            context.persist == "disk"
-            and context.ttl_seconds is not None
-            and not math.isinf(context.ttl_seconds)
-        ):
-            _LOGGER.warning(
-                f"The cached function '{context.function_display_name}' has a TTL "
-                "that will be ignored. Persistent cached functions currently don't "
-                "support TTL."
-            )
+        """All contexts are supported."""
 
 
 class LocalDiskCacheStorage(CacheStorage):
@@ -125,6 +219,9 @@ class LocalDiskCacheStorage(CacheStorage):
         self.persist = context.persist
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
+        self._compression = _get_compression(
+            config.get_option("runner.cacheDiskCompression")
+        )
 
     @property
     def ttl_seconds(self) -> float:
@@ -143,12 +240,19 @@ class LocalDiskCacheStorage(CacheStorage):
         if self.persist == "disk":
             path = self._get_cache_file_path(key)
             try:
+                if self._is_expired(path):
+                    self.delete(key)
+                    raise CacheStorageKeyNotFoundError("Key expired in disk cache")
                 with streamlit_read(path, binary=True) as input:
                     value = input.read()
                     _LOGGER.debug("Disk cache HIT: %s", key)
-                    return bytes(value)
+                if self._tracks_access_times():
+                    touch_cache_file(path)
+                return _decompress(bytes(value))
             except FileNotFoundError:
                 raise CacheStorageKeyNotFoundError("Key not found in disk cache")
+            except CacheStorageKeyNotFoundError:
+                raise
             except Exception as ex:
                 _LOGGER.error(ex)
                 raise CacheStorageError("Unable to read from cache") from ex
@@ -161,19 +265,27 @@ class LocalDiskCacheStorage(CacheStorage):
         """Sets the value for a given key"""
         if self.persist == "disk":
             path = self._get_cache_file_path(key)
+            # Write to a temporary file first, and replace the cache file with
+            # it once it's complete, so that no process reads partial files.
+            temp_path = f"{path}.{uuid.uuid4().hex}.{_TEMP_FILE_EXTENSION}"
             try:
-                with streamlit_write(path, binary=True) as output:
-                    output.write(value)
-            except errors.Error as e:
+                with streamlit_write(temp_path, binary=True) as output:
+                    output.write(_compress(value, self._compression))
+                os.replace(temp_path, path)
+            except (errors.Error, OSError) as e:
                 _LOGGER.debug(e)
                 # Clean up file so we don't leave zero byte files.
                 try:
-                    os.remove(path)
+                    os.remove(temp_path)
                 except (FileNotFoundError, OSError):
                     # If we can't remove the file, it's not a big deal.
                     pass
                 raise CacheStorageError("Unable to write to cache") from e
 
+            if self.max_entries != math.inf:
+                self._evict_lru_entries(self.max_entries)
+            _enforce_max_disk_size()
+
     def delete(self, key: str) -> None:
         """Delete a cache file from disk. If the file does not exist on disk,
         return silently. If another exception occurs, log it. Does not throw.
@@ -205,6 +317,24 @@ class LocalDiskCacheStorage(CacheStorage):
     def close(self) -> None:
         """Dummy implementation of close, we don't need to actually "close" anything"""
 
+    def _tracks_access_times(self) -> bool:
+        """True if entries can be evicted, so that their access times matter."""
+        return self.max_entries != math.inf or _get_max_disk_size() != math.inf
+
+    def _is_expired(self, path: str) -> bool:
+        if self.ttl_seconds == math.inf:
+            return False
+        return time.time() - os.stat(path).st_mtime >= self.ttl_seconds
+
+    def _evict_lru_entries(self, max_entries: float) -> None:
+        """Delete the least recently used entries of this storage until there
+        are at most max_entries.
+        """
+        evict_lru_cache_files(
+            list_cache_files(get_cache_folder_path(), self._is_cache_file),
+            max_entries=max_entries,
+        )
+
     def _get_cache_file_path(self, value_key: str) -> str:
         """Return the path of the disk cache file for the given value."""
         cache_dir = get_cache_folder_path()
@@ -221,3 +351,83 @@ class LocalDiskCacheStorage(CacheStorage):
 
 def get_cache_folder_path() -> str:
     return get_streamlit_file_path(_CACHE_DIR_NAME)
+
+
+def _get_max_disk_size() -> float:
+    """The maximum total size of the cache files in bytes."""
+    max_size_mb = config.get_option("runner.cacheMaxDiskSize")
+    return max_size_mb * 1024 * 1024 if max_size_mb > 0 else math.inf
+
+
+def touch_cache_file(path: str) -> None:
+    """Set a cache file's access time to now, keeping its modification time."""
+    try:
+        os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+    except FileNotFoundError:
+        # Another process deleted the file in the meantime.
+        pass
+
+
+def list_cache_files(
+    cache_dir: str, is_cache_file: Callable[[str], bool]
+) -> list[CacheFileInfo]:
+    """Return the cache files in cache_dir whose names pass is_cache_file."""
+    cache_files = []
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not is_cache_file(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                cache_files.append(
+                    CacheFileInfo(entry.path, stat.st_size, stat.st_atime_ns)
+                )
+    except FileNotFoundError:
+        pass
+    return cache_files
+
+
+def remove_cache_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # Another process deleted the file in the meantime.
+        pass
+
+
+def evict_lru_cache_files(
+    cache_files: list[CacheFileInfo],
+    max_entries: float = math.inf,
+    max_size: float = math.inf,
+) -> None:
+    """Delete the least recently used of the given cache files until there are
+    at most max_entries of them, and their total size is at most max_size.
+    """
+    num_files = len(cache_files)
+    total_size = sum(cache_file.size for cache_file in cache_files)
+    for cache_file in sorted(cache_files, key=lambda f: f.access_time_ns):
+        if num_files <= max_entries and total_size <= max_size:
+            break
+        remove_cache_file(cache_file.path)
+        num_files -= 1
+        total_size -= cache_file.size
+
+
+def _is_any_cache_file(fname: str) -> bool:
+    return fname.endswith(f".{_CACHED_FILE_EXTENSION}")
+
+
+def _enforce_max_disk_size() -> None:
+    """Delete the least recently used cache files of all functions until their
+    total size is at most runner.cacheMaxDiskSize.
+    """
+    max_size = _get_max_disk_size()
+    if max_size == math.inf:
+        return
+    evict_lru_cache_files(
+        list_cache_files(get_cache_folder_path(), _is_any_cache_file),
+        max_size=max_size,
+    )
@@ -0,0 +1,367 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declares the SharedMemoryCacheStorageManager class, which is used to create
+SharedMemoryCacheStorage instances, and is selected with
+`runner.cacheStorage = "shared_memory"`.
+
+Declares the SharedMemoryCacheStorage class, which stores the cached values of
+a single `@st.cache_data` decorated function in shared memory, so that all
+Streamlit server processes on the same machine share them, instead of each
+process computing and holding its own copy.
+
+How these classes work together
+-------------------------------
+
+- SharedMemoryCacheStorageManager : each instance of this is able to create
+SharedMemoryCacheStorage instances, and to clear the data of all of them.
+
+- SharedMemoryCacheStorage : each instance of this is able to get, set, delete,
+and clear the shared entries of a single `@st.cache_data` decorated function.
+If `persist="disk"` is used in CacheStorageContext, the entries are also
+persisted to a LocalDiskCacheStorage, which is read when an entry isn't in
+shared memory, e.g. after a restart of the machine.
+
+Each entry is stored in its own file in a memory-backed directory (`/dev/shm`
+where available), and read with mmap, so reads don't hit the disk and the
+operating system keeps a single copy of each entry for all processes. Like in
+LocalDiskCacheStorage, entries are written atomically, and the files' metadata
+serves as the index of the cache that all processes see: the modification time
+is used to expire entries after their TTL, and the access time to evict the
+least recently used entries when a function has more than `max_entries`
+entries, or entries larger than `max_size`, or all entries are larger than
+`runner.cacheMaxSharedMemorySize`.
+
+    ┌─────────────────────────────────┐
+    │ SharedMemoryCacheStorageManager │
+    │                                 │
+    │     - clear_all                 │
+    │     - check_context             │
+    │                                 │
+    └──┬──────────────────────────────┘
+       │
+       │                ┌──────────────────────────────┐
+       │                │                              │
+       │ create(context)│   SharedMemoryCacheStorage   │
+       └────────────────►                              │
+                        │    ┌─────────────────────┐   │
+                        │    │                     │   │
+                        │    │   LocalDiskStorage  │   │
+                        │    │                     │   │
+                        │    └─────────────────────┘   │
+                        │                              │
+                        └──────────────────────────────┘
+
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import stat
+import tempfile
+import threading
+import time
+import uuid
+from typing import Final
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.caching.storage.cache_storage_protocol import (
+    CacheStorage,
+    CacheStorageContext,
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+    CacheStorageManager,
+)
+from streamlit.runtime.caching.storage.local_disk_cache_storage import (
+    LocalDiskCacheStorage,
+    LocalDiskCacheStorageManager,
+    evict_lru_cache_files,
+    list_cache_files,
+    remove_cache_file,
+    touch_cache_file,
+)
+
+_LOGGER: Final = get_logger(__name__)
+
+# Memory-backed directory in which the shared cache directory is created, if the
+# operating system has one. Otherwise, the temporary directory is used.
+_SHARED_MEMORY_DIR: Final = "/dev/shm"
+
+# The cache directory is private to the user that runs Streamlit, since its
+# entries are unpickled. Its name includes the user ID.
+_CACHE_DIR_NAME: Final = "streamlit-cache"
+
+_CACHED_FILE_EXTENSION: Final = "memo"
+
+_TEMP_FILE_EXTENSION: Final = "tmp"
+
+
+class SharedMemoryCacheStorageManager(CacheStorageManager):
+    def create(self, context: CacheStorageContext) -> CacheStorage:
+        """Creates a new shared cache storage instance, which also persists
+        its entries to disk if the context asks for it.
+        """
+        return SharedMemoryCacheStorage(
+            persist_storage=LocalDiskCacheStorage(context), context=context
+        )
+
+    def clear_all(self) -> None:
+        # The directory itself is kept, since other processes may have checked
+        # it already.
+        cache_path = get_shared_cache_folder_path()
+        if _is_private_dir(cache_path):
+            for fname in os.listdir(cache_path):
+                remove_cache_file(os.path.join(cache_path, fname))
+        LocalDiskCacheStorageManager().clear_all()
+
+    def check_context(self, context: CacheStorageContext) -> None:
+        """All contexts are supported."""
+
+
+class SharedMemoryCacheStorage(CacheStorage):
+    """Cache storage that keeps its entries in shared memory, where all server
+    processes on the machine can read them.
+
+    Notes
+    -----
+    Threading: the storage doesn't hold any state in memory, and writes files
+    atomically, so it's safe to use from multiple threads and processes.
+    """
+
+    def __init__(self, persist_storage: CacheStorage, context: CacheStorageContext):
+        self.function_key = context.function_key
+        self.function_display_name = context.function_display_name
+        self._ttl_seconds = context.ttl_seconds
+        self._max_entries = context.max_entries
+        self._max_size = context.max_size
+        self._persist_storage = persist_storage
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else math.inf
+
+    @property
+    def max_entries(self) -> float:
+        return float(self._max_entries) if self._max_entries is not None else math.inf
+
+    @property
+    def max_size(self) -> float:
+        return float(self._max_size) if self._max_size is not None else math.inf
+
+    def get(self, key: str) -> bytes:
+        """
+        Returns the stored value for the key or raise CacheStorageKeyNotFoundError if
+        the key is not found
+        """
+        try:
+            return self._read_from_shared_memory(key)
+        except CacheStorageKeyNotFoundError:
+            entry_bytes = self._persist_storage.get(key)
+            self._write_to_shared_memory(key, entry_bytes)
+            return entry_bytes
+
+    def set(self, key: str, value: bytes) -> None:
+        """Sets the value for a given key"""
+        self._write_to_shared_memory(key, value)
+        self._persist_storage.set(key, value)
+
+    def delete(self, key: str) -> None:
+        """Delete a given key"""
+        remove_cache_file(self._get_cache_file_path(key))
+        self._persist_storage.delete(key)
+
+    def clear(self) -> None:
+        """Delete all keys in shared memory, and also in the persistent storage"""
+        cache_path = get_shared_cache_folder_path()
+        if _is_private_dir(cache_path):
+            for cache_file in list_cache_files(cache_path, self._is_cache_file):
+                remove_cache_file(cache_file.path)
+        self._persist_storage.clear()
+
+    def close(self) -> None:
+        """Closes the cache storage"""
+        self._persist_storage.close()
+
+    def _read_from_shared_memory(self, key: str) -> bytes:
+        if not _ensure_private_cache_dir():
+            raise CacheStorageKeyNotFoundError("Shared memory cache is unavailable")
+
+        path = self._get_cache_file_path(key)
+        try:
+            with open(path, "rb") as input:
+                stat = os.fstat(input.fileno())
+                if time.time() - stat.st_mtime >= self.ttl_seconds:
+                    remove_cache_file(path)
+                    raise CacheStorageKeyNotFoundError("Key expired in shared memory")
+                if stat.st_size == 0:
+                    # Empty files can't be mapped.
+                    value = b""
+                else:
+                    with mmap.mmap(
+                        input.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        value = mapped[:]
+        except FileNotFoundError:
+            _LOGGER.debug("Shared memory cache MISS: %s", key)
+            raise CacheStorageKeyNotFoundError("Key not found in shared memory")
+        except OSError as ex:
+            _LOGGER.error(ex)
+            raise CacheStorageError("Unable to read from shared memory") from ex
+
+        _LOGGER.debug("Shared memory cache HIT: %s", key)
+        if self._tracks_access_times():
+            touch_cache_file(path)
+        return value
+
+    def _write_to_shared_memory(self, key: str, value: bytes) -> None:
+        if not _ensure_private_cache_dir():
+            return
+
+        path = self._get_cache_file_path(key)
+        # Write to a temporary file first, and replace the cache file with it
+        # once it's complete, so that no process reads partial entries.
+        temp_path = f"{path}.{uuid.uuid4().hex}.{_TEMP_FILE_EXTENSION}"
+        try:
+            with open(temp_path, "wb") as output:
+                output.write(value)
+            os.replace(temp_path, path)
+        except OSError as ex:
+            # Shared memory is full, or not writable. The value is still
+            # cached in the persistent storage, if the function uses one.
+            _LOGGER.warning(
+                "Unable to write an entry of %s to shared memory: %s",
+                self.function_display_name,
+                ex,
+            )
+            remove_cache_file(temp_path)
+            return
+
+        if self.max_entries != math.inf or self.max_size != math.inf:
+            evict_lru_cache_files(
+                list_cache_files(get_shared_cache_folder_path(), self._is_cache_file),
+                max_entries=self.max_entries,
+                max_size=self.max_size,
+            )
+        _enforce_max_shared_memory_size()
+
+    def _tracks_access_times(self) -> bool:
+        """True if entries can be evicted, so that their access times matter."""
+        return (
+            self.max_entries != math.inf
+            or self.max_size != math.inf
+            or _get_max_shared_memory_size() != math.inf
+        )
+
+    def _get_cache_file_path(self, value_key: str) -> str:
+        """Return the path of the shared memory file for the given value."""
+        return os.path.join(
+            get_shared_cache_folder_path(),
+            f"{self.function_key}-{value_key}.{_CACHED_FILE_EXTENSION}",
+        )
+
+    def _is_cache_file(self, fname: str) -> bool:
+        """Return true if the given file name is a cache file for this storage."""
+        return fname.startswith(f"{self.function_key}-") and fname.endswith(
+            f".{_CACHED_FILE_EXTENSION}"
+        )
+
+
+def get_shared_cache_folder_path() -> str:
+    """Return the directory in which the shared cache entries of the current
+    user live.
+    """
+    base_dir = (
+        _SHARED_MEMORY_DIR
+        if os.path.isdir(_SHARED_MEMORY_DIR)
+        else tempfile.gettempdir()
+    )
+    if hasattr(os, "getuid"):
+        return os.path.join(base_dir, f"{_CACHE_DIR_NAME}-{os.getuid()}")
+    # On Windows, the temporary directory is already private to the user.
+    return os.path.join(base_dir, _CACHE_DIR_NAME)
+
+
+# The cache directories that were checked by _ensure_private_cache_dir. Other
+# users can't replace or change a directory once it's private to this user.
+_checked_cache_dirs: dict[str, bool] = {}
+_checked_cache_dirs_lock = threading.Lock()
+
+
+def _is_private_dir(path: str) -> bool:
+    """True if path is a directory, and not a symlink to one, that only the
+    current user can access.
+    """
+    try:
+        dir_stat = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(dir_stat.st_mode):
+        return False
+    if not hasattr(os, "getuid"):
+        return True
+    return dir_stat.st_uid == os.getuid() and stat.S_IMODE(dir_stat.st_mode) == 0o700
+
+
+def _ensure_private_cache_dir() -> bool:
+    """Create the shared cache directory if it doesn't exist, and return
+    whether it can be used.
+
+    Entries are unpickled when they're read, so a directory that another user
+    can write to, e.g. because they created it first, is never used.
+    """
+    cache_path = get_shared_cache_folder_path()
+    if _checked_cache_dirs.get(cache_path):
+        return True
+
+    with _checked_cache_dirs_lock:
+        try:
+            os.makedirs(cache_path, mode=0o700, exist_ok=True)
+        except OSError as ex:
+            _LOGGER.warning("Unable to create the shared memory cache: %s", ex)
+
+        is_private = _is_private_dir(cache_path)
+        if not is_private and cache_path not in _checked_cache_dirs:
+            _LOGGER.error(
+                "Not using the shared memory cache at %s, because it isn't a "
+                "directory that is owned by the current user with mode 0700.",
+                cache_path,
+            )
+        _checked_cache_dirs[cache_path] = is_private
+        return is_private
+
+
+def _get_max_shared_memory_size() -> float:
+    """The maximum total size of the shared cache entries in bytes."""
+    max_size_mb = config.get_option("runner.cacheMaxSharedMemorySize")
+    return max_size_mb * 1024 * 1024 if max_size_mb > 0 else math.inf
+
+
+def _is_any_cache_file(fname: str) -> bool:
+    return fname.endswith(f".{_CACHED_FILE_EXTENSION}")
+
+
+def _enforce_max_shared_memory_size() -> None:
+    """Delete the least recently used shared entries of all functions until
+    their total size is at most runner.cacheMaxSharedMemorySize.
+    """
+    max_size = _get_max_shared_memory_size()
+    if max_size == math.inf:
+        return
+    evict_lru_cache_files(
+        list_cache_files(get_shared_cache_folder_path(), _is_any_cache_file),
+        max_size=max_size,
+    )
@@ -0,0 +1,186 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import NamedTuple, Tuple
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+
+DeltaPath = Tuple[int, ...]
+
+
+@dataclass
+class DeltaDiffStats:
+    """Counters for deltas that were replaced with an "unchanged" marker."""
+
+    # The number of deltas that were replaced.
+    unchanged_deltas: int = 0
+    # The number of bytes that were not sent because of the replacements.
+    bytes_saved: int = 0
+
+
+class _SentDelta(NamedTuple):
+    hash: str
+    active_script_hash: str
+    fragment_id: str
+    is_block: bool
+
+
+def create_unchanged_delta_msg(msg: ForwardMsg) -> ForwardMsg:
+    """Create a ForwardMsg that tells the client to keep the element or block
+    it already displays at the given message's delta path.
+
+    Only the delta path is copied from the source message's metadata, since
+    that's all the client needs to find its existing node.
+    """
+    unchanged_msg = ForwardMsg()
+    unchanged_msg.delta.unchanged = True
+    unchanged_msg.metadata.delta_path[:] = msg.metadata.delta_path
+    return unchanged_msg
+
+
+def _is_descendant(path: DeltaPath, ancestor: DeltaPath) -> bool:
+    return len(path) > len(ancestor) and path[: len(ancestor)] == ancestor
+
+
+def _sets_widget_value(msg: ForwardMsg) -> bool:
+    """True if the message sets the value of a widget from session_state.
+
+    The frontend applies such a value whenever it receives the message, so it
+    has to be sent even if it didn't change.
+    """
+    if msg.delta.WhichOneof("type") != "new_element":
+        return False
+    element = msg.delta.new_element
+    element_type = element.WhichOneof("type")
+    if element_type is None:
+        return False
+    return bool(getattr(getattr(element, element_type), "set_value", False))
+
+
+class DeltaDiffTracker:
+    """Tracks the elements and blocks that a client currently displays.
+
+    For each delta path, we remember the hash of the last delta that was sent
+    to the client. When a rerun produces an identical delta at the same path,
+    it can be replaced with a small "unchanged" marker.
+
+    The tracked state must never claim that the client displays something it
+    doesn't, so it mirrors how the frontend prunes its element tree:
+
+    - All tracked deltas are forgotten when the client switches pages.
+    - Deltas that weren't re-sent during a successful script run are
+      forgotten when the run finishes, because the client removes them as
+      stale.
+    - Replacing a block forgets all deltas below it, because the client may
+      drop the children of the replaced block.
+    - Deltas are only tracked from the start of a script run on, so the
+      parent block of every tracked delta is tracked as well.
+
+    One tracker exists per client connection. It must only be used on the
+    eventloop thread.
+    """
+
+    def __init__(self) -> None:
+        self._sent_deltas: dict[DeltaPath, _SentDelta] = {}
+        self._paths_this_run: set[DeltaPath] = set()
+        self._current_page: tuple[str, str] | None = None
+
+    def track_msg(self, msg: ForwardMsg) -> bool:
+        """Update the tracked state with a message that is about to be sent.
+
+        Returns
+        -------
+        bool
+            True if the message is a delta that the client already displays.
+            The caller can then send the message created by
+            ``create_unchanged_delta_msg`` instead.
+        """
+        msg_type = msg.WhichOneof("type")
+        if msg_type == "delta":
+            return self._track_delta(msg)
+        if msg_type == "new_session":
+            self._on_new_session(msg)
+        elif msg_type == "script_finished":
+            self._on_script_finished(msg.script_finished)
+        return False
+
+    def _track_delta(self, msg: ForwardMsg) -> bool:
+        if self._current_page is None:
+            # No script run has started since the client connected.
+            return False
+
+        path = tuple(msg.metadata.delta_path)
+        delta_type = msg.delta.WhichOneof("type")
+        if delta_type not in ("new_element", "add_block"):
+            # The client modifies its existing node (e.g. with add_rows), so
+            # we don't know what it displays anymore.
+            self._sent_deltas.pop(path, None)
+            return False
+
+        self._paths_this_run.add(path)
+        sent_delta = _SentDelta(
+            populate_hash_if_needed(msg),
+            msg.metadata.active_script_hash,
+            msg.delta.fragment_id,
+            delta_type == "add_block",
+        )
+        sets_widget_value = _sets_widget_value(msg)
+        previous_delta = self._sent_deltas.get(path)
+        if previous_delta == sent_delta and not sets_widget_value:
+            return True
+
+        if previous_delta is not None and previous_delta.is_block:
+            self._forget_descendants(path)
+        if sets_widget_value:
+            self._sent_deltas.pop(path, None)
+        else:
+            self._sent_deltas[path] = sent_delta
+        return False
+
+    def _on_new_session(self, msg: ForwardMsg) -> None:
+        page = (msg.new_session.main_script_path, msg.new_session.page_script_hash)
+        if page != self._current_page:
+            self._sent_deltas.clear()
+            self._current_page = page
+        self._paths_this_run.clear()
+
+    def _on_script_finished(
+        self, status: ForwardMsg.ScriptFinishedStatus.ValueType
+    ) -> None:
+        if status == ForwardMsg.FINISHED_SUCCESSFULLY:
+            self._sent_deltas = {
+                path: sent_delta
+                for path, sent_delta in self._sent_deltas.items()
+                if path in self._paths_this_run
+            }
+        elif status == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+            # The client only removes stale nodes that belong to a fragment,
+            # so we forget those (and everything below them).
+            stale_paths = [
+                path
+                for path, sent_delta in self._sent_deltas.items()
+                if sent_delta.fragment_id and path not in self._paths_this_run
+            ]
+            for path in stale_paths:
+                self._sent_deltas.pop(path, None)
+                self._forget_descendants(path)
+
+    def _forget_descendants(self, path: DeltaPath) -> None:
+        descendants = [p for p in self._sent_deltas if _is_descendant(p, path)]
+        for descendant in descendants:
+            del self._sent_deltas[descendant]
@@ -25,6 +25,8 @@ from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
 from streamlit.util import HASHLIB_KWARGS
 
 if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
     from streamlit.runtime.app_session import AppSession
 
 _LOGGER: Final = get_logger(__name__)
@@ -64,6 +66,42 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
     return msg.hash
 
 
+def compute_element_hash(delta_type: str, element_proto: Message) -> str:
+    """Computes a unique hash for an element's proto, from which the hash of
+    the ForwardMsgs that contain the element can be computed cheaply with
+    populate_hash_from_element_hash.
+    """
+    hasher = hashlib.md5(**HASHLIB_KWARGS)
+    hasher.update(delta_type.encode())
+    hasher.update(element_proto.SerializeToString())
+    return hasher.hexdigest()
+
+
+def populate_hash_from_element_hash(
+    msg: ForwardMsg, element_hash: str, fragment_id: str | None
+) -> str:
+    """Assigns the unique hash for a ForwardMsg that holds a new element, from
+    the hash of the element, without serializing the message.
+
+    The message must hold nothing but the element with the given hash, and
+    the ID of the fragment the element belongs to, if any (its metadata isn't
+    part of the hash).
+
+    Returns
+    -------
+    string
+        The message's hash.
+
+    """
+    hasher = hashlib.md5(**HASHLIB_KWARGS)
+    hasher.update(b"new_element:")
+    hasher.update(element_hash.encode())
+    hasher.update(b":")
+    hasher.update((fragment_id or "").encode())
+    msg.hash = hasher.hexdigest()
+    return msg.hash
+
+
 def create_reference_msg(msg: ForwardMsg) -> ForwardMsg:
     """Create a ForwardMsg that refers to the given message via its hash.
 
@@ -14,13 +14,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
+from streamlit.proto.Delta_pb2 import Delta
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
-if TYPE_CHECKING:
-    from streamlit.proto.Delta_pb2 import Delta
-
 
 class ForwardMsgQueue:
     """Accumulates a session's outgoing ForwardMsgs.
@@ -192,6 +190,33 @@ def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
     if new_delta_type == "add_block":
         return new_delta
 
+    if new_delta_type == "append_markdown":
+        return _maybe_append_markdown(old_delta, new_delta.append_markdown)
+
+    return None
+
+
+def _maybe_append_markdown(old_delta: Delta, text: str) -> Delta | None:
+    """Append text to a Markdown element or an append_markdown delta.
+
+    Returns None if old_delta is neither.
+    """
+    old_delta_type = old_delta.WhichOneof("type")
+    if old_delta_type == "append_markdown":
+        composed_delta = Delta()
+        composed_delta.CopyFrom(old_delta)
+        composed_delta.append_markdown += text
+        return composed_delta
+
+    if (
+        old_delta_type == "new_element"
+        and old_delta.new_element.WhichOneof("type") == "markdown"
+    ):
+        composed_delta = Delta()
+        composed_delta.CopyFrom(old_delta)
+        composed_delta.new_element.markdown.body += text
+        return composed_delta
+
     return None
 
 
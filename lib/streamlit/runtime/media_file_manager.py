@@ -232,3 +232,33 @@ class MediaFileManager:
             self._files_by_session_and_coord[session_id][coordinates] = file_id
 
             return self._storage.get_url(file_id)
+
+    def add_ref(self, file_id: str, coordinates: str) -> bool:
+        """Register the current session as a user of an existing file at the
+        given coordinates, like `add` does, without loading and hashing the
+        file's data again.
+
+        Return False if the file doesn't exist anymore, in which case it has
+        to be added with `add`.
+
+        Safe to call from any thread.
+        """
+        session_id = _get_session_id()
+
+        with self._lock:
+            if file_id not in self._file_metadata:
+                return False
+            self._files_by_session_and_coord[session_id][coordinates] = file_id
+            return True
+
+    def get_file_id(self, coordinates: str) -> str | None:
+        """Return the ID of the file that the current session uses at the
+        given coordinates, or None if it doesn't use one.
+
+        Safe to call from any thread.
+        """
+        session_id = _get_session_id()
+
+        with self._lock:
+            session_file_ids = self._files_by_session_and_coord.get(session_id)
+            return session_file_ids.get(coordinates) if session_file_ids else None
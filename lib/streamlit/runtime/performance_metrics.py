@@ -0,0 +1,414 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Counters, gauges and histograms that describe the performance of the
+runtime, exported by the /_stcore/metrics endpoint in the OpenMetrics format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Final, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from streamlit.proto.openmetrics_data_model_pb2 import (
+        MetricFamily as MetricFamilyProto,
+    )
+    from streamlit.proto.openmetrics_data_model_pb2 import (
+        MetricPoint as MetricPointProto,
+    )
+    from streamlit.proto.openmetrics_data_model_pb2 import (
+        MetricSet as MetricSetProto,
+    )
+
+# The sorted (name, value) pairs of a metric's labels.
+LabelSet = Tuple[Tuple[str, str], ...]
+
+DEFAULT_DURATION_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _to_label_set(labels: dict[str, str]) -> LabelSet:
+    return tuple(sorted(labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(label_set: LabelSet) -> str:
+    if not label_set:
+        return ""
+    labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in label_set
+    )
+    return f"{{{labels}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _add_metric_point_proto(
+    family_proto: MetricFamilyProto, label_set: LabelSet
+) -> MetricPointProto:
+    """Add a metric with the given labels and a single point to a
+    `MetricFamily` protobuf object, and return the point.
+    """
+    metric_proto = family_proto.metrics.add()
+    for name, value in label_set:
+        label = metric_proto.labels.add()
+        label.name = name
+        label.value = value
+    return metric_proto.metric_points.add()
+
+
+class Metric(ABC):
+    """A metric family: a named metric that has a value per set of labels."""
+
+    # The OpenMetrics type of the metric.
+    metric_type: str = "unknown"
+
+    def __init__(self, name: str, help: str, unit: str = "") -> None:
+        self.name = name
+        self.help = help
+        self.unit = unit
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def to_metric_lines(self) -> list[str]:
+        """Return the OpenMetrics text lines of the metric's samples."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def marshall_metric_family_proto(self, family_proto: MetricFamilyProto) -> None:
+        """Fill the metrics of an OpenMetrics `MetricFamily` protobuf object."""
+        raise NotImplementedError
+
+
+class _ValueMetric(Metric):
+    """A metric with a single value per set of labels.
+
+    If a function is given, the metric has no labels and its value is the
+    function's return value at the time the metric is exported.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        unit: str = "",
+        function: Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__(name, help, unit)
+        self._function = function
+        self._values: dict[LabelSet, float] = {}
+
+    def get(self, **labels: str) -> float:
+        """Return the value of the metric for the given labels."""
+        if self._function is not None:
+            return self._function()
+        with self._lock:
+            return self._values.get(_to_label_set(labels), 0)
+
+    def _get_values(self) -> list[tuple[LabelSet, float]]:
+        if self._function is not None:
+            return [((), self._function())]
+        with self._lock:
+            return list(self._values.items())
+
+
+class Counter(_ValueMetric):
+    """A metric that only goes up, like the number of handled requests.
+
+    As required by OpenMetrics, the samples of a counter named ``foo`` are
+    exported as ``foo_total``.
+    """
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increment the counter for the given labels."""
+        label_set = _to_label_set(labels)
+        with self._lock:
+            self._values[label_set] = self._values.get(label_set, 0) + amount
+
+    def to_metric_lines(self) -> list[str]:
+        return [
+            f"{self.name}_total{_format_labels(label_set)} {_format_value(value)}"
+            for label_set, value in self._get_values()
+        ]
+
+    def marshall_metric_family_proto(self, family_proto: MetricFamilyProto) -> None:
+        for label_set, value in self._get_values():
+            metric_point = _add_metric_point_proto(family_proto, label_set)
+            if isinstance(value, int):
+                metric_point.counter_value.int_value = value
+            else:
+                metric_point.counter_value.double_value = value
+
+
+class Gauge(_ValueMetric):
+    """A metric that can go up and down, like the number of open connections."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge's value for the given labels."""
+        with self._lock:
+            self._values[_to_label_set(labels)] = value
+
+    def to_metric_lines(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(label_set)} {_format_value(value)}"
+            for label_set, value in self._get_values()
+        ]
+
+    def marshall_metric_family_proto(self, family_proto: MetricFamilyProto) -> None:
+        for label_set, value in self._get_values():
+            metric_point = _add_metric_point_proto(family_proto, label_set)
+            if isinstance(value, int):
+                metric_point.gauge_value.int_value = value
+            else:
+                metric_point.gauge_value.double_value = value
+
+
+class _HistogramValue:
+    def __init__(self, num_buckets: int) -> None:
+        # The number of observations per bucket, including the +Inf bucket.
+        # Unlike in the exported histogram, the counts aren't cumulative.
+        self.bucket_counts = [0] * num_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """A metric that counts observed values, like durations, in buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        unit: str = "",
+        buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, unit)
+        self._upper_bounds = (*sorted(buckets), math.inf)
+        self._values: dict[LabelSet, _HistogramValue] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Add an observed value to the histogram for the given labels."""
+        label_set = _to_label_set(labels)
+        bucket_index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            histogram_value = self._values.get(label_set)
+            if histogram_value is None:
+                histogram_value = _HistogramValue(len(self._upper_bounds))
+                self._values[label_set] = histogram_value
+            histogram_value.bucket_counts[bucket_index] += 1
+            histogram_value.sum += value
+            histogram_value.count += 1
+
+    def get_count(self, **labels: str) -> int:
+        """Return the number of observed values for the given labels."""
+        with self._lock:
+            histogram_value = self._values.get(_to_label_set(labels))
+            return 0 if histogram_value is None else histogram_value.count
+
+    def _get_values(
+        self,
+    ) -> list[tuple[LabelSet, list[tuple[float, int]], float, int]]:
+        """Return the cumulative bucket counts, sum and count per label set."""
+        with self._lock:
+            values = [
+                (label_set, list(v.bucket_counts), v.sum, v.count)
+                for label_set, v in self._values.items()
+            ]
+
+        result = []
+        for label_set, bucket_counts, value_sum, count in values:
+            cumulative_buckets = []
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(self._upper_bounds, bucket_counts):
+                cumulative_count += bucket_count
+                cumulative_buckets.append((upper_bound, cumulative_count))
+            result.append((label_set, cumulative_buckets, value_sum, count))
+        return result
+
+    def to_metric_lines(self) -> list[str]:
+        lines = []
+        for label_set, buckets, value_sum, count in self._get_values():
+            for upper_bound, bucket_count in buckets:
+                bucket_labels = _format_labels(
+                    (*label_set, ("le", _format_value(upper_bound)))
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {bucket_count}")
+            labels = _format_labels(label_set)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(value_sum)}")
+        return lines
+
+    def marshall_metric_family_proto(self, family_proto: MetricFamilyProto) -> None:
+        for label_set, buckets, value_sum, count in self._get_values():
+            metric_point = _add_metric_point_proto(family_proto, label_set)
+            histogram_value = metric_point.histogram_value
+            histogram_value.double_value = value_sum
+            histogram_value.count = count
+            for upper_bound, bucket_count in buckets:
+                bucket = histogram_value.buckets.add()
+                bucket.upper_bound = upper_bound
+                bucket.count = bucket_count
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    """The set of metrics exported by the /_stcore/metrics endpoint."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: M) -> M:
+        """Add a metric to the registry, replacing a metric with the same name.
+
+        Returns the metric, so that it can be registered where it's defined.
+        """
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get_metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def to_text_lines(self) -> list[str]:
+        """Return the OpenMetrics text lines of all metrics, without the
+        trailing "# EOF" line.
+        """
+        lines = []
+        for metric in self.get_metrics():
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            if metric.unit:
+                lines.append(f"# UNIT {metric.name} {metric.unit}")
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.extend(metric.to_metric_lines())
+        return lines
+
+    def marshall_metric_set_proto(self, metric_set: MetricSetProto) -> None:
+        """Add the metric families of all metrics to an OpenMetrics `MetricSet`
+        protobuf object.
+        """
+        # Lazy load the import of this proto message for better performance:
+        from streamlit.proto.openmetrics_data_model_pb2 import MetricType
+
+        for metric in self.get_metrics():
+            family_proto = metric_set.metric_families.add()
+            family_proto.name = metric.name
+            family_proto.type = MetricType.Value(metric.metric_type.upper())
+            family_proto.unit = metric.unit
+            family_proto.help = metric.help
+            metric.marshall_metric_family_proto(family_proto)
+
+
+# The registry shared by all parts of the runtime.
+metrics_registry: Final = MetricsRegistry()
+
+script_run_duration: Final = metrics_registry.register(
+    Histogram(
+        "script_run_duration_seconds",
+        "Time spent running the app script, by how the run ended.",
+        unit="seconds",
+    )
+)
+rerun_requests: Final = metrics_registry.register(
+    Counter("rerun_requests", "Number of script reruns requested by clients.")
+)
+forward_msgs_sent: Final = metrics_registry.register(
+    Counter("forward_msgs_sent", "Number of messages sent to clients.")
+)
+forward_msg_sent_bytes: Final = metrics_registry.register(
+    Counter(
+        "forward_msg_sent_bytes",
+        "Total size of the serialized messages sent to clients.",
+        unit="bytes",
+    )
+)
+cache_hits: Final = metrics_registry.register(
+    Counter("cache_hits", "Number of calls to cached functions that hit the cache.")
+)
+cache_misses: Final = metrics_registry.register(
+    Counter(
+        "cache_misses", "Number of calls to cached functions that missed the cache."
+    )
+)
+cache_background_computations: Final = metrics_registry.register(
+    Counter(
+        "cache_background_computations",
+        "Number of cached values computed in the background, to revalidate "
+        "stale values or prewarm caches.",
+    )
+)
+cache_coalesced_calls: Final = metrics_registry.register(
+    Counter(
+        "cache_coalesced_calls",
+        "Number of calls to cached functions that missed the cache and received "
+        "the value computed by a concurrent call with the same arguments.",
+    )
+)
+cache_computation_waits: Final = metrics_registry.register(
+    Counter(
+        "cache_computation_waits",
+        "Number of cached value computations that waited for another "
+        "computation of the function to finish, because of its max_concurrency.",
+    )
+)
+cache_evictions: Final = metrics_registry.register(
+    Counter(
+        "cache_evictions",
+        "Number of cache entries that were evicted to stay within the caches' "
+        "max_entries, max_size, or the runner.cacheMaxSize budget.",
+    )
+)
+event_loop_lag: Final = metrics_registry.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay of the server's event loop in running scheduled callbacks.",
+        unit="seconds",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
@@ -17,7 +17,7 @@ from __future__ import annotations
 import asyncio
 import time
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Awaitable, Final, NamedTuple
 
@@ -33,6 +33,11 @@ from streamlit.runtime.caching import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.delta_diff_tracker import (
+    DeltaDiffStats,
+    DeltaDiffTracker,
+    create_unchanged_delta_msg,
+)
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
@@ -40,13 +45,23 @@ from streamlit.runtime.forward_msg_cache import (
 )
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
+from streamlit.runtime.performance_metrics import (
+    Counter,
+    Gauge,
+    event_loop_lag,
+    metrics_registry,
+)
 from streamlit.runtime.runtime_util import is_cacheable_msg
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_execution_pool import (
+    get_script_execution_pool,
+)
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
     SessionClient,
     SessionClientDisconnectedError,
+    SessionClientStatProvider,
     SessionManager,
     SessionStorage,
 )
@@ -67,6 +82,12 @@ if TYPE_CHECKING:
 # Wait for the script run result for 60s and if no result is available give up
 SCRIPT_RUN_CHECK_TIMEOUT: Final = 60
 
+# How often to check whether clients that fell behind caught up.
+_THROTTLED_SESSION_CHECK_INTERVAL_SECS: Final = 0.05
+
+# How often to measure the event loop lag.
+_EVENT_LOOP_LAG_CHECK_INTERVAL_SECS: Final = 1.0
+
 _LOGGER: Final = get_logger(__name__)
 
 
@@ -193,6 +214,7 @@ class Runtime:
         # The task that runs our main loop. We need to save a reference
         # to it so that it doesn't get garbage collected while running.
         self._loop_coroutine_task: asyncio.Task[None] | None = None
+        self._event_loop_lag_task: asyncio.Task[None] | None = None
 
         self._main_script_path = config.script_path
         self._is_hello = config.is_hello
@@ -202,13 +224,18 @@ class Runtime:
         # Initialize managers
         self._component_registry = config.component_registry
         self._message_cache = ForwardMsgCache()
+        self._delta_diff_trackers: dict[
+            str, tuple[SessionClient, DeltaDiffTracker]
+        ] = {}
+        self._delta_diff_stats = DeltaDiffStats()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
         self._cache_storage_manager = config.cache_storage_manager
         self._script_cache = ScriptCache()
 
+        self._session_storage = config.session_storage
         self._session_mgr = config.session_manager_class(
-            session_storage=config.session_storage,
+            session_storage=self._session_storage,
             uploaded_file_manager=self._uploaded_file_mgr,
             script_cache=self._script_cache,
             message_enqueued_callback=self._enqueued_some_message,
@@ -220,6 +247,9 @@ class Runtime:
         self._stats_mgr.register_provider(self._message_cache)
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        self._stats_mgr.register_provider(SessionClientStatProvider(self._session_mgr))
+
+        self._register_performance_metrics()
 
     @property
     def state(self) -> RuntimeState:
@@ -233,6 +263,13 @@ class Runtime:
     def message_cache(self) -> ForwardMsgCache:
         return self._message_cache
 
+    @property
+    def delta_diff_stats(self) -> DeltaDiffStats:
+        """A snapshot of the counters for deltas that were replaced with an
+        "unchanged" marker.
+        """
+        return replace(self._delta_diff_stats)
+
     @property
     def uploaded_file_mgr(self) -> UploadedFileManager:
         return self._uploaded_file_mgr
@@ -299,6 +336,9 @@ class Runtime:
         self._loop_coroutine_task = asyncio.create_task(
             self._loop_coroutine(), name="Runtime.loop_coroutine"
         )
+        self._event_loop_lag_task = asyncio.create_task(
+            self._measure_event_loop_lag(), name="Runtime.measure_event_loop_lag"
+        )
 
         await async_objs.started
 
@@ -438,6 +478,7 @@ class Runtime:
         if session_info:
             self._message_cache.remove_refs_for_session(session_info.session)
             self._session_mgr.close_session(session_id)
+        self._delta_diff_trackers.pop(session_id, None)
         self._on_session_disconnected()
 
     def disconnect_session(self, session_id: str) -> None:
@@ -470,6 +511,7 @@ class Runtime:
             # that will be useful once the browser tab reconnects.
             self._message_cache.remove_refs_for_session(session_info.session)
             self._session_mgr.disconnect_session(session_id)
+        self._delta_diff_trackers.pop(session_id, None)
         self._on_session_disconnected()
 
     def handle_backmsg(self, session_id: str, msg: BackMsg) -> None:
@@ -611,6 +653,8 @@ class Runtime:
             async_objs.started.set_result(None)
 
             while not async_objs.must_stop.is_set():
+                has_throttled_sessions = False
+
                 if self._state == RuntimeState.NO_SESSIONS_CONNECTED:  # type: ignore[comparison-overlap]
                     # mypy 1.4 incorrectly thinks this if-clause is unreachable,
                     # because it thinks self._state must be INITIAL | ONE_OR_MORE_SESSIONS_CONNECTED.
@@ -630,6 +674,13 @@ class Runtime:
                     async_objs.need_send_data.clear()
 
                     for active_session_info in self._session_mgr.list_active_sessions():
+                        if self._is_client_behind(active_session_info):
+                            # Leave the messages in the session's queue, where
+                            # they're combined with newer ones, until the
+                            # client catches up.
+                            has_throttled_sessions = True
+                            continue
+
                         msg_list = active_session_info.session.flush_browser_queue()
                         for msg in msg_list:
                             try:
@@ -638,6 +689,9 @@ class Runtime:
                                 self._session_mgr.disconnect_session(
                                     active_session_info.session.id
                                 )
+                                self._delta_diff_trackers.pop(
+                                    active_session_info.session.id, None
+                                )
 
                             # Yield for a tick after sending a message.
                             await asyncio.sleep(0)
@@ -649,12 +703,18 @@ class Runtime:
                     # Break out of the thread loop if we encounter any other state.
                     break
 
-                # Wait for new proto messages that need to be sent out:
+                # Wait for new proto messages that need to be sent out, or
+                # check again soon whether throttled clients caught up:
                 _, pending_tasks = await asyncio.wait(
                     (
                         asyncio.create_task(async_objs.must_stop.wait()),
                         asyncio.create_task(async_objs.need_send_data.wait()),
                     ),
+                    timeout=(
+                        _THROTTLED_SESSION_CHECK_INTERVAL_SECS
+                        if has_throttled_sessions
+                        else None
+                    ),
                     return_when=asyncio.FIRST_COMPLETED,
                 )
                 # We need to cancel the pending tasks (the `must_stop` one in most situations).
@@ -664,6 +724,12 @@ class Runtime:
                 for task in pending_tasks:
                     task.cancel()
 
+            # Disconnect all active sessions first, which gives the SessionStorage
+            # a chance to persist them so that their clients can resume them
+            # after a restart.
+            for active_session_info in self._session_mgr.list_active_sessions():
+                self._session_mgr.disconnect_session(active_session_info.session.id)
+
             # Shut down all AppSessions.
             for session_info in self._session_mgr.list_sessions():
                 # NOTE: We want to fully shut down sessions when the runtime stops for
@@ -671,6 +737,11 @@ class Runtime:
                 # is no longer so tightly coupled to a browser tab.
                 self._session_mgr.close_session(session_info.session.id)
 
+            self._session_storage.close()
+
+            if self._event_loop_lag_task is not None:
+                self._event_loop_lag_task.cancel()
+
             self._set_state(RuntimeState.STOPPED)
             async_objs.stopped.set_result(None)
 
@@ -683,12 +754,103 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
 """
             )
 
+    async def _measure_event_loop_lag(self) -> None:
+        """Periodically record how late the event loop wakes us up, which is
+        how long callbacks, like sending messages or handling requests, wait
+        to be run.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            expected_time = loop.time() + _EVENT_LOOP_LAG_CHECK_INTERVAL_SECS
+            await asyncio.sleep(_EVENT_LOOP_LAG_CHECK_INTERVAL_SECS)
+            event_loop_lag.observe(max(loop.time() - expected_time, 0.0))
+
+    def _register_performance_metrics(self) -> None:
+        """Register the metrics that are computed from the Runtime's state
+        when they're exported.
+        """
+        for metric in (
+            Gauge(
+                "websocket_connections",
+                "Number of sessions with a connected client.",
+                function=self._session_mgr.num_active_sessions,
+            ),
+            Gauge(
+                "sessions",
+                "Number of sessions, including disconnected ones.",
+                function=self._session_mgr.num_sessions,
+            ),
+            Gauge(
+                "forward_msg_queue_length",
+                "Number of messages waiting to be sent to clients.",
+                function=self._get_forward_msg_queue_length,
+            ),
+            Gauge(
+                "script_runs_running",
+                "Number of script runs that are executing.",
+                function=lambda: get_script_execution_pool().get_stats().running,
+            ),
+            Gauge(
+                "script_runs_queued",
+                "Number of script runs waiting for runner.maxConcurrentScriptRuns.",
+                function=lambda: get_script_execution_pool().get_stats().queued,
+            ),
+            Counter(
+                "script_run_queue_wait_seconds",
+                "Total time script runs waited for runner.maxConcurrentScriptRuns.",
+                unit="seconds",
+                function=lambda: get_script_execution_pool()
+                .get_stats()
+                .total_wait_time_seconds,
+            ),
+            Counter(
+                "unchanged_deltas",
+                "Number of deltas replaced with an unchanged marker.",
+                function=lambda: self._delta_diff_stats.unchanged_deltas,
+            ),
+            Counter(
+                "unchanged_delta_saved_bytes",
+                "Total size saved by replacing deltas with an unchanged marker.",
+                unit="bytes",
+                function=lambda: self._delta_diff_stats.bytes_saved,
+            ),
+        ):
+            metrics_registry.register(metric)
+
+    def _get_forward_msg_queue_length(self) -> int:
+        return sum(
+            session_info.session.browser_queue_length
+            for session_info in self._session_mgr.list_active_sessions()
+        )
+
+    def _is_client_behind(self, session_info: ActiveSessionInfo) -> bool:
+        """True if the session's client has more buffered bytes than
+        server.maxSessionBufferSize allows.
+        """
+        max_buffer_size_mb = config.get_option("server.maxSessionBufferSize")
+        if max_buffer_size_mb <= 0:
+            return False
+        buffered_bytes = session_info.client.buffered_bytes
+        if buffered_bytes <= max_buffer_size_mb * 1024 * 1024:
+            return False
+        _LOGGER.debug(
+            "Holding back messages for session %s (%s buffered bytes)",
+            session_info.session.id,
+            buffered_bytes,
+        )
+        return True
+
     def _send_message(self, session_info: ActiveSessionInfo, msg: ForwardMsg) -> None:
         """Send a message to a client.
 
         If the client is likely to have already cached the message, we may
         instead send a "reference" message that contains only the hash of the
-        message.
+        message. If the message is a delta that the client already displays,
+        we instead send an "unchanged" marker.
 
         Parameters
         ----------
@@ -722,6 +884,18 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 msg, session_info.session, session_info.script_run_count
             )
 
+        if config.get_option("global.enableDeltaDiffing"):
+            tracker = self._get_delta_diff_tracker(session_info)
+            if tracker.track_msg(msg):
+                _LOGGER.debug("Sending unchanged delta (hash=%s)", msg.hash)
+                msg_to_send = create_unchanged_delta_msg(msg)
+                self._delta_diff_stats.unchanged_deltas += 1
+                self._delta_diff_stats.bytes_saved += (
+                    msg.ByteSize() - msg_to_send.ByteSize()
+                )
+        else:
+            self._delta_diff_trackers.pop(session_info.session.id, None)
+
         # If this was a `script_finished` message, we increment the
         # script_run_count for this session, and update the cache
         if (
@@ -742,6 +916,24 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         # Ship it off!
         session_info.client.write_forward_msg(msg_to_send)
 
+    def _get_delta_diff_tracker(
+        self, session_info: ActiveSessionInfo
+    ) -> DeltaDiffTracker:
+        """Return the DeltaDiffTracker for the session's current client.
+
+        A reconnected client gets a new tracker, since we don't know which
+        of the previously sent deltas it still displays.
+        """
+        session_id = session_info.session.id
+        client_and_tracker = self._delta_diff_trackers.get(session_id)
+        if (
+            client_and_tracker is None
+            or client_and_tracker[0] is not session_info.client
+        ):
+            client_and_tracker = (session_info.client, DeltaDiffTracker())
+            self._delta_diff_trackers[session_id] = client_and_tracker
+        return client_and_tracker[1]
+
     def _enqueued_some_message(self) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
         message. Sets the "needs_send_data" event, which causes our core
@@ -0,0 +1,168 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Admission control for script runs across all sessions."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from timeit import default_timer as timer
+from typing import Callable, Final
+
+from streamlit import config
+from streamlit.logger import get_logger
+
+_LOGGER: Final = get_logger(__name__)
+
+# How often a queued script run checks whether it was cancelled (e.g. because
+# its session was closed or a fast rerun replaced its ScriptRunner).
+_CANCELLATION_POLL_INTERVAL_SECS: Final = 0.05
+
+
+@dataclass(frozen=True)
+class ScriptExecutionPoolStats:
+    """A snapshot of the state and the queue wait metrics of the pool."""
+
+    # The maximum number of concurrent script runs. 0 means unlimited.
+    max_concurrent_runs: int
+    # The number of script runs that are currently executing.
+    running: int
+    # The number of script runs that are waiting for an execution slot.
+    queued: int
+    # The total number of script runs that were admitted.
+    admitted_runs: int
+    # The total number of queued script runs that were cancelled.
+    cancelled_runs: int
+    # The total and maximum time that admitted runs spent in the queue.
+    total_wait_time_seconds: float
+    max_wait_time_seconds: float
+
+
+class ScriptExecutionPool:
+    """Limits the number of script runs that execute at the same time.
+
+    Every ScriptRunner still runs its script on its own thread, but before
+    each run it has to acquire an execution slot from the pool. Runs that
+    don't get a slot wait in a first-come, first-served queue, so no session
+    can starve the others. Each ScriptRunner only has a single run in flight,
+    and rerun requests that arrive while a run is queued are coalesced into
+    that run by the ScriptRunner, so a session occupies at most one entry of
+    the queue.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_concurrent_runs: int):
+        self._max_concurrent_runs = max(max_concurrent_runs, 0)
+        self._condition = threading.Condition()
+        self._running = 0
+        self._queue: deque[object] = deque()
+
+        self._admitted_runs = 0
+        self._cancelled_runs = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def max_concurrent_runs(self) -> int:
+        return self._max_concurrent_runs
+
+    def acquire(self, is_cancelled: Callable[[], bool]) -> bool:
+        """Wait for a free execution slot.
+
+        Parameters
+        ----------
+        is_cancelled : Callable[[], bool]
+            Polled while waiting. If it returns True, the run leaves the
+            queue without acquiring a slot.
+
+        Returns
+        -------
+        bool
+            True if a slot was acquired, in which case the caller must call
+            ``release`` once its script run is done. False if the run was
+            cancelled while waiting.
+        """
+        start_time = timer()
+        ticket = object()
+
+        with self._condition:
+            self._queue.append(ticket)
+            try:
+                while not self._can_admit(ticket):
+                    if is_cancelled():
+                        self._cancelled_runs += 1
+                        return False
+                    self._condition.wait(_CANCELLATION_POLL_INTERVAL_SECS)
+
+                self._running += 1
+            finally:
+                self._queue.remove(ticket)
+                # The head of the queue changed, so the next waiting run
+                # might be admitted now.
+                self._condition.notify_all()
+
+            wait_time = timer() - start_time
+            self._admitted_runs += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+        if self._max_concurrent_runs > 0 and wait_time > 1:
+            _LOGGER.debug("Script run waited %.2fs for an execution slot", wait_time)
+        return True
+
+    def release(self) -> None:
+        """Release an execution slot acquired with ``acquire``."""
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    def get_stats(self) -> ScriptExecutionPoolStats:
+        with self._condition:
+            return ScriptExecutionPoolStats(
+                max_concurrent_runs=self._max_concurrent_runs,
+                running=self._running,
+                queued=len(self._queue),
+                admitted_runs=self._admitted_runs,
+                cancelled_runs=self._cancelled_runs,
+                total_wait_time_seconds=self._total_wait_time,
+                max_wait_time_seconds=self._max_wait_time,
+            )
+
+    def _can_admit(self, ticket: object) -> bool:
+        if self._max_concurrent_runs == 0:
+            return True
+        return self._queue[0] is ticket and self._running < self._max_concurrent_runs
+
+
+_pool: ScriptExecutionPool | None = None
+_pool_lock: Final = threading.Lock()
+
+
+def get_script_execution_pool() -> ScriptExecutionPool:
+    """Return the global ScriptExecutionPool, creating it on first use.
+
+    The pool is configured via the ``runner.maxConcurrentScriptRuns`` config
+    option.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ScriptExecutionPool(
+                config.get_option("runner.maxConcurrentScriptRuns")
+            )
+        return _pool
@@ -34,8 +34,12 @@ from streamlit.runtime.metrics_util import (
     create_page_profile_message,
     to_microseconds,
 )
+from streamlit.runtime.performance_metrics import script_run_duration
 from streamlit.runtime.scriptrunner.exec_code import exec_func_with_error_handling
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_execution_pool import (
+    get_script_execution_pool,
+)
 from streamlit.runtime.scriptrunner_utils.exceptions import (
     RerunException,
     StopException,
@@ -44,6 +48,7 @@ from streamlit.runtime.scriptrunner_utils.script_requests import (
     RerunData,
     ScriptRequests,
     ScriptRequestType,
+    coalesce_pending_rerun_data,
 )
 from streamlit.runtime.scriptrunner_utils.script_run_context import (
     ScriptRunContext,
@@ -311,13 +316,23 @@ class ScriptRunner:
         )
         add_script_run_ctx(threading.current_thread(), ctx)
 
+        execution_pool = get_script_execution_pool()
+
         request = self._requests.on_scriptrunner_ready()
         while request.type == ScriptRequestType.RERUN:
             # When the script thread starts, we'll have a pending rerun
             # request that we'll handle immediately. When the script finishes,
             # it's possible that another request has come in that we need to
             # handle, which is why we call _run_script in a loop.
-            self._run_script(request.rerun_data)
+            if execution_pool.acquire(
+                is_cancelled=lambda: self._requests.is_stop_requested
+            ):
+                try:
+                    rerun_data = self._get_coalesced_rerun_data(request.rerun_data)
+                    if rerun_data is not None:
+                        self._run_script(rerun_data)
+                finally:
+                    execution_pool.release()
             request = self._requests.on_scriptrunner_ready()
 
         assert request.type == ScriptRequestType.STOP
@@ -331,6 +346,21 @@ class ScriptRunner:
             self, event=ScriptRunnerEvent.SHUTDOWN, client_state=client_state
         )
 
+    def _get_coalesced_rerun_data(self, rerun_data: RerunData) -> RerunData | None:
+        """Return the RerunData to run after waiting for an execution slot.
+
+        Requests that arrived while this run was queued in the execution pool
+        are handled here, so that a session that received several rerun
+        requests in the meantime only runs its script once. Returns None if
+        the ScriptRunner was stopped.
+        """
+        request = self._requests.on_scriptrunner_yield()
+        if request is None:
+            return rerun_data
+        if request.type == ScriptRequestType.STOP:
+            return None
+        return coalesce_pending_rerun_data(rerun_data, request.rerun_data)
+
     def _is_in_script_thread(self) -> bool:
         """True if the calling function is running in the script thread"""
         return self._script_thread == threading.current_thread()
@@ -503,6 +533,9 @@ class ScriptRunner:
                 # We got a compile error. Send an error event and bail immediately.
                 _LOGGER.debug("Fatal script error: %s", ex)
                 self._session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY] = False
+                script_run_duration.observe(
+                    timer() - start_time, status="compile_error"
+                )
                 self.on_event.send(
                     self,
                     event=ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR,
@@ -606,6 +639,16 @@ class ScriptRunner:
             else:
                 finished_event = ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS
 
+            if rerun_exception_data:
+                run_status = "rerun"
+            elif premature_stop:
+                run_status = "stopped"
+            elif not run_without_errors:
+                run_status = "error"
+            else:
+                run_status = "success"
+            script_run_duration.observe(timer() - start_time, status=run_status)
+
             if ctx.gather_usage_stats:
                 try:
                     # Create and send page profile information
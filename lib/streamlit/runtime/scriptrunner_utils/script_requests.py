@@ -146,6 +146,39 @@ def _coalesce_widget_states(
     return coalesced
 
 
+def coalesce_pending_rerun_data(old_data: RerunData, new_data: RerunData) -> RerunData:
+    """Coalesce the RerunData of a rerun that hasn't started yet into the
+    RerunData of a newer rerun, and return the result.
+
+    Widget states are coalesced with _coalesce_widget_states, so that trigger
+    values of the older rerun don't go missing. Since neither rerun ran yet,
+    the result runs the full script if either of them would, and otherwise
+    the fragments of both.
+    """
+    if old_data.fragment_id_queue and new_data.fragment_id_queue:
+        fragment_id_queue = [*old_data.fragment_id_queue]
+        fragment_id_queue.extend(
+            fragment_id
+            for fragment_id in new_data.fragment_id_queue
+            if fragment_id not in fragment_id_queue
+        )
+        is_fragment_scoped_rerun = (
+            old_data.is_fragment_scoped_rerun or new_data.is_fragment_scoped_rerun
+        )
+    else:
+        fragment_id_queue = []
+        is_fragment_scoped_rerun = False
+
+    return replace(
+        new_data,
+        widget_states=_coalesce_widget_states(
+            old_data.widget_states, new_data.widget_states
+        ),
+        fragment_id_queue=fragment_id_queue,
+        is_fragment_scoped_rerun=is_fragment_scoped_rerun,
+    )
+
+
 class ScriptRequests:
     """An interface for communicating with a ScriptRunner. Thread-safe.
 
@@ -158,6 +191,11 @@ class ScriptRequests:
         self._state = ScriptRequestType.CONTINUE
         self._rerun_data = RerunData()
 
+    @property
+    def is_stop_requested(self) -> bool:
+        """True if the ScriptRunner was requested to stop."""
+        return self._state == ScriptRequestType.STOP
+
     def request_stop(self) -> None:
         """Request that the ScriptRunner stop running. A stopped ScriptRunner
         can't be used anymore. STOP requests succeed unconditionally.
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
     from streamlit.cursor import RunningCursor
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
     from streamlit.proto.PageProfile_pb2 import Command
+    from streamlit.runtime.caching.hashing import MemoizedDataHash
     from streamlit.runtime.fragment import FragmentStorage
     from streamlit.runtime.pages_manager import PagesManager
     from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
@@ -101,6 +102,9 @@ class ScriptRunContext:
     _active_script_hash: str = ""
     # we allow only one dialog to be open at the same time
     has_dialog_opened: bool = False
+    # Hashes of large dataframes and arrays that were passed to cached
+    # functions this run, by the id() of the hashed object.
+    data_hashes_this_run: dict[int, MemoizedDataHash] = field(default_factory=dict)
 
     # TODO(willhuang1997): Remove this variable when experimental query params are removed
     _experimental_query_params_used = False
@@ -138,6 +142,7 @@ class ScriptRunContext:
         self.widget_ids_this_run = set()
         self.widget_user_keys_this_run = set()
         self.form_ids_this_run = set()
+        self.data_hashes_this_run = {}
         self.query_string = query_string
         self.pages_manager.set_current_page_script_hash(page_script_hash)
         self._active_script_hash = self.pages_manager.initial_active_script_hash
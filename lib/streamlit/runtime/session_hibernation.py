@@ -0,0 +1,122 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Moves the session_state of idle sessions out of memory and back."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    from streamlit.runtime.state import SessionState
+
+_LOGGER: Final = get_logger(__name__)
+
+_hibernation_dir: str | None = None
+_hibernation_dir_lock = threading.Lock()
+
+
+def _get_hibernation_dir() -> str:
+    """Return the directory that hibernated session states are written to.
+
+    The directory is private to this process and is removed when it exits.
+    """
+    global _hibernation_dir
+
+    with _hibernation_dir_lock:
+        if _hibernation_dir is None:
+            _hibernation_dir = tempfile.mkdtemp(prefix="streamlit-sessions-")
+            atexit.register(shutil.rmtree, _hibernation_dir, ignore_errors=True)
+        return _hibernation_dir
+
+
+def hibernate_session_state(
+    session_id: str, user_state: tuple[dict[str, Any], dict[str, Any]]
+) -> tuple[str | None, tuple[dict[str, Any], dict[str, Any]]]:
+    """Write the session_state values returned by SessionState.pop_user_state
+    to a file.
+
+    This pickles all values, so it should be called outside of the event loop.
+
+    Returns
+    -------
+    tuple[str or None, tuple[dict[str, Any], dict[str, Any]]]
+        The path of the file that the values were written to, which must be
+        passed to rehydrate_session_state to restore them, or None if no values
+        were written. And the values that weren't written because they can't
+        be pickled, which must be kept in memory.
+    """
+    pickled_states: tuple[dict[str, bytes], dict[str, bytes]] = ({}, {})
+    kept_states: tuple[dict[str, Any], dict[str, Any]] = ({}, {})
+    for state, pickled_state, kept_state in zip(
+        user_state, pickled_states, kept_states
+    ):
+        for key, value in state.items():
+            try:
+                pickled_state[key] = pickle.dumps(value)
+            except Exception:
+                kept_state[key] = value
+
+    if not any(pickled_states):
+        return None, kept_states
+
+    path: str | None = None
+    try:
+        # Each call writes to a new file, since the file of a previous call
+        # for the same session may not have been discarded yet.
+        fd, path = tempfile.mkstemp(
+            suffix=".pickle", prefix=f"{session_id}-", dir=_get_hibernation_dir()
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(pickled_states, f)
+    except OSError as ex:
+        _LOGGER.warning("Unable to hibernate session %s: %s", session_id, ex)
+        if path is not None:
+            discard_hibernated_session_state(path)
+        return None, user_state
+
+    return path, kept_states
+
+
+def rehydrate_session_state(path: str, session_state: SessionState) -> None:
+    """Restore the values that hibernate_session_state wrote to path, and
+    remove the file.
+    """
+    try:
+        with open(path, "rb") as f:
+            pickled_states: tuple[dict[str, bytes], dict[str, bytes]] = pickle.load(f)
+    finally:
+        discard_hibernated_session_state(path)
+
+    old_state, new_state = (
+        {key: pickle.loads(value) for key, value in pickled_state.items()}
+        for pickled_state in pickled_states
+    )
+    session_state.push_user_state(old_state, new_state)
+
+
+def discard_hibernated_session_state(path: str) -> None:
+    """Remove a file written by hibernate_session_state."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
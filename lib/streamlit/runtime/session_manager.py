@@ -16,7 +16,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Protocol, cast
+from typing import TYPE_CHECKING, Any, Callable, Protocol, cast
+
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
 
 if TYPE_CHECKING:
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -42,6 +44,17 @@ class SessionClient(Protocol):
         """
         raise NotImplementedError
 
+    @property
+    def buffered_bytes(self) -> int:
+        """The number of bytes of delivered ForwardMsgs that are still waiting
+        to be sent to the client.
+
+        The Runtime stops delivering messages to clients that fall too far
+        behind, until they catch up. SessionClients that deliver messages
+        synchronously don't need to override this.
+        """
+        return 0
+
 
 @dataclass
 class ActiveSessionInfo:
@@ -167,6 +180,37 @@ class SessionStorage(Protocol):
         """
         raise NotImplementedError
 
+    def pop_session_state(self, session_id: str) -> dict[str, Any] | None:
+        """Return the persisted session_state values of a session that is no longer
+        held by this SessionStorage, and stop tracking them.
+
+        SessionStorages that persist the state of sessions outside of the current
+        process (e.g. so that clients can resume their session after the server is
+        restarted) can implement this. The SessionManager then creates a new session
+        with the same ID and these session_state values when the session's client
+        reconnects.
+
+        Parameters
+        ----------
+        session_id
+            The unique ID of the session whose state is being fetched.
+
+        Returns
+        -------
+        dict[str, Any] or None
+            The session_state values that were set by user code (i.e. excluding
+            widget values), or None if no state was persisted for the session.
+        """
+        return None
+
+    def close(self) -> None:
+        """Release the resources held by this SessionStorage, e.g. connections to
+        its storage backend.
+
+        This is called when the Runtime stops, after all sessions were
+        disconnected and closed.
+        """
+
 
 class SessionManager(Protocol):
     """SessionManagers are responsible for encapsulating all session lifecycle behavior
@@ -392,3 +436,20 @@ class SessionManager(Protocol):
         int
         """
         return len(self.list_active_sessions())
+
+
+@dataclass
+class SessionClientStatProvider(CacheStatsProvider):
+    """Reports the bytes that are waiting to be sent to each session's client."""
+
+    _session_mgr: SessionManager
+
+    def get_stats(self) -> list[CacheStat]:
+        return [
+            CacheStat(
+                category_name="session_client_buffer",
+                cache_name=session_info.session.id,
+                byte_length=session_info.client.buffered_bytes,
+            )
+            for session_info in self._session_mgr.list_active_sessions()
+        ]
@@ -0,0 +1,249 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Final
+
+from streamlit.logger import get_logger
+from streamlit.runtime.memory_session_storage import MemorySessionStorage
+from streamlit.runtime.session_manager import SessionInfo, SessionStorage
+
+_LOGGER: Final = get_logger(__name__)
+
+# How long to wait for other processes (e.g. other server workers) that use the
+# same database to release their lock.
+_DB_TIMEOUT_SECONDS: Final = 5.0
+
+
+class SQLiteSessionStorage(SessionStorage):
+    """A SessionStorage that persists the session_state of disconnected sessions in
+    an SQLite database, so that their clients can resume them after the server was
+    restarted (or in a different server process that uses the same database).
+
+    Disconnected sessions themselves are kept in a MemorySessionStorage, exactly
+    like the default SessionStorage does. Additionally, whenever a session is
+    saved, the values that user code set in its session_state are pickled and
+    written to the database. If a client reconnects to a session that is no
+    longer held in memory, the SessionManager resumes it with these values.
+    Widget values aren't persisted, since the frontend sends them with the
+    rerun request that it makes after reconnecting. Sessions are saved on the
+    event loop, so the values are pickled and written by a background thread.
+
+    The database should only be writable by the server, since the stored values
+    are unpickled when sessions are resumed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 10_000,
+        ttl_seconds: int = 24 * 60 * 60,  # 1 day
+        memory_maxsize: int = 128,
+        memory_ttl_seconds: int = 2 * 60,  # 2 minutes
+    ) -> None:
+        """Instantiate a new SQLiteSessionStorage.
+
+        Parameters
+        ----------
+        path
+            The path of the SQLite database file. It's created if it doesn't exist.
+
+        maxsize
+            The maximum number of sessions whose state is persisted. If this is
+            exceeded, the states that were saved least recently are removed.
+
+        ttl_seconds
+            The time in seconds that a persisted session state can be resumed
+            after it was saved.
+
+        memory_maxsize
+            The maximum number of disconnected sessions that are kept in memory.
+
+        memory_ttl_seconds
+            The time in seconds for a disconnected session to be kept in memory.
+        """
+        self._memory_storage = MemorySessionStorage(
+            maxsize=memory_maxsize, ttl_seconds=memory_ttl_seconds
+        )
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        # The connection is used from the eventloop thread and the thread that
+        # writes saved states, so we guard it with a lock.
+        self._lock = threading.Lock()
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SQLiteSessionStorage"
+        )
+        # The most recent save of each session whose state isn't written yet.
+        self._pending_saves: dict[str, Future[None]] = {}
+        self._pending_saves_lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=_DB_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS session_states ("
+                "session_id TEXT PRIMARY KEY, "
+                "state BLOB NOT NULL, "
+                "saved_at REAL NOT NULL)"
+            )
+
+    def get(self, session_id: str) -> SessionInfo | None:
+        return self._memory_storage.get(session_id)
+
+    def save(self, session_info: SessionInfo) -> None:
+        self._memory_storage.save(session_info)
+
+        session_id = session_info.session.id
+        try:
+            user_state = session_info.session.session_state.get_user_state()
+        except Exception as ex:
+            # E.g. the session's script thread modified session_state while we
+            # were reading it.
+            _LOGGER.warning(
+                "Unable to read the state of session %s: %s", session_id, ex
+            )
+            return
+
+        future = self._save_executor.submit(
+            self._save_state, session_id, user_state, time.time()
+        )
+        with self._pending_saves_lock:
+            self._pending_saves[session_id] = future
+        future.add_done_callback(functools.partial(self._on_state_saved, session_id))
+
+    def delete(self, session_id: str) -> None:
+        # The persisted state is kept, so that the session can still be resumed if
+        # the server is restarted before it's saved again. It's removed once it
+        # expires or is evicted.
+        self._memory_storage.delete(session_id)
+
+    def list(self) -> list[SessionInfo]:
+        return self._memory_storage.list()
+
+    def pop_session_state(self, session_id: str) -> dict[str, Any] | None:
+        with self._pending_saves_lock:
+            pending_save = self._pending_saves.get(session_id)
+        if pending_save is not None:
+            wait([pending_save])
+
+        try:
+            with self._lock, self._db:
+                row = self._db.execute(
+                    "SELECT state FROM session_states "
+                    "WHERE session_id = ? AND saved_at > ?",
+                    (session_id, time.time() - self._ttl_seconds),
+                ).fetchone()
+                self._db.execute(
+                    "DELETE FROM session_states WHERE session_id = ?", (session_id,)
+                )
+        except sqlite3.Error as ex:
+            _LOGGER.warning(
+                "Unable to read the persisted state of session %s: %s", session_id, ex
+            )
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            pickled_state: dict[str, bytes] = pickle.loads(row[0])
+        except Exception as ex:
+            _LOGGER.warning(
+                "Unable to read the persisted state of session %s: %s", session_id, ex
+            )
+            return None
+
+        state = {}
+        for key, pickled_value in pickled_state.items():
+            try:
+                state[key] = pickle.loads(pickled_value)
+            except Exception:
+                # E.g. the class of the value no longer exists.
+                _LOGGER.debug(
+                    "Not restoring session_state[%r] of session %s since it can't "
+                    "be unpickled.",
+                    key,
+                    session_id,
+                )
+        return state
+
+    def close(self) -> None:
+        """Write the states of all saved sessions and close the database
+        connection.
+        """
+        self._save_executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def _on_state_saved(self, session_id: str, future: Future[None]) -> None:
+        with self._pending_saves_lock:
+            if self._pending_saves.get(session_id) is future:
+                del self._pending_saves[session_id]
+
+    def _save_state(
+        self, session_id: str, user_state: dict[str, Any], now: float
+    ) -> None:
+        """Pickle the values of user_state and write them to the database."""
+        state = {}
+        for key, value in user_state.items():
+            try:
+                state[key] = pickle.dumps(value)
+            except Exception:
+                _LOGGER.debug(
+                    "Not persisting session_state[%r] of session %s since it can't "
+                    "be pickled.",
+                    key,
+                    session_id,
+                )
+
+        try:
+            self._write_state(session_id, pickle.dumps(state), now)
+        except sqlite3.Error as ex:
+            # The session is still available in memory, so we don't fail here.
+            _LOGGER.warning(
+                "Unable to persist the state of session %s: %s", session_id, ex
+            )
+
+    def _write_state(self, session_id: str, state: bytes, now: float) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO session_states (session_id, state, saved_at) "
+                "VALUES (?, ?, ?)",
+                (session_id, state, now),
+            )
+            # Remove expired states, and the least recently saved states beyond
+            # maxsize.
+            self._db.execute(
+                "DELETE FROM session_states WHERE saved_at <= ?",
+                (now - self._ttl_seconds,),
+            )
+            self._db.execute(
+                "DELETE FROM session_states WHERE session_id IN ("
+                "SELECT session_id FROM session_states "
+                "ORDER BY saved_at DESC LIMIT -1 OFFSET ?)",
+                (self._maxsize,),
+            )
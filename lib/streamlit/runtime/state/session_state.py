@@ -22,6 +22,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Final,
+    Hashable,
     Iterator,
     KeysView,
     List,
@@ -48,7 +49,13 @@ from streamlit.runtime.state.common import (
     is_keyed_element_id,
 )
 from streamlit.runtime.state.query_params import QueryParams
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    SizeEstimates,
+    estimate_size,
+    group_stats,
+)
 
 if TYPE_CHECKING:
     from streamlit.runtime.session_manager import SessionManager
@@ -417,6 +424,63 @@ class SessionState:
 
         return state
 
+    def get_user_state(self) -> dict[str, Any]:
+        """The values set in Session State by user code, excluding widget values.
+
+        Widget values aren't included since the frontend sends them with every
+        rerun request.
+        """
+        state: dict[str, Any] = {}
+        for k in self._keys():
+            if is_element_id(k) or _is_internal_key(k):
+                continue
+            try:
+                state[k] = self[k]
+            except KeyError:
+                pass
+        return state
+
+    def restore_user_state(self, state: dict[str, Any]) -> None:
+        """Add values returned by get_user_state (e.g. of a session that existed
+        before the server restarted) to Session State.
+        """
+        self._old_state.update(state)
+
+    def pop_user_state(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Remove the values set in Session State by user code and return them.
+
+        Values whose keys are used by widgets are kept. The returned values can
+        be added back with push_user_state.
+
+        Returns
+        -------
+        tuple[dict[str, Any], dict[str, Any]]
+            The values that were set in previous script runs, and the values
+            that were set in the current script run.
+        """
+
+        def is_user_key(k: str) -> bool:
+            return (
+                not is_element_id(k)
+                and not _is_internal_key(k)
+                and k not in self._key_id_mapper
+            )
+
+        old_state = {k: v for k, v in self._old_state.items() if is_user_key(k)}
+        new_state = {k: v for k, v in self._new_session_state.items() if is_user_key(k)}
+        for k in old_state:
+            del self._old_state[k]
+        for k in new_state:
+            del self._new_session_state[k]
+        return old_state, new_state
+
+    def push_user_state(
+        self, old_state: dict[str, Any], new_state: dict[str, Any]
+    ) -> None:
+        """Add back values that were removed by pop_user_state."""
+        self._old_state.update(old_state)
+        self._new_session_state.update(new_state)
+
     def _keys(self) -> set[str]:
         """All keys active in Session State, with widget keys converted
         to widget ids when one is known. (This includes autogenerated keys
@@ -706,10 +770,7 @@ class SessionState:
             return True
 
     def get_stats(self) -> list[CacheStat]:
-        # Lazy-load vendored package to prevent import of numpy
-        from streamlit.vendor.pympler.asizeof import asizeof
-
-        stat = CacheStat("st_session_state", "", asizeof(self))
+        stat = CacheStat("st_session_state", "", estimate_size(self))
         return [stat]
 
     def _check_serializable(self) -> None:
@@ -760,10 +821,27 @@ def _is_stale_widget(
 @dataclass
 class SessionStateStatProvider(CacheStatsProvider):
     _session_mgr: SessionManager
+    # Sizing the session states of all sessions on every call would be slow
+    # with many sessions, so their sizes are estimated incrementally.
+    _size_estimates: SizeEstimates = field(default_factory=SizeEstimates)
 
     def get_stats(self) -> list[CacheStat]:
+        session_states: list[tuple[Hashable, object]] = []
         stats: list[CacheStat] = []
         for session_info in self._session_mgr.list_active_sessions():
-            session_state = session_info.session.session_state
-            stats.extend(session_state.get_stats())
+            session = session_info.session
+            if session.is_hibernated:
+                # Reading session_state would rehydrate the session, so the
+                # size of its hibernated values on disk is reported instead.
+                stats.append(
+                    CacheStat(
+                        "st_session_state", "hibernated", session.hibernated_state_size
+                    )
+                )
+            else:
+                session_states.append((session.id, session.session_state))
+        stats.extend(
+            CacheStat("st_session_state", "", byte_length)
+            for byte_length in self._size_estimates.get_sizes(session_states)
+        )
         return group_stats(stats)
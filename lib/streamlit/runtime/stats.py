@@ -15,10 +15,26 @@
 from __future__ import annotations
 
 import itertools
+import sys
+import threading
+import time
 from abc import abstractmethod
-from typing import TYPE_CHECKING, NamedTuple, Protocol, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Protocol,
+    cast,
+    runtime_checkable,
+)
+
+from streamlit import type_util
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from streamlit.proto.openmetrics_data_model_pb2 import Metric as MetricProto
 
 
@@ -107,3 +123,213 @@ class StatsManager:
             all_stats.extend(provider.get_stats())
 
         return all_stats
+
+
+# The number of items that are sized to estimate the size of a large container
+# or of an array of Python objects.
+_SIZE_SAMPLE_COUNT = 100
+
+# Containers nested deeper than this are sized with asizeof.
+_MAX_SIZE_ESTIMATE_DEPTH = 3
+
+_PRIMITIVE_TYPES = (bytes, bytearray, str, int, float, complex, bool, type(None))
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+
+def estimate_size(obj: object) -> int:
+    """Return an estimate of an object's memory footprint in bytes.
+
+    NumPy arrays and pandas and Arrow objects are sized from the sizes of
+    their buffers, and the Python objects in them and in large builtin
+    containers are sampled. Other objects are sized with pympler's asizeof,
+    which is exact but slow for large objects.
+    """
+    return cast(int, _estimate_size(obj, 0, use_asizeof=True))
+
+
+def _estimate_size(obj: object, depth: int, use_asizeof: bool) -> int | None:
+    """Estimate an object's size, or return None if that needs asizeof and
+    `use_asizeof` is False.
+    """
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return sys.getsizeof(obj)
+
+    size = _estimate_data_size(obj)
+    if size is not None:
+        return size
+
+    if depth < _MAX_SIZE_ESTIMATE_DEPTH:
+        if isinstance(obj, _CONTAINER_TYPES):
+            if isinstance(obj, dict):
+                items: Iterable[Any] = itertools.chain.from_iterable(obj.items())
+                num_items = 2 * len(obj)
+            else:
+                items, num_items = obj, len(obj)
+            items_size = _sampled_size(items, num_items, depth + 1, use_asizeof)
+            return None if items_size is None else sys.getsizeof(obj) + items_size
+        if type_util.is_dataclass_instance(obj) and hasattr(obj, "__dict__"):
+            fields_size = _estimate_size(vars(obj), depth + 1, use_asizeof)
+            return None if fields_size is None else sys.getsizeof(obj) + fields_size
+
+    if not use_asizeof:
+        return None
+
+    # Lazy-load vendored package to prevent import of numpy
+    from streamlit.vendor.pympler.asizeof import asizeof
+
+    return asizeof(obj)
+
+
+def _estimate_data_size(obj: object) -> int | None:
+    """Return the size of NumPy, pandas and Arrow objects and memoryviews,
+    or None for other objects.
+    """
+    if isinstance(obj, memoryview):
+        return sys.getsizeof(obj) + obj.nbytes
+
+    if type_util.is_type(obj, "numpy.ndarray"):
+        # sys.getsizeof includes the buffer, unless the array is a view.
+        size = max(sys.getsizeof(obj), obj.nbytes)  # type: ignore[attr-defined]
+        if obj.dtype.hasobject:  # type: ignore[attr-defined]
+            size += _object_values_size(obj.ravel())  # type: ignore[attr-defined]
+        return size
+
+    if type_util.is_type(obj, "pandas.core.frame.DataFrame") or type_util.is_type(
+        obj, "pandas.core.series.Series"
+    ):
+        # DataFrame.memory_usage builds a Series of the column sizes, which
+        # takes longer than sizing the column arrays.
+        size = _pandas_index_size(obj.index)  # type: ignore[attr-defined]
+        for arr in obj._mgr.arrays:  # type: ignore[attr-defined]
+            size += arr.nbytes
+            if arr.dtype == object:
+                size += _object_values_size(arr.ravel())
+        return size
+
+    if type_util.get_fqn_type(obj).startswith("pyarrow.") and hasattr(obj, "nbytes"):
+        # Tables, record batches, arrays and buffers.
+        return int(obj.nbytes)  # type: ignore[attr-defined]
+
+    return None
+
+
+def _pandas_index_size(index: Any) -> int:
+    size = index.memory_usage(deep=False)
+    if index.dtype == object:
+        # memory_usage(deep=False) doesn't include the Python objects that
+        # object indices consist of.
+        size += _object_values_size(index.to_numpy())
+    return size
+
+
+def _object_values_size(values: Sequence[Any]) -> int:
+    """Estimate the size of the Python objects in a sequence from the sizes of
+    evenly spaced samples.
+    """
+    num_values = len(values)
+    if num_values == 0:
+        return 0
+    step = max(1, num_values // _SIZE_SAMPLE_COUNT)
+    sample = values[::step]
+    return int(sum(sys.getsizeof(value) for value in sample) * num_values / len(sample))
+
+
+def _sampled_size(
+    items: Iterable[Any], num_items: int, depth: int, use_asizeof: bool
+) -> int | None:
+    """Estimate the size of the items of a container from the sizes of its
+    first items.
+    """
+    if num_items == 0:
+        return 0
+    size = 0
+    sample = list(itertools.islice(items, _SIZE_SAMPLE_COUNT))
+    for item in sample:
+        item_size = _estimate_size(item, depth, use_asizeof)
+        if item_size is None:
+            return None
+        size += item_size
+    return int(size * num_items / len(sample))
+
+
+class SizeEstimates:
+    """Remembers size estimates of objects, so that computing stats doesn't
+    have to size every object on every call.
+
+    Estimates that are older than `max_age_secs` are refreshed in
+    `get_sizes`, oldest first, until the call took `time_budget_secs`. The
+    sizes of objects that weren't estimated yet and that don't fit into the
+    time budget are approximated with `sys.getsizeof` until then.
+    """
+
+    def __init__(self, max_age_secs: float = 60.0, time_budget_secs: float = 0.05):
+        self._max_age_secs = max_age_secs
+        self._time_budget_secs = time_budget_secs
+        # Maps keys to the time of their estimate and the estimate.
+        self._estimates: dict[Hashable, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def set(self, key: Hashable, obj: object) -> None:
+        """Estimate the size of an object that was just written, if that's
+        cheap. Other objects are estimated in the next call to `get_sizes`.
+        """
+        size = _estimate_size(obj, 0, use_asizeof=False)
+        with self._lock:
+            if size is None:
+                self._estimates.pop(key, None)
+            else:
+                self._estimates[key] = (time.monotonic(), size)
+
+    def get_sizes(self, entries: list[tuple[Hashable, object]]) -> list[int]:
+        """Return the size estimates of objects, given as (key, object) pairs.
+
+        The estimates of keys that aren't in `entries` are forgotten.
+        """
+        start_time = time.monotonic()
+        with self._lock:
+            estimates = {
+                key: self._estimates[key]
+                for key, _ in entries
+                if key in self._estimates
+            }
+
+        expired = [
+            i
+            for i, (key, _) in enumerate(entries)
+            if key not in estimates
+            or start_time - estimates[key][0] >= self._max_age_secs
+        ]
+        expired.sort(key=lambda i: estimates.get(entries[i][0], (-1.0, 0))[0])
+
+        sizes = [estimates[key][1] if key in estimates else 0 for key, _ in entries]
+        refreshed: dict[Hashable, tuple[float, int]] = {}
+        for i in expired:
+            key, obj = entries[i]
+            now = time.monotonic()
+            # The oldest estimate is always refreshed, so that all of them
+            # are refreshed eventually.
+            if not refreshed or now - start_time < self._time_budget_secs:
+                try:
+                    sizes[i] = estimate_size(obj)
+                    refreshed[key] = (now, sizes[i])
+                    continue
+                except RuntimeError:
+                    # The object was changed by another thread while it was
+                    # sized. Try again in the next call.
+                    pass
+            if key not in estimates:
+                sizes[i] = sys.getsizeof(obj)
+
+        keys = {key for key, _ in entries}
+        with self._lock:
+            self._estimates = {
+                key: estimate
+                for key, estimate in self._estimates.items()
+                if key in keys
+            }
+            for key, estimate in refreshed.items():
+                # Don't overwrite estimates of objects that were written in
+                # the meantime.
+                if self._estimates.get(key) == estimates.get(key):
+                    self._estimates[key] = estimate
+        return sizes
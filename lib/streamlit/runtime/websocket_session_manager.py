@@ -96,6 +96,18 @@ class WebsocketSessionManager(SessionManager):
 
             return existing_session.id
 
+        # The session may no longer be held in memory (e.g. because the server was
+        # restarted), but its session_state may have been persisted. In that case,
+        # we resume it in a new session with the same ID.
+        restored_state = (
+            self._session_storage.pop_session_state(existing_session_id)
+            if existing_session_id
+            and existing_session_id not in self._active_session_info_by_id
+            else None
+        )
+        if restored_state is not None:
+            session_id_override = existing_session_id
+
         session = AppSession(
             script_data=script_data,
             uploaded_file_manager=self._uploaded_file_mgr,
@@ -104,6 +116,8 @@ class WebsocketSessionManager(SessionManager):
             user_info=user_info,
             session_id_override=session_id_override,
         )
+        if restored_state is not None:
+            session.session_state.restore_user_state(restored_state)
 
         _LOGGER.debug(
             "Created new session for client %s. Session ID: %s", id(client), session.id
@@ -2058,6 +2058,9 @@ def parse_tree_from_messages(messages: list[ForwardMsg]) -> ElementTree:
                 new_node = Tab(block.tab, root=root)
             else:
                 new_node = Block(proto=block, root=root)
+        elif delta.WhichOneof("type") == "append_markdown":
+            _append_markdown(root, delta_path, delta.append_markdown)
+            continue
         else:
             # add_rows
             continue
@@ -2082,3 +2085,18 @@ def parse_tree_from_messages(messages: list[ForwardMsg]) -> ElementTree:
         current_node.children[delta_path[-1]] = new_node
 
     return root
+
+
+def _append_markdown(root: ElementTree, delta_path: Sequence[int], text: str) -> None:
+    """Append text to the body of the Markdown element at delta_path."""
+    node: Node | None = root
+    for idx in delta_path:
+        if not isinstance(node, Block):
+            return
+        node = node.children.get(idx)
+
+    if isinstance(node, Markdown):
+        proto = MarkdownProto()
+        proto.CopyFrom(node.proto)
+        proto.body += text
+        node.proto = proto
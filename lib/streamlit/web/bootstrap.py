@@ -18,7 +18,7 @@ import asyncio
 import os
 import signal
 import sys
-from typing import Any, Final
+from typing import TYPE_CHECKING, Any, Final
 
 from streamlit import cli_util, config, env_util, file_util, net_util, secrets
 from streamlit.config import CONFIG_FILENAMES
@@ -26,6 +26,10 @@ from streamlit.git_util import MIN_GIT_VERSION, GitRepo
 from streamlit.logger import get_logger
 from streamlit.watcher import report_watchdog_availability, watch_file
 from streamlit.web.server import Server, server_address_is_unix_socket, server_util
+from streamlit.web.server.worker_proxy import WorkerProxyServer, can_run_workers
+
+if TYPE_CHECKING:
+    import socket
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -36,7 +40,7 @@ _LOGGER: Final = get_logger(__name__)
 MAX_APP_STATIC_FOLDER_SIZE = 1 * 1024 * 1024 * 1024  # 1 GB
 
 
-def _set_up_signal_handler(server: Server) -> None:
+def _set_up_signal_handler(server: Server | WorkerProxyServer) -> None:
     _LOGGER.debug("Setting up signal handler")
 
     def signal_handler(signal_number, stack_frame):
@@ -101,7 +105,7 @@ def _fix_sys_argv(main_script_path: str, args: list[str]) -> None:
     sys.argv = [main_script_path] + list(args)
 
 
-def _on_server_start(server: Server) -> None:
+def _on_server_start(server: Server | WorkerProxyServer) -> None:
     _maybe_print_old_git_warning(server.main_script_path)
     _maybe_print_static_folder_warning(server.main_script_path)
     _print_url(server.is_running_hello)
@@ -293,6 +297,53 @@ def _install_config_watchers(flag_options: dict[str, Any]) -> None:
             watch_file(filename, on_config_changed)
 
 
+def _should_run_workers() -> bool:
+    if config.get_option("server.workers") <= 1:
+        return False
+
+    if not can_run_workers():
+        _LOGGER.warning(
+            "server.workers is not supported on this platform. "
+            "Running all sessions in a single process."
+        )
+        return False
+
+    return True
+
+
+def _create_worker_proxy_server(
+    main_script_path: str, is_hello: bool, flag_options: dict[str, Any]
+) -> WorkerProxyServer:
+    def run_worker(sockets: list[socket.socket]) -> None:
+        _run_worker(main_script_path, is_hello, flag_options, sockets)
+
+    return WorkerProxyServer(
+        main_script_path, is_hello, config.get_option("server.workers"), run_worker
+    )
+
+
+def _run_worker(
+    main_script_path: str,
+    is_hello: bool,
+    flag_options: dict[str, Any],
+    sockets: list[socket.socket],
+) -> None:
+    """The entry point of a worker process in multi-process mode."""
+    _install_config_watchers(flag_options)
+    server = Server(main_script_path, is_hello)
+
+    async def run_server() -> None:
+        await server.start(sockets)
+
+        _set_up_signal_handler(server)
+        # Ctrl+C is handled by the main process, which then stops the workers.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        await server.stopped
+
+    asyncio.run(run_server())
+
+
 def run(
     main_script_path: str,
     is_hello: bool,
@@ -307,10 +358,18 @@ def run(
     _fix_tornado_crash()
     _fix_sys_argv(main_script_path, args)
     _fix_pydeck_mapbox_api_warning()
-    _install_config_watchers(flag_options)
 
-    # Create the server. It won't start running yet.
-    server = Server(main_script_path, is_hello)
+    server: Server | WorkerProxyServer
+    if _should_run_workers():
+        # This forks the worker processes, so it has to happen before any
+        # threads (e.g. the config file watchers) are started.
+        server = _create_worker_proxy_server(main_script_path, is_hello, flag_options)
+        _install_config_watchers(flag_options)
+    else:
+        _install_config_watchers(flag_options)
+
+        # Create the server. It won't start running yet.
+        server = Server(main_script_path, is_hello)
 
     async def run_server() -> None:
         # Start the server
@@ -16,9 +16,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from streamlit import config
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.shared_memory_cache_storage import (
+    SharedMemoryCacheStorageManager,
+)
 
 if TYPE_CHECKING:
     from streamlit.runtime.caching.storage import CacheStorageManager
@@ -32,7 +36,9 @@ def create_default_cache_storage_manager() -> CacheStorageManager:
     Returns
     -------
     CacheStorageManager
-        The cache storage manager.
+        The cache storage manager, which is selected by `runner.cacheStorage`.
 
     """
+    if config.get_option("runner.cacheStorage") == "shared_memory":
+        return SharedMemoryCacheStorageManager()
     return LocalDiskCacheStorageManager()
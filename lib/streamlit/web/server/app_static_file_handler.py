@@ -17,11 +17,15 @@ from __future__ import annotations
 import mimetypes
 import os
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import tornado.web
 
 from streamlit.logger import get_logger
+from streamlit.web.server.static_asset_cache import static_asset_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 _LOGGER: Final = get_logger(__name__)
 
@@ -77,3 +81,30 @@ class AppStaticFileHandler(tornado.web.StaticFileHandler):
         if Path(path).suffix not in SAFE_APP_STATIC_FILE_EXTENSIONS:
             self.set_header("Content-Type", "text/plain")
         self.set_header("X-Content-Type-Options", "nosniff")
+
+    def compute_etag(self) -> str | None:
+        """Use the hash of the cached file as its ETag.
+
+        Unlike tornado's version hash, it changes when the file changes.
+        """
+        assert self.absolute_path is not None
+        try:
+            asset = static_asset_cache.get(self.absolute_path)
+        except OSError:
+            asset = None
+        if asset is None:
+            return super().compute_etag()
+        return asset.get_etag(None)
+
+    @classmethod
+    def get_content(
+        cls, abspath: str, start: int | None = None, end: int | None = None
+    ) -> bytes | Generator[bytes, None, None]:
+        """Serve files from the static asset cache, if they fit in it."""
+        try:
+            asset = static_asset_cache.get(abspath)
+        except OSError:
+            asset = None
+        if asset is None:
+            return super().get_content(abspath, start, end)
+        return asset.content[start:end]
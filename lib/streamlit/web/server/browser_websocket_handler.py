@@ -30,21 +30,47 @@ from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
+from streamlit.runtime.performance_metrics import (
+    forward_msg_sent_bytes,
+    forward_msgs_sent,
+)
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server_util import is_url_from_allowed_origins
 
 if TYPE_CHECKING:
+    from tornado.httputil import HTTPHeaders
+
     from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
 _LOGGER: Final = get_logger(__name__)
 
 
+def get_existing_session_id(headers: HTTPHeaders) -> str | None:
+    """Return the ID of the session a websocket connection wants to reconnect to.
+
+    See the NOTE in the docstring of `BrowserWebSocketHandler.select_subprotocol`
+    for a detailed explanation of why the session ID is passed as the third
+    value of the Sec-WebSocket-Protocol header.
+    """
+    try:
+        ws_protocols = [p.strip() for p in headers["Sec-Websocket-Protocol"].split(",")]
+    except KeyError:
+        # Just return None if we run into any error while trying to extract the
+        # session ID from the Sec-Websocket-Protocol header.
+        return None
+
+    if len(ws_protocols) >= 3:
+        return ws_protocols[2]
+    return None
+
+
 class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     """Handles a WebSocket connection from the browser"""
 
     def initialize(self, runtime: Runtime) -> None:
         self._runtime = runtime
         self._session_id: str | None = None
+        self._buffered_bytes = 0
         # The XSRF cookie is normally set when xsrf_form_html is used, but in a
         # pure-Javascript application that does not use any regular forms we just
         # need to read the self.xsrf_token manually to set the cookie as a side
@@ -57,13 +83,29 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
         """Set up CORS."""
         return super().check_origin(origin) or is_url_from_allowed_origins(origin)
 
+    @property
+    def buffered_bytes(self) -> int:
+        return self._buffered_bytes
+
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
+        serialized_msg = serialize_forward_msg(msg)
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            future = self.write_message(serialized_msg, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
 
+        # The future resolves once the message was written to the socket, so
+        # the bytes of unresolved futures are still buffered in Tornado.
+        msg_size = len(serialized_msg)
+        forward_msgs_sent.inc()
+        forward_msg_sent_bytes.inc(msg_size)
+        self._buffered_bytes += msg_size
+        future.add_done_callback(lambda _: self._on_message_written(msg_size))
+
+    def _on_message_written(self, msg_size: int) -> None:
+        self._buffered_bytes -= msg_size
+
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
 
@@ -107,26 +149,10 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
             "email": None if is_public_cloud_app else email
         }
 
-        existing_session_id = None
-        try:
-            ws_protocols = [
-                p.strip()
-                for p in self.request.headers["Sec-Websocket-Protocol"].split(",")
-            ]
-
-            if len(ws_protocols) >= 3:
-                # See the NOTE in the docstring of the `select_subprotocol` method above
-                # for a detailed explanation of why this is done.
-                existing_session_id = ws_protocols[2]
-        except KeyError:
-            # Just let existing_session_id=None if we run into any error while trying to
-            # extract it from the Sec-Websocket-Protocol header.
-            pass
-
         self._session_id = self._runtime.connect_session(
             client=self,
             user_info=user_info,
-            existing_session_id=existing_session_id,
+            existing_session_id=get_existing_session_id(self.request.headers),
         )
         return None
 
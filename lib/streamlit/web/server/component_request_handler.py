@@ -18,10 +18,15 @@ import mimetypes
 import os
 from typing import TYPE_CHECKING, Final
 
+import tornado.ioloop
 import tornado.web
 
 import streamlit.web.server.routes
 from streamlit.logger import get_logger
+from streamlit.web.server.static_asset_cache import (
+    get_content_type,
+    static_asset_cache,
+)
 
 if TYPE_CHECKING:
     from streamlit.components.types.base_component_registry import BaseComponentRegistry
@@ -39,7 +44,7 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
         mimetypes.add_type("application/javascript", ".js")
         mimetypes.add_type("text/css", ".css")
 
-    def get(self, path: str) -> None:
+    async def get(self, path: str) -> None:
         parts = path.split("/")
         component_name = parts[0]
         component_root = self._registry.get_component_path(component_name)
@@ -59,8 +64,17 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
             self.set_status(403)
             return
         try:
-            with open(abspath, "rb") as file:
-                contents = file.read()
+            # Reading and compressing the file blocks, so it's done in an
+            # executor. Files that are already cached and unchanged only
+            # need a stat.
+            asset = await tornado.ioloop.IOLoop.current().run_in_executor(
+                None, static_asset_cache.get, abspath, True
+            )
+            if asset is None:
+                # The file is too large to be cached.
+                contents = await tornado.ioloop.IOLoop.current().run_in_executor(
+                    None, _read_file, abspath
+                )
         except OSError as e:
             _LOGGER.error(
                 "ComponentRequestHandler: GET %s read error", abspath, exc_info=e
@@ -69,16 +83,40 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
             self.set_status(404)
             return
 
-        self.write(contents)
         self.set_header("Content-Type", self.get_content_type(abspath))
-
         self.set_extra_headers(path)
 
+        if asset is None:
+            self.write(contents)
+            return
+
+        encoding = None
+        if asset.encoded_contents:
+            encoding = asset.get_encoding(
+                self.request.headers.get("Accept-Encoding", "")
+            )
+            if not self.settings.get("compress_response"):
+                # Otherwise, tornado's GZipContentEncoding adds it.
+                self.set_header("Vary", "Accept-Encoding")
+
+        self.set_header("Etag", asset.get_etag(encoding))
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        if encoding is None:
+            self.write(asset.content)
+        else:
+            # tornado doesn't compress responses that already have a
+            # Content-Encoding.
+            self.set_header("Content-Encoding", encoding)
+            self.write(asset.encoded_contents[encoding])
+
     def set_extra_headers(self, path: str) -> None:
         """Disable cache for HTML files.
 
         Other assets like JS and CSS are suffixed with their hash, so they can
-        be cached indefinitely.
+        be cached indefinitely. HTML files are revalidated with their ETag.
         """
         is_index_url = len(path) == 0
 
@@ -98,25 +136,15 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
 
     @staticmethod
     def get_content_type(abspath: str) -> str:
-        """Returns the ``Content-Type`` header to be used for this request.
-        From tornado.web.StaticFileHandler.
-        """
-        mime_type, encoding = mimetypes.guess_type(abspath)
-        # per RFC 6713, use the appropriate type for a gzip compressed file
-        if encoding == "gzip":
-            return "application/gzip"
-        # As of 2015-07-21 there is no bzip2 encoding defined at
-        # http://www.iana.org/assignments/media-types/media-types.xhtml
-        # So for that (and any other encoding), use octet-stream.
-        elif encoding is not None:
-            return "application/octet-stream"
-        elif mime_type is not None:
-            return mime_type
-        # if mime_type not detected, use application/octet-stream
-        else:
-            return "application/octet-stream"
+        """Returns the ``Content-Type`` header to be used for this request."""
+        return get_content_type(abspath)
 
     @staticmethod
     def get_url(file_id: str) -> str:
         """Return the URL for a component file with the given ID."""
         return f"components/{file_id}"
+
+
+def _read_file(abspath: str) -> bytes:
+    with open(abspath, "rb") as file:
+        return file.read()
@@ -35,6 +35,7 @@ from streamlit.runtime import Runtime, RuntimeConfig, RuntimeState
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.performance_metrics import metrics_registry
 from streamlit.runtime.runtime_util import get_max_message_size_bytes
 from streamlit.web.cache_storage_manager_config import (
     create_default_cache_storage_manager,
@@ -56,8 +57,11 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
 
 if TYPE_CHECKING:
+    import socket
     from ssl import SSLContext
 
+    from streamlit.runtime.session_manager import SessionStorage
+
 _LOGGER: Final = get_logger(__name__)
 
 TORNADO_SETTINGS = {
@@ -109,16 +113,25 @@ def server_address_is_unix_socket() -> bool:
     return address is not None and address.startswith(UNIX_SOCKET_PREFIX)
 
 
-def start_listening(app: tornado.web.Application) -> None:
+def start_listening(
+    app: tornado.web.Application, sockets: list[socket.socket] | None = None
+) -> None:
     """Makes the server start listening at the configured port.
 
     In case the port is already taken it tries listening to the next available
     port.  It will error after MAX_PORT_SEARCH_RETRIES attempts.
 
+    If sockets are given, the server accepts connections on these already
+    bound sockets instead (this is used by worker processes). These are
+    loopback sockets that only the worker proxy connects to, so they don't use
+    SSL: TLS is terminated by the proxy.
     """
-    cert_file = config.get_option("server.sslCertFile")
-    key_file = config.get_option("server.sslKeyFile")
-    ssl_options = _get_ssl_options(cert_file, key_file)
+    if sockets is not None:
+        ssl_options = None
+    else:
+        cert_file = config.get_option("server.sslCertFile")
+        key_file = config.get_option("server.sslKeyFile")
+        ssl_options = _get_ssl_options(cert_file, key_file)
 
     http_server = HTTPServer(
         app,
@@ -126,7 +139,9 @@ def start_listening(app: tornado.web.Application) -> None:
         ssl_options=ssl_options,
     )
 
-    if server_address_is_unix_socket():
+    if sockets is not None:
+        http_server.add_sockets(sockets)
+    elif server_address_is_unix_socket():
         start_listening_unix_socket(http_server)
     else:
         start_listening_tcp_socket(http_server)
@@ -227,6 +242,32 @@ def start_listening_tcp_socket(http_server: HTTPServer) -> None:
         )
 
 
+def _create_session_storage() -> SessionStorage:
+    """Create the SessionStorage that holds disconnected sessions.
+
+    Sessions are persisted in an SQLite database if server.sessionStoragePath is
+    set, and only kept in memory otherwise.
+    """
+    path = config.get_option("server.sessionStoragePath")
+    disconnected_session_maxsize = config.get_option(
+        "server.disconnectedSessionMaxEntries"
+    )
+    disconnected_session_ttl = config.get_option("server.disconnectedSessionTTL")
+    if path:
+        from streamlit.runtime.sqlite_session_storage import SQLiteSessionStorage
+
+        return SQLiteSessionStorage(
+            path,
+            maxsize=config.get_option("server.sessionStorageMaxEntries"),
+            ttl_seconds=config.get_option("server.sessionStorageTTL"),
+            memory_maxsize=disconnected_session_maxsize,
+            memory_ttl_seconds=disconnected_session_ttl,
+        )
+    return MemorySessionStorage(
+        maxsize=disconnected_session_maxsize, ttl_seconds=disconnected_session_ttl
+    )
+
+
 class Server:
     def __init__(self, main_script_path: str, is_hello: bool):
         """Create the server. It won't be started yet."""
@@ -248,9 +289,7 @@ class Server:
                 uploaded_file_manager=uploaded_file_mgr,
                 cache_storage_manager=create_default_cache_storage_manager(),
                 is_hello=is_hello,
-                session_storage=MemorySessionStorage(
-                    ttl_seconds=config.get_option("server.disconnectedSessionTTL")
-                ),
+                session_storage=_create_session_storage(),
             ),
         )
 
@@ -263,16 +302,22 @@ class Server:
     def main_script_path(self) -> str:
         return self._main_script_path
 
-    async def start(self) -> None:
+    async def start(self, sockets: list[socket.socket] | None = None) -> None:
         """Start the server.
 
         When this returns, Streamlit is ready to accept new sessions.
+
+        Parameters
+        ----------
+        sockets : list[socket.socket] or None
+            Already bound sockets to accept connections on. If None, the
+            server listens on the configured address and port.
         """
 
         _LOGGER.debug("Starting server...")
 
         app = self._create_app()
-        start_listening(app)
+        start_listening(app, sockets)
 
         port = config.get_option("server.port")
         _LOGGER.debug("Server started on port %s", port)
@@ -307,7 +352,10 @@ class Server:
             (
                 make_url_path_regex(base, METRIC_ENDPOINT),
                 StatsRequestHandler,
-                {"stats_manager": self._runtime.stats_mgr},
+                {
+                    "stats_manager": self._runtime.stats_mgr,
+                    "metrics_registry": metrics_registry,
+                },
             ),
             (
                 make_url_path_regex(base, HOST_CONFIG_ENDPOINT),
@@ -0,0 +1,222 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-memory cache for static files served by the server, like the assets of
+custom components.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mimetypes
+import os
+import threading
+from typing import Final, NamedTuple
+
+from cachetools import LRUCache
+from tornado.web import GZipContentEncoding
+
+from streamlit.util import calc_md5
+
+# The maximum total size of the cached files, including their compressed
+# variants.
+MAX_CACHE_SIZE_BYTES: Final = 128 * 1024 * 1024  # 128 MB
+# Larger files aren't cached.
+MAX_CACHED_FILE_SIZE_BYTES: Final = 16 * 1024 * 1024  # 16 MB
+# Smaller files aren't compressed, since they're unlikely to benefit from it.
+MIN_COMPRESSED_FILE_SIZE_BYTES: Final = 1024
+
+GZIP_ENCODING: Final = "gzip"
+BROTLI_ENCODING: Final = "br"
+
+
+def _brotli_compress(content: bytes) -> bytes | None:
+    """Compress content with brotli, if the brotli module is installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(content)
+
+
+class CachedAsset(NamedTuple):
+    """A static file's content, and its compressed variants."""
+
+    content: bytes
+    content_type: str
+    # The MD5 hash of content, used for ETags.
+    content_hash: str
+    # Maps Content-Encoding values to the content compressed with them.
+    encoded_contents: dict[str, bytes]
+    # Whether encoded_contents was populated (it stays empty for content that
+    # isn't compressible).
+    is_compressed: bool
+    # The modification time and size of the file when it was read, used to
+    # detect when the file changes.
+    mtime_ns: int
+    size: int
+
+    @property
+    def cache_size(self) -> int:
+        return len(self.content) + sum(len(c) for c in self.encoded_contents.values())
+
+    def get_encoding(self, accept_encoding: str) -> str | None:
+        """Return the best content encoding that is supported by a client that
+        sent the given Accept-Encoding header, or None to send the content
+        uncompressed.
+        """
+        accepted = {
+            encoding.split(";")[0].strip() for encoding in accept_encoding.split(",")
+        }
+        for encoding in (BROTLI_ENCODING, GZIP_ENCODING):
+            if encoding in accepted and encoding in self.encoded_contents:
+                return encoding
+        return None
+
+    def get_etag(self, encoding: str | None) -> str:
+        """Return the ETag of the content with the given encoding.
+
+        Each encoding is a different representation of the file, so they need
+        different ETags.
+        """
+        if encoding is None:
+            return f'"{self.content_hash}"'
+        return f'"{self.content_hash}-{encoding}"'
+
+
+def get_content_type(abspath: str) -> str:
+    """Returns the ``Content-Type`` header to be used for the given file.
+    From tornado.web.StaticFileHandler.
+    """
+    mime_type, encoding = mimetypes.guess_type(abspath)
+    # per RFC 6713, use the appropriate type for a gzip compressed file
+    if encoding == "gzip":
+        return "application/gzip"
+    # As of 2015-07-21 there is no bzip2 encoding defined at
+    # http://www.iana.org/assignments/media-types/media-types.xhtml
+    # So for that (and any other encoding), use octet-stream.
+    elif encoding is not None:
+        return "application/octet-stream"
+    elif mime_type is not None:
+        return mime_type
+    # if mime_type not detected, use application/octet-stream
+    else:
+        return "application/octet-stream"
+
+
+def _is_compressible(content_type: str) -> bool:
+    return (
+        content_type.startswith("text/")
+        or content_type in GZipContentEncoding.CONTENT_TYPES
+    )
+
+
+def _read_asset(abspath: str, stat_result: os.stat_result) -> CachedAsset:
+    with open(abspath, "rb") as file:
+        content = file.read()
+
+    return CachedAsset(
+        content=content,
+        content_type=get_content_type(abspath),
+        content_hash=calc_md5(content),
+        encoded_contents={},
+        is_compressed=False,
+        mtime_ns=stat_result.st_mtime_ns,
+        size=len(content),
+    )
+
+
+def _compress_asset(asset: CachedAsset) -> CachedAsset:
+    encoded_contents: dict[str, bytes] = {}
+    if (
+        _is_compressible(asset.content_type)
+        and len(asset.content) >= MIN_COMPRESSED_FILE_SIZE_BYTES
+    ):
+        encoded_contents[GZIP_ENCODING] = gzip.compress(
+            asset.content, compresslevel=9, mtime=0
+        )
+        brotli_content = _brotli_compress(asset.content)
+        if brotli_content is not None:
+            encoded_contents[BROTLI_ENCODING] = brotli_content
+
+    return asset._replace(encoded_contents=encoded_contents, is_compressed=True)
+
+
+class StaticAssetCache:
+    """Caches the contents of static files in memory, keyed by their path.
+
+    A cached file is re-read once its modification time or size changes.
+    Compressible files can be stored with their gzip (and brotli, if the
+    brotli module is installed) compressed variants, so that they're only
+    compressed once.
+
+    Safe to use from any thread. Since reading and compressing files blocks,
+    the handlers call it from an executor.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int = MAX_CACHE_SIZE_BYTES,
+        max_file_size_bytes: int = MAX_CACHED_FILE_SIZE_BYTES,
+    ) -> None:
+        self._max_file_size_bytes = max_file_size_bytes
+        self._cache: LRUCache[str, CachedAsset] = LRUCache(
+            maxsize=max_size_bytes, getsizeof=lambda asset: asset.cache_size
+        )
+        self._lock = threading.Lock()
+
+    def get(self, abspath: str, compress: bool = False) -> CachedAsset | None:
+        """Return the cached asset for the file at abspath, reading it if it
+        isn't cached or has changed.
+
+        If compress is True, the asset includes the compressed variants of the
+        file (if its content type is compressible).
+
+        Returns None if the file is too large to be cached.
+
+        Raises
+        ------
+        OSError
+            If the file can't be read.
+        """
+        stat_result = os.stat(abspath)
+        if stat_result.st_size > self._max_file_size_bytes:
+            return None
+
+        with self._lock:
+            asset = self._cache.get(abspath)
+        if (
+            asset is not None
+            and asset.mtime_ns == stat_result.st_mtime_ns
+            and asset.size == stat_result.st_size
+        ):
+            if not compress or asset.is_compressed:
+                return asset
+            asset = _compress_asset(asset)
+        else:
+            asset = _read_asset(abspath, stat_result)
+            if compress:
+                asset = _compress_asset(asset)
+
+        with self._lock:
+            self._cache[abspath] = asset
+        return asset
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# The cache shared by all handlers that serve static files.
+static_asset_cache: Final = StaticAssetCache()
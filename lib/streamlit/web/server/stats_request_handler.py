@@ -23,12 +23,28 @@ from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 if TYPE_CHECKING:
     from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
+    from streamlit.runtime.performance_metrics import MetricsRegistry
     from streamlit.runtime.stats import CacheStat, StatsManager
 
 
 class StatsRequestHandler(tornado.web.RequestHandler):
-    def initialize(self, stats_manager: StatsManager) -> None:
+    def initialize(
+        self,
+        stats_manager: StatsManager,
+        metrics_registry: MetricsRegistry | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Parameters
+        ----------
+        stats_manager : StatsManager
+            The manager of the cache_memory_bytes stats.
+        metrics_registry : MetricsRegistry or None
+            The registry of the runtime's performance metrics, which are
+            exported after the cache stats.
+        """
         self._manager = stats_manager
+        self._metrics_registry = metrics_registry
 
     def set_default_headers(self):
         if allow_cross_origin_requests():
@@ -48,24 +64,31 @@ class StatsRequestHandler(tornado.web.RequestHandler):
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            metric_set = self._stats_to_proto(stats)
+            if self._metrics_registry is not None:
+                self._metrics_registry.marshall_metric_set_proto(metric_set)
+            self.write(metric_set.SerializeToString())
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(self._stats_to_text(stats, self._metrics_registry))
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: list[CacheStat]) -> str:
+    def _stats_to_text(
+        stats: list[CacheStat], metrics_registry: MetricsRegistry | None = None
+    ) -> str:
         metric_type = "# TYPE cache_memory_bytes gauge"
         metric_unit = "# UNIT cache_memory_bytes bytes"
-        metric_help = "# HELP Total memory consumed by a cache."
+        metric_help = "# HELP cache_memory_bytes Total memory consumed by a cache."
         openmetrics_eof = "# EOF\n"
 
-        # Format: header, stats, EOF
+        # Format: header, stats, performance metrics, EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+        if metrics_registry is not None:
+            result.extend(metrics_registry.to_text_lines())
         result.append(openmetrics_eof)
 
         return "\n".join(result)
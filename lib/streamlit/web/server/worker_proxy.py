@@ -0,0 +1,712 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Multi-process mode (`server.workers`).
+
+In this mode, the server process doesn't run any sessions itself. It spawns
+`server.workers` worker processes that each run a regular Streamlit `Server`
+on a local port, and proxies all browser traffic to them:
+
+* Each websocket session is routed to a single worker. New sessions go to the
+  worker with the fewest connections, and reconnecting sessions are routed back
+  to the worker that holds their state (in its `MemorySessionStorage`).
+* File uploads are routed to the worker of the session they belong to.
+* Metrics are fetched from all workers and combined, with a `worker` label
+  that holds the index of the worker. The health check fetches the health of
+  all workers, and fails if any of them is unhealthy.
+* All other requests (static files, media files, ...) can be served by any
+  worker. Since media files and cached messages only exist in the worker that
+  created them, GET requests that 404 are retried on the other workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import multiprocessing
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Final,
+    Iterable,
+    MutableMapping,
+)
+
+import tornado.httpclient
+import tornado.ioloop
+import tornado.netutil
+import tornado.web
+import tornado.websocket
+from cachetools import TTLCache
+
+from streamlit import cli_util, config, util
+from streamlit.logger import get_logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.runtime_util import get_max_message_size_bytes
+from streamlit.web.server.browser_websocket_handler import get_existing_session_id
+from streamlit.web.server.server import (
+    HEALTH_ENDPOINT,
+    METRIC_ENDPOINT,
+    STREAM_ENDPOINT,
+    TORNADO_SETTINGS,
+    UPLOAD_FILE_ENDPOINT,
+    start_listening,
+)
+from streamlit.web.server.server_util import (
+    is_url_from_allowed_origins,
+    make_url_path_regex,
+)
+
+if TYPE_CHECKING:
+    import socket
+    from multiprocessing.process import BaseProcess
+
+_LOGGER: Final = get_logger(__name__)
+
+# How often the server checks whether its worker processes are still alive.
+_WORKER_HEALTH_CHECK_INTERVAL_MS: Final = 1000
+
+# How long to wait for worker processes to exit when shutting down.
+_WORKER_SHUTDOWN_TIMEOUT_SECS: Final = 5
+
+# Headers that only apply to a single connection and must not be forwarded.
+_HOP_BY_HOP_HEADERS: Final = frozenset(
+    [
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+        "content-length",
+    ]
+)
+
+# Headers that tornado's websocket client sets itself for the upgrade request.
+_WEBSOCKET_HANDSHAKE_HEADERS: Final = frozenset(
+    [
+        "origin",
+        "sec-websocket-key",
+        "sec-websocket-version",
+        "sec-websocket-extensions",
+        "sec-websocket-protocol",
+    ]
+)
+
+# A worker entry point. It's called in the worker process with the already
+# bound sockets that the worker should accept connections on.
+WorkerTarget = Callable[["list[socket.socket]"], None]
+
+
+def can_run_workers() -> bool:
+    """True if worker processes can be forked on this platform."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class SessionRouter:
+    """Assigns websocket sessions to worker processes.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        disconnected_session_ttl: float,
+        disconnected_session_maxsize: int = 128,
+    ):
+        """Initialize the router.
+
+        Parameters
+        ----------
+        num_workers
+            The number of worker processes.
+
+        disconnected_session_ttl
+            The time in seconds that workers keep disconnected sessions.
+
+        disconnected_session_maxsize
+            The maximum number of disconnected sessions that each worker keeps.
+        """
+        self._lock = threading.Lock()
+        self._connections = [0] * num_workers
+        self._connected_sessions: dict[str, int] = {}
+        # Disconnected sessions are remembered for as long as the workers keep
+        # their state around, so that reconnects are routed to the right worker.
+        self._disconnected_sessions: MutableMapping[str, int] = TTLCache(
+            maxsize=disconnected_session_maxsize * num_workers,
+            ttl=disconnected_session_ttl,
+        )
+        self._round_robin = itertools.cycle(range(num_workers))
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._connections)
+
+    def connect(self, existing_session_id: str | None) -> int:
+        """Return the worker a new websocket connection should be routed to."""
+        with self._lock:
+            worker = self._get_session_worker(existing_session_id)
+            if worker is None:
+                # Pick the worker with the fewest connections. Ties are broken
+                # round-robin, so that sessions are spread evenly.
+                worker = min(
+                    self._get_round_robin_order(), key=self._connections.__getitem__
+                )
+            self._connections[worker] += 1
+            return worker
+
+    def register_session(self, session_id: str, worker: int) -> None:
+        """Record that the given session lives in the given worker."""
+        with self._lock:
+            self._disconnected_sessions.pop(session_id, None)
+            self._connected_sessions[session_id] = worker
+
+    def disconnect(self, session_id: str | None, worker: int) -> None:
+        """Record that a websocket connection to the given worker was closed."""
+        with self._lock:
+            self._connections[worker] -= 1
+            if session_id is not None:
+                self._connected_sessions.pop(session_id, None)
+                self._disconnected_sessions[session_id] = worker
+
+    def get_workers(self, session_id: str | None = None) -> list[int]:
+        """Return the workers that may serve a request, in order of preference.
+
+        Requests of a known session only go to that session's worker. All other
+        requests are spread across all workers.
+        """
+        with self._lock:
+            worker = self._get_session_worker(session_id)
+            if worker is not None:
+                return [worker]
+            return self._get_round_robin_order()
+
+    def _get_round_robin_order(self) -> list[int]:
+        first = next(self._round_robin)
+        return [(first + i) % self.num_workers for i in range(self.num_workers)]
+
+    def _get_session_worker(self, session_id: str | None) -> int | None:
+        if session_id is None:
+            return None
+        worker = self._connected_sessions.get(session_id)
+        if worker is None:
+            worker = self._disconnected_sessions.get(session_id)
+        return worker
+
+
+def _get_forwarded_headers(
+    headers: Iterable[tuple[str, str]], excluded: Iterable[str] = ()
+) -> dict[str, str]:
+    excluded = _HOP_BY_HOP_HEADERS.union(excluded)
+    forwarded: dict[str, str] = {}
+    for name, value in headers:
+        if name.lower() in excluded:
+            continue
+        forwarded[name] = f"{forwarded[name]},{value}" if name in forwarded else value
+    return forwarded
+
+
+class WorkerWebSocketProxyHandler(tornado.websocket.WebSocketHandler):
+    """Proxies a browser websocket connection to a worker process."""
+
+    def initialize(self, router: SessionRouter, worker_ports: list[int]) -> None:
+        self._router = router
+        self._worker_ports = worker_ports
+        self._worker: int | None = None
+        self._session_id: str | None = None
+        self._subprotocols: list[str] = []
+        self._upstream: tornado.websocket.WebSocketClientConnection | None = None
+        # See BrowserWebSocketHandler.initialize.
+        if config.get_option("server.enableXsrfProtection"):
+            _ = self.xsrf_token
+
+    def check_origin(self, origin: str) -> bool:
+        """Set up CORS."""
+        return super().check_origin(origin) or is_url_from_allowed_origins(origin)
+
+    def select_subprotocol(self, subprotocols: list[str]) -> str | None:
+        # The subprotocols are forwarded to the worker, which extracts the ID
+        # of the session to reconnect to from them.
+        # See BrowserWebSocketHandler.select_subprotocol.
+        self._subprotocols = subprotocols
+        if subprotocols:
+            return subprotocols[0]
+        return None
+
+    def get_compression_options(self) -> dict[Any, Any] | None:
+        if config.get_option("server.enableWebsocketCompression"):
+            return {}
+        return None
+
+    async def open(self, *args, **kwargs) -> None:
+        self._worker = self._router.connect(
+            get_existing_session_id(self.request.headers)
+        )
+        url = f"ws://127.0.0.1:{self._worker_ports[self._worker]}{self.request.path}"
+        request = tornado.httpclient.HTTPRequest(
+            url,
+            headers=_get_forwarded_headers(
+                self.request.headers.get_all(), _WEBSOCKET_HANDSHAKE_HEADERS
+            ),
+        )
+
+        try:
+            self._upstream = await tornado.websocket.websocket_connect(
+                request,
+                on_message_callback=self._on_upstream_message,
+                max_message_size=get_max_message_size_bytes(),
+                subprotocols=self._subprotocols or None,
+            )
+        except Exception as ex:
+            _LOGGER.error("Failed to connect to worker %s: %s", self._worker, ex)
+            self.close()
+
+    def on_message(self, message: str | bytes) -> None:
+        if self._upstream is not None:
+            self._upstream.write_message(message, binary=isinstance(message, bytes))
+
+    def on_close(self) -> None:
+        if self._upstream is not None:
+            self._upstream.close()
+            self._upstream = None
+        if self._worker is not None:
+            self._router.disconnect(self._session_id, self._worker)
+            self._worker = None
+
+    def _on_upstream_message(self, message: str | bytes | None) -> None:
+        if message is None:
+            # The worker closed the connection.
+            self._upstream = None
+            self.close()
+            return
+
+        if self._session_id is None and isinstance(message, bytes):
+            self._maybe_register_session(message)
+
+        try:
+            self.write_message(message, binary=isinstance(message, bytes))
+        except tornado.websocket.WebSocketClosedError:
+            pass
+
+    def _maybe_register_session(self, message: bytes) -> None:
+        """Learn the session ID from the NewSession message of the worker."""
+        msg = ForwardMsg()
+        msg.ParseFromString(message)
+        if msg.WhichOneof("type") == "new_session" and self._worker is not None:
+            self._session_id = msg.new_session.initialize.session_id
+            self._router.register_session(self._session_id, self._worker)
+
+
+class WorkerHTTPProxyHandler(tornado.web.RequestHandler):
+    """Proxies a plain HTTP request to a worker process."""
+
+    SUPPORTED_METHODS = ("GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS")  # type: ignore[assignment]
+
+    def initialize(
+        self,
+        router: SessionRouter,
+        worker_ports: list[int],
+        http_client: tornado.httpclient.AsyncHTTPClient,
+    ) -> None:
+        self._router = router
+        self._worker_ports = worker_ports
+        self._http_client = http_client
+
+    def check_xsrf_cookie(self) -> None:
+        # The worker that handles the request checks the XSRF cookie.
+        pass
+
+    async def get(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def head(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def post(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def put(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def delete(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def options(self, *args, **kwargs) -> None:
+        await self._proxy(kwargs.get("session_id"))
+
+    async def _proxy(self, session_id: str | None) -> None:
+        method = self.request.method or "GET"
+        response = None
+        for worker in self._router.get_workers(session_id):
+            response = await self._fetch(worker)
+            # Media files and cached messages only exist in the worker that
+            # created them, so we have to look for them in all workers.
+            if response.code != 404 or method not in ("GET", "HEAD"):
+                break
+
+        assert response is not None
+        if response.code == 599:
+            _LOGGER.error("Failed to proxy request to worker: %s", response.error)
+            raise tornado.web.HTTPError(502)
+        self._finish_with_response(response)
+
+    async def _fetch(self, worker: int) -> tornado.httpclient.HTTPResponse:
+        """Send the request to the given worker."""
+        method = self.request.method or "GET"
+        return await self._http_client.fetch(
+            tornado.httpclient.HTTPRequest(
+                f"http://127.0.0.1:{self._worker_ports[worker]}{self.request.uri}",
+                method=method,
+                headers=_get_forwarded_headers(self.request.headers.get_all()),
+                body=self.request.body if method in ("POST", "PUT") else None,
+                follow_redirects=False,
+                decompress_response=False,
+                allow_nonstandard_methods=True,
+            ),
+            raise_error=False,
+        )
+
+    async def _fetch_from_all_workers(self) -> list[tornado.httpclient.HTTPResponse]:
+        """Send the request to all workers at once."""
+        return await asyncio.gather(
+            *(self._fetch(worker) for worker in range(len(self._worker_ports)))
+        )
+
+    def _finish_with_response(self, response: tornado.httpclient.HTTPResponse) -> None:
+        """Send the response of a worker to the browser."""
+        self.set_status(response.code, response.reason)
+        # Replace tornado's default headers (e.g. Content-Type and Server) with
+        # the ones of the worker's response.
+        for name in set(response.headers.keys()):
+            self.clear_header(name)
+        for name, value in response.headers.get_all():
+            if name.lower() in _HOP_BY_HOP_HEADERS:
+                continue
+            self.add_header(name, value)
+
+        if response.code == 304 or self.request.method == "HEAD":
+            self.finish()
+        else:
+            self.finish(response.body)
+
+
+class WorkerHealthProxyHandler(WorkerHTTPProxyHandler):
+    """Reports the server as healthy only if all workers are."""
+
+    async def _proxy(self, session_id: str | None) -> None:
+        if self.request.method not in ("GET", "HEAD"):
+            await super()._proxy(session_id)
+            return
+
+        responses = await self._fetch_from_all_workers()
+        for worker, response in enumerate(responses):
+            if response.code == 599:
+                _LOGGER.error(
+                    "Failed to check the health of worker %s: %s",
+                    worker,
+                    response.error,
+                )
+                raise tornado.web.HTTPError(503)
+            if response.code != 200:
+                self._finish_with_response(response)
+                return
+        self._finish_with_response(responses[0])
+
+
+class WorkerMetricsProxyHandler(WorkerHTTPProxyHandler):
+    """Combines the metrics of all workers.
+
+    Each worker tracks its own metrics, so each metric is labeled with the
+    index of its worker.
+    """
+
+    async def _proxy(self, session_id: str | None) -> None:
+        if self.request.method != "GET":
+            await super()._proxy(session_id)
+            return
+
+        responses = await self._fetch_from_all_workers()
+        for worker, response in enumerate(responses):
+            if response.code != 200:
+                _LOGGER.error(
+                    "Failed to fetch the metrics of worker %s: %s %s",
+                    worker,
+                    response.code,
+                    response.error,
+                )
+                raise tornado.web.HTTPError(502)
+
+        content_type = responses[0].headers.get("Content-Type", "")
+        bodies = [response.body for response in responses]
+        if content_type == "application/x-protobuf":
+            body = _merge_metric_sets(bodies)
+        else:
+            body = _merge_metrics_text(
+                [body.decode("utf-8") for body in bodies]
+            ).encode("utf-8")
+
+        self.set_status(200)
+        self.set_header("Content-Type", content_type)
+        allow_origin = responses[0].headers.get("Access-Control-Allow-Origin")
+        if allow_origin is not None:
+            self.set_header("Access-Control-Allow-Origin", allow_origin)
+        self.finish(body)
+
+
+def _add_worker_label(sample_line: str, worker: int) -> str:
+    """Add the worker label to a sample line of the OpenMetrics text format."""
+    label = f'worker="{worker}"'
+    name_end = sample_line.index(" ")
+    labels_start = sample_line.find("{", 0, name_end)
+    if labels_start == -1:
+        return f"{sample_line[:name_end]}{{{label}}}{sample_line[name_end:]}"
+    if sample_line[labels_start + 1] != "}":
+        label += ","
+    return f"{sample_line[: labels_start + 1]}{label}{sample_line[labels_start + 1 :]}"
+
+
+def _merge_metrics_text(texts: list[str]) -> str:
+    """Combine the OpenMetrics texts of all workers into one, with a worker
+    label on each sample.
+    """
+    # The metadata lines and samples of each metric family, in the order in
+    # which the families first appear.
+    families: dict[str, tuple[list[str], list[str]]] = {}
+    for worker, text in enumerate(texts):
+        family = ""
+        for line in text.splitlines():
+            if not line or line == "# EOF":
+                continue
+            if line.startswith("# "):
+                # E.g. "# TYPE cache_memory_bytes gauge"
+                family = line.split(" ", 3)[2]
+                metadata, _ = families.setdefault(family, ([], []))
+                if line not in metadata:
+                    metadata.append(line)
+            else:
+                _, samples = families.setdefault(family, ([], []))
+                samples.append(_add_worker_label(line, worker))
+
+    lines = []
+    for metadata, samples in families.values():
+        lines.extend(metadata)
+        lines.extend(samples)
+    lines.append("# EOF\n")
+    return "\n".join(lines)
+
+
+def _merge_metric_sets(serialized_metric_sets: list[bytes]) -> bytes:
+    """Combine the OpenMetrics MetricSet protobufs of all workers into one,
+    with a worker label on each metric.
+    """
+    # Lazy load the import of this proto message for better performance:
+    from streamlit.proto.openmetrics_data_model_pb2 import MetricFamily, MetricSet
+
+    merged = MetricSet()
+    families: dict[str, MetricFamily] = {}
+    for worker, serialized_metric_set in enumerate(serialized_metric_sets):
+        metric_set = MetricSet()
+        metric_set.ParseFromString(serialized_metric_set)
+        for family in metric_set.metric_families:
+            merged_family = families.get(family.name)
+            if merged_family is None:
+                merged_family = merged.metric_families.add()
+                merged_family.CopyFrom(family)
+                del merged_family.metrics[:]
+                families[family.name] = merged_family
+            for metric in family.metrics:
+                merged_metric = merged_family.metrics.add()
+                merged_metric.CopyFrom(metric)
+                label = merged_metric.labels.add()
+                label.name = "worker"
+                label.value = str(worker)
+    return merged.SerializeToString()
+
+
+def create_worker_proxy_app(
+    router: SessionRouter,
+    worker_ports: list[int],
+    http_client: tornado.httpclient.AsyncHTTPClient,
+) -> tornado.web.Application:
+    """Create the tornado app that proxies requests to the worker processes."""
+    base = config.get_option("server.baseUrlPath")
+    http_proxy_args = {
+        "router": router,
+        "worker_ports": worker_ports,
+        "http_client": http_client,
+    }
+
+    routes: list[Any] = [
+        (
+            make_url_path_regex(base, HEALTH_ENDPOINT),
+            WorkerHealthProxyHandler,
+            http_proxy_args,
+        ),
+        (
+            make_url_path_regex(base, METRIC_ENDPOINT),
+            WorkerMetricsProxyHandler,
+            http_proxy_args,
+        ),
+        (
+            make_url_path_regex(base, STREAM_ENDPOINT),
+            WorkerWebSocketProxyHandler,
+            {"router": router, "worker_ports": worker_ports},
+        ),
+        (
+            make_url_path_regex(
+                base,
+                rf"{UPLOAD_FILE_ENDPOINT}/(?P<session_id>[^/]+)/(?P<file_id>[^/]+)",
+            ),
+            WorkerHTTPProxyHandler,
+            http_proxy_args,
+        ),
+        (make_url_path_regex(base, "(.*)"), WorkerHTTPProxyHandler, http_proxy_args),
+    ]
+
+    return tornado.web.Application(
+        routes,
+        cookie_secret=config.get_option("server.cookieSecret"),
+        xsrf_cookies=config.get_option("server.enableXsrfProtection"),
+        websocket_max_message_size=get_max_message_size_bytes(),
+        # The workers already compress their responses.
+        **{**TORNADO_SETTINGS, "compress_response": False},  # type: ignore[arg-type]
+    )
+
+
+class WorkerProxyServer:
+    """Runs app sessions in multiple worker processes.
+
+    Quacks like `Server`, so that bootstrap can run it the same way. The worker
+    processes are forked when this is created, which has to happen before the
+    asyncio event loop is started.
+    """
+
+    def __init__(
+        self,
+        main_script_path: str,
+        is_hello: bool,
+        num_workers: int,
+        worker_target: WorkerTarget,
+    ):
+        self._main_script_path = main_script_path
+        self._is_hello = is_hello
+        self._router = SessionRouter(
+            num_workers,
+            config.get_option("server.disconnectedSessionTTL"),
+            config.get_option("server.disconnectedSessionMaxEntries"),
+        )
+        self._worker_ports: list[int] = []
+        self._processes: list[BaseProcess] = []
+        self._stopping = False
+        self._stopped: asyncio.Event | None = None
+        self._health_check: tornado.ioloop.PeriodicCallback | None = None
+
+        context = multiprocessing.get_context("fork")
+        for index in range(num_workers):
+            sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+            process = context.Process(
+                target=worker_target,
+                args=(sockets,),
+                name=f"StreamlitWorker-{index}",
+            )
+            process.start()
+
+            self._worker_ports.append(sockets[0].getsockname()[1])
+            self._processes.append(process)
+            # Only the worker accepts connections on its sockets.
+            for sock in sockets:
+                sock.close()
+
+        _LOGGER.debug("Started %s workers on ports %s", num_workers, self._worker_ports)
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    @property
+    def main_script_path(self) -> str:
+        return self._main_script_path
+
+    @property
+    def is_running_hello(self) -> bool:
+        from streamlit.hello import streamlit_app
+
+        return self._main_script_path == streamlit_app.__file__
+
+    async def start(self) -> None:
+        """Start proxying requests to the workers."""
+        self._stopped = asyncio.Event()
+        max_body_size = max(
+            config.get_option("server.maxUploadSize") * 1024 * 1024,
+            get_max_message_size_bytes(),
+        )
+        self._http_client = tornado.httpclient.AsyncHTTPClient(
+            force_instance=True,
+            max_body_size=max_body_size,
+            max_buffer_size=max_body_size,
+        )
+        start_listening(
+            create_worker_proxy_app(self._router, self._worker_ports, self._http_client)
+        )
+
+        self._health_check = tornado.ioloop.PeriodicCallback(
+            self._check_workers, _WORKER_HEALTH_CHECK_INTERVAL_MS
+        )
+        self._health_check.start()
+
+    @property
+    def stopped(self) -> Awaitable[None]:
+        """A coroutine that completes when the server and its workers stopped."""
+        return self._wait_until_stopped()
+
+    def stop(self) -> None:
+        cli_util.print_to_cli("  Stopping...", fg="blue")
+        self._stopping = True
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _wait_until_stopped(self) -> None:
+        assert self._stopped is not None
+        await self._stopped.wait()
+
+        if self._health_check is not None:
+            self._health_check.stop()
+        self._http_client.close()
+        for process in self._processes:
+            process.join(_WORKER_SHUTDOWN_TIMEOUT_SECS)
+            if process.is_alive():
+                process.kill()
+
+    def _check_workers(self) -> None:
+        if self._stopping:
+            return
+        for index, process in enumerate(self._processes):
+            if not process.is_alive():
+                _LOGGER.error(
+                    "Worker %s exited unexpectedly with exit code %s. "
+                    "Shutting down.",
+                    index,
+                    process.exitcode,
+                )
+                self.stop()
+                return
@@ -23,11 +23,15 @@ from typing import TYPE_CHECKING, Any
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
+from parameterized import parameterized
 
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit import dataframe_util
 from streamlit.components.lib.local_component_registry import LocalComponentRegistry
 from streamlit.components.types.base_component_registry import BaseComponentRegistry
 from streamlit.components.v1 import component_arrow
@@ -37,6 +41,7 @@ from streamlit.components.v1.component_registry import (
 )
 from streamlit.components.v1.custom_component import CustomComponent
 from streamlit.errors import DuplicateWidgetID, StreamlitAPIException
+from streamlit.proto.Components_pb2 import ArrowTable as ArrowTableProto
 from streamlit.proto.Components_pb2 import SpecialArg
 from streamlit.proto.WidgetStates_pb2 import WidgetState, WidgetStates
 from streamlit.runtime import Runtime, RuntimeConfig
@@ -581,6 +586,105 @@ class IFrameTest(DeltaGeneratorTestCase):
         self.assertTrue(el.iframe.scrolling)
 
 
+class ComponentArrowTest(unittest.TestCase):
+    """Test marshalling dataframe args into ArrowTable protos."""
+
+    def setUp(self) -> None:
+        component_arrow._marshalled_table_cache.clear()
+
+    def tearDown(self) -> None:
+        component_arrow._marshalled_table_cache.clear()
+
+    @parameterized.expand(
+        [
+            ("range", pd.RangeIndex(3)),
+            ("int32", pd.Index(np.arange(3, dtype="int32"))),
+            ("float", pd.Index([1.0, np.nan, 3.0])),
+            ("datetime", pd.date_range("2024-01-01", periods=3)),
+            ("string", pd.Index(["a", "b", "c"])),
+            ("category", pd.CategoricalIndex(["a", "b", "a"])),
+            ("multi", pd.MultiIndex.from_tuples([("a", 1), ("b", 2)])),
+            ("empty", pd.RangeIndex(0)),
+        ]
+    )
+    def test_marshall_index(self, _, index: pd.Index):
+        """The index is marshalled like a dataframe with a column per level."""
+        proto = ArrowTableProto()
+        component_arrow._marshall_index(proto, index)
+
+        expected_df = pd.DataFrame(
+            [list(i) if isinstance(i, tuple) else i for i in index.values]
+        )
+        self.assertEqual(
+            proto.index, dataframe_util.convert_pandas_df_to_arrow_bytes(expected_df)
+        )
+
+    def test_marshall_arrow_table(self):
+        """pyarrow.Tables are marshalled without converting them to pandas."""
+        table = pa.table(
+            {
+                "name": pa.array(["a", "b", None], pa.large_string()),
+                "value": pa.array([1, 2, 3]),
+            }
+        )
+        proto = ArrowTableProto()
+        pandas_proto = ArrowTableProto()
+
+        with patch.object(
+            dataframe_util, "convert_anything_to_pandas_df"
+        ) as convert_to_pandas:
+            component_arrow.marshall(proto, table)
+            convert_to_pandas.assert_not_called()
+        component_arrow.marshall(pandas_proto, table.to_pandas())
+
+        self.assertEqual(proto.index, pandas_proto.index)
+        self.assertEqual(proto.columns, pandas_proto.columns)
+        data = pa.ipc.open_stream(proto.data).read_all()
+        self.assertEqual(data.schema.field("name").type, pa.string())
+        self.assertEqual(data.to_pylist(), table.to_pylist())
+        pd.testing.assert_frame_equal(
+            component_arrow.arrow_proto_to_dataframe(proto),
+            component_arrow.arrow_proto_to_dataframe(pandas_proto),
+        )
+
+    def test_unchanged_dataframe_is_reused(self):
+        """Dataframes with the same content are only converted once."""
+        proto = ArrowTableProto()
+        component_arrow.marshall(
+            proto, pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[3, 4])
+        )
+
+        with patch.object(component_arrow, "_marshall_data") as marshall_data:
+            other_proto = ArrowTableProto()
+            component_arrow.marshall(
+                other_proto,
+                pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[3, 4]),
+            )
+            marshall_data.assert_not_called()
+            self.assertEqual(proto, other_proto)
+
+            component_arrow.marshall(
+                ArrowTableProto(),
+                pd.DataFrame({"a": [1, 2], "b": ["x", "z"]}, index=[3, 4]),
+            )
+            marshall_data.assert_called_once()
+
+    @parameterized.expand(
+        [
+            ("mixed objects", pd.DataFrame({"a": [1, "1"]})),
+            ("category", pd.DataFrame({"a": pd.Categorical(["x", "y"])})),
+            ("multi index", pd.DataFrame({"a": [1]}, index=[("x", 1)])),
+        ]
+    )
+    def test_dataframe_without_fingerprint_is_not_reused(self, _, df: pd.DataFrame):
+        self.assertIsNone(component_arrow._get_dataframe_fingerprint(df))
+
+        component_arrow.marshall(ArrowTableProto(), df)
+        with patch.object(component_arrow, "_marshall_data") as marshall_data:
+            component_arrow.marshall(ArrowTableProto(), df)
+            marshall_data.assert_called_once()
+
+
 class AlternativeComponentRegistryTest(unittest.TestCase):
     """Test alternative component registry initialization."""
 
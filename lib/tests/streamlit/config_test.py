@@ -228,6 +228,36 @@ class ConfigTest(unittest.TestCase):
             config.get_where_defined("_test.dependentOption"), config._USER_DEFINED
         )
 
+    def test_get_option_without_lock(self):
+        """Test that get_option only grabs the config lock for computed options
+        and while config files are being parsed.
+        """
+        config._create_option("_test.staticOption", default_val="static")
+
+        @config._create_option("_test.computedOption")
+        def _test_computed_option():
+            """Computed on each access."""
+            return "computed"
+
+        config.get_config_options(force_reparse=True)
+
+        with patch.object(config, "_config_lock") as mock_lock:
+            self.assertEqual(config.get_option("_test.staticOption"), "static")
+            mock_lock.__enter__.assert_not_called()
+
+            self.assertEqual(config.get_option("_test.computedOption"), "computed")
+            mock_lock.__enter__.assert_called_once()
+
+        # The snapshot is updated when an option is set.
+        config.set_option("_test.staticOption", "changed")
+        self.assertEqual(config.get_option("_test.staticOption"), "changed")
+
+        # The snapshot isn't used for a different options dict.
+        other_options = copy.deepcopy(config._config_options)
+        other_options["_test.staticOption"].set_value("other")
+        with patch.object(config, "_config_options", new=other_options):
+            self.assertEqual(config.get_option("_test.staticOption"), "other")
+
     def test_parsing_toml(self):
         """Test config._update_config_with_toml()."""
         # Some useful variables.
@@ -389,6 +419,7 @@ class ConfigTest(unittest.TestCase):
                 "global.maxCachedMessageAge",
                 "global.minCachedMessageSize",
                 "global.showWarningOnDirectExecution",
+                "global.enableDeltaDiffing",
                 "global.storeCachedForwardMessagesInMemory",
                 "global.suppressDeprecationWarnings",
                 "global.unitTest",
@@ -400,6 +431,13 @@ class ConfigTest(unittest.TestCase):
                 "runner.postScriptGC",
                 "runner.fastReruns",
                 "runner.enumCoercion",
+                "runner.cacheHashFullData",
+                "runner.cacheDiskCompression",
+                "runner.cacheMaxDiskSize",
+                "runner.cacheStorage",
+                "runner.cacheMaxSharedMemorySize",
+                "runner.cacheMaxSize",
+                "runner.maxConcurrentScriptRuns",
                 "magic.displayRootDocString",
                 "magic.displayLastExprIfNoSemicolon",
                 "mapbox.token",
@@ -419,11 +457,19 @@ class ConfigTest(unittest.TestCase):
                 "server.runOnSave",
                 "server.maxUploadSize",
                 "server.maxMessageSize",
+                "server.maxSessionBufferSize",
                 "server.enableStaticServing",
                 "server.enableArrowTruncation",
+                "server.addRowsMaxRows",
                 "server.sslCertFile",
                 "server.sslKeyFile",
+                "server.disconnectedSessionMaxEntries",
                 "server.disconnectedSessionTTL",
+                "server.sessionHibernationTimeout",
+                "server.sessionStorageMaxEntries",
+                "server.sessionStoragePath",
+                "server.sessionStorageTTL",
+                "server.workers",
                 "ui.hideTopBar",
             ]
         )
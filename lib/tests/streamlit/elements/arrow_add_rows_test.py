@@ -14,12 +14,16 @@
 
 """Unit test of dg.add_rows()."""
 
+from unittest.mock import patch
+
 import pandas as pd
+import pyarrow as pa
 from parameterized import parameterized
 
 import streamlit as st
 from streamlit.dataframe_util import convert_arrow_bytes_to_pandas_df
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
+from tests.testutil import patch_config_options
 
 DATAFRAME = pd.DataFrame({"a": [10], "b": [20], "c": [30]})
 NEW_ROWS = pd.DataFrame({"a": [11, 12, 13], "b": [21, 22, 23], "c": [31, 32, 33]})
@@ -202,3 +206,48 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
         )
 
         pd.testing.assert_frame_equal(proto, expected)
+
+    @parameterized.expand(
+        [
+            (pa.Table.from_pandas(NEW_ROWS),),
+            (pa.RecordBatch.from_pandas(NEW_ROWS),),
+        ]
+    )
+    def test_dataframe_with_arrow_data(self, new_rows):
+        """Arrow data is appended to dataframes without a pandas roundtrip."""
+        element = st.dataframe(DATAFRAME)
+        with patch(
+            "streamlit.dataframe_util.convert_anything_to_pandas_df"
+        ) as convert_mock:
+            element.add_rows(new_rows)
+            convert_mock.assert_not_called()
+
+        table = pa.ipc.open_stream(
+            self.get_delta_from_queue().arrow_add_rows.data.data
+        ).read_all()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column("a").to_pylist(), [11, 12, 13])
+
+    def test_dataframe_chunks_use_negotiated_schema(self):
+        """Following chunks are casted to the schema of the first chunk."""
+        element = st.dataframe(DATAFRAME)
+        element.add_rows(pa.table({"a": pa.array([1], pa.int64())}))
+        element.add_rows(pa.table({"a": pa.array([2], pa.int32())}))
+
+        table = pa.ipc.open_stream(
+            self.get_delta_from_queue().arrow_add_rows.data.data
+        ).read_all()
+        self.assertEqual(table.schema.field("a").type, pa.int64())
+
+    def test_max_rows_not_set_by_default(self):
+        element = st.dataframe(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+
+        self.assertEqual(self.get_delta_from_queue().arrow_add_rows.max_rows, 0)
+
+    @patch_config_options({"server.addRowsMaxRows": 100})
+    def test_max_rows_from_config(self):
+        element = st.line_chart(DATAFRAME)
+        element.add_rows(NEW_ROWS)
+
+        self.assertEqual(self.get_delta_from_queue().arrow_add_rows.max_rows, 100)
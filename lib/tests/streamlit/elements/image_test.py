@@ -517,3 +517,105 @@ class ImageProtoTest(DeltaGeneratorTestCase):
             "`use_container_width` and `use_column_width` cannot be set at the same time."
             in str(e.exception)
         )
+
+
+class EncodedImageCacheTest(DeltaGeneratorTestCase):
+    """Test the caching and parallel encoding of images."""
+
+    def setUp(self):
+        super().setUp()
+        image._encoded_image_cache.clear()
+
+    def tearDown(self):
+        image._encoded_image_cache.clear()
+        super().tearDown()
+
+    def test_unchanged_image_is_not_encoded_again(self):
+        """Test that an image with the same content is only encoded once."""
+        img = np.full((32, 32, 3), 100, dtype=np.uint8)
+
+        with mock.patch(
+            "streamlit.elements.image._encode_image", wraps=image._encode_image
+        ) as encode_image:
+            st.image(img)
+            st.image(img.copy())
+            self.assertEqual(encode_image.call_count, 1)
+
+            # Changed content or parameters lead to a new encoding:
+            img[0, 0, 0] = 0
+            st.image(img)
+            st.image(img, width=16)
+            self.assertEqual(encode_image.call_count, 3)
+
+        urls = [
+            self.get_delta_from_queue(i).new_element.imgs.imgs[0].url
+            for i in range(-4, -2)
+        ]
+        self.assertEqual(urls[0].split("/")[-1], urls[1].split("/")[-1])
+
+    def test_multi_frame_image_is_not_cached(self):
+        """Test that multi-frame images that only differ after their first
+        frame don't share a cache entry."""
+
+        def create_gif(second_frame_color: str) -> Image.Image:
+            frames = [
+                Image.new("RGB", (8, 8), "red"),
+                Image.new("RGB", (8, 8), second_frame_color),
+            ]
+            data = io.BytesIO()
+            frames[0].save(data, format="GIF", save_all=True, append_images=frames[1:])
+            data.seek(0)
+            return Image.open(data)
+
+        with mock.patch(
+            "streamlit.elements.image._encode_image", wraps=image._encode_image
+        ) as encode_image, mock.patch.object(
+            image._encoded_image_cache, "set"
+        ) as cache_set:
+            st.image(create_gif("green"))
+            st.image(create_gif("blue"))
+            self.assertEqual(encode_image.call_count, 2)
+            cache_set.assert_not_called()
+
+    def test_repeated_image_in_list_is_encoded_once(self):
+        """Test that an image that appears multiple times in a list is only
+        encoded by one thread, since PIL images aren't thread-safe."""
+        img = Image.new("RGB", (8, 8), "red")
+
+        with mock.patch(
+            "streamlit.elements.image._get_encoded_image",
+            wraps=image._get_encoded_image,
+        ) as get_encoded_image:
+            st.image([img] * 4, output_format="PNG")
+            self.assertEqual(get_encoded_image.call_count, 1)
+
+        urls = [img.url for img in self.get_delta_from_queue().new_element.imgs.imgs]
+        self.assertEqual(len(urls), 4)
+        self.assertEqual(len({url.split("/")[-1] for url in urls}), 1)
+
+    def test_cache_is_bounded_by_bytes(self):
+        """Test that the cache evicts images once the byte budget is exceeded."""
+        cache = image._EncodedImageCache(max_bytes=10)
+        cache.set("a", (b"123456", "PNG"))
+        cache.set("b", (b"123456", "PNG"))
+        cache.set("too-large", (b"12345678901", "PNG"))
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), (b"123456", "PNG"))
+        self.assertIsNone(cache.get("too-large"))
+
+    def test_image_list_is_encoded_in_order(self):
+        """Test that a list of images encoded in parallel keeps its order."""
+        imgs = [np.full((8, 8, 3), i, dtype=np.uint8) for i in range(8)]
+
+        st.image(imgs, output_format="PNG")
+
+        urls = [img.url for img in self.get_delta_from_queue().new_element.imgs.imgs]
+        expected_file_ids = [
+            _calculate_file_id(
+                _np_array_to_bytes(img, output_format="PNG"), mimetype="image/png"
+            )
+            for img in imgs
+        ]
+        for url, file_id in zip(urls, expected_file_ids):
+            self.assertIn(file_id, url)
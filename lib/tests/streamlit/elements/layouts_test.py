@@ -13,13 +13,20 @@
 # limitations under the License.
 
 from typing import Literal
+from unittest import mock
 
 import pytest
 from parameterized import parameterized
 
 import streamlit as st
-from streamlit.errors import FragmentHandledException, StreamlitAPIException
+from streamlit.errors import (
+    FragmentHandledException,
+    StreamlitAPIException,
+    StreamlitDuplicateElementId,
+    StreamlitDuplicateElementKey,
+)
 from streamlit.proto.Block_pb2 import Block as BlockProto
+from streamlit.proto.WidgetStates_pb2 import WidgetState
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 
 
@@ -249,6 +256,58 @@ class ExpanderTest(DeltaGeneratorTestCase):
             f" Please use a Material icon shortcode like **`:material{invisible_white_space}/thumb_up:`**. ",
         )
 
+    def test_lazy_content_not_rendered_until_opened(self):
+        """Test that the content of a lazy expander is deferred until opened."""
+        content = mock.Mock(side_effect=lambda: st.markdown("content"))
+
+        st.expander("label", content=content)
+
+        content.assert_not_called()
+        expander_block = self.get_delta_from_queue()
+        self.assertTrue(expander_block.add_block.lazy)
+        self.assertTrue(expander_block.add_block.allow_empty)
+        self.assertNotEqual(expander_block.add_block.id, "")
+        self.assertEqual(len(self.get_all_deltas_from_queue()), 1)
+
+        # Simulate the frontend reporting that the expander was opened:
+        widget_state = WidgetState()
+        widget_state.id = expander_block.add_block.id
+        widget_state.bool_value = True
+        self.script_run_ctx.reset(page_script_hash=self.script_run_ctx.page_script_hash)
+        self.script_run_ctx.session_state._state._new_widget_state.set_widget_from_proto(
+            widget_state
+        )
+
+        st.expander("label", content=content)
+
+        content.assert_called_once()
+        self.assertEqual(
+            self.get_delta_from_queue().new_element.markdown.body, "content"
+        )
+
+    def test_lazy_expanders_in_loop(self):
+        """Test that lazy expanders with the same label and content function
+        can be told apart with a key."""
+        for index in range(2):
+            st.expander("label", content=lambda: None, key=f"expander-{index}")
+
+        expander_ids = [
+            delta.add_block.id for delta in self.get_all_deltas_from_queue()
+        ]
+        self.assertEqual(len(set(expander_ids)), 2)
+
+        with self.assertRaises(StreamlitDuplicateElementId):
+            for _ in range(2):
+                st.expander("other label", content=lambda: None)
+
+    def test_lazy_content_rendered_if_expanded(self):
+        """Test that the content of an initially expanded lazy expander is rendered."""
+        content = mock.Mock()
+
+        st.expander("label", expanded=True, content=content)
+
+        content.assert_called_once()
+
 
 class ContainerTest(DeltaGeneratorTestCase):
     def test_border_parameter(self):
@@ -502,6 +561,41 @@ class TabsTest(DeltaGeneratorTestCase):
         for index, tab_block in enumerate(tabs_block):
             self.assertEqual(tab_block.add_block.tab.label, f"tab {index}")
 
+    def test_lazy_content_only_renders_first_tab(self):
+        """Test that only the content of the selected lazy tab is rendered."""
+        first_content = mock.Mock()
+        second_content = mock.Mock()
+
+        tabs = st.tabs(["tab 1", "tab 2"], content=[first_content, second_content])
+
+        self.assertEqual(len(tabs), 2)
+        first_content.assert_called_once()
+        second_content.assert_not_called()
+        for tab_block in self.get_all_deltas_from_queue()[1:]:
+            self.assertTrue(tab_block.add_block.lazy)
+            self.assertNotEqual(tab_block.add_block.id, "")
+
+    def test_lazy_tabs_in_loop(self):
+        """Test that lazy tabs with the same labels and content functions can
+        be told apart with a key."""
+        for index in range(2):
+            st.tabs(["tab 1", "tab 2"], content=[mock.Mock()] * 2, key=index)
+
+        tab_ids = [
+            delta.add_block.id
+            for delta in self.get_all_deltas_from_queue()
+            if delta.add_block.HasField("tab")
+        ]
+        self.assertEqual(len(set(tab_ids)), 4)
+
+        with self.assertRaises(StreamlitDuplicateElementKey):
+            st.tabs(["tab 1"], content=[mock.Mock()], key=0)
+
+    def test_lazy_content_length_must_match(self):
+        """Test that one content function is required per tab."""
+        with self.assertRaises(StreamlitAPIException):
+            st.tabs(["tab 1", "tab 2"], content=[mock.Mock()])
+
 
 class DialogTest(DeltaGeneratorTestCase):
     """Run unit tests for the non-public delta-generator dialog and also the dialog
@@ -20,9 +20,11 @@ from unittest import mock
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.elements.deck_gl_json_chart import ARROW_LAYER_DATA_MIN_ROWS
 from streamlit.elements.map import _DEFAULT_MAP, _DEFAULT_ZOOM_LEVEL
 from streamlit.errors import StreamlitAPIException
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
@@ -75,6 +77,26 @@ class StMapTest(DeltaGeneratorTestCase):
             )
             self.assertEqual(len(c.get("layers")[0].get("data")), 4)
 
+    def test_large_data_uses_arrow(self):
+        """Test that large data is sent as Arrow instead of JSON records."""
+        df = pd.DataFrame(
+            {
+                "lat": np.linspace(37.7, 37.8, ARROW_LAYER_DATA_MIN_ROWS),
+                "lon": np.linspace(-122.5, -122.4, ARROW_LAYER_DATA_MIN_ROWS),
+                "foo": 0,
+            }
+        )
+        st.map(df)
+
+        el = self.get_delta_from_queue().new_element.deck_gl_json_chart
+        c = json.loads(el.json)
+        self.assertEqual(c.get("layers")[0].get("data"), "@@streamlit-arrow-data:0")
+
+        table = pa.ipc.open_stream(el.arrow_data["0"].data).read_all()
+        self.assertEqual(table.num_rows, ARROW_LAYER_DATA_MIN_ROWS)
+        # Unused columns are not transmitted:
+        self.assertEqual(table.column_names, ["lat", "lon"])
+
     def test_map_uses_convert_anything_to_df(self):
         """Test that st.map uses convert_anything_to_df to convert input data."""
         with mock.patch(
@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import base64
+import json
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import plotly.express as px
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.elements.plotly_chart import _encode_typed_arrays
 from streamlit.errors import StreamlitAPIException
 from streamlit.runtime.caching import cached_message_replay
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
@@ -276,3 +280,44 @@ class PyDeckTest(DeltaGeneratorTestCase):
             "has been deprecated and will be removed in a future release",
             el.alert.body,
         )
+
+
+class PlotlyTypedArrayTest(DeltaGeneratorTestCase):
+    def test_numpy_arrays_are_sent_as_typed_arrays(self):
+        """Test that NumPy arrays are sent as binary typed arrays."""
+        import plotly.graph_objs as go
+
+        y = np.linspace(0, 1, 100)
+        st.plotly_chart(go.Figure(go.Scatter(x=np.arange(100), y=y)))
+
+        spec = json.loads(self.get_delta_from_queue().new_element.plotly_chart.spec)
+        trace = spec["data"][0]
+        self.assertEqual(trace["y"]["dtype"], "f8")
+        np.testing.assert_array_equal(
+            np.frombuffer(base64.b64decode(trace["y"]["bdata"]), dtype="f8"), y
+        )
+        # int64 values are downcasted to the smallest supported type:
+        self.assertEqual(trace["x"]["dtype"], "i1")
+
+    def test_encode_typed_arrays(self):
+        fig_dict = {
+            "data": [
+                {
+                    "x": np.array([1, 2, 3], dtype="int64"),
+                    "z": np.ones((2, 3), dtype="float32"),
+                    "text": np.array(["a", "b", "c"]),
+                    "big": np.array([2**40], dtype="int64"),
+                    "geojson": {"coords": np.array([1.0, 2.0])},
+                }
+            ]
+        }
+        _encode_typed_arrays(fig_dict)
+        trace = fig_dict["data"][0]
+
+        self.assertEqual(trace["x"]["dtype"], "i1")
+        self.assertEqual(trace["z"]["dtype"], "f4")
+        self.assertEqual(trace["z"]["shape"], "2, 3")
+        # Unsupported arrays and skipped keys are kept as-is:
+        self.assertIsInstance(trace["text"], np.ndarray)
+        self.assertIsInstance(trace["big"], np.ndarray)
+        self.assertIsInstance(trace["geojson"]["coords"], np.ndarray)
@@ -16,6 +16,7 @@ import json
 from unittest import mock
 
 import pandas as pd
+import pyarrow as pa
 import pydeck as pdk
 
 import streamlit as st
@@ -226,3 +227,36 @@ class PyDeckTest(DeltaGeneratorTestCase):
             )
 
         self.assertTrue("Invalid selection mode: {'multi-object'}." in str(e.exception))
+
+    def test_large_layer_data_uses_arrow(self):
+        """Test that large layer data is sent as Arrow instead of JSON."""
+        num_rows = deck_gl_json_chart.ARROW_LAYER_DATA_MIN_ROWS
+        df = pd.DataFrame({"lat": range(num_rows), "lon": range(num_rows)})
+        layer = pdk.Layer("ScatterplotLayer", data=df)
+
+        st.pydeck_chart(pdk.Deck(layers=[layer]))
+
+        el = self.get_delta_from_queue().new_element
+        actual = json.loads(el.deck_gl_json_chart.json)
+        self.assertEqual(actual["layers"][0]["data"], "@@streamlit-arrow-data:0")
+
+        table = pa.ipc.open_stream(
+            el.deck_gl_json_chart.arrow_data["0"].data
+        ).read_all()
+        self.assertEqual(table.num_rows, num_rows)
+        self.assertEqual(table.column_names, ["lat", "lon"])
+
+        # The data of the pydeck object is not modified:
+        self.assertEqual(len(layer.data), num_rows)
+
+    def test_non_uniform_layer_data_stays_inline(self):
+        """Test that records with differing keys are not sent as Arrow."""
+        num_rows = deck_gl_json_chart.ARROW_LAYER_DATA_MIN_ROWS
+        data = [{"lat": 1, "lon": 10}] * (num_rows - 1) + [{"lat": 1}]
+
+        st.pydeck_chart(pdk.Deck(layers=[pdk.Layer("ScatterplotLayer", data=data)]))
+
+        el = self.get_delta_from_queue().new_element
+        actual = json.loads(el.deck_gl_json_chart.json)
+        self.assertEqual(actual["layers"][0]["data"], data)
+        self.assertEqual(len(el.deck_gl_json_chart.arrow_data), 0)
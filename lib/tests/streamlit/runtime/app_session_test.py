@@ -15,7 +15,9 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import gc
+import os
 import threading
 import unittest
 from asyncio import AbstractEventLoop
@@ -51,7 +53,9 @@ from streamlit.runtime.scriptrunner import (
     add_script_run_ctx,
     get_script_run_ctx,
 )
-from streamlit.runtime.state import SessionState
+from streamlit.runtime.session_manager import ActiveSessionInfo
+from streamlit.runtime.state import SessionState, SessionStateStatProvider
+from streamlit.runtime.stats import CacheStat
 from streamlit.runtime.uploaded_file_manager import (
     UploadedFileManager,
     UploadFileUrlInfo,
@@ -65,13 +69,29 @@ def del_path(monkeypatch):
     monkeypatch.setenv("PATH", "")
 
 
+def _run_in_executor_now(
+    executor: concurrent.futures.Executor | None, func: Callable[..., Any], *args: Any
+) -> concurrent.futures.Future[Any]:
+    """Run func immediately instead of in an executor."""
+    future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+    future.set_result(func(*args))
+    return future
+
+
+def _create_mock_event_loop() -> MagicMock:
+    """Create a mock event loop that runs executor jobs immediately."""
+    event_loop = MagicMock()
+    event_loop.run_in_executor.side_effect = _run_in_executor_now
+    return event_loop
+
+
 def _create_test_session(
     event_loop: AbstractEventLoop | None = None,
     session_id_override: str | None = None,
 ) -> AppSession:
     """Create an AppSession instance with some default mocked data."""
     if event_loop is None:
-        event_loop = MagicMock()
+        event_loop = _create_mock_event_loop()
 
     with patch(
         "streamlit.runtime.app_session.asyncio.get_running_loop",
@@ -584,6 +604,135 @@ class AppSessionTest(unittest.TestCase):
 
         assert len(gc.get_referrers(session)) == 0
 
+    def test_hibernate_and_rehydrate(self):
+        """Test that hibernate moves session_state values out of memory until the
+        session is used again.
+        """
+        session = _create_test_session()
+        session._session_state["foo"] = "bar"
+        lock = threading.Lock()
+        session._session_state["lock"] = lock
+
+        with patch.object(
+            Runtime._instance.media_file_mgr, "clear_session_refs"
+        ) as patched_clear_session_refs:
+            session.hibernate()
+
+        assert session.is_hibernated
+        # The session's media files are still displayed by its client.
+        patched_clear_session_refs.assert_not_called()
+        Runtime._instance.message_cache.remove_refs_for_session.assert_called_once_with(
+            session
+        )
+        assert "foo" not in session._session_state
+        # Values that can't be pickled are kept in memory.
+        assert session._session_state["lock"] is lock
+
+        # Heartbeats don't rehydrate the session.
+        session.handle_backmsg(BackMsg(app_heartbeat=True))
+        assert session.is_hibernated
+
+        assert session.session_state["foo"] == "bar"
+        assert not session.is_hibernated
+        assert session._hibernated_state_path is None
+
+    def test_hibernate_does_nothing_while_script_is_running(self):
+        session = _create_test_session()
+        session._session_state["foo"] = "bar"
+        session._state = AppSessionState.APP_IS_RUNNING
+
+        session.hibernate()
+
+        assert not session.is_hibernated
+        assert session._session_state["foo"] == "bar"
+
+    @patch_config_options({"server.sessionHibernationTimeout": 60})
+    def test_hibernates_after_timeout(self):
+        event_loop = _create_mock_event_loop()
+        session = _create_test_session(event_loop)
+
+        session._reset_hibernation_timer()
+        event_loop.call_later.assert_called_once_with(
+            60, session._on_hibernation_timeout
+        )
+
+        session._on_hibernation_timeout()
+        assert session.is_hibernated
+
+    @patch_config_options({"server.sessionHibernationTimeout": 60})
+    def test_session_state_access_restarts_hibernation_timer(self):
+        """Test that rehydrating a session by accessing its session_state
+        restarts the timer, so that the session is hibernated again.
+        """
+        event_loop = _create_mock_event_loop()
+        session = _create_test_session(event_loop)
+        session._session_state["foo"] = "bar"
+        session.hibernate()
+
+        assert session.session_state["foo"] == "bar"
+
+        event_loop.call_soon_threadsafe.assert_called_once_with(
+            session._reset_hibernation_timer
+        )
+
+    def test_rehydrate_while_hibernating(self):
+        """Test that a session that is rehydrated before its session_state
+        values were written to disk keeps them in memory.
+        """
+        event_loop = MagicMock()
+        write_future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        event_loop.run_in_executor.return_value = write_future
+        session = _create_test_session(event_loop)
+        session._session_state["foo"] = "bar"
+
+        session.hibernate()
+        assert session.is_hibernated
+        assert "foo" not in session._session_state
+
+        assert session.session_state["foo"] == "bar"
+        assert not session.is_hibernated
+
+        # Finishing the write afterwards discards the file.
+        _, func, *args = event_loop.run_in_executor.call_args.args
+        path, _ = func(*args)
+        assert os.path.exists(path)
+        write_future.set_result((path, ({}, {})))
+
+        assert not os.path.exists(path)
+        assert session._hibernated_state_path is None
+        assert session._session_state["foo"] == "bar"
+
+    def test_metrics_dont_rehydrate_hibernated_sessions(self):
+        session = _create_test_session()
+        session._session_state["foo"] = "bar"
+        session.hibernate()
+        session_mgr = MagicMock()
+        session_mgr.list_active_sessions.return_value = [
+            ActiveSessionInfo(MagicMock(), session)
+        ]
+
+        stats = SessionStateStatProvider(session_mgr).get_stats()
+
+        assert session.is_hibernated
+        assert stats == [
+            CacheStat(
+                "st_session_state",
+                "hibernated",
+                os.path.getsize(session._hibernated_state_path),
+            )
+        ]
+
+    def test_shutdown_discards_hibernated_state(self):
+        session = _create_test_session()
+        session._session_state["foo"] = "bar"
+        session.hibernate()
+        path = session._hibernated_state_path
+        assert os.path.exists(path)
+
+        session.shutdown()
+
+        assert not os.path.exists(path)
+
     @patch("streamlit.runtime.app_session.AppSession._enqueue_forward_msg")
     def test_handle_file_urls_request(self, mock_enqueue):
         session = _create_test_session()
@@ -277,6 +277,29 @@ If you think this is actually a Streamlit bug, please
         # So the call to foo() should return the new value 2
         assert example_instance.foo(1) == 2
 
+    def test_max_size(self):
+        """The least recently used entries are evicted when the total size of
+        the pickled entries exceeds max_size.
+        """
+        calls = []
+
+        @st.cache_data(max_size=1_800)
+        def foo(n):
+            calls.append(n)
+            return b"0" * n
+
+        foo(600)
+        foo(300)
+        foo(600)
+        self.assertEqual(calls, [600, 300])
+
+        # The pickled entries are about 170 bytes larger than their values,
+        # so this evicts the least recently used entry.
+        foo(500)
+        foo(600)
+        foo(300)
+        self.assertEqual(calls, [600, 300, 500, 300])
+
 
 class CacheDataPersistTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
@@ -300,9 +323,12 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         foo()
         mock_write.assert_not_called()
 
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.os.replace")
     @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
-    def test_persist_path(self, mock_write):
-        """Ensure we're writing to ~/.streamlit/cache/*.memo"""
+    def test_persist_path(self, mock_write, mock_replace):
+        """Ensure we're writing to ~/.streamlit/cache/*.memo, through a
+        temporary file that replaces it once it's complete.
+        """
 
         @st.cache_data(persist="disk")
         def foo():
@@ -310,12 +336,15 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
 
         foo()
         mock_write.assert_called_once()
+        mock_replace.assert_called_once()
 
         write_path = mock_write.call_args[0][0]
-        match = re.fullmatch(
-            r"/mock/home/folder/.streamlit/cache/.*?\.memo", write_path
-        )
+        temp_path, path = mock_replace.call_args[0]
+        self.assertEqual(write_path, temp_path)
+        match = re.fullmatch(r"/mock/home/folder/.streamlit/cache/.*?\.memo", path)
         self.assertIsNotNone(match)
+        self.assertTrue(temp_path.startswith(path))
+        self.assertTrue(temp_path.endswith(".tmp"))
 
     @patch("streamlit.file_util.os.stat", MagicMock())
     @patch(
@@ -478,6 +507,10 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         "streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write",
         MagicMock(),
     )
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage.os.replace",
+        MagicMock(),
+    )
     @patch(
         "streamlit.file_util.open",
         wraps=mock_open(read_data=pickle.dumps(1)),
@@ -501,6 +534,10 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         "streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write",
         MagicMock(),
     )
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage.os.replace",
+        MagicMock(),
+    )
     @patch(
         "streamlit.file_util.open",
         wraps=mock_open(read_data=pickle.dumps(1)),
@@ -514,26 +551,6 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         # Executes normally, without raising any errors
         foo(1)
 
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
-    def test_warning_memo_ttl_persist(self, _):
-        """Using @st.cache_data with ttl and persist produces a warning."""
-        with self.assertLogs(
-            "streamlit.runtime.caching.storage.local_disk_cache_storage",
-            level=logging.WARNING,
-        ) as logs:
-
-            @st.cache_data(ttl=60, persist="disk")
-            def user_function():
-                return 42
-
-            st.write(user_function())
-
-            output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'user_function' has a TTL that will be ignored.",
-                output,
-            )
-
     @parameterized.expand(
         [
             ("disk", "disk", True),
@@ -542,6 +559,10 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             ("False", False, False),
         ]
     )
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage.os.replace",
+        MagicMock(),
+    )
     @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
     def test_persist_param_value(
         self,
@@ -713,6 +734,127 @@ class CacheDataMessageReplayTest(DeltaGeneratorTestCase):
             replay_cached_messages_mock.assert_called()
 
 
+class _SynchronousExecutor:
+    """Runs submitted functions right away, in place of the background executor."""
+
+    def submit(self, fn):
+        fn()
+
+
+@patch(
+    "streamlit.runtime.caching.cache_utils._get_background_executor",
+    new=_SynchronousExecutor,
+)
+@patch("streamlit.runtime.caching.cache_utils.TTLCACHE_TIMER")
+class CacheDataStaleWhileRevalidateTest(DeltaGeneratorTestCase):
+    def setUp(self):
+        super().setUp()
+        st.cache_data.clear()
+
+    def tearDown(self):
+        st.cache_data.clear()
+        super().tearDown()
+
+    def test_stale_while_revalidate(self, timer_patch: Mock):
+        """Expired entries are returned while they're recomputed in the
+        background, until the stale_while_revalidate time passed.
+        """
+        calls = []
+
+        @st.cache_data(ttl=10, stale_while_revalidate=100)
+        def foo():
+            calls.append(timer_patch.return_value)
+            return len(calls)
+
+        timer_patch.return_value = 0
+        self.assertEqual(foo(), 1)
+
+        timer_patch.return_value = 5
+        self.assertEqual(foo(), 1)
+        self.assertEqual(len(calls), 1)
+
+        # The entry is stale: it's returned, and recomputed in the background.
+        timer_patch.return_value = 20
+        self.assertEqual(foo(), 1)
+        self.assertEqual(calls, [0, 20])
+        self.assertEqual(foo(), 2)
+
+        # The entry expired completely, so it's recomputed right away.
+        timer_patch.return_value = 200
+        self.assertEqual(foo(), 3)
+        self.assertEqual(calls, [0, 20, 200])
+
+    def test_stale_entry_with_elements_recomputed(self, timer_patch: Mock):
+        """Stale entries of functions that display elements are recomputed in
+        the script thread.
+        """
+        calls = []
+
+        @st.cache_data(ttl=10, stale_while_revalidate=100)
+        def foo():
+            calls.append(timer_patch.return_value)
+            st.text(len(calls))
+            return len(calls)
+
+        timer_patch.return_value = 0
+        self.assertEqual(foo(), 1)
+
+        timer_patch.return_value = 20
+        self.assertEqual(foo(), 2)
+        self.assertEqual(self.get_delta_from_queue().new_element.text.body, "2")
+        self.assertEqual(calls, [0, 20])
+
+    def test_failed_revalidation_keeps_stale_entry(self, timer_patch: Mock):
+        calls = []
+
+        @st.cache_data(ttl=10, stale_while_revalidate=100)
+        def foo():
+            calls.append(timer_patch.return_value)
+            if len(calls) > 1:
+                raise RuntimeError("failed")
+            return len(calls)
+
+        timer_patch.return_value = 0
+        self.assertEqual(foo(), 1)
+
+        timer_patch.return_value = 20
+        with self.assertLogs(
+            "streamlit.runtime.caching.cache_utils", level=logging.WARNING
+        ) as logs:
+            self.assertEqual(foo(), 1)
+        self.assertIn("Failed to compute a value of", "".join(logs.output))
+        self.assertEqual(foo(), 1)
+
+    def test_stale_while_revalidate_requires_ttl(self, _):
+        with self.assertRaises(StreamlitAPIException):
+
+            @st.cache_data(stale_while_revalidate=100)
+            def foo():
+                return 1
+
+    def test_prewarm(self, timer_patch: Mock):
+        """Prewarmed entries are computed when the function is decorated, once
+        per cache.
+        """
+        timer_patch.return_value = 0
+        calls = []
+
+        def foo(x):
+            calls.append(x)
+            return x
+
+        cached_foo = st.cache_data(prewarm=[(1,), (2,)])(foo)
+        self.assertEqual(calls, [1, 2])
+
+        self.assertEqual(cached_foo(1), 1)
+        self.assertEqual(cached_foo(2), 2)
+        self.assertEqual(calls, [1, 2])
+
+        cached_foo.clear(1)
+        st.cache_data(prewarm=[(1,), (2,)])(foo)
+        self.assertEqual(calls, [1, 2, 1])
+
+
 def get_byte_length(value):
     """Return the byte length of the pickled value."""
     return len(pickle.dumps(value))
@@ -21,6 +21,7 @@ import unittest
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
+import numpy as np
 from parameterized import parameterized
 
 import streamlit as st
@@ -29,10 +30,10 @@ from streamlit.runtime.caching import (
     cached_message_replay,
     get_resource_cache_stats_provider,
 )
+from streamlit.runtime.caching.cache_utils import CacheMemoryBudget
 from streamlit.runtime.caching.hashing import UserHashError
 from streamlit.runtime.scriptrunner import add_script_run_ctx
-from streamlit.runtime.stats import CacheStat
-from streamlit.vendor.pympler.asizeof import asizeof
+from streamlit.runtime.stats import CacheStat, estimate_size
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.element_mocks import (
     ELEMENT_PRODUCER,
@@ -42,7 +43,7 @@ from tests.streamlit.element_mocks import (
 from tests.streamlit.runtime.caching.common_cache_test import (
     as_cached_result as _as_cached_result,
 )
-from tests.testutil import create_mock_script_run_ctx
+from tests.testutil import create_mock_script_run_ctx, patch_config_options
 
 if TYPE_CHECKING:
     from streamlit.runtime.caching.cached_message_replay import CachedResult
@@ -299,6 +300,82 @@ class CacheResourceValidateTest(unittest.TestCase):
             validate.reset_mock()
 
 
+class CacheResourceMaxSizeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Caching functions rely on an active script run ctx
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+
+    def tearDown(self):
+        st.cache_resource.clear()
+
+    def test_max_size(self):
+        """The least recently used resources are evicted when their total
+        size exceeds max_size.
+        """
+        calls: list[int] = []
+
+        @st.cache_resource(max_size=1_000_000)
+        def f(n: int) -> np.ndarray:
+            calls.append(n)
+            return np.zeros(n, dtype=np.uint8)
+
+        f(400_000)
+        f(400_001)
+        f(400_000)
+        f(400_002)
+        self.assertEqual(calls, [400_000, 400_001, 400_002])
+
+        # The least recently used resource was evicted.
+        f(400_000)
+        f(400_001)
+        self.assertEqual(calls, [400_000, 400_001, 400_002, 400_001])
+
+    def test_resource_larger_than_max_size(self):
+        """Resources that are larger than max_size aren't cached."""
+        calls: list[int] = []
+
+        @st.cache_resource(max_size=1_000)
+        def f(n: int) -> np.ndarray:
+            calls.append(n)
+            return np.zeros(n, dtype=np.uint8)
+
+        f(2_000)
+        f(2_000)
+        self.assertEqual(calls, [2_000, 2_000])
+
+    @patch_config_options({"runner.cacheMaxSize": 1})
+    def test_memory_budget(self):
+        """Resources of the largest caches are evicted when all caches exceed
+        the cache memory budget.
+        """
+        calls: list[str] = []
+
+        @st.cache_resource
+        def large(n: int) -> np.ndarray:
+            calls.append("large")
+            return np.zeros(n, dtype=np.uint8)
+
+        @st.cache_resource
+        def small(n: int) -> np.ndarray:
+            calls.append("small")
+            return np.zeros(n, dtype=np.uint8)
+
+        with patch(
+            "streamlit.runtime.caching.cache_utils._cache_memory_budget",
+            CacheMemoryBudget(),
+        ):
+            large(400_000)
+            large(400_001)
+            small(300_000)
+            self.assertEqual(calls, ["large", "large", "small"])
+
+            large(400_001)
+            small(300_000)
+            self.assertEqual(calls, ["large", "large", "small"])
+            large(400_000)
+            self.assertEqual(calls, ["large", "large", "small", "large"])
+
+
 class CacheResourceStatsProviderTest(unittest.TestCase):
     def setUp(self):
         # Guard against external tests not properly cache-clearing
@@ -423,5 +500,5 @@ class CacheResourceMessageReplayTest(DeltaGeneratorTestCase):
 
 
 def get_byte_length(value: Any) -> int:
-    """Return the byte length of the pickled value."""
-    return asizeof(value)
+    """Return the estimated byte length of the value."""
+    return estimate_size(value)
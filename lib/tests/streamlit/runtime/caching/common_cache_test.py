@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import functools
 import threading
 import time
 import unittest
@@ -23,13 +24,16 @@ from datetime import timedelta
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
+from cachetools import LRUCache
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime
-from streamlit.runtime.caching import cache_data, cache_resource
+from streamlit.runtime.caching import cache_data, cache_resource, cache_utils
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
-from streamlit.runtime.caching.cache_utils import CachedResult
+from streamlit.runtime.caching.cache_utils import Cache, CachedResult
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
@@ -37,6 +41,12 @@ from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.fragment import MemoryFragmentStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.performance_metrics import (
+    cache_coalesced_calls,
+    cache_computation_waits,
+    cache_hits,
+    cache_misses,
+)
 from streamlit.runtime.scriptrunner import (
     ScriptRunContext,
     add_script_run_ctx,
@@ -102,6 +112,29 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(foo(), 42)
         self.assertEqual(foo(), 42)
 
+    @parameterized.expand(
+        [
+            ("cache_data", cache_data, "st_cache_data"),
+            ("cache_resource", cache_resource, "st_cache_resource"),
+        ]
+    )
+    def test_hit_and_miss_metrics(self, _, cache_decorator, metric_cache_type):
+        """Cache hits and misses are counted in the performance metrics."""
+
+        @cache_decorator
+        def foo(x):
+            return x
+
+        hits = cache_hits.get(cache_type=metric_cache_type)
+        misses = cache_misses.get(cache_type=metric_cache_type)
+
+        foo(1)
+        foo(1)
+        foo(2)
+
+        self.assertEqual(cache_hits.get(cache_type=metric_cache_type), hits + 1)
+        self.assertEqual(cache_misses.get(cache_type=metric_cache_type), misses + 2)
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
@@ -200,6 +233,88 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         foo(1, 2, 3, kwarg1=4, _kwarg2=5, kwarg3=None, _kwarg4=7)
         self.assertEqual([5], call_count)
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_function_info_computed_once(self, _, cache_decorator):
+        """A function's key and argument names are computed once, and reused
+        when the function is defined again, e.g. on a rerun.
+        """
+
+        call_count = [0]
+
+        def define_foo():
+            def foo(x):
+                call_count[0] += 1
+                return x
+
+            return foo
+
+        with patch.object(
+            cache_utils, "_function_keys", LRUCache(maxsize=8)
+        ), patch.object(
+            cache_utils, "_positional_arg_names", LRUCache(maxsize=8)
+        ), patch.object(
+            cache_utils.inspect, "getsource", wraps=cache_utils.inspect.getsource
+        ) as getsource, patch.object(
+            cache_utils.inspect, "signature", wraps=cache_utils.inspect.signature
+        ) as signature:
+            cache_decorator(define_foo())(1)
+            cache_decorator(define_foo())(1)
+
+        # The second definition shares the first one's cache.
+        self.assertEqual([1], call_count)
+        self.assertEqual(getsource.call_count, 1)
+        self.assertEqual(signature.call_count, 1)
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_function_info_invalidated_on_source_change(self, _, cache_decorator):
+        """A function whose source code changed gets a new cache."""
+        namespace1: dict[str, Any] = {"__name__": __name__}
+        exec("def foo(x):\n    return x", namespace1)
+        namespace2: dict[str, Any] = {"__name__": __name__}
+        exec("def foo(x):\n    return x + 1", namespace2)
+
+        self.assertEqual(cache_decorator(namespace1["foo"])(1), 1)
+        self.assertEqual(cache_decorator(namespace2["foo"])(1), 2)
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_wrapped_functions_arg_names(self, _, cache_decorator):
+        """The argument names of functions that share a wrapper's code are
+        those of the wrapped functions.
+        """
+        call_count = [0]
+
+        def count_calls(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                call_count[0] += 1
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @cache_decorator
+        @count_calls
+        def foo(arg):
+            pass
+
+        @cache_decorator
+        @count_calls
+        def bar(_arg):
+            pass
+
+        foo(1)
+        foo(2)
+        self.assertEqual([2], call_count)
+
+        bar(1)
+        bar(2)
+        self.assertEqual([3], call_count)
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
@@ -518,6 +633,61 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         img_fn_multi()
         img_fn_multi()
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_cached_st_image_replay_reuses_file(self, _, cache_decorator):
+        """Replaying an image reuses its media file, without hashing the image
+        data again, unless the file was deleted in the meantime.
+        """
+
+        @cache_decorator
+        def img_fn():
+            st.image(create_image(10))
+
+        img_fn()
+        url = self.get_delta_from_queue().new_element.imgs.imgs[0].url
+        media_file_mgr = Runtime._instance.media_file_mgr
+
+        with patch.object(
+            media_file_mgr._storage,
+            "load_and_get_id",
+            wraps=media_file_mgr._storage.load_and_get_id,
+        ) as load_and_get_id:
+            img_fn()
+            load_and_get_id.assert_not_called()
+
+            media_file_mgr.clear_session_refs()
+            media_file_mgr.remove_orphaned_files()
+            img_fn()
+            load_and_get_id.assert_called_once()
+
+        self.assertEqual(url, self.get_delta_from_queue().new_element.imgs.imgs[0].url)
+        self.assertEqual(1, len(media_file_mgr._file_metadata))
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_replayed_element_hash(self, _, cache_decorator):
+        """Replayed elements' messages are hashed from their recorded element
+        hash, consistently, without serializing them.
+        """
+
+        @cache_decorator
+        def foo():
+            st.text("hello")
+
+        foo()
+        self.assertEqual("", self.get_message_from_queue().hash)
+
+        foo()
+        replayed_hash = self.get_message_from_queue().hash
+        self.assertNotEqual("", replayed_hash)
+
+        with patch.object(ForwardMsg, "SerializeToString", side_effect=AssertionError):
+            foo()
+        self.assertEqual(replayed_hash, self.get_message_from_queue().hash)
+
     @parameterized.expand(
         [
             ("cache_data", cache_data, cache_data.clear),
@@ -909,6 +1079,144 @@ class CommonCacheThreadingTest(unittest.TestCase):
         # Sanity check: ensure we can still call our cached function.
         self.assertEqual(42, foo())
 
+    @parameterized.expand(
+        [
+            ("cache_data", cache_data, "st_cache_data", False),
+            ("cache_resource", cache_resource, "st_cache_resource", True),
+        ]
+    )
+    def test_concurrent_misses_share_result(
+        self, _, cache_decorator, cache_type, shares_value
+    ):
+        """Callers that wait for a value to be computed receive its result,
+        as their own copy for st.cache_data.
+        """
+        coalesced_calls = cache_coalesced_calls.get(cache_type=cache_type)
+        # Set once all callers but the one computing the value joined its
+        # computation, so that none of them gets an ordinary cache hit.
+        all_joined = threading.Event()
+        num_joined = [0]
+        lock = threading.Lock()
+        join_computation = Cache.join_computation
+
+        def counting_join_computation(cache, value_key):
+            computation, must_compute = join_computation(cache, value_key)
+            if not must_compute:
+                with lock:
+                    num_joined[0] += 1
+                    if num_joined[0] == self.NUM_THREADS - 1:
+                        all_joined.set()
+            return computation, must_compute
+
+        @cache_decorator
+        def foo():
+            self.assertTrue(all_joined.wait(timeout=5))
+            return [42]
+
+        results = [None] * self.NUM_THREADS
+
+        def call_foo(i: int) -> None:
+            results[i] = foo()
+
+        with patch.object(
+            Cache,
+            "join_computation",
+            autospec=True,
+            side_effect=counting_join_computation,
+        ):
+            call_on_threads(call_foo, num_threads=self.NUM_THREADS, timeout=10)
+
+        self.assertEqual([[42]] * self.NUM_THREADS, results)
+        self.assertEqual(shares_value, all(result is results[0] for result in results))
+        self.assertEqual(
+            self.NUM_THREADS - 1,
+            cache_coalesced_calls.get(cache_type=cache_type) - coalesced_calls,
+        )
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_waiters_compute_value_if_computation_fails(self, _, cache_decorator):
+        """If computing a value fails, a caller that waited for it computes it."""
+        call_count = [0]
+
+        @cache_decorator
+        def foo():
+            call_count[0] += 1
+            time.sleep(0.1)
+            if call_count[0] == 1:
+                raise RuntimeError("failed")
+            return 42
+
+        results = [None] * 2
+
+        def call_foo(i: int) -> None:
+            time.sleep(0.05 * i)
+            try:
+                results[i] = foo()
+            except RuntimeError:
+                results[i] = "failed"
+
+        call_on_threads(call_foo, num_threads=2)
+
+        self.assertEqual(["failed", 42], results)
+        self.assertEqual(2, call_count[0])
+
+    @parameterized.expand(
+        [
+            ("cache_data", cache_data, "st_cache_data"),
+            ("cache_resource", cache_resource, "st_cache_resource"),
+        ]
+    )
+    def test_max_concurrency(self, _, cache_decorator, cache_type):
+        """At most max_concurrency values of a function are computed at once."""
+        computation_waits = cache_computation_waits.get(cache_type=cache_type)
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        @cache_decorator(max_concurrency=2)
+        def foo(i):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+            return i
+
+        def call_foo(i: int) -> None:
+            self.assertEqual(i, foo(i))
+
+        call_on_threads(call_foo, num_threads=8)
+
+        self.assertEqual(2, max_running[0])
+        self.assertGreater(
+            cache_computation_waits.get(cache_type=cache_type), computation_waits
+        )
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_max_concurrency_recursive_call(self, _, cache_decorator):
+        """A function that calls itself doesn't wait for its own slot."""
+
+        @cache_decorator(max_concurrency=1)
+        def factorial(n):
+            return 1 if n <= 1 else n * factorial(n - 1)
+
+        self.assertEqual(120, factorial(5))
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_invalid_max_concurrency(self, _, cache_decorator):
+        with self.assertRaises(StreamlitAPIException):
+
+            @cache_decorator(max_concurrency=0)
+            def foo():
+                return 42
+
 
 def test_arrow_replay():
     """Regression test for https://github.com/streamlit/streamlit/issues/6103"""
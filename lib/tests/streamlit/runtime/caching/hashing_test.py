@@ -29,7 +29,7 @@ import uuid
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO, StringIO
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pandas as pd
@@ -44,11 +44,14 @@ from streamlit.runtime.caching.hashing import (
     _NP_SIZE_LARGE,
     _PANDAS_ROWS_LARGE,
     UserHashError,
+    _CacheFuncHasher,
+    _get_sample_positions,
     update_hash,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from streamlit.type_util import is_type
 from streamlit.util import HASHLIB_KWARGS
+from tests.testutil import create_mock_script_run_ctx, patch_config_options
 
 get_main_script_director = MagicMock(return_value=os.getcwd())
 
@@ -521,6 +524,160 @@ class HashTest(unittest.TestCase):
         self.assertNotEqual(get_hash(enum_a), get_hash(enum_b))
 
 
+class LargeDataHashTest(unittest.TestCase):
+    """Tests for hashing large dataframes and arrays."""
+
+    def setUp(self):
+        self.ctx = create_mock_script_run_ctx()
+        patcher = patch(
+            "streamlit.runtime.caching.hashing.get_script_run_ctx",
+            return_value=self.ctx,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _count_hashes(self, value) -> int:
+        """Hash value, and return how often a dataframe or series was hashed.
+
+        Hashing a dataframe also hashes two series: the hashes of its dtypes
+        and of its values.
+        """
+        with patch.object(
+            _CacheFuncHasher,
+            "_dataframe_to_bytes",
+            autospec=True,
+            side_effect=_CacheFuncHasher._dataframe_to_bytes,
+        ) as dataframe_to_bytes, patch.object(
+            _CacheFuncHasher,
+            "_series_to_bytes",
+            autospec=True,
+            side_effect=_CacheFuncHasher._series_to_bytes,
+        ) as series_to_bytes:
+            get_hash(value)
+        return dataframe_to_bytes.call_count + series_to_bytes.call_count
+
+    def test_large_dataframe_hash_not_memoized(self):
+        """Dataframes can be modified in place, so they're hashed on every
+        call."""
+        df = pd.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 2)), columns=["A", "B"])
+
+        self.assertEqual(self._count_hashes(df), 3)
+        self.assertEqual(self._count_hashes(df), 3)
+        self.assertEqual(self._count_hashes(df["A"]), 1)
+        self.assertEqual(self._count_hashes(df["A"]), 1)
+
+    def test_sampled_hash_unchanged(self):
+        """The memoized sample positions are the ones that DataFrame.sample
+        and RandomState.choice pick."""
+        df = pd.DataFrame(
+            np.random.default_rng(0).random((_PANDAS_ROWS_LARGE, 2)), columns=["A", "B"]
+        )
+        arr = np.random.default_rng(0).random(_NP_SIZE_LARGE)
+
+        pd.testing.assert_frame_equal(
+            df.take(_get_sample_positions(len(df), 10000, False)),
+            df.sample(n=10000, random_state=0),
+        )
+        np.testing.assert_array_equal(
+            arr[_get_sample_positions(arr.size, 100000, True)],
+            np.random.RandomState(0).choice(arr.flat, size=100000),
+        )
+
+    @parameterized.expand(
+        [
+            ("set_column", lambda df: df.__setitem__("A", np.ones(len(df)))),
+            ("add_column", lambda df: df.__setitem__("C", 1.0)),
+            ("rename_columns", lambda df: df.rename(columns={"A": "Z"}, inplace=True)),
+            ("set_index", lambda df: setattr(df, "index", df.index + 1)),
+            ("change_dtype", lambda df: df.__setitem__("A", df["A"].astype(int))),
+        ]
+    )
+    def test_memoized_hash_invalidated(self, _, modify):
+        """Modifications that replace the data of a dataframe change its
+        hash within the same script run.
+        """
+        df = pd.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 2)), columns=["A", "B"])
+        hash1 = get_hash(df)
+
+        modify(df)
+
+        self.assertNotEqual(get_hash(df), hash1)
+
+    @parameterized.expand(
+        [
+            ("dataframe_loc", lambda df: df.loc.__setitem__((slice(None), "A"), 1.0)),
+            ("dataframe_iloc", lambda df: df.iloc.__setitem__((slice(None), 0), 1.0)),
+            ("numpy_multiply", lambda arr: arr.__imul__(2)),
+        ]
+    )
+    def test_hash_changes_after_in_place_modification(self, name, modify):
+        """Values that are modified in place change the hash within the same
+        script run.
+        """
+        if name.startswith("dataframe"):
+            obj = pd.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 2)), columns=["A", "B"])
+        else:
+            obj = np.ones(2 * _NP_SIZE_LARGE)
+        hash1 = get_hash(obj)
+
+        modify(obj)
+
+        self.assertNotEqual(get_hash(obj), hash1)
+
+    def test_immutable_numpy_hash_memoized(self):
+        """Arrays whose data can't be modified are only hashed once per
+        script run."""
+        arr = np.frombuffer(bytes(8 * _NP_SIZE_LARGE))
+        self.assertFalse(arr.flags.writeable)
+        hash1 = get_hash(arr)
+
+        with patch.object(
+            _CacheFuncHasher, "_ndarray_to_bytes", autospec=True
+        ) as ndarray_to_bytes:
+            self.assertEqual(get_hash(arr), hash1)
+        ndarray_to_bytes.assert_not_called()
+
+        arr.shape = (2, _NP_SIZE_LARGE // 2)
+        self.assertNotEqual(get_hash(arr), hash1)
+
+        self.ctx.reset()
+        self.assertEqual(self.ctx.data_hashes_this_run, {})
+
+    def test_read_only_view_of_writeable_numpy_not_memoized(self):
+        base = np.zeros(_NP_SIZE_LARGE)
+        view = base.view()
+        view.flags.writeable = False
+        hash1 = get_hash(view)
+
+        base *= 2
+        base += 1
+
+        self.assertNotEqual(get_hash(view), hash1)
+
+    def test_hash_full_data(self):
+        """Changes outside of the hashed sample of a large dataframe are only
+        detected when hashing the full data.
+        """
+        df1 = pd.DataFrame(np.zeros((_PANDAS_ROWS_LARGE, 2)), columns=["A", "B"])
+        df2 = df1.copy()
+        unsampled_rows = df1.index.difference(df1.sample(n=10000, random_state=0).index)
+        df2.loc[unsampled_rows[0], "A"] = 1.0
+
+        self.assertEqual(get_hash(df1), get_hash(df2))
+        with patch_config_options({"runner.cacheHashFullData": True}):
+            self.assertNotEqual(get_hash(df1), get_hash(df2))
+
+    def test_hash_full_data_numpy(self):
+        arr1 = np.zeros(_NP_SIZE_LARGE)
+        arr2 = arr1.copy()
+        sample = np.random.RandomState(0).choice(np.arange(_NP_SIZE_LARGE), 100000)
+        arr2[np.setdiff1d(np.arange(_NP_SIZE_LARGE), sample)[0]] = 1.0
+
+        self.assertEqual(get_hash(arr1), get_hash(arr2))
+        with patch_config_options({"runner.cacheHashFullData": True}):
+            self.assertNotEqual(get_hash(arr1), get_hash(arr2))
+
+
 class NotHashableTest(unittest.TestCase):
     """Tests for various unhashable types."""
 
@@ -21,6 +21,7 @@ from unittest.mock import patch
 
 from testfixtures import TempDirectory
 
+from streamlit.runtime.caching.cache_utils import CacheMemoryBudget
 from streamlit.runtime.caching.storage import (
     CacheStorageContext,
     CacheStorageKeyNotFoundError,
@@ -32,6 +33,8 @@ from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
 )
+from streamlit.runtime.performance_metrics import cache_evictions
+from tests.testutil import patch_config_options
 
 
 class InMemoryCacheStorageWrapperTest(unittest.TestCase):
@@ -179,3 +182,73 @@ class InMemoryCacheStorageWrapperTest(unittest.TestCase):
         ) as mock_persist_close:
             wrapped_storage.close()
             mock_persist_close.assert_called_once()
+
+    def test_in_memory_cache_storage_wrapper_max_size(self):
+        """
+        Test that the least recently used entries are evicted from the in-memory
+        cache when their total size exceeds max_size
+        """
+        context = CacheStorageContext(
+            function_key="func-key",
+            function_display_name="func-display-name",
+            max_size=10,
+        )
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=DummyCacheStorage(), context=context
+        )
+        evictions = cache_evictions.get(
+            cache_type="st_cache_data", cache="func-display-name"
+        )
+
+        wrapped_storage.set("key-1", b"1234")
+        wrapped_storage.set("key-2", b"1234")
+        wrapped_storage.get("key-1")
+        wrapped_storage.set("key-3", b"1234")
+
+        self.assertEqual(wrapped_storage.get("key-1"), b"1234")
+        self.assertEqual(wrapped_storage.get("key-3"), b"1234")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            wrapped_storage.get("key-2")
+        self.assertEqual(wrapped_storage.memory_size, 8)
+
+        # Values that are larger than max_size aren't kept in memory.
+        wrapped_storage.set("key-4", b"12345678901")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            wrapped_storage.get("key-4")
+
+        self.assertEqual(
+            cache_evictions.get(cache_type="st_cache_data", cache="func-display-name"),
+            evictions + 2,
+        )
+
+    @patch_config_options({"runner.cacheMaxSize": 1})
+    def test_in_memory_cache_storage_wrapper_memory_budget(self):
+        """
+        Test that entries of the largest caches are evicted when all caches
+        together exceed the cache memory budget
+        """
+        with patch(
+            "streamlit.runtime.caching.cache_utils._cache_memory_budget",
+            CacheMemoryBudget(),
+        ):
+            large_storage = InMemoryCacheStorageWrapper(
+                persist_storage=DummyCacheStorage(),
+                context=CacheStorageContext(
+                    function_key="large", function_display_name="large"
+                ),
+            )
+            small_storage = InMemoryCacheStorageWrapper(
+                persist_storage=DummyCacheStorage(),
+                context=CacheStorageContext(
+                    function_key="small", function_display_name="small"
+                ),
+            )
+
+            large_storage.set("key-1", b"0" * 400_000)
+            large_storage.set("key-2", b"0" * 400_000)
+            small_storage.set("key-1", b"0" * 300_000)
+
+            with self.assertRaises(CacheStorageKeyNotFoundError):
+                large_storage.get("key-1")
+            self.assertEqual(large_storage.get("key-2"), b"0" * 400_000)
+            self.assertEqual(small_storage.get("key-1"), b"0" * 300_000)
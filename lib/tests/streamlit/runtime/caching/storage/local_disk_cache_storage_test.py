@@ -20,6 +20,7 @@ import logging
 import math
 import os.path
 import shutil
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -39,6 +40,7 @@ from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
     LocalDiskCacheStorageManager,
 )
+from tests.testutil import patch_config_options
 
 
 class LocalDiskCacheStorageManagerTest(unittest.TestCase):
@@ -93,8 +95,9 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
         self.assertEqual(storage.max_entries, math.inf)
 
     def test_check_context_with_persist_and_ttl(self):
-        """Tests that LocalDiskCacheStorageManager.check_context() writes a warning
-        in logs when persist="disk" and ttl_seconds is not None
+        """Tests that LocalDiskCacheStorageManager.check_context() doesn't write
+        a warning in logs when persist="disk" and ttl_seconds is not None, since
+        the TTL is supported.
         """
         context = CacheStorageContext(
             function_key="func-key",
@@ -111,12 +114,14 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
             manager = LocalDiskCacheStorageManager()
             manager.check_context(context)
 
+            # assertLogs is being used as a context manager, but it also checks
+            # that some log output was captured, so we have to let it capture something
+            get_logger(
+                "streamlit.runtime.caching.storage.local_disk_cache_storage"
+            ).warning("irrelevant warning so assertLogs passes")
+
             output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'func-display-name' has a TTL that will be "
-                "ignored. Persistent cached functions currently don't support TTL.",
-                output,
-            )
+            self.assertNotIn("has a TTL that will be ignored", output)
 
     def test_check_context_without_persist(self):
         """Tests that LocalDiskCacheStorageManager.check_context() does not
@@ -275,3 +280,110 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
     def test_storage_close(self):
         """Test that storage.close() does not raise any exception."""
         self.storage.close()
+
+    def test_storage_set_leaves_no_temp_files(self):
+        """Test that storage.set() writes through a temporary file that
+        replaces the cache file once it's complete."""
+        with patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.os.replace",
+            wraps=os.replace,
+        ) as mock_replace:
+            self.storage.set("new-key", b"new-value")
+
+        temp_path, path = mock_replace.call_args[0]
+        self.assertEqual(path, self.tempdir.path + "/func-key-new-key.memo")
+        self.assertTrue(temp_path.endswith(".tmp"))
+        self.assertEqual(os.listdir(self.tempdir.path), ["func-key-new-key.memo"])
+
+    def test_storage_get_expired(self):
+        """Test that storage.get() deletes entries that are older than the TTL."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+        storage.set("new-key", b"new-value")
+        self.assertEqual(storage.get("new-key"), b"new-value")
+
+        path = self.tempdir.path + "/func-key-new-key.memo"
+        written_time = time.time() - 61
+        os.utime(path, (written_time, written_time))
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("new-key")
+        self.assertFalse(os.path.exists(path))
+
+    def test_storage_max_entries(self):
+        """Test that storage.set() deletes the least recently used entries when
+        there are more than max_entries."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                max_entries=2,
+            )
+        )
+        storage.set("key-1", b"value-1")
+        os.utime(self.tempdir.path + "/func-key-key-1.memo", (1000, 1000))
+        storage.set("key-2", b"value-2")
+        os.utime(self.tempdir.path + "/func-key-key-2.memo", (2000, 2000))
+
+        # Reading key-1 makes key-2 the least recently used entry.
+        self.assertEqual(storage.get("key-1"), b"value-1")
+        storage.set("key-3", b"value-3")
+
+        self.assertEqual(storage.get("key-1"), b"value-1")
+        self.assertEqual(storage.get("key-3"), b"value-3")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("key-2")
+
+    @patch_config_options({"runner.cacheMaxDiskSize": 1})
+    def test_storage_max_disk_size(self):
+        """Test that storage.set() deletes the least recently used entries of
+        all storages when their total size exceeds runner.cacheMaxDiskSize."""
+        other_storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+                persist="disk",
+            )
+        )
+        other_storage.set("key-1", b"0" * 600_000)
+        os.utime(self.tempdir.path + "/other-func-key-key-1.memo", (1000, 1000))
+        self.storage.set("key-1", b"0" * 600_000)
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            other_storage.get("key-1")
+        self.assertEqual(self.storage.get("key-1"), b"0" * 600_000)
+
+    @patch_config_options({"runner.cacheDiskCompression": "zlib"})
+    def test_storage_compression(self):
+        """Test that values are compressed on disk, and that compressed values
+        can be read regardless of the configured compression."""
+        storage = LocalDiskCacheStorage(self.context)
+        storage.set("new-key", b"0" * 10_000)
+
+        self.assertLess(
+            os.path.getsize(self.tempdir.path + "/func-key-new-key.memo"), 1_000
+        )
+        self.assertEqual(storage.get("new-key"), b"0" * 10_000)
+        self.assertEqual(self.storage.get("new-key"), b"0" * 10_000)
+
+    @patch_config_options({"runner.cacheDiskCompression": "zstd"})
+    def test_storage_compression_not_installed(self):
+        """Test that values are stored uncompressed if the package that
+        implements the compression isn't installed."""
+        with patch.dict("sys.modules", {"zstandard": None}), self.assertLogs(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage",
+            level=logging.WARNING,
+        ) as logs:
+            storage = LocalDiskCacheStorage(self.context)
+
+        self.assertIn("isn't installed", "".join(logs.output))
+        storage.set("new-key", b"new-value")
+        with open(self.tempdir.path + "/func-key-new-key.memo", "rb") as f:
+            self.assertEqual(f.read(), b"new-value")
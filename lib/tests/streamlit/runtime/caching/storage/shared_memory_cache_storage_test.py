@@ -0,0 +1,289 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for SharedMemoryCacheStorage and SharedMemoryCacheStorageManager"""
+
+from __future__ import annotations
+
+import math
+import os
+import stat
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from testfixtures import TempDirectory
+
+from streamlit.runtime.caching.storage import (
+    CacheStorageContext,
+    CacheStorageKeyNotFoundError,
+)
+from streamlit.runtime.caching.storage.local_disk_cache_storage import (
+    LocalDiskCacheStorage,
+)
+from streamlit.runtime.caching.storage.shared_memory_cache_storage import (
+    SharedMemoryCacheStorage,
+    SharedMemoryCacheStorageManager,
+    get_shared_cache_folder_path,
+)
+from streamlit.web.cache_storage_manager_config import (
+    create_default_cache_storage_manager,
+)
+from tests.testutil import patch_config_options
+
+
+def _create_context(**kwargs) -> CacheStorageContext:
+    return CacheStorageContext(
+        function_key="func-key", function_display_name="func-display-name", **kwargs
+    )
+
+
+class SharedMemoryCacheStorageTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.shared_dir = TempDirectory(create=True)
+        self.disk_dir = TempDirectory(create=True)
+        self.patches = [
+            patch(
+                "streamlit.runtime.caching.storage.shared_memory_cache_storage.get_shared_cache_folder_path",
+                return_value=self.shared_dir.path,
+            ),
+            patch(
+                "streamlit.runtime.caching.storage.local_disk_cache_storage.get_cache_folder_path",
+                return_value=self.disk_dir.path,
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        for p in self.patches:
+            p.stop()
+        self.shared_dir.cleanup()
+        self.disk_dir.cleanup()
+
+    def _create_storage(self, **kwargs) -> SharedMemoryCacheStorage:
+        return SharedMemoryCacheStorageManager().create(_create_context(**kwargs))
+
+    def _shared_path(self, key: str, function_key: str = "func-key") -> str:
+        return os.path.join(self.shared_dir.path, f"{function_key}-{key}.memo")
+
+
+class SharedMemoryCacheStorageManagerTest(SharedMemoryCacheStorageTestCase):
+    def test_create(self):
+        """Tests that SharedMemoryCacheStorageManager.create() returns a
+        SharedMemoryCacheStorage with correct parameters from context.
+        """
+        storage = self._create_storage(ttl_seconds=60, max_entries=100)
+        self.assertIsInstance(storage, SharedMemoryCacheStorage)
+        self.assertEqual(storage.ttl_seconds, 60)
+        self.assertEqual(storage.max_entries, 100)
+        self.assertEqual(storage.max_size, math.inf)
+
+    def test_clear_all(self):
+        """Tests that SharedMemoryCacheStorageManager.clear_all() removes the
+        shared entries and the persisted entries.
+        """
+        self._create_storage(persist="disk").set("key", b"value")
+
+        SharedMemoryCacheStorageManager().clear_all()
+
+        self.assertEqual(os.listdir(self.shared_dir.path), [])
+        self.assertFalse(os.path.exists(self.disk_dir.path))
+
+    def test_selected_by_config(self):
+        """Tests that runner.cacheStorage selects the cache storage manager."""
+        self.assertNotIsInstance(
+            create_default_cache_storage_manager(), SharedMemoryCacheStorageManager
+        )
+        with patch_config_options({"runner.cacheStorage": "shared_memory"}):
+            self.assertIsInstance(
+                create_default_cache_storage_manager(),
+                SharedMemoryCacheStorageManager,
+            )
+
+
+@unittest.skipIf(not hasattr(os, "getuid"), "Windows has no user IDs")
+class SharedMemoryCacheDirTest(SharedMemoryCacheStorageTestCase):
+    def test_folder_path_is_per_user(self):
+        self.patches[0].stop()
+        try:
+            path = get_shared_cache_folder_path()
+        finally:
+            self.patches[0].start()
+        self.assertEqual(os.path.basename(path), f"streamlit-cache-{os.getuid()}")
+
+    def test_refuses_dir_that_others_can_access(self):
+        """Test that entries planted in a directory that other users can
+        write to aren't read, and that no entries are written to it."""
+        os.chmod(self.shared_dir.path, 0o777)
+        self.shared_dir.write("func-key-some-key.memo", b"planted")
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self._create_storage().get("some-key")
+        self._create_storage().set("other-key", b"some-value")
+
+        self.assertEqual(os.listdir(self.shared_dir.path), ["func-key-some-key.memo"])
+
+    def test_refuses_dir_owned_by_another_user(self):
+        self.shared_dir.write("func-key-some-key.memo", b"planted")
+
+        with patch(
+            "streamlit.runtime.caching.storage.shared_memory_cache_storage.os.getuid",
+            return_value=os.getuid() + 1,
+        ), self.assertRaises(CacheStorageKeyNotFoundError):
+            self._create_storage().get("some-key")
+
+    def test_creates_private_dir(self):
+        path = os.path.join(self.shared_dir.path, "cache")
+        with patch(
+            "streamlit.runtime.caching.storage.shared_memory_cache_storage.get_shared_cache_folder_path",
+            return_value=path,
+        ):
+            self._create_storage().set("some-key", b"some-value")
+
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o700)
+
+
+class SharedMemoryCacheStorageTest(SharedMemoryCacheStorageTestCase):
+    def test_get_not_found(self):
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self._create_storage().get("some-key")
+
+    def test_set_shared_between_storages(self):
+        """Test that an entry set by one storage, e.g. in another server
+        process, can be read by another storage of the same function."""
+        self._create_storage().set("some-key", b"some-value")
+
+        self.assertEqual(self._create_storage().get("some-key"), b"some-value")
+        self.assertEqual(os.listdir(self.shared_dir.path), ["func-key-some-key.memo"])
+
+    def test_get_empty_value(self):
+        storage = self._create_storage()
+        storage.set("some-key", b"")
+        self.assertEqual(storage.get("some-key"), b"")
+
+    def test_delete(self):
+        storage = self._create_storage()
+        storage.set("some-key", b"some-value")
+        storage.delete("some-key")
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+
+    def test_clear(self):
+        """Test that storage.clear() only deletes the entries of its function."""
+        storage = self._create_storage()
+        storage.set("some-key", b"some-value")
+        other_storage = SharedMemoryCacheStorageManager().create(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+            )
+        )
+        other_storage.set("some-key", b"other-value")
+
+        storage.clear()
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+        self.assertEqual(other_storage.get("some-key"), b"other-value")
+
+    def test_get_expired(self):
+        """Test that storage.get() deletes entries that are older than the TTL."""
+        storage = self._create_storage(ttl_seconds=60)
+        storage.set("some-key", b"some-value")
+        written_time = time.time() - 61
+        os.utime(self._shared_path("some-key"), (written_time, written_time))
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+        self.assertFalse(os.path.exists(self._shared_path("some-key")))
+
+    def test_max_entries(self):
+        """Test that storage.set() deletes the least recently used entries when
+        there are more than max_entries."""
+        storage = self._create_storage(max_entries=2)
+        storage.set("key-1", b"value-1")
+        os.utime(self._shared_path("key-1"), (1000, 1000))
+        storage.set("key-2", b"value-2")
+        os.utime(self._shared_path("key-2"), (2000, 2000))
+
+        # Reading key-1 makes key-2 the least recently used entry.
+        self.assertEqual(storage.get("key-1"), b"value-1")
+        storage.set("key-3", b"value-3")
+
+        self.assertEqual(
+            sorted(os.listdir(self.shared_dir.path)),
+            ["func-key-key-1.memo", "func-key-key-3.memo"],
+        )
+
+    def test_max_size(self):
+        """Test that storage.set() deletes the least recently used entries when
+        they're larger than max_size."""
+        storage = self._create_storage(max_size=10)
+        storage.set("key-1", b"0" * 6)
+        os.utime(self._shared_path("key-1"), (1000, 1000))
+        storage.set("key-2", b"0" * 6)
+
+        self.assertEqual(os.listdir(self.shared_dir.path), ["func-key-key-2.memo"])
+
+    @patch_config_options({"runner.cacheMaxSharedMemorySize": 1})
+    def test_max_shared_memory_size(self):
+        """Test that storage.set() deletes the least recently used entries of
+        all functions when they're larger than runner.cacheMaxSharedMemorySize."""
+        other_storage = SharedMemoryCacheStorageManager().create(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+            )
+        )
+        other_storage.set("key-1", b"0" * 600_000)
+        os.utime(self._shared_path("key-1", "other-func-key"), (1000, 1000))
+        self._create_storage().set("key-1", b"0" * 600_000)
+
+        self.assertEqual(os.listdir(self.shared_dir.path), ["func-key-key-1.memo"])
+
+    def test_persist(self):
+        """Test that entries are also persisted to disk with persist="disk", and
+        read from disk when they aren't in shared memory."""
+        storage = self._create_storage(persist="disk")
+        storage.set("some-key", b"some-value")
+        self.assertEqual(os.listdir(self.disk_dir.path), ["func-key-some-key.memo"])
+
+        os.remove(self._shared_path("some-key"))
+
+        self.assertEqual(storage.get("some-key"), b"some-value")
+        self.assertTrue(os.path.exists(self._shared_path("some-key")))
+
+    def test_not_persisted_without_persist(self):
+        storage = self._create_storage()
+        storage.set("some-key", b"some-value")
+
+        self.assertEqual(os.listdir(self.disk_dir.path), [])
+
+    def test_write_error(self):
+        """Test that the entry is still persisted if it can't be written to
+        shared memory, e.g. because it's full."""
+        persist_storage = MagicMock(spec=LocalDiskCacheStorage)
+        storage = SharedMemoryCacheStorage(
+            persist_storage=persist_storage, context=_create_context()
+        )
+
+        with patch("builtins.open", side_effect=OSError("No space left on device")):
+            storage.set("some-key", b"some-value")
+
+        persist_storage.set.assert_called_once_with("some-key", b"some-value")
+        self.assertEqual(os.listdir(self.shared_dir.path), [])
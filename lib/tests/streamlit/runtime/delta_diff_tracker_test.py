@@ -0,0 +1,197 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DeltaDiffTracker."""
+
+from __future__ import annotations
+
+import unittest
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.delta_diff_tracker import (
+    DeltaDiffTracker,
+    create_unchanged_delta_msg,
+)
+from tests.streamlit.message_mocks import create_script_finished_message
+
+
+def _create_new_session_msg(page_script_hash: str = "page") -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.new_session.main_script_path = "app.py"
+    msg.new_session.page_script_hash = page_script_hash
+    return msg
+
+
+def _create_text_msg(
+    path: list[int], body: str = "text", fragment_id: str = ""
+) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = path
+    msg.delta.new_element.markdown.body = body
+    msg.delta.fragment_id = fragment_id
+    return msg
+
+
+def _create_block_msg(path: list[int], label: str = "block") -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = path
+    msg.delta.add_block.expandable.label = label
+    return msg
+
+
+class DeltaDiffTrackerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tracker = DeltaDiffTracker()
+
+    def _run_script(
+        self,
+        msgs: list[ForwardMsg],
+        status: ForwardMsg.ScriptFinishedStatus.ValueType = (
+            ForwardMsg.FINISHED_SUCCESSFULLY
+        ),
+        page_script_hash: str = "page",
+    ) -> list[bool]:
+        """Track the messages of a script run and return which deltas were
+        unchanged.
+        """
+        self.tracker.track_msg(_create_new_session_msg(page_script_hash))
+        unchanged = [self.tracker.track_msg(msg) for msg in msgs]
+        self.tracker.track_msg(create_script_finished_message(status))
+        return unchanged
+
+    def test_unchanged_deltas(self):
+        """Deltas that were already sent in the previous run are unchanged."""
+        self.assertEqual(
+            self._run_script([_create_text_msg([0, 0]), _create_text_msg([0, 1])]),
+            [False, False],
+        )
+        self.assertEqual(
+            self._run_script(
+                [_create_text_msg([0, 0]), _create_text_msg([0, 1], "changed")]
+            ),
+            [True, False],
+        )
+        self.assertEqual(
+            self._run_script(
+                [_create_text_msg([0, 0]), _create_text_msg([0, 1], "changed")]
+            ),
+            [True, True],
+        )
+
+    def test_same_delta_at_different_path(self):
+        """Deltas are compared with the delta that was sent to the same path."""
+        self._run_script([_create_text_msg([0, 0])])
+        self.assertEqual(self._run_script([_create_text_msg([0, 1])]), [False])
+
+    def test_deltas_before_first_script_run_are_not_tracked(self):
+        """Deltas are only tracked from the start of a script run."""
+        self.assertFalse(self.tracker.track_msg(_create_text_msg([0, 0])))
+        self.assertFalse(self.tracker.track_msg(_create_text_msg([0, 0])))
+
+    def test_page_change_forgets_deltas(self):
+        """The frontend clears the app when the page changes."""
+        self._run_script([_create_text_msg([0, 0])])
+        self.assertEqual(
+            self._run_script([_create_text_msg([0, 0])], page_script_hash="other"),
+            [False],
+        )
+
+    def test_successful_run_forgets_stale_deltas(self):
+        """Deltas that weren't sent in a successful run are removed by the
+        frontend.
+        """
+        self._run_script([_create_text_msg([0, 0]), _create_text_msg([0, 1])])
+        self._run_script([_create_text_msg([0, 0])])
+        self.assertEqual(self._run_script([_create_text_msg([0, 1])]), [False])
+
+    def test_interrupted_run_keeps_deltas(self):
+        """The frontend keeps stale elements when a run is interrupted."""
+        self._run_script([_create_text_msg([0, 0]), _create_text_msg([0, 1])])
+        self._run_script(
+            [_create_text_msg([0, 0])], status=ForwardMsg.FINISHED_EARLY_FOR_RERUN
+        )
+        self.assertEqual(self._run_script([_create_text_msg([0, 1])]), [True])
+
+    def test_fragment_run_forgets_stale_fragment_deltas(self):
+        """A fragment run only removes stale deltas that belong to a fragment."""
+        self._run_script(
+            [
+                _create_text_msg([0, 0]),
+                _create_text_msg([0, 1], fragment_id="fragment"),
+            ]
+        )
+        self._run_script([], status=ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+        self.assertEqual(
+            self._run_script(
+                [
+                    _create_text_msg([0, 0]),
+                    _create_text_msg([0, 1], fragment_id="fragment"),
+                ]
+            ),
+            [True, False],
+        )
+
+    def test_replacing_block_forgets_children(self):
+        """The frontend may drop the children of a replaced block."""
+        self._run_script([_create_block_msg([0, 0]), _create_text_msg([0, 0, 0])])
+        self.assertEqual(
+            self._run_script([_create_block_msg([0, 0]), _create_text_msg([0, 0, 0])]),
+            [True, True],
+        )
+        self.assertEqual(
+            self._run_script(
+                [_create_block_msg([0, 0], "changed"), _create_text_msg([0, 0, 0])]
+            ),
+            [False, False],
+        )
+
+    def test_add_rows_forgets_delta(self):
+        """The frontend modifies its element when rows are added to it."""
+        add_rows_msg = ForwardMsg()
+        add_rows_msg.metadata.delta_path[:] = [0, 0]
+        add_rows_msg.delta.arrow_add_rows.data.data = b"data"
+
+        self._run_script([_create_text_msg([0, 0]), add_rows_msg])
+        self.assertEqual(self._run_script([_create_text_msg([0, 0])]), [False])
+
+    def test_widget_with_set_value_is_always_sent(self):
+        """The frontend applies values set via session_state whenever it
+        receives the widget.
+        """
+        msg = ForwardMsg()
+        msg.metadata.delta_path[:] = [0, 0]
+        msg.delta.new_element.slider.id = "slider"
+        msg.delta.new_element.slider.set_value = True
+
+        self._run_script([msg])
+        self.assertEqual(self._run_script([msg]), [False])
+
+        msg.delta.new_element.slider.set_value = False
+        self._run_script([msg])
+        self.assertEqual(self._run_script([msg]), [True])
+
+    def test_create_unchanged_delta_msg(self):
+        """The unchanged message only keeps the delta path of the original
+        message.
+        """
+        msg = _create_text_msg([0, 3])
+        msg.metadata.active_script_hash = "script"
+        msg.metadata.cacheable = True
+
+        unchanged_msg = create_unchanged_delta_msg(msg)
+
+        self.assertEqual(unchanged_msg.delta.WhichOneof("type"), "unchanged")
+        self.assertEqual(list(unchanged_msg.metadata.delta_path), [0, 3])
+        self.assertEqual(unchanged_msg.metadata.active_script_hash, "")
+        self.assertFalse(unchanged_msg.metadata.cacheable)
@@ -23,7 +23,9 @@ from streamlit import config
 from streamlit.runtime import app_session
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
+    compute_element_hash,
     create_reference_msg,
+    populate_hash_from_element_hash,
     populate_hash_if_needed,
 )
 from streamlit.runtime.stats import CacheStat
@@ -53,6 +55,33 @@ class ForwardMsgCacheTest(unittest.TestCase):
         msg2 = create_dataframe_msg([1, 2, 3], 2)
         self.assertEqual(populate_hash_if_needed(msg1), populate_hash_if_needed(msg2))
 
+    def test_msg_hash_from_element_hash(self):
+        """Test that hashes computed from element hashes are unique"""
+        msg = create_dataframe_msg([1, 2, 3])
+        element = msg.delta.new_element.arrow_data_frame
+        element_hash = compute_element_hash("arrow_data_frame", element)
+        self.assertEqual(
+            element_hash, compute_element_hash("arrow_data_frame", element)
+        )
+
+        msg_hash = populate_hash_from_element_hash(msg, element_hash, None)
+        self.assertEqual(msg_hash, msg.hash)
+        self.assertEqual(
+            msg_hash,
+            populate_hash_from_element_hash(
+                create_dataframe_msg([1, 2, 3], 2), element_hash, None
+            ),
+        )
+        self.assertNotEqual(
+            msg_hash, populate_hash_from_element_hash(msg, element_hash, "fragment")
+        )
+
+        other_element = create_dataframe_msg([2, 3, 4]).delta.new_element
+        self.assertNotEqual(
+            element_hash,
+            compute_element_hash("arrow_data_frame", other_element.arrow_data_frame),
+        )
+
     def test_reference_msg(self):
         """Test creation of 'reference' ForwardMsgs"""
         msg = create_dataframe_msg([1, 2, 3], 34)
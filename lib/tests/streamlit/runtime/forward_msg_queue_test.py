@@ -58,6 +58,13 @@ arrow.marshall(
 ADD_ROWS_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
 
 
+def _create_append_markdown_msg(text: str) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.delta.append_markdown = text
+    msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+    return msg
+
+
 class ForwardMsgQueueTest(unittest.TestCase):
     def test_simple_enqueue(self):
         """Enqueue a single ForwardMsg."""
@@ -145,6 +152,48 @@ class ForwardMsgQueueTest(unittest.TestCase):
         )
         self.assertEqual("text2", queue[1].delta.new_element.text.body)
 
+    def test_append_markdown_to_markdown_element(self):
+        """append_markdown deltas are combined with the markdown element they
+        append to, if it's still in the queue.
+        """
+        markdown_msg = ForwardMsg()
+        markdown_msg.delta.new_element.markdown.body = "Hello"
+        markdown_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(markdown_msg)
+        fmq.enqueue(_create_append_markdown_msg(" wor"))
+        fmq.enqueue(_create_append_markdown_msg("ld"))
+
+        queue = fmq.flush()
+        self.assertEqual(1, len(queue))
+        self.assertEqual("Hello world", queue[0].delta.new_element.markdown.body)
+        # The original message isn't modified.
+        self.assertEqual("Hello", markdown_msg.delta.new_element.markdown.body)
+
+    def test_combine_append_markdown_deltas(self):
+        """Consecutive append_markdown deltas are combined."""
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(_create_append_markdown_msg("Hello"))
+        fmq.enqueue(_create_append_markdown_msg(" world"))
+
+        queue = fmq.flush()
+        self.assertEqual(1, len(queue))
+        self.assertEqual("Hello world", queue[0].delta.append_markdown)
+
+    def test_dont_append_markdown_to_other_elements(self):
+        TEXT_DELTA_MSG1.metadata.delta_path[:] = make_delta_path(
+            RootContainer.MAIN, (), 0
+        )
+        append_msg = _create_append_markdown_msg(" world")
+
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(TEXT_DELTA_MSG1)
+        fmq.enqueue(append_msg)
+
+        queue = fmq.flush()
+        self.assertEqual([TEXT_DELTA_MSG1, append_msg], queue)
+
     @parameterized.expand([(TEXT_DELTA_MSG1,), (ADD_BLOCK_MSG,)])
     def test_dont_replace_block(self, other_msg: ForwardMsg):
         """add_block deltas should never be replaced because they can
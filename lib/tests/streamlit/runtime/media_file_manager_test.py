@@ -283,6 +283,32 @@ class MediaFileManagerTest(TestCase):
         # There should only be 1 session with registered files.
         self.assertEqual(len(self.media_file_manager._files_by_session_and_coord), 1)
 
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_add_ref(self):
+        """Adding a reference to an existing file registers it at the given
+        coordinates, without loading the file again.
+        """
+        sample = IMAGE_FIXTURES["png"]
+        coord = random_coordinates()
+        self.media_file_manager.add(sample["content"], sample["mimetype"], coord)
+        file_id = self.media_file_manager.get_file_id(coord)
+        self.assertEqual(
+            _calculate_file_id(sample["content"], sample["mimetype"]), file_id
+        )
+
+        other_coord = random_coordinates()
+        self.assertIsNone(self.media_file_manager.get_file_id(other_coord))
+        self.assertTrue(self.media_file_manager.add_ref(file_id, other_coord))
+        self.assertEqual(file_id, self.media_file_manager.get_file_id(other_coord))
+
+        self.media_file_manager.clear_session_refs()
+        self.media_file_manager.remove_orphaned_files()
+        self.assertFalse(self.media_file_manager.add_ref(file_id, other_coord))
+        self.assertIsNone(self.media_file_manager.get_file_id(other_coord))
+
     @mock.patch(
         "streamlit.runtime.media_file_manager._get_session_id",
         MagicMock(return_value="mock_session_id"),
@@ -0,0 +1,161 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import unittest
+
+from google.protobuf.json_format import MessageToDict
+
+from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
+from streamlit.runtime.performance_metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.register(Counter("cache_hits", "Number of cache hits."))
+        counter.inc(cache_type="st_cache_data")
+        counter.inc(2, cache_type="st_cache_data")
+        counter.inc(cache_type="st_cache_resource")
+
+        self.assertEqual(counter.get(cache_type="st_cache_data"), 3)
+        self.assertEqual(
+            self.registry.to_text_lines(),
+            [
+                "# TYPE cache_hits counter",
+                "# HELP cache_hits Number of cache hits.",
+                'cache_hits_total{cache_type="st_cache_data"} 3',
+                'cache_hits_total{cache_type="st_cache_resource"} 1',
+            ],
+        )
+
+    def test_gauge_with_function(self):
+        self.registry.register(
+            Gauge("sessions", "Number of sessions.", function=lambda: 4)
+        )
+
+        self.assertEqual(
+            self.registry.to_text_lines(),
+            [
+                "# TYPE sessions gauge",
+                "# HELP sessions Number of sessions.",
+                "sessions 4",
+            ],
+        )
+
+    def test_histogram(self):
+        histogram = self.registry.register(
+            Histogram(
+                "run_duration_seconds",
+                "Run duration.",
+                unit="seconds",
+                buckets=(0.1, 1.0),
+            )
+        )
+        histogram.observe(0.1, status="success")
+        histogram.observe(0.5, status="success")
+        histogram.observe(2.5, status="success")
+
+        self.assertEqual(histogram.get_count(status="success"), 3)
+        self.assertEqual(
+            self.registry.to_text_lines(),
+            [
+                "# TYPE run_duration_seconds histogram",
+                "# UNIT run_duration_seconds seconds",
+                "# HELP run_duration_seconds Run duration.",
+                'run_duration_seconds_bucket{status="success",le="0.1"} 1',
+                'run_duration_seconds_bucket{status="success",le="1"} 2',
+                'run_duration_seconds_bucket{status="success",le="+Inf"} 3',
+                'run_duration_seconds_count{status="success"} 3',
+                'run_duration_seconds_sum{status="success"} 3.1',
+            ],
+        )
+
+    def test_escape_label_values(self):
+        counter = self.registry.register(Counter("foo", "Foo."))
+        counter.inc(name='a "quoted"\\name\n')
+
+        self.assertEqual(
+            self.registry.to_text_lines()[-1],
+            r'foo_total{name="a \"quoted\"\\name\n"} 1',
+        )
+
+    def test_register_replaces_metric_with_same_name(self):
+        self.registry.register(Gauge("sessions", "Sessions.", function=lambda: 1))
+        self.registry.register(Gauge("sessions", "Sessions.", function=lambda: 2))
+
+        self.assertEqual(self.registry.to_text_lines()[-1], "sessions 2")
+
+    def test_marshall_metric_set_proto(self):
+        counter = self.registry.register(
+            Counter("sent_bytes", "Sent bytes.", unit="bytes")
+        )
+        counter.inc(10)
+        histogram = self.registry.register(
+            Histogram("lag_seconds", "Lag.", unit="seconds", buckets=(1.0,))
+        )
+        histogram.observe(0.5)
+
+        metric_set = MetricSetProto()
+        self.registry.marshall_metric_set_proto(metric_set)
+
+        self.assertEqual(
+            MessageToDict(metric_set),
+            {
+                "metricFamilies": [
+                    {
+                        "name": "sent_bytes",
+                        "type": "COUNTER",
+                        "unit": "bytes",
+                        "help": "Sent bytes.",
+                        "metrics": [
+                            {"metricPoints": [{"counterValue": {"intValue": "10"}}]}
+                        ],
+                    },
+                    {
+                        "name": "lag_seconds",
+                        "type": "HISTOGRAM",
+                        "unit": "seconds",
+                        "help": "Lag.",
+                        "metrics": [
+                            {
+                                "metricPoints": [
+                                    {
+                                        "histogramValue": {
+                                            "doubleValue": 0.5,
+                                            "count": "1",
+                                            "buckets": [
+                                                {"count": "1", "upperBound": 1.0},
+                                                {
+                                                    "count": "1",
+                                                    "upperBound": "Infinity",
+                                                },
+                                            ],
+                                        }
+                                    }
+                                ]
+                            }
+                        ],
+                    },
+                ]
+            },
+        )
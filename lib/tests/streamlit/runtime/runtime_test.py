@@ -39,7 +39,9 @@ from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.performance_metrics import metrics_registry
 from streamlit.runtime.runtime import AsyncObjects, RuntimeStoppedError
+from streamlit.runtime.stats import CacheStat
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 from streamlit.watcher import event_based_path_watcher
 from tests.streamlit.message_mocks import (
@@ -60,6 +62,12 @@ class MockSessionClient(SessionClient):
         self.forward_msgs.append(msg)
 
 
+class BufferingSessionClient(MockSessionClient):
+    """A MockSessionClient with a settable number of buffered bytes."""
+
+    buffered_bytes = 0
+
+
 class RuntimeConfigTests(unittest.TestCase):
     def test_runtime_config_defaults(self):
         config = RuntimeConfig(
@@ -356,6 +364,15 @@ class RuntimeTest(RuntimeTestCase):
             # All sessions should be shut down via self._session_mgr.close_session
             patched_close_session.assert_has_calls(call(s.id) for s in app_sessions)
 
+    async def test_closes_session_storage_on_stop(self):
+        await self.runtime.start()
+
+        with patch.object(self.runtime._session_storage, "close") as patched_close:
+            self.runtime.stop()
+            await self.runtime.stopped
+
+        patched_close.assert_called_once()
+
     @patch("streamlit.runtime.app_session.AppSession.handle_backmsg", new=MagicMock())
     async def test_handle_backmsg(self):
         """BackMsgs should be delivered to the appropriate AppSession."""
@@ -431,6 +448,7 @@ class RuntimeTest(RuntimeTestCase):
         await self.runtime.start()
 
         client = MagicMock(spec=SessionClient)
+        client.buffered_bytes = 0
         session_id = self.runtime.connect_session(client, MagicMock())
 
         # Send the client a message. All should be well.
@@ -544,6 +562,92 @@ class RuntimeTest(RuntimeTestCase):
             # And the same *metadata* as msg2:
             self.assertEqual(msg2.metadata, cached.metadata)
 
+    async def test_unchanged_deltas(self):
+        """Test that deltas the client already displays are replaced with an
+        "unchanged" marker."""
+        await self.runtime.start()
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        async def run_script(enable_delta_diffing: bool) -> ForwardMsg:
+            with patch_config_options(
+                {"global.enableDeltaDiffing": enable_delta_diffing}
+            ):
+                new_session_msg = ForwardMsg()
+                new_session_msg.new_session.page_script_hash = "page"
+                for msg in (
+                    new_session_msg,
+                    create_dataframe_msg([1, 2, 3]),
+                    create_script_finished_message(ForwardMsg.FINISHED_SUCCESSFULLY),
+                ):
+                    self.enqueue_forward_msg(session_id, msg)
+                    await self.tick_runtime_loop()
+            return client.forward_msgs[-2]
+
+        received = await run_script(enable_delta_diffing=True)
+        self.assertEqual("new_element", received.delta.WhichOneof("type"))
+
+        data_msg = create_dataframe_msg([1, 2, 3])
+        received = await run_script(enable_delta_diffing=True)
+        self.assertEqual("unchanged", received.delta.WhichOneof("type"))
+        self.assertEqual(data_msg.metadata.delta_path, received.metadata.delta_path)
+
+        stats = self.runtime.delta_diff_stats
+        self.assertEqual(1, stats.unchanged_deltas)
+        populate_hash_if_needed(data_msg)
+        self.assertEqual(data_msg.ByteSize() - received.ByteSize(), stats.bytes_saved)
+
+        received = await run_script(enable_delta_diffing=False)
+        self.assertEqual("new_element", received.delta.WhichOneof("type"))
+
+    async def test_throttle_client_that_fell_behind(self):
+        """Test that messages are held back, and combined, while a client has
+        more buffered bytes than server.maxSessionBufferSize allows."""
+        await self.runtime.start()
+
+        client = BufferingSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        with patch_config_options({"server.maxSessionBufferSize": 1}):
+            client.buffered_bytes = 2 * 1024 * 1024
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2]))
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
+            await self.tick_runtime_loop()
+            self.assertEqual([], client.forward_msgs)
+
+            stats = self.runtime.stats_mgr.get_stats()
+            self.assertIn(
+                CacheStat("session_client_buffer", session_id, 2 * 1024 * 1024),
+                stats,
+            )
+
+            # Once the client catches up, only the latest version of the
+            # element is sent.
+            client.buffered_bytes = 0
+            await asyncio.sleep(0.1)
+            self.assertEqual(
+                [create_dataframe_msg([1, 2, 3]).delta],
+                [msg.delta for msg in client.forward_msgs],
+            )
+
+    async def test_performance_metrics(self):
+        """Test that the Runtime's gauges reflect its sessions and queues."""
+        await self.runtime.start()
+
+        client = BufferingSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        with patch_config_options({"server.maxSessionBufferSize": 1}):
+            client.buffered_bytes = 2 * 1024 * 1024
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2]))
+            await self.tick_runtime_loop()
+
+            metric_lines = metrics_registry.to_text_lines()
+            self.assertIn("websocket_connections 1", metric_lines)
+            self.assertIn("sessions 1", metric_lines)
+            self.assertIn("forward_msg_queue_length 1", metric_lines)
+
     async def test_forwardmsg_cache_clearing(self):
         """Test that the ForwardMsgCache gets properly cleared when scripts
         finish running.
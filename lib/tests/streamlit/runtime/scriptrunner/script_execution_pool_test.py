@@ -0,0 +1,120 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ScriptExecutionPool."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from streamlit.runtime.scriptrunner.script_execution_pool import ScriptExecutionPool
+
+
+def _wait_until(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        time.sleep(0.01)
+
+
+class ScriptExecutionPoolTest(unittest.TestCase):
+    def test_unlimited_pool_admits_immediately(self):
+        """Test that a pool without a limit never queues runs."""
+        pool = ScriptExecutionPool(0)
+
+        for _ in range(10):
+            self.assertTrue(pool.acquire(is_cancelled=lambda: False))
+
+        stats = pool.get_stats()
+        self.assertEqual(stats.running, 10)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.admitted_runs, 10)
+
+    def test_runs_wait_for_free_slot(self):
+        """Test that runs beyond the limit wait until a slot is released."""
+        pool = ScriptExecutionPool(1)
+        self.assertTrue(pool.acquire(is_cancelled=lambda: False))
+
+        acquired = threading.Event()
+
+        def acquire():
+            pool.acquire(is_cancelled=lambda: False)
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+
+        _wait_until(lambda: pool.get_stats().queued == 1)
+        self.assertFalse(acquired.is_set())
+
+        pool.release()
+        thread.join()
+
+        self.assertTrue(acquired.is_set())
+        stats = pool.get_stats()
+        self.assertEqual(stats.running, 1)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.admitted_runs, 2)
+        self.assertGreater(stats.max_wait_time_seconds, 0)
+
+    def test_runs_are_admitted_in_fifo_order(self):
+        """Test that queued runs are admitted first-come, first-served."""
+        pool = ScriptExecutionPool(1)
+        pool.acquire(is_cancelled=lambda: False)
+
+        admitted: list[int] = []
+
+        def acquire(index: int):
+            pool.acquire(is_cancelled=lambda: False)
+            admitted.append(index)
+            pool.release()
+
+        threads = []
+        for index in range(3):
+            thread = threading.Thread(target=acquire, args=(index,))
+            thread.start()
+            threads.append(thread)
+            _wait_until(lambda index=index: pool.get_stats().queued == index + 1)
+
+        pool.release()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(admitted, [0, 1, 2])
+
+    def test_cancelled_run_leaves_queue(self):
+        """Test that a cancelled run leaves the queue without a slot."""
+        pool = ScriptExecutionPool(1)
+        pool.acquire(is_cancelled=lambda: False)
+
+        cancelled = threading.Event()
+        result: list[bool] = []
+
+        thread = threading.Thread(
+            target=lambda: result.append(pool.acquire(is_cancelled=cancelled.is_set))
+        )
+        thread.start()
+        _wait_until(lambda: pool.get_stats().queued == 1)
+
+        cancelled.set()
+        thread.join()
+
+        self.assertEqual(result, [False])
+        stats = pool.get_stats()
+        self.assertEqual(stats.running, 1)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.cancelled_runs, 1)
@@ -38,6 +38,7 @@ from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.performance_metrics import script_run_duration
 from streamlit.runtime.scriptrunner import (
     RerunData,
     RerunException,
@@ -46,6 +47,7 @@ from streamlit.runtime.scriptrunner import (
     StopException,
 )
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_execution_pool import ScriptExecutionPool
 from streamlit.runtime.scriptrunner_utils.script_requests import (
     ScriptRequest,
     ScriptRequests,
@@ -244,6 +246,8 @@ class ScriptRunnerTest(AsyncTestCase):
     )
     def test_run_script(self, filename, text):
         """Tests that we can run a script to completion."""
+        successful_runs = script_run_duration.get_count(status="success")
+
         scriptrunner = TestScriptRunner(filename)
         scriptrunner._fragment_storage = MagicMock()
 
@@ -263,6 +267,9 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, [text])
         scriptrunner._fragment_storage.clear.assert_called_once()
+        self.assertEqual(
+            script_run_duration.get_count(status="success"), successful_runs + 1
+        )
         # The following check is a requirement for the CodeHasher to
         # work correctly. The CodeHasher is scoped to
         # files contained in the directory of __main__.__file__, which we
@@ -469,6 +476,8 @@ class ScriptRunnerTest(AsyncTestCase):
 
     def test_compile_error(self):
         """Tests that we get an exception event when a script can't compile."""
+        compile_errors = script_run_duration.get_count(status="compile_error")
+
         scriptrunner = TestScriptRunner("compile_error.py.txt")
         scriptrunner.request_rerun(RerunData())
         scriptrunner.start()
@@ -484,6 +493,9 @@ class ScriptRunnerTest(AsyncTestCase):
             ],
         )
         self._assert_text_deltas(scriptrunner, [])
+        self.assertEqual(
+            script_run_duration.get_count(status="compile_error"), compile_errors + 1
+        )
 
     @patch("streamlit.runtime.state.session_state.SessionState._call_callbacks")
     def test_calls_widget_callbacks(self, patched_call_callbacks):
@@ -871,6 +883,96 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, [text_utf])
 
+    def test_coalesce_rerun_while_waiting_for_execution_slot(self):
+        """Tests that reruns requested while queued in the execution pool are
+        coalesced into a single script run."""
+        pool = ScriptExecutionPool(1)
+        # Occupy the only execution slot:
+        pool.acquire(is_cancelled=lambda: False)
+
+        with patch(
+            "streamlit.runtime.scriptrunner.script_runner.get_script_execution_pool",
+            return_value=pool,
+        ):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.start()
+
+            while pool.get_stats().queued == 0:
+                time.sleep(0.01)
+
+            scriptrunner.request_rerun(RerunData())
+            scriptrunner.request_rerun(RerunData())
+            pool.release()
+            scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_events(
+            scriptrunner,
+            [
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+        )
+        self.assertEqual(pool.get_stats().running, 0)
+
+    def test_coalesce_rerun_while_waiting_for_execution_slot_keeps_triggers(self):
+        """Tests that a trigger value of a rerun that was queued in the
+        execution pool isn't lost when another rerun is requested."""
+        pool = ScriptExecutionPool(1)
+        pool.acquire(is_cancelled=lambda: False)
+
+        with patch(
+            "streamlit.runtime.scriptrunner.script_runner.get_script_execution_pool",
+            return_value=pool,
+        ):
+            scriptrunner = TestScriptRunner("good_script.py")
+            first_states = WidgetStates()
+            _create_widget("button", first_states).trigger_value = True
+            _create_widget("slider", first_states).int_value = 1
+            scriptrunner.request_rerun(RerunData(widget_states=first_states))
+
+            with patch.object(scriptrunner, "_run_script") as patched_run_script:
+                scriptrunner.start()
+
+                while pool.get_stats().queued == 0:
+                    time.sleep(0.01)
+
+                second_states = WidgetStates()
+                _create_widget("slider", second_states).int_value = 2
+                scriptrunner.request_rerun(RerunData(widget_states=second_states))
+                pool.release()
+                scriptrunner.join()
+
+        patched_run_script.assert_called_once()
+        rerun_data = patched_run_script.call_args.args[0]
+        states_by_id = {state.id: state for state in rerun_data.widget_states.widgets}
+        self.assertTrue(states_by_id["button"].trigger_value)
+        self.assertEqual(states_by_id["slider"].int_value, 2)
+
+    def test_stop_while_waiting_for_execution_slot(self):
+        """Tests that a ScriptRunner stopped while queued never runs its script."""
+        pool = ScriptExecutionPool(1)
+        pool.acquire(is_cancelled=lambda: False)
+
+        with patch(
+            "streamlit.runtime.scriptrunner.script_runner.get_script_execution_pool",
+            return_value=pool,
+        ):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.start()
+
+            while pool.get_stats().queued == 0:
+                time.sleep(0.01)
+
+            scriptrunner.request_stop()
+            scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_events(scriptrunner, [ScriptRunnerEvent.SHUTDOWN])
+        self.assertEqual(pool.get_stats().running, 1)
+
     def test_remove_nonexistent_elements(self):
         """Tests that nonexistent elements are removed from widget cache after script run."""
 
@@ -882,6 +984,7 @@ class ScriptRunnerTest(AsyncTestCase):
         _create_widget(widget_id, states).string_value = "streamlit"
         scriptrunner.request_rerun(RerunData(widget_states=states))
         scriptrunner.start()
+        scriptrunner.join()
 
         # At this point, scriptrunner should have finished running, detected
         # that our widget_id wasn't in the list of widgets found this run, and
@@ -22,6 +22,7 @@ from streamlit.runtime.scriptrunner_utils.script_requests import (
     ScriptRequest,
     ScriptRequests,
     ScriptRequestType,
+    coalesce_pending_rerun_data,
 )
 
 
@@ -281,3 +282,20 @@ class ScriptRequestsTest(unittest.TestCase):
         result = reqs.on_scriptrunner_ready()
         self.assertEqual(ScriptRequest(ScriptRequestType.RERUN, RerunData()), result)
         self.assertEqual(ScriptRequestType.CONTINUE, reqs._state)
+
+    def test_coalesce_pending_rerun_data_fragments(self):
+        """A pending fragment run coalesced into a newer one runs both
+        fragments, and a full script run wins over fragment runs."""
+        fragment_a = RerunData(fragment_id_queue=["a"])
+        fragment_b = RerunData(fragment_id_queue=["b", "a"])
+
+        self.assertEqual(
+            ["a", "b"],
+            coalesce_pending_rerun_data(fragment_a, fragment_b).fragment_id_queue,
+        )
+        self.assertEqual(
+            [], coalesce_pending_rerun_data(RerunData(), fragment_b).fragment_id_queue
+        )
+        self.assertEqual(
+            [], coalesce_pending_rerun_data(fragment_a, RerunData()).fragment_id_queue
+        )
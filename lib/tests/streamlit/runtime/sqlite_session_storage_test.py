@@ -0,0 +1,161 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from streamlit.runtime.session_manager import SessionInfo
+from streamlit.runtime.sqlite_session_storage import SQLiteSessionStorage
+from streamlit.runtime.state import SessionState
+
+
+def _create_session_info(session_id: str, **state) -> SessionInfo:
+    session = MagicMock()
+    session.id = session_id
+    session.session_state = SessionState()
+    for key, value in state.items():
+        session.session_state[key] = value
+    return SessionInfo(client=None, session=session)
+
+
+class _SlowPickle:
+    """A value that can only be pickled once the given event is set."""
+
+    def __init__(self, pickling_allowed: threading.Event | None):
+        self.pickling_allowed = pickling_allowed
+
+    def __reduce__(self):
+        assert self.pickling_allowed is not None
+        assert self.pickling_allowed.wait(timeout=5)
+        return (_SlowPickle, (None,))
+
+
+class SQLiteSessionStorageTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp_dir.name, "sessions", "sessions.db")
+        self.store = SQLiteSessionStorage(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp_dir.cleanup()
+
+    def test_save_get_delete_and_list(self):
+        """Disconnected sessions are kept in memory."""
+        session_info = _create_session_info("foo")
+
+        self.store.save(session_info)
+        self.assertEqual(self.store.get("foo"), session_info)
+        self.assertEqual(self.store.list(), [session_info])
+
+        self.store.delete("foo")
+        self.assertIsNone(self.store.get("foo"))
+        self.assertEqual(self.store.list(), [])
+
+    def test_pop_session_state(self):
+        """The state of saved sessions can be restored from another storage
+        that uses the same database.
+        """
+        self.store.save(_create_session_info("foo", counter=3, items=["a", "b"]))
+        self.store.delete("foo")
+        # Closing the storage writes the saved states, as when the server stops.
+        self.store.close()
+
+        other_store = SQLiteSessionStorage(self.path)
+        try:
+            self.assertIsNone(other_store.get("foo"))
+            self.assertEqual(
+                other_store.pop_session_state("foo"),
+                {"counter": 3, "items": ["a", "b"]},
+            )
+            # The state can only be restored once.
+            self.assertIsNone(other_store.pop_session_state("foo"))
+        finally:
+            other_store.close()
+
+    def test_save_does_not_wait_for_pickling(self):
+        """Values are pickled and written by a background thread, and restoring
+        a session waits until its state was written.
+        """
+        pickling_allowed = threading.Event()
+        self.store.save(
+            _create_session_info("foo", value=_SlowPickle(pickling_allowed))
+        )
+        self.assertEqual(self.store.get("foo").session.id, "foo")
+
+        pickling_allowed.set()
+        state = self.store.pop_session_state("foo")
+        self.assertIsInstance(state["value"], _SlowPickle)
+
+    def test_close_writes_saved_states(self):
+        self.store.save(_create_session_info("foo", counter=3))
+        self.store.close()
+
+        other_store = SQLiteSessionStorage(self.path)
+        try:
+            self.assertEqual(other_store.pop_session_state("foo"), {"counter": 3})
+        finally:
+            other_store.close()
+
+    def test_pop_session_state_of_unknown_session(self):
+        self.assertIsNone(self.store.pop_session_state("foo"))
+
+    def test_unpicklable_values_are_not_persisted(self):
+        self.store.save(_create_session_info("foo", counter=3, lock=threading.Lock()))
+
+        self.assertEqual(self.store.pop_session_state("foo"), {"counter": 3})
+
+    def test_widget_values_are_not_persisted(self):
+        session_info = _create_session_info("foo", counter=3)
+        session_info.session.session_state._old_state["$$ID-abc-None"] = "widget value"
+
+        self.store.save(session_info)
+
+        self.assertEqual(self.store.pop_session_state("foo"), {"counter": 3})
+
+    def test_expired_states_are_not_restored(self):
+        store = SQLiteSessionStorage(self.path, ttl_seconds=10)
+        try:
+            with patch(
+                "streamlit.runtime.sqlite_session_storage.time.time", return_value=100
+            ):
+                store.save(_create_session_info("foo", counter=3))
+
+            with patch(
+                "streamlit.runtime.sqlite_session_storage.time.time", return_value=111
+            ):
+                self.assertIsNone(store.pop_session_state("foo"))
+        finally:
+            store.close()
+
+    @patch("streamlit.runtime.sqlite_session_storage.time.time")
+    def test_least_recently_saved_states_are_evicted(self, patched_time):
+        store = SQLiteSessionStorage(self.path, maxsize=2)
+        try:
+            for i, session_id in enumerate(["foo", "bar", "baz"]):
+                patched_time.return_value = 100 + i
+                store.save(_create_session_info(session_id, counter=i))
+
+            # Restoring "baz" waits for its state to be written, which evicts
+            # the state of "foo".
+            self.assertEqual(store.pop_session_state("baz"), {"counter": 2})
+            self.assertEqual(store.pop_session_state("bar"), {"counter": 1})
+            self.assertIsNone(store.pop_session_state("foo"))
+        finally:
+            store.close()
@@ -14,14 +14,24 @@
 
 from __future__ import annotations
 
+import sys
+import threading
 import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 from streamlit.runtime.stats import (
     CacheStat,
     CacheStatsProvider,
+    SizeEstimates,
     StatsManager,
+    estimate_size,
     group_stats,
 )
+from streamlit.vendor.pympler.asizeof import asizeof
 
 
 class MockStatsProvider(CacheStatsProvider):
@@ -108,3 +118,118 @@ class StatsManagerTest(unittest.TestCase):
                 CacheStat("provider3", "boo", 7),
             },
         )
+
+
+class EstimateSizeTest(unittest.TestCase):
+    def test_numpy_array(self):
+        arr = np.zeros(100_000)
+        self.assertGreaterEqual(estimate_size(arr), arr.nbytes)
+        self.assertGreaterEqual(estimate_size(arr[::2]), arr[::2].nbytes)
+
+    def test_pandas_objects(self):
+        df = pd.DataFrame({"a": np.arange(10_000), "b": ["x" * 100] * 10_000})
+        expected = df.memory_usage(index=True, deep=True).sum()
+        self.assertAlmostEqual(estimate_size(df), expected, delta=expected * 0.01)
+        expected = df["b"].memory_usage(index=True, deep=True)
+        self.assertAlmostEqual(estimate_size(df["b"]), expected, delta=expected * 0.01)
+
+    def test_arrow_table(self):
+        table = pa.table({"a": np.arange(10_000)})
+        self.assertEqual(estimate_size(table), table.nbytes)
+
+    def test_containers(self):
+        """Containers are sized from their items, and large values in them use
+        the fast sizers.
+        """
+        arr = np.zeros(100_000)
+        self.assertGreater(estimate_size({"arr": arr, "list": [arr]}), 2 * arr.nbytes)
+        self.assertEqual(
+            estimate_size(["foo", b"bar"]),
+            sys.getsizeof(["foo", b"bar"])
+            + sys.getsizeof("foo")
+            + sys.getsizeof(b"bar"),
+        )
+
+    def test_other_objects(self):
+        """Other objects are sized with asizeof."""
+        obj = threading.Lock()
+        self.assertEqual(estimate_size(obj), asizeof(obj))
+
+
+class SizeEstimatesTest(unittest.TestCase):
+    def test_estimates_are_reused(self):
+        size_estimates = SizeEstimates()
+        with patch(
+            "streamlit.runtime.stats.estimate_size", wraps=estimate_size
+        ) as estimate_size_mock:
+            size_estimates.get_sizes([("a", [1, 2]), ("b", [3])])
+            self.assertEqual(estimate_size_mock.call_count, 2)
+
+            self.assertEqual(
+                size_estimates.get_sizes([("a", [1, 2]), ("b", [3])]),
+                [estimate_size([1, 2]), estimate_size([3])],
+            )
+            self.assertEqual(estimate_size_mock.call_count, 2)
+
+    def test_estimates_are_refreshed(self):
+        size_estimates = SizeEstimates(max_age_secs=0)
+        size_estimates.get_sizes([("a", [1])])
+
+        self.assertEqual(
+            size_estimates.get_sizes([("a", [1, 2])]), [estimate_size([1, 2])]
+        )
+
+    def test_set_estimates_cheap_objects(self):
+        """Cheap objects are sized when they're set, others on the next call
+        to get_sizes.
+        """
+        size_estimates = SizeEstimates()
+        arr = np.zeros(1000)
+        lock = threading.Lock()
+        size_estimates.set("arr", arr)
+        size_estimates.set("lock", lock)
+
+        with patch(
+            "streamlit.runtime.stats.estimate_size", wraps=estimate_size
+        ) as estimate_size_mock:
+            self.assertEqual(
+                size_estimates.get_sizes([("arr", arr), ("lock", lock)]),
+                [estimate_size(arr), estimate_size(lock)],
+            )
+            estimate_size_mock.assert_called_once_with(lock)
+
+    def test_unsized_objects_over_time_budget(self):
+        """Objects that weren't sized yet and don't fit into the time budget
+        are approximated with sys.getsizeof.
+        """
+        size_estimates = SizeEstimates(time_budget_secs=0)
+
+        self.assertEqual(
+            size_estimates.get_sizes([("a", [1, 2]), ("b", [1, 2])]),
+            [estimate_size([1, 2]), sys.getsizeof([1, 2])],
+        )
+
+    def test_time_budget(self):
+        """Objects that don't fit into the time budget keep their previous
+        estimate, and the oldest estimates are refreshed first.
+        """
+        size_estimates = SizeEstimates(max_age_secs=0, time_budget_secs=0)
+        size_estimates.set("a", [1])
+        size_estimates.set("b", [1])
+
+        # With a time budget of 0, one estimate is refreshed per call.
+        self.assertEqual(
+            size_estimates.get_sizes([("a", [1, 2]), ("b", [1, 2])]),
+            [estimate_size([1, 2]), estimate_size([1])],
+        )
+        self.assertEqual(
+            size_estimates.get_sizes([("a", [1, 2, 3]), ("b", [1, 2, 3])]),
+            [estimate_size([1, 2]), estimate_size([1, 2, 3])],
+        )
+
+    def test_forgets_removed_keys(self):
+        size_estimates = SizeEstimates()
+        size_estimates.get_sizes([("a", [1]), ("b", [2])])
+        size_estimates.get_sizes([("b", [2])])
+
+        self.assertEqual(list(size_estimates._estimates), ["b"])
@@ -99,6 +99,22 @@ class WebsocketSessionManagerTests(unittest.TestCase):
         assert session_info.session.id == session_id
         assert session_info.session.id != "not a valid session"
 
+    def test_connect_session_resumes_persisted_session_state(self):
+        """Test that connect_session resumes a session that's no longer held in
+        memory if its state was persisted.
+        """
+        with patch.object(
+            self.session_mgr._session_storage,
+            "pop_session_state",
+            return_value={"foo": "bar"},
+        ) as patched_pop_session_state:
+            session_id = self.connect_session(existing_session_id="persisted_session")
+
+        patched_pop_session_state.assert_called_once_with("persisted_session")
+        session_info = self.session_mgr._active_session_info_by_id[session_id]
+        assert session_id == "persisted_session"
+        assert session_info.session.session_state["foo"] == "bar"
+
     @patch("streamlit.runtime.websocket_session_manager._LOGGER.warning")
     def test_connect_session_connects_new_session_if_already_connected(
         self, patched_warning
@@ -21,7 +21,10 @@ import pandas as pd
 import pytest
 
 from streamlit.elements.markdown import MARKDOWN_HORIZONTAL_RULE_EXPRESSION
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Markdown_pb2 import Markdown as MarkdownProto
 from streamlit.testing.v1.app_test import AppTest
+from streamlit.testing.v1.element_tree import parse_tree_from_messages
 
 
 def test_alert():
@@ -375,6 +378,33 @@ def test_markdown():
     repr(sr.markdown[0])
 
 
+def test_append_markdown():
+    markdown_msg = ForwardMsg()
+    markdown_msg.metadata.delta_path[:] = [0, 0]
+    markdown_msg.delta.new_element.markdown.body = "Hello"
+    markdown_msg.delta.new_element.markdown.element_type = MarkdownProto.Type.NATIVE
+
+    append_msg = ForwardMsg()
+    append_msg.metadata.delta_path[:] = [0, 0]
+    append_msg.delta.append_markdown = " world"
+
+    tree = parse_tree_from_messages([markdown_msg, append_msg])
+
+    assert tree.markdown[0].value == "Hello world"
+    assert markdown_msg.delta.new_element.markdown.body == "Hello"
+
+
+def test_write_stream():
+    def script():
+        import streamlit as st
+
+        st.write_stream(["Hello", " world"])
+
+    at = AppTest.from_function(script).run()
+
+    assert [markdown.value for markdown in at.markdown] == ["Hello world"]
+
+
 def test_caption():
     script = AppTest.from_string(
         """
@@ -141,6 +141,44 @@ class AppStaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
         assert response.headers["Content-Type"] == "application/pdf"
         assert response.headers["X-Content-Type-Options"] == "nosniff"
 
+    def test_static_file_etag_changes_with_content(self):
+        """Clients revalidating a file get a 304 until the file changes."""
+        with open(self._tmp_png_image_file.name, "wb") as f:
+            f.write(b"png content")
+
+        response = self.fetch(f"/app/static/{self._png_image_filename}")
+        assert response.code == 200
+        assert response.body == b"png content"
+        etag = response.headers["Etag"]
+
+        response = self.fetch(
+            f"/app/static/{self._png_image_filename}",
+            headers={"If-None-Match": etag},
+        )
+        assert response.code == 304
+
+        with open(self._tmp_png_image_file.name, "wb") as f:
+            f.write(b"changed png content")
+
+        response = self.fetch(
+            f"/app/static/{self._png_image_filename}",
+            headers={"If-None-Match": etag},
+        )
+        assert response.code == 200
+        assert response.body == b"changed png content"
+        assert response.headers["Etag"] != etag
+
+    def test_static_file_range_request(self):
+        with open(self._tmp_png_image_file.name, "wb") as f:
+            f.write(b"png content")
+
+        response = self.fetch(
+            f"/app/static/{self._png_image_filename}",
+            headers={"Range": "bytes=4-6"},
+        )
+        assert response.code == 206
+        assert response.body == b"con"
+
     @patch("os.path.getsize", MagicMock(return_value=MAX_APP_STATIC_FILE_SIZE + 1))
     def test_big_file_404(self):
         """Files with size greater than MAX_APP_STATIC_FILE_SIZE should return 404."""
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import ANY, MagicMock, patch
 
 import tornado.httpserver
@@ -24,6 +25,7 @@ import tornado.websocket
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime, SessionClientDisconnectedError
+from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server import BrowserWebSocketHandler
 from tests.streamlit.web.server.server_test_case import ServerTestCase
 from tests.testutil import patch_config_options
@@ -94,6 +96,35 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    @tornado.testing.gen_test
+    async def test_buffered_bytes(self):
+        """Messages count as buffered until they were written to the socket."""
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+            self.assertEqual(0, websocket_handler.buffered_bytes)
+
+            write_future: asyncio.Future[None] = asyncio.Future()
+            with patch.object(
+                websocket_handler, "write_message", return_value=write_future
+            ):
+                msg = ForwardMsg()
+                msg.script_finished = (
+                    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY
+                )
+                websocket_handler.write_forward_msg(msg)
+
+            self.assertEqual(
+                len(serialize_forward_msg(msg)), websocket_handler.buffered_bytes
+            )
+
+            write_future.set_result(None)
+            await asyncio.sleep(0)
+            self.assertEqual(0, websocket_handler.buffered_bytes)
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
+import gzip
 import mimetypes
+import os
+import tempfile
 import threading
 from unittest import mock
 
@@ -28,6 +31,7 @@ from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.scriptrunner import add_script_run_ctx
 from streamlit.web.server import ComponentRequestHandler
+from streamlit.web.server.static_asset_cache import static_asset_cache
 from tests.testutil import create_mock_script_run_ctx
 
 URL = "http://not.a.real.url:3001"
@@ -48,6 +52,8 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
             uploaded_file_manager=MemoryUploadedFileManager("/mock/upload"),
         )
         self.runtime = Runtime(config)
+        self._tmpdir = tempfile.TemporaryDirectory()
+        static_asset_cache.clear()
         super().setUp()
 
         # declare_component needs a script_run_ctx to be set
@@ -56,6 +62,8 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def tearDown(self) -> None:
         super().tearDown()
         Runtime._instance = None
+        self._tmpdir.cleanup()
+        static_asset_cache.clear()
 
     # get_app is called in the super constructor
     def get_app(self) -> tornado.web.Application:
@@ -69,26 +77,29 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
             ]
         )
 
-    def _request_component(self, path):
-        return self.fetch("/component/%s" % path, method="GET")
+    def _request_component(self, path, headers=None):
+        return self.fetch("/component/%s" % path, method="GET", headers=headers)
+
+    def _write_component_file(self, filename, content):
+        """Write a file to a temporary component directory and return the path
+        to request it.
+        """
+        with open(os.path.join(self._tmpdir.name, filename), "wb") as f:
+            f.write(content)
+        declare_component("test", path=self._tmpdir.name)
+        return (
+            f"tests.streamlit.web.server.component_request_handler_test.test/{filename}"
+        )
 
     def test_success_request(self):
         """Test request success when valid parameters are provided."""
 
-        with mock.patch(MOCK_IS_DIR_PATH):
-            # We don't need the return value in this case.
-            declare_component("test", path=PATH)
-
-        with mock.patch(
-            "streamlit.web.server.component_request_handler.open",
-            mock.mock_open(read_data="Test Content"),
-        ):
-            response = self._request_component(
-                "tests.streamlit.web.server.component_request_handler_test.test"
-            )
+        path = self._write_component_file("index.html", b"Test Content")
+        response = self._request_component(path)
 
         self.assertEqual(200, response.code)
         self.assertEqual(b"Test Content", response.body)
+        self.assertEqual("no-cache", response.headers["Cache-Control"])
 
     def test_outside_component_root_request(self):
         """Tests to ensure a path based on the root directory (and therefore
@@ -167,7 +178,7 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
         with mock.patch(MOCK_IS_DIR_PATH):
             declare_component("test", path=PATH)
 
-        with mock.patch("streamlit.web.server.component_request_handler.open") as m:
+        with mock.patch("streamlit.web.server.static_asset_cache.os.stat") as m:
             m.side_effect = OSError("Invalid content")
             response = self._request_component(
                 "tests.streamlit.web.server.component_request_handler_test.test"
@@ -182,41 +193,65 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def test_support_binary_files_request(self):
         """Test support for binary files reads."""
 
-        def _open_read(m, payload):
-            is_binary = False
-            args, kwargs = m.call_args
-            if len(args) > 1:
-                if "b" in args[1]:
-                    is_binary = True
-            encoding = "utf-8"
-            if "encoding" in kwargs:
-                encoding = kwargs["encoding"]
+        payload = b"\x00\x01\x00\x00\x00\x0d\x00\x80"  # binary non utf-8 payload
+
+        path = self._write_component_file("data.bin", payload)
+        response = self._request_component(path)
 
-            if is_binary:
-                from io import BytesIO
+        self.assertEqual(200, response.code)
+        self.assertEqual(
+            payload,
+            response.body,
+        )
 
-                return BytesIO(payload)
-            else:
-                from io import TextIOWrapper
+    def test_etag_request(self):
+        """Test that unchanged files aren't resent to clients that have them."""
+        path = self._write_component_file("index.html", b"Test Content")
 
-                return TextIOWrapper(str(payload, encoding=encoding))
+        response = self._request_component(path)
+        self.assertEqual(200, response.code)
+        etag = response.headers["Etag"]
 
-        with mock.patch(MOCK_IS_DIR_PATH):
-            declare_component("test", path=PATH)
+        response = self._request_component(path, headers={"If-None-Match": etag})
+        self.assertEqual(304, response.code)
+        self.assertEqual(b"", response.body)
 
-        payload = b"\x00\x01\x00\x00\x00\x0d\x00\x80"  # binary non utf-8 payload
+    def test_changed_file_request(self):
+        """Test that files are reread when they change."""
+        path = self._write_component_file("index.html", b"Test Content")
+        response = self._request_component(path)
+        etag = response.headers["Etag"]
 
-        with mock.patch("streamlit.web.server.component_request_handler.open") as m:
-            m.return_value.__enter__ = lambda _: _open_read(m, payload)
-            response = self._request_component(
-                "tests.streamlit.web.server.component_request_handler_test.test"
-            )
+        path = self._write_component_file("index.html", b"Changed Test Content")
+        response = self._request_component(path, headers={"If-None-Match": etag})
 
         self.assertEqual(200, response.code)
-        self.assertEqual(
-            payload,
-            response.body,
+        self.assertEqual(b"Changed Test Content", response.body)
+        self.assertNotEqual(etag, response.headers["Etag"])
+
+    def test_compressed_request(self):
+        """Test that compressible files are sent compressed to clients that
+        accept it.
+        """
+        payload = b"console.log('Test Content');\n" * 100
+        path = self._write_component_file("main.js", payload)
+
+        # Don't let the client decompress the response, so we can check it.
+        response = self.fetch(
+            f"/component/{path}",
+            headers={"Accept-Encoding": "gzip, deflate"},
+            decompress_response=False,
         )
+        self.assertEqual(200, response.code)
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual("public", response.headers["Cache-Control"])
+        self.assertEqual(payload, gzip.decompress(response.body))
+
+        response = self._request_component(path, headers={"Accept-Encoding": ""})
+        self.assertEqual(200, response.code)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(payload, response.body)
 
     def test_mimetype_is_overridden_by_component_request_handler(self):
         """Test get_content_type function."""
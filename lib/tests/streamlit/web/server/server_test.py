@@ -451,6 +451,26 @@ class SslServerTest(unittest.TestCase):
             r"Make sure cert file '.+' and key file '.+' are correct\.",
         )
 
+    def test_worker_sockets_dont_use_ssl(self):
+        """Worker processes listen on loopback sockets that the worker proxy
+        connects to without SSL, so they ignore the SSL options.
+        """
+        app = mock.MagicMock()
+        sockets = [mock.MagicMock()]
+        mock_server = mock.MagicMock()
+        with patch_config_options(
+            {
+                "server.sslCertFile": "/does/not/exist.cert",
+                "server.sslKeyFile": "/does/not/exist.key",
+            }
+        ), patch(
+            "streamlit.web.server.server.HTTPServer", return_value=mock_server
+        ) as mock_http_server:
+            start_listening(app, sockets)
+
+        assert mock_http_server.call_args.kwargs["ssl_options"] is None
+        mock_server.add_sockets.assert_called_once_with(sockets)
+
 
 class UnixSocketTest(unittest.TestCase):
     """Tests start_listening uses a unix socket when socket.address starts with
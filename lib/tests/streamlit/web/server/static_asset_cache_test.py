@@ -0,0 +1,102 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gzip
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from streamlit.web.server.static_asset_cache import StaticAssetCache
+
+JS_CONTENT = b"console.log('Hello world');\n" * 100
+
+
+class StaticAssetCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cache = StaticAssetCache()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _write_file(self, filename: str, content: bytes) -> str:
+        path = os.path.join(self._tmpdir.name, filename)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_get_caches_content(self):
+        path = self._write_file("main.js", JS_CONTENT)
+
+        asset = self.cache.get(path)
+        self.assertEqual(asset.content, JS_CONTENT)
+        self.assertEqual(asset.encoded_contents, {})
+
+        with patch("streamlit.web.server.static_asset_cache.open") as patched_open:
+            self.assertIs(self.cache.get(path), asset)
+            patched_open.assert_not_called()
+
+    def test_get_compressed(self):
+        path = self._write_file("main.js", JS_CONTENT)
+
+        asset = self.cache.get(path, compress=True)
+
+        self.assertEqual(gzip.decompress(asset.encoded_contents["gzip"]), JS_CONTENT)
+        self.assertEqual(asset.get_encoding("deflate, gzip;q=1.0"), "gzip")
+        self.assertIsNone(asset.get_encoding("deflate"))
+        self.assertNotEqual(asset.get_etag("gzip"), asset.get_etag(None))
+        # The compressed variants are kept for later calls.
+        self.assertIs(self.cache.get(path), asset)
+
+    def test_small_and_binary_files_are_not_compressed(self):
+        small_path = self._write_file("small.js", b"console.log(1);")
+        binary_path = self._write_file("image.png", b"\x89PNG" * 1000)
+
+        self.assertEqual(self.cache.get(small_path, compress=True).encoded_contents, {})
+        self.assertEqual(
+            self.cache.get(binary_path, compress=True).encoded_contents, {}
+        )
+
+    def test_get_rereads_changed_file(self):
+        path = self._write_file("index.html", b"old content")
+        old_asset = self.cache.get(path)
+
+        self._write_file("index.html", b"new content!")
+        new_asset = self.cache.get(path)
+
+        self.assertEqual(new_asset.content, b"new content!")
+        self.assertNotEqual(new_asset.content_hash, old_asset.content_hash)
+
+    def test_large_files_are_not_cached(self):
+        cache = StaticAssetCache(max_file_size_bytes=10)
+        path = self._write_file("index.html", b"more than 10 bytes")
+
+        self.assertIsNone(cache.get(path))
+
+    def test_least_recently_used_files_are_evicted(self):
+        cache = StaticAssetCache(max_size_bytes=25)
+        paths = [self._write_file(f"{i}.html", b"ten bytes!") for i in range(3)]
+
+        first_asset = cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[2])
+
+        self.assertIsNot(cache.get(paths[0]), first_asset)
+
+    def test_get_missing_file(self):
+        with self.assertRaises(OSError):
+            self.cache.get(os.path.join(self._tmpdir.name, "missing.js"))
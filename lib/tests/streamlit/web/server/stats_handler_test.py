@@ -22,6 +22,7 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
+from streamlit.runtime.performance_metrics import Counter, MetricsRegistry
 from streamlit.runtime.stats import CacheStat
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
@@ -30,7 +31,7 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
-        mock_stats_manager = MagicMock()
+        self.mock_stats_manager = mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
         return tornado.web.Application(
             [
@@ -50,7 +51,7 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         expected_body = (
             b"# TYPE cache_memory_bytes gauge\n"
             b"# UNIT cache_memory_bytes bytes\n"
-            b"# HELP Total memory consumed by a cache.\n"
+            b"# HELP cache_memory_bytes Total memory consumed by a cache.\n"
             b"# EOF\n"
         )
 
@@ -89,13 +90,14 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         expected_body = (
             b"# TYPE cache_memory_bytes gauge\n"
             b"# UNIT cache_memory_bytes bytes\n"
-            b"# HELP Total memory consumed by a cache.\n"
+            b"# HELP cache_memory_bytes Total memory consumed by a cache.\n"
             b'cache_memory_bytes{cache_type="st.singleton",cache="foo"} 128\n'
             b'cache_memory_bytes{cache_type="st.memo",cache="bar"} 256\n'
             b"# EOF\n"
         )
 
         self.assertEqual(expected_body, response.body)
+        self.mock_stats_manager.get_stats.assert_called_once()
 
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
@@ -161,3 +163,64 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         }
 
         self.assertEqual(expected, MessageToDict(metric_set))
+
+
+class StatsHandlerWithMetricsRegistryTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        mock_stats_manager = MagicMock()
+        mock_stats_manager.get_stats = MagicMock(return_value=[])
+        self.registry = MetricsRegistry()
+        self.counter = self.registry.register(
+            Counter("forward_msgs_sent", "Number of messages sent to clients.")
+        )
+        return tornado.web.Application(
+            [
+                (
+                    rf"/{METRIC_ENDPOINT}",
+                    StatsRequestHandler,
+                    dict(
+                        stats_manager=mock_stats_manager,
+                        metrics_registry=self.registry,
+                    ),
+                )
+            ]
+        )
+
+    def test_text_metrics(self):
+        """The performance metrics are exported after the cache stats."""
+        self.counter.inc(3)
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            b"# TYPE cache_memory_bytes gauge\n"
+            b"# UNIT cache_memory_bytes bytes\n"
+            b"# HELP cache_memory_bytes Total memory consumed by a cache.\n"
+            b"# TYPE forward_msgs_sent counter\n"
+            b"# HELP forward_msgs_sent Number of messages sent to clients.\n"
+            b"forward_msgs_sent_total 3\n"
+            b"# EOF\n"
+        )
+        self.assertEqual(expected_body, response.body)
+
+    def test_protobuf_metrics(self):
+        self.counter.inc(3)
+
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+        self.assertEqual(200, response.code)
+
+        metric_set = MetricSetProto()
+        metric_set.ParseFromString(response.body)
+
+        self.assertEqual(
+            {
+                "name": "forward_msgs_sent",
+                "type": "COUNTER",
+                "help": "Number of messages sent to clients.",
+                "metrics": [{"metricPoints": [{"counterValue": {"intValue": "3"}}]}],
+            },
+            MessageToDict(metric_set.metric_families[1]),
+        )
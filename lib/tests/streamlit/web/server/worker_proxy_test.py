@@ -0,0 +1,362 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""worker_proxy.py unit tests"""
+
+from __future__ import annotations
+
+import unittest
+
+import tornado.httpclient
+import tornado.httpserver
+import tornado.netutil
+import tornado.testing
+import tornado.web
+import tornado.websocket
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.openmetrics_data_model_pb2 import MetricSet
+from streamlit.runtime.performance_metrics import Counter, MetricsRegistry
+from streamlit.runtime.stats import CacheStat
+from streamlit.web.server.stats_request_handler import StatsRequestHandler
+from streamlit.web.server.worker_proxy import SessionRouter, create_worker_proxy_app
+from tests.testutil import patch_config_options
+
+
+class SessionRouterTest(unittest.TestCase):
+    def test_spreads_new_sessions_across_workers(self):
+        """New connections go to the worker with the fewest connections."""
+        router = SessionRouter(3, disconnected_session_ttl=60)
+
+        workers = [router.connect(None) for _ in range(6)]
+
+        self.assertEqual(sorted(workers), [0, 0, 1, 1, 2, 2])
+
+    def test_spreads_sequential_sessions_across_workers(self):
+        """Ties between idle workers are broken round-robin."""
+        router = SessionRouter(2, disconnected_session_ttl=60)
+
+        workers = []
+        for _ in range(4):
+            worker = router.connect(None)
+            router.disconnect(None, worker)
+            workers.append(worker)
+
+        self.assertEqual(sorted(workers), [0, 0, 1, 1])
+
+    def test_reconnects_go_to_the_same_worker(self):
+        """A reconnecting session is routed to the worker that holds its state."""
+        router = SessionRouter(2, disconnected_session_ttl=60)
+        worker = router.connect(None)
+        router.register_session("session", worker)
+        router.disconnect("session", worker)
+
+        # Make the other worker the less busy one:
+        router.connect(None)
+        router.connect(None)
+
+        self.assertEqual(router.connect("session"), worker)
+        self.assertEqual(router.get_workers("session"), [worker])
+
+    def test_forgets_disconnected_sessions_after_ttl(self):
+        """Disconnected sessions are forgotten once the workers discard them."""
+        router = SessionRouter(2, disconnected_session_ttl=0)
+        worker = router.connect(None)
+        router.register_session("session", worker)
+        router.disconnect("session", worker)
+
+        self.assertEqual(len(router.get_workers("session")), 2)
+
+    def test_remembers_disconnected_sessions_of_all_workers(self):
+        """Each worker keeps up to disconnected_session_maxsize sessions."""
+        router = SessionRouter(
+            2, disconnected_session_ttl=60, disconnected_session_maxsize=2
+        )
+        for i in range(4):
+            worker = i % 2
+            router.register_session(f"session-{i}", worker)
+            router.disconnect(f"session-{i}", router.connect(f"session-{i}"))
+
+        for i in range(4):
+            self.assertEqual(router.get_workers(f"session-{i}"), [i % 2])
+
+    def test_get_workers_without_session(self):
+        """Requests without a session may be served by any worker."""
+        router = SessionRouter(3, disconnected_session_ttl=60)
+
+        self.assertEqual(sorted(router.get_workers()), [0, 1, 2])
+
+
+class _FakeWorkerWebSocketHandler(tornado.websocket.WebSocketHandler):
+    def initialize(self, index: int) -> None:
+        self._index = index
+
+    def select_subprotocol(self, subprotocols: list[str]) -> str | None:
+        return subprotocols[0] if subprotocols else None
+
+    def open(self, *args, **kwargs) -> None:
+        protocols = self.request.headers.get("Sec-Websocket-Protocol", "").split(",")
+        msg = ForwardMsg()
+        msg.new_session.initialize.session_id = (
+            protocols[2].strip() if len(protocols) >= 3 else f"session-{self._index}"
+        )
+        self.write_message(msg.SerializeToString(), binary=True)
+
+    def on_message(self, message: str | bytes) -> None:
+        self.write_message(f"worker-{self._index}:{message!r}")
+
+
+class _FakeWorkerMediaHandler(tornado.web.RequestHandler):
+    def initialize(self, index: int, has_media: bool) -> None:
+        self._index = index
+        self._has_media = has_media
+
+    def get(self, *args) -> None:
+        if not self._has_media:
+            raise tornado.web.HTTPError(404)
+        self.write(f"media from worker-{self._index}")
+
+
+class _FakeWorkerHealthHandler(tornado.web.RequestHandler):
+    def initialize(self, index: int, healthy: list[bool]) -> None:
+        self._index = index
+        self._healthy = healthy
+
+    def get(self) -> None:
+        if self._healthy[self._index]:
+            self.write("ok")
+        else:
+            self.set_status(503)
+            self.write("unavailable")
+
+
+class _FakeWorkerMetricsHandler(tornado.web.RequestHandler):
+    def initialize(self, index: int) -> None:
+        self._index = index
+
+    def get(self) -> None:
+        cache_stats = [
+            CacheStat("st_cache_data", "foo", 10 * (self._index + 1)),
+            CacheStat("st_session_state", "", 100),
+        ]
+        metrics_registry = MetricsRegistry()
+        metrics_registry.register(
+            Counter("rerun_requests", "Number of script reruns requested by clients.")
+        ).inc(self._index + 1)
+
+        if "application/x-protobuf" in self.request.headers.get_list("Accept"):
+            metric_set = StatsRequestHandler._stats_to_proto(cache_stats)
+            metrics_registry.marshall_metric_set_proto(metric_set)
+            self.set_header("Content-Type", "application/x-protobuf")
+            self.write(metric_set.SerializeToString())
+        else:
+            self.set_header("Content-Type", "application/openmetrics-text")
+            self.write(
+                StatsRequestHandler._stats_to_text(cache_stats, metrics_registry)
+            )
+
+
+class _FakeWorkerUploadHandler(tornado.web.RequestHandler):
+    def initialize(self, index: int) -> None:
+        self._index = index
+
+    def check_xsrf_cookie(self) -> None:
+        pass
+
+    def put(self, *args) -> None:
+        self.write(f"worker-{self._index} received {self.request.body.decode()}")
+
+
+class WorkerProxyTest(tornado.testing.AsyncHTTPTestCase):
+    def setUp(self) -> None:
+        self._patched_config = patch_config_options(
+            {"server.enableXsrfProtection": False}
+        )
+        self._patched_config.__enter__()
+        super().setUp()
+
+    def tearDown(self) -> None:
+        self._http_client.close()
+        for server in self._worker_servers:
+            server.stop()
+        super().tearDown()
+        self._patched_config.__exit__(None, None, None)
+
+    def get_app(self) -> tornado.web.Application:
+        self.router = SessionRouter(2, disconnected_session_ttl=60)
+        self.healthy = [True, True]
+        self._worker_servers = []
+        worker_ports = []
+        for index in range(2):
+            app = tornado.web.Application(
+                [
+                    (
+                        r"/_stcore/stream",
+                        _FakeWorkerWebSocketHandler,
+                        {"index": index},
+                    ),
+                    (
+                        r"/media/(.*)",
+                        _FakeWorkerMediaHandler,
+                        # Only the second worker has the media file.
+                        {"index": index, "has_media": index == 1},
+                    ),
+                    (
+                        r"/_stcore/upload_file/(.*)",
+                        _FakeWorkerUploadHandler,
+                        {"index": index},
+                    ),
+                    (
+                        r"/_stcore/health",
+                        _FakeWorkerHealthHandler,
+                        {"index": index, "healthy": self.healthy},
+                    ),
+                    (
+                        r"/_stcore/metrics",
+                        _FakeWorkerMetricsHandler,
+                        {"index": index},
+                    ),
+                ]
+            )
+            sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+            server = tornado.httpserver.HTTPServer(app)
+            server.add_sockets(sockets)
+            self._worker_servers.append(server)
+            worker_ports.append(sockets[0].getsockname()[1])
+
+        self._http_client = tornado.httpclient.AsyncHTTPClient(force_instance=True)
+        return create_worker_proxy_app(self.router, worker_ports, self._http_client)
+
+    async def _connect(
+        self, existing_session_id: str | None = None
+    ) -> tornado.websocket.WebSocketClientConnection:
+        subprotocols = ["streamlit", "token"]
+        if existing_session_id:
+            subprotocols.append(existing_session_id)
+        return await tornado.websocket.websocket_connect(
+            self.get_url("/_stcore/stream").replace("http", "ws"),
+            subprotocols=subprotocols,
+        )
+
+    @tornado.testing.gen_test
+    async def test_proxies_websocket_and_registers_session(self):
+        """Websocket messages are proxied and the session ID is recorded."""
+        ws_client = await self._connect()
+
+        msg = ForwardMsg()
+        msg.ParseFromString(await ws_client.read_message())
+        session_id = msg.new_session.initialize.session_id
+        worker = self.router.get_workers(session_id)
+        self.assertEqual(len(worker), 1)
+
+        await ws_client.write_message(b"hello", binary=True)
+        self.assertEqual(await ws_client.read_message(), f"worker-{worker[0]}:b'hello'")
+        ws_client.close()
+
+    @tornado.testing.gen_test
+    async def test_reconnect_is_routed_to_the_same_worker(self):
+        """A reconnecting session is routed back to its worker."""
+        ws_client = await self._connect()
+        msg = ForwardMsg()
+        msg.ParseFromString(await ws_client.read_message())
+        session_id = msg.new_session.initialize.session_id
+        ws_client.close()
+
+        for _ in range(3):
+            ws_client = await self._connect(session_id)
+            msg.ParseFromString(await ws_client.read_message())
+            self.assertEqual(msg.new_session.initialize.session_id, session_id)
+            await ws_client.write_message(b"ping", binary=True)
+            self.assertTrue(
+                (await ws_client.read_message()).startswith(
+                    f"worker-{self.router.get_workers(session_id)[0]}:"
+                )
+            )
+            ws_client.close()
+
+    def test_media_requests_fall_back_to_other_workers(self):
+        """Media files are looked up in all workers."""
+        for _ in range(2):
+            response = self.fetch("/media/file.png")
+            self.assertEqual(response.code, 200)
+            self.assertEqual(response.body, b"media from worker-1")
+
+    def test_uploads_are_routed_to_the_session_worker(self):
+        """Uploads go to the worker of the session they belong to."""
+        self.router.register_session("session", 0)
+
+        for _ in range(2):
+            response = self.fetch(
+                "/_stcore/upload_file/session/file_id", method="PUT", body="data"
+            )
+            self.assertEqual(response.code, 200)
+            self.assertEqual(response.body, b"worker-0 received data")
+
+    def test_health_checks_all_workers(self):
+        """The server is only healthy if all workers are."""
+        response = self.fetch("/_stcore/health")
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.body, b"ok")
+
+        self.healthy[1] = False
+        for _ in range(2):
+            response = self.fetch("/_stcore/health")
+            self.assertEqual(response.code, 503)
+            self.assertEqual(response.body, b"unavailable")
+
+    def test_metrics_of_all_workers_are_combined(self):
+        """The metrics of each worker are labeled with the worker's index."""
+        response = self.fetch("/_stcore/metrics")
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(
+            response.body.decode(),
+            """# TYPE cache_memory_bytes gauge
+# UNIT cache_memory_bytes bytes
+# HELP cache_memory_bytes Total memory consumed by a cache.
+cache_memory_bytes{worker="0",cache_type="st_cache_data",cache="foo"} 10
+cache_memory_bytes{worker="0",cache_type="st_session_state",cache=""} 100
+cache_memory_bytes{worker="1",cache_type="st_cache_data",cache="foo"} 20
+cache_memory_bytes{worker="1",cache_type="st_session_state",cache=""} 100
+# TYPE rerun_requests counter
+# HELP rerun_requests Number of script reruns requested by clients.
+rerun_requests_total{worker="0"} 1
+rerun_requests_total{worker="1"} 2
+# EOF
+""",
+        )
+
+    def test_metrics_protobuf_of_all_workers_are_combined(self):
+        response = self.fetch(
+            "/_stcore/metrics", headers={"Accept": "application/x-protobuf"}
+        )
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/x-protobuf")
+        metric_set = MetricSet()
+        metric_set.ParseFromString(response.body)
+        self.assertEqual(
+            [family.name for family in metric_set.metric_families],
+            ["cache_memory_bytes", "rerun_requests"],
+        )
+        self.assertEqual(
+            [
+                (
+                    {label.name: label.value for label in metric.labels}["worker"],
+                    metric.metric_points[0].counter_value.int_value,
+                )
+                for metric in metric_set.metric_families[1].metrics
+            ],
+            [("0", 1), ("1", 2)],
+        )
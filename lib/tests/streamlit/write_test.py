@@ -33,7 +33,9 @@ from streamlit import type_util
 from streamlit.elements import write
 from streamlit.error_util import handle_uncaught_app_exception
 from streamlit.errors import StreamlitAPIException
+from streamlit.runtime.scriptrunner_utils.exceptions import StopException
 from streamlit.runtime.state import QueryParamsProxy, SessionStateProxy
+from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.data_test_cases import (
     SHARED_TEST_CASES,
     CaseMetadata,
@@ -559,3 +561,131 @@ def make_is_type_mock(true_type_matchers):
         return False
 
     return new_is_type
+
+
+class WriteStreamDeltasTest(DeltaGeneratorTestCase):
+    """Test the messages that st.write_stream sends."""
+
+    def _write_stream_and_get_sent_deltas(self, chunks: list[Any]) -> list[Any]:
+        """Stream the chunks and return the deltas, flushing the queue after
+        each chunk like the runtime would.
+        """
+        sent_msgs = []
+
+        def stream():
+            for chunk in chunks:
+                yield chunk
+                sent_msgs.extend(self.forward_msg_queue.flush())
+
+        st.write_stream(stream)
+        sent_msgs.extend(self.forward_msg_queue.flush())
+        return [msg.delta for msg in sent_msgs]
+
+    @patch.object(write, "_STREAM_FLUSH_INTERVAL_SECS", 0)
+    def test_appends_text_chunks(self):
+        """Only the first chunk is sent as a markdown element, the following
+        ones are appended to it.
+        """
+        deltas = self._write_stream_and_get_sent_deltas(["Hello", " wor", "ld"])
+
+        self.assertEqual(3, len(deltas))
+        self.assertEqual("Hello", deltas[0].new_element.markdown.body)
+        self.assertEqual(" wor", deltas[1].append_markdown)
+        self.assertEqual("ld", deltas[2].append_markdown)
+
+    @patch.object(write, "_STREAM_FLUSH_INTERVAL_SECS", 60)
+    def test_batches_text_chunks(self):
+        """Chunks that arrive within the flush interval are sent together."""
+        deltas = self._write_stream_and_get_sent_deltas(["Hello", " wor", "ld"])
+
+        self.assertEqual(2, len(deltas))
+        self.assertEqual("Hello", deltas[0].new_element.markdown.body)
+        self.assertEqual(" world", deltas[1].append_markdown)
+
+    @patch.object(write, "_STREAM_FLUSH_INTERVAL_SECS", 60)
+    def test_sends_pending_text_before_other_elements(self):
+        deltas = self._write_stream_and_get_sent_deltas(
+            ["Hello", " world", {"a": 1}, "Bye"]
+        )
+
+        self.assertEqual(
+            ["new_element", "append_markdown", "new_element", "new_element"],
+            [delta.WhichOneof("type") for delta in deltas],
+        )
+        self.assertEqual(" world", deltas[1].append_markdown)
+        self.assertEqual("Bye", deltas[3].new_element.markdown.body)
+
+    @patch.object(write, "_STREAM_FLUSH_INTERVAL_SECS", 0.05)
+    def test_sends_pending_text_when_stream_stalls(self):
+        """Pending text is sent at the end of the flush interval, even if the
+        next chunk takes longer to arrive."""
+        sent_while_stalled = []
+
+        def stream():
+            yield "Hello"
+            yield " wor"
+            # Stall until the pending text was sent, or give up.
+            deadline = time.monotonic() + 5
+            while not sent_while_stalled and time.monotonic() < deadline:
+                sent_while_stalled.extend(
+                    msg.delta.append_markdown
+                    for msg in self.forward_msg_queue.flush()
+                    if msg.delta.append_markdown
+                )
+                time.sleep(0.01)
+            yield "ld"
+
+        self.assertEqual("Hello world", st.write_stream(stream))
+        self.assertEqual([" wor"], sent_while_stalled)
+
+    @parameterized.expand(
+        [
+            (RuntimeError("API error"), "Hello wor"),
+            (StopException(), "Hello"),
+        ]
+    )
+    def test_no_pending_text_is_sent_after_stream_raised(
+        self, exception: BaseException, expected_text: str
+    ):
+        """Text that is pending when the stream raises isn't sent by the
+        timer later, which could be during the next script run."""
+
+        def stream():
+            yield "Hello"
+            yield " wor"
+            raise exception
+
+        with self.assertRaises(type(exception)):
+            st.write_stream(stream)
+
+        def get_sent_text():
+            return "".join(
+                msg.delta.new_element.markdown.body + msg.delta.append_markdown
+                for msg in self.forward_msg_queue.flush()
+            )
+
+        # Failed streams show the text that arrived before the error.
+        self.assertEqual(expected_text, get_sent_text())
+        time.sleep(write._STREAM_FLUSH_INTERVAL_SECS * 2)
+        self.assertEqual("", get_sent_text())
+
+    def test_replaces_element_in_cached_function(self):
+        """Cached functions don't replay appended text, so the element is
+        replaced with the full response.
+        """
+
+        @st.cache_data
+        def cached_stream():
+            return st.write_stream(["Hello", " world"])
+
+        self.assertEqual("Hello world", cached_stream())
+        self.assertEqual(
+            "Hello world", self.get_delta_from_queue().new_element.markdown.body
+        )
+        self.clear_queue()
+
+        self.assertEqual("Hello world", cached_stream())
+        self.assertEqual(
+            "Hello world", self.get_delta_from_queue().new_element.markdown.body
+        )
+        st.cache_data.clear()
@@ -0,0 +1,124 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how long it takes to hash a large dataframe and a large read-only
+array that are passed to several cached functions in each script run.
+
+Compares generating the hashed sample positions for every call (the previous
+behavior) against reusing them, and hashing a read-only array for every call
+against reusing its hash within the script run.
+
+Usage: python scripts/benchmarks/cache_arg_hashing.py [num_rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import streamlit as st
+from streamlit import config, logger
+from streamlit.runtime.caching import hashing
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.fragment import MemoryFragmentStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+NUM_FUNCTIONS = 10
+NUM_RUNS = 5
+
+
+def _make_cached_funcs() -> list:
+    funcs = []
+    for i in range(NUM_FUNCTIONS):
+
+        def summarize(data: Any, i: int = i) -> float:
+            return float(np.asarray(data)[:, i % data.shape[1]].sum())
+
+        funcs.append(st.cache_data(summarize, show_spinner=False))
+    return funcs
+
+
+def _time_per_run_ms(ctx: ScriptRunContext, data: Any) -> float:
+    cached_funcs = _make_cached_funcs()
+    for func in cached_funcs:
+        func(data)
+
+    start_time = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        ctx.data_hashes_this_run = {}
+        for func in cached_funcs:
+            func(data)
+    return (time.perf_counter() - start_time) / NUM_RUNS * 1e3
+
+
+def main(num_rows: int) -> None:
+    # Parse the config first, since that sets the log level.
+    config.get_config_options()
+    logger.set_log_level("warning")
+    ctx = ScriptRunContext(
+        session_id="benchmark",
+        _enqueue=ForwardMsgQueue().enqueue,
+        query_string="",
+        session_state=SafeSessionState(SessionState(), lambda: None),
+        uploaded_file_mgr=MemoryUploadedFileManager("/upload"),
+        main_script_path="",
+        user_info={},
+        script_requests=ScriptRequests(),
+        fragment_storage=MemoryFragmentStorage(),
+        pages_manager=PagesManager(""),
+    )
+    add_script_run_ctx(threading.current_thread(), ctx)
+    values = np.random.default_rng(0).random((num_rows, 8))
+    df = pd.DataFrame(values, columns=list("ABCDEFGH"))
+    read_only_array = values.copy()
+    read_only_array.flags.writeable = False
+
+    print(f"{num_rows:,} rows, {NUM_FUNCTIONS} cached functions per run")
+
+    with patch.object(
+        hashing,
+        "_get_sample_positions",
+        hashing._get_sample_positions.__wrapped__,
+    ):
+        previous = _time_per_run_ms(ctx, df)
+    current = _time_per_run_ms(ctx, df)
+    print(
+        f"  {'dataframe, sampled:':<26} new sample {previous:8.2f} ms per run, "
+        f"memoized {current:8.2f} ms per run ({previous / current:.1f}x)"
+    )
+    st.cache_data.clear()
+
+    config.set_option("runner.cacheHashFullData", True)
+    with patch.object(hashing, "_get_data_version", return_value=None):
+        previous = _time_per_run_ms(ctx, read_only_array)
+    current = _time_per_run_ms(ctx, read_only_array)
+    print(
+        f"  {'read-only array, full:':<26} hash every call {previous:8.2f} ms per "
+        f"run, memoized {current:8.2f} ms per run ({previous / current:.1f}x)"
+    )
+    st.cache_data.clear()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,109 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the latency of st.cache_data and st.cache_resource cache hits.
+
+Measures how long it takes to decorate a function, which happens on every
+rerun for functions defined in the app script, and how long a call to a
+cached function takes when its value is already cached, for functions with
+different numbers of arguments. The spinner is disabled, so that the timings
+are dominated by computing the cache keys.
+
+Usage: python scripts/benchmarks/cache_hit_latency.py [num_calls]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+import streamlit as st
+from streamlit import config, logger
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.fragment import MemoryFragmentStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+
+def no_args() -> int:
+    return 1
+
+
+def one_arg(a: int) -> int:
+    return a
+
+
+def five_args(a: int, b: str, c: float, d: tuple[int, int], e: bool = True) -> int:
+    return a
+
+
+def _time_per_call_us(func: Callable[[], Any], num_calls: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(num_calls):
+        func()
+    return (time.perf_counter() - start_time) / num_calls * 1e6
+
+
+def main(num_calls: int) -> None:
+    # Cache keys are logged at the debug level, which would dominate the timings.
+    # Parse the config first, since that sets the log level.
+    config.get_config_options()
+    logger.set_log_level("warning")
+    add_script_run_ctx(
+        threading.current_thread(),
+        ScriptRunContext(
+            session_id="benchmark",
+            _enqueue=ForwardMsgQueue().enqueue,
+            query_string="",
+            session_state=SafeSessionState(SessionState(), lambda: None),
+            uploaded_file_mgr=MemoryUploadedFileManager("/upload"),
+            main_script_path="",
+            user_info={},
+            script_requests=ScriptRequests(),
+            fragment_storage=MemoryFragmentStorage(),
+            pages_manager=PagesManager(""),
+        ),
+    )
+
+    print(f"{num_calls:,} calls per measurement")
+    for decorator_name, decorator in (
+        ("st.cache_data", st.cache_data),
+        ("st.cache_resource", st.cache_resource),
+    ):
+        decorate = _time_per_call_us(
+            lambda: decorator(five_args, show_spinner=False),  # noqa: B023
+            num_calls // 10,
+        )
+        print(f"  {decorator_name}:")
+        print(f"    {'decorate:':<12} {decorate:8.2f} us")
+
+        for name, func, args in (
+            ("no args:", no_args, ()),
+            ("one arg:", one_arg, (1,)),
+            ("five args:", five_args, (1, "b", 2.5, (3, 4))),
+        ):
+            cached_func = decorator(func, show_spinner=False)
+            cached_func(*args)
+            hit = _time_per_call_us(lambda: cached_func(*args), num_calls)  # noqa: B023
+            print(f"    {name:<12} {hit:8.2f} us per hit")
+        decorator.clear()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
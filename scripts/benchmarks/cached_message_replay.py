@@ -0,0 +1,121 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how long it takes to replay the elements of a cached function on a
+cache hit, and to hash the replayed messages like the runtime does before
+sending them.
+
+Compares re-adding the media files and serializing the messages to hash them
+(the previous behavior) against reusing the media files and the elements'
+recorded hashes, for a function that draws a grid of images and charts.
+
+Usage: python scripts/benchmarks/cached_message_replay.py [num_elements]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+import streamlit as st
+from streamlit import config, logger
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching import cached_message_replay
+from streamlit.runtime.caching.storage.dummy_cache_storage import (
+    MemoryCacheStorageManager,
+)
+from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.fragment import MemoryFragmentStorage
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+NUM_RUNS = 10
+
+
+def _time_per_hit_ms(queue: ForwardMsgQueue, num_elements: int) -> float:
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 255, (256, 256, 3), dtype=np.uint8)] * num_elements
+    df = pd.DataFrame(rng.random((1_000, 4)), columns=list("ABCD"))
+
+    @st.cache_data(show_spinner=False)
+    def draw_grid() -> None:
+        for i, image in enumerate(images):
+            st.image(image, caption=str(i))
+            st.line_chart(df)
+
+    draw_grid()
+    queue.flush()
+
+    start_time = time.perf_counter()
+    for _ in range(NUM_RUNS):
+        draw_grid()
+        for msg in queue.flush():
+            populate_hash_if_needed(msg)
+    elapsed = (time.perf_counter() - start_time) / NUM_RUNS * 1e3
+    st.cache_data.clear()
+    return elapsed
+
+
+def main(num_elements: int) -> None:
+    # Parse the config first, since that sets the log level.
+    config.get_config_options()
+    logger.set_log_level("warning")
+    media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/media"))
+    mock_runtime = MagicMock(spec=Runtime)
+    mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+    mock_runtime.media_file_mgr = media_file_mgr
+    Runtime._instance = mock_runtime
+
+    queue = ForwardMsgQueue()
+    add_script_run_ctx(
+        threading.current_thread(),
+        ScriptRunContext(
+            session_id="benchmark",
+            _enqueue=queue.enqueue,
+            query_string="",
+            session_state=SafeSessionState(SessionState(), lambda: None),
+            uploaded_file_mgr=MemoryUploadedFileManager("/upload"),
+            main_script_path="",
+            user_info={},
+            script_requests=ScriptRequests(),
+            fragment_storage=MemoryFragmentStorage(),
+            pages_manager=PagesManager(""),
+        ),
+    )
+
+    print(f"{num_elements:,} images and {num_elements:,} charts")
+    with patch.object(
+        cached_message_replay, "compute_element_hash", return_value=None
+    ), patch.object(media_file_mgr, "get_file_id", return_value=None):
+        previous = _time_per_hit_ms(queue, num_elements)
+    reused = _time_per_hit_ms(queue, num_elements)
+    print(
+        f"  previous: {previous:8.2f} ms per hit\n"
+        f"  reused:   {reused:8.2f} ms per hit ({previous / reused:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,97 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the time it takes to marshall a dataframe arg of a custom component.
+
+Compares the previous marshalling (which converted the index row by row)
+against the current one, for a first render, a rerun with an unchanged
+dataframe, and a pyarrow.Table arg.
+
+Usage: python scripts/benchmarks/component_arrow.py [num_rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit import dataframe_util
+from streamlit.components.v1 import component_arrow
+from streamlit.proto.Components_pb2 import ArrowTable as ArrowTableProto
+
+
+def _marshall_previous(proto: ArrowTableProto, data: Any) -> None:
+    """The way component_arrow.marshall worked before."""
+    df = dataframe_util.convert_anything_to_pandas_df(data)
+    proto.index = dataframe_util.convert_pandas_df_to_arrow_bytes(
+        pd.DataFrame(map(component_arrow._maybe_tuple_to_list, df.index.values))
+    )
+    proto.columns = dataframe_util.convert_pandas_df_to_arrow_bytes(
+        pd.DataFrame(map(component_arrow._maybe_tuple_to_list, df.columns.values))
+    )
+    proto.data = dataframe_util.convert_pandas_df_to_arrow_bytes(df)
+
+
+def _time(marshall: Callable[[ArrowTableProto, Any], None], data: Any) -> float:
+    """Return the best time of a few runs, in milliseconds."""
+    times = []
+    for _ in range(5):
+        component_arrow._marshalled_table_cache.clear()
+        start_time = time.perf_counter()
+        marshall(ArrowTableProto(), data)
+        times.append(time.perf_counter() - start_time)
+    return min(times) * 1000
+
+
+def _time_rerun(data: Any) -> float:
+    """Return the best time of a few runs with a warm cache, in milliseconds."""
+    component_arrow.marshall(ArrowTableProto(), data)
+    times = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        component_arrow.marshall(ArrowTableProto(), data)
+        times.append(time.perf_counter() - start_time)
+    return min(times) * 1000
+
+
+def main(num_rows: int) -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            **{f"value_{i}": rng.random(num_rows) for i in range(8)},
+            "label": rng.choice(["a", "b", "c", "d"], num_rows).astype(object),
+            "time": pd.date_range("2024-01-01", periods=num_rows, freq="s"),
+        }
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    print(f"{num_rows:,} rows x {len(df.columns)} columns")
+    previous = _time(_marshall_previous, df)
+    print(f"  previous, pandas.DataFrame:  {previous:8.1f} ms")
+    for name, duration in [
+        ("current, pandas.DataFrame:", _time(component_arrow.marshall, df)),
+        ("current, unchanged rerun:", _time_rerun(df)),
+        ("previous, pyarrow.Table:", _time(_marshall_previous, table)),
+        ("current, pyarrow.Table:", _time(component_arrow.marshall, table)),
+    ]:
+        print(f"  {name:<28} {duration:8.1f} ms ({previous / duration:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
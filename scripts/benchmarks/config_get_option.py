@@ -0,0 +1,85 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the throughput of config.get_option from many threads.
+
+Compares reading from the lock-free snapshot (as done by config.get_option)
+against reading the options while holding the config lock, for a number of
+concurrent threads that mimic script threads reading hot-path options.
+
+Usage: python scripts/benchmarks/config_get_option.py [reads_per_thread]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+from streamlit import config
+
+_HOT_PATH_OPTIONS = [
+    "global.minCachedMessageSize",
+    "runner.fastReruns",
+    "runner.magicEnabled",
+    "server.enableArrowTruncation",
+    "server.maxMessageSize",
+]
+
+
+def _get_option_with_lock(key: str) -> Any:
+    """The way config.get_option read options before the snapshot existed."""
+    with config._config_lock:
+        return config.get_config_options()[key].value
+
+
+def _run_threads(
+    get_option: Callable[[str], Any], num_threads: int, reads_per_thread: int
+) -> float:
+    """Return the number of reads per second across all threads."""
+    start = threading.Barrier(num_threads + 1)
+
+    def read_options() -> None:
+        start.wait()
+        for i in range(reads_per_thread):
+            get_option(_HOT_PATH_OPTIONS[i % len(_HOT_PATH_OPTIONS)])
+
+    threads = [threading.Thread(target=read_options) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * reads_per_thread / (time.perf_counter() - start_time)
+
+
+def main(reads_per_thread: int) -> None:
+    config.get_config_options()
+
+    print(f"{reads_per_thread:,} reads per thread")
+    for num_threads in (1, 4, 16, 64):
+        locked = _run_threads(_get_option_with_lock, num_threads, reads_per_thread)
+        snapshot = _run_threads(config.get_option, num_threads, reads_per_thread)
+        print(
+            f"  {num_threads:>3} threads: "
+            f"locked {locked / 1e6:6.2f} M reads/s, "
+            f"snapshot {snapshot / 1e6:6.2f} M reads/s "
+            f"({snapshot / locked:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
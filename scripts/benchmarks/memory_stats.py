@@ -0,0 +1,69 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how long it takes to compute the memory stats of session states.
+
+Creates session states that hold a small dataframe and a few other values,
+and compares sizing all of them with asizeof (the previous behavior) against
+estimating their sizes, and against reusing the estimates between calls like
+repeated /_stcore/metrics scrapes do.
+
+Usage: python scripts/benchmarks/memory_stats.py [num_sessions]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from streamlit.runtime.state import SessionState
+from streamlit.runtime.stats import SizeEstimates, estimate_size
+from streamlit.vendor.pympler.asizeof import asizeof
+
+
+def _make_session_state(i: int) -> SessionState:
+    session_state = SessionState()
+    session_state["df"] = pd.DataFrame(
+        {"a": np.arange(1_000), "b": [f"row {j}" for j in range(1_000)]}
+    )
+    session_state["messages"] = [{"role": "user", "content": "hi"}] * 20
+    session_state["count"] = i
+    return session_state
+
+
+def _time_ms(func) -> float:
+    start_time = time.perf_counter()
+    func()
+    return (time.perf_counter() - start_time) * 1e3
+
+
+def main(num_sessions: int) -> None:
+    session_states = [(i, _make_session_state(i)) for i in range(num_sessions)]
+    size_estimates = SizeEstimates(time_budget_secs=float("inf"))
+    size_estimates.get_sizes(session_states)
+
+    print(f"{num_sessions:,} sessions")
+    for name, func in (
+        ("asizeof:", lambda: [asizeof(state) for _, state in session_states]),
+        ("estimate:", lambda: [estimate_size(state) for _, state in session_states]),
+        ("reused:", lambda: size_estimates.get_sizes(session_states)),
+    ):
+        print(f"  {name:<10} {_time_ms(func):10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
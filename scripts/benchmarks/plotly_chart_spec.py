@@ -0,0 +1,84 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the size and marshalling time of st.plotly_chart specs.
+
+Compares the spec with decimal text arrays against the spec with binary
+typed arrays (as sent by st.plotly_chart), for each available JSON engine.
+
+Usage: python scripts/benchmarks/plotly_chart_spec.py [num_points]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+import numpy as np
+import plotly.graph_objs as go
+import plotly.io
+
+from streamlit.elements.plotly_chart import _figure_to_json
+
+
+def _text_spec(fig: go.Figure, engine: str) -> str:
+    """Spec with all arrays encoded as decimal text."""
+    fig_dict = fig.to_dict()
+    for trace, source in zip(fig_dict["data"], fig.data):
+        trace["x"] = np.asarray(source.x).tolist()
+        trace["y"] = np.asarray(source.y).tolist()
+    return plotly.io.to_json(fig_dict, validate=False, engine=engine)
+
+
+def main(num_points: int) -> None:
+    rng = np.random.default_rng(0)
+    fig = go.Figure(
+        go.Scattergl(
+            x=rng.standard_normal(num_points), y=rng.standard_normal(num_points)
+        )
+    )
+
+    engines = ["json"]
+    try:
+        import orjson  # noqa: F401
+
+        engines.append("orjson")
+    except ImportError:
+        pass
+
+    print(f"{num_points:,} points")
+    for engine in engines:
+        plotly.io.json.config.default_engine = engine
+
+        text_spec = _text_spec(fig, engine)
+        text_time = min(
+            timeit.repeat(lambda: _text_spec(fig, engine), number=1, repeat=3)
+        )
+        binary_spec = _figure_to_json(fig)
+        binary_time = min(
+            timeit.repeat(lambda: _figure_to_json(fig), number=1, repeat=3)
+        )
+
+        for name, spec, seconds in (
+            ("text", text_spec, text_time),
+            ("binary", binary_spec, binary_time),
+        ):
+            print(
+                f"  {engine:>6} {name:>6}: {len(spec) / 1e6:8.2f} MB "
+                f"{seconds * 1e3:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,103 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the messages that st.write_stream sends for a streamed response.
+
+Streams a response token by token, with a short delay between tokens like an
+LLM would, and flushes the message queue after every token like the runtime
+does. Compares re-sending the whole response for every token (the previous
+behavior) against appending the new text, with and without batching.
+
+Usage: python scripts/benchmarks/write_stream.py [num_tokens]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+import streamlit as st
+from streamlit.elements import write
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.fragment import MemoryFragmentStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+TOKEN = "lorem ip "
+TOKEN_DELAY_SECS = 0.002
+
+
+def _write_stream_previous(tokens: Iterator[str]) -> None:
+    """The way st.write_stream wrote text chunks before."""
+    placeholder = st.empty()
+    response = ""
+    for token in tokens:
+        response += token
+        placeholder.markdown(response + "▕")
+    placeholder.markdown(response)
+
+
+def _measure(
+    write_stream: Callable[[Iterator[str]], object], num_tokens: int
+) -> tuple[int, int]:
+    """Return the number of messages and bytes that were sent."""
+    queue = ForwardMsgQueue()
+    add_script_run_ctx(
+        threading.current_thread(),
+        ScriptRunContext(
+            session_id="benchmark",
+            _enqueue=queue.enqueue,
+            query_string="",
+            session_state=SafeSessionState(SessionState(), lambda: None),
+            uploaded_file_mgr=MemoryUploadedFileManager("/upload"),
+            main_script_path="",
+            user_info={},
+            script_requests=ScriptRequests(),
+            fragment_storage=MemoryFragmentStorage(),
+            pages_manager=PagesManager(""),
+        ),
+    )
+    sent_msgs = []
+
+    def tokens() -> Iterator[str]:
+        for _ in range(num_tokens):
+            yield TOKEN
+            sent_msgs.extend(queue.flush())
+            time.sleep(TOKEN_DELAY_SECS)
+
+    write_stream(tokens())
+    sent_msgs.extend(queue.flush())
+    return len(sent_msgs), sum(msg.ByteSize() for msg in sent_msgs)
+
+
+def main(num_tokens: int) -> None:
+    print(f"{num_tokens:,} tokens, {num_tokens * len(TOKEN):,} characters")
+    with patch.object(write, "_STREAM_FLUSH_INTERVAL_SECS", 0):
+        results = [
+            ("previous:", _measure(_write_stream_previous, num_tokens)),
+            ("append, no batching:", _measure(st.write_stream, num_tokens)),
+        ]
+    results.append(("append, batching:", _measure(st.write_stream, num_tokens)))
+    for name, (num_msgs, num_bytes) in results:
+        print(f"  {name:<22} {num_msgs:6,} messages {num_bytes:14,} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)